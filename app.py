@@ -1,21 +1,36 @@
 """영어-한국어 번역기 Streamlit 애플리케이션"""
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import os
 import uuid
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 from dotenv import load_dotenv
 from utils import strip_markdown
 from components.language import LanguageDetector
 from components.text import TextAnalyzer
-from components.translation import TranslationManager
+from components.tokens import TokenCounter
+from components.translation import StreamResultReplaced, TranslationManager
 from config import Config
 from components.observability import configure_langfuse
+from components.prompts import configure_prompts
+from components.cache import TranslationCache
+from components.memory import TranslationMemory
+from components.glossary import GlossaryRegistry
+from components.placeholders import PlaceholderProtector
+from components.client_registry import ClientRegistry
+from components.document import DocumentTranslator
+from components.singleflight import SingleFlight
+from components.budget import TokenBudget
+from components.rate_limit import RateLimiter
+from components.hedging import HedgingPolicy
+from components.deployment_pool import DeploymentPool
+from components.router import ModelRouter
 from logger import setup_logging, get_logger
 
 load_dotenv()
 
-# 설정 로드
-config = Config.load()
+# 설정 로드 (프로세스 전역 캐시 사용: rerun마다 .env를 다시 읽지 않음)
+config = Config.get()
 
 # 로깅 시스템 초기화
 setup_logging(config)
@@ -24,6 +39,9 @@ logger = get_logger("transbot.app")
 # Langfuse 관찰성 초기화
 configure_langfuse(config)
 
+# 시스템 프롬프트 버전 적용
+configure_prompts(config)
+
 
 # ============================================================================
 # Helper Functions (클립보드 복사 버튼)
@@ -203,18 +221,214 @@ def initialize_session_state() -> None:
         st.session_state.selected_styles = []
     if 'multi_style_results' not in st.session_state:
         st.session_state.multi_style_results = None
+    if 'pending_translation' not in st.session_state:
+        st.session_state.pending_translation = None
+
+
+@st.cache_resource
+def get_translation_cache() -> Optional[TranslationCache]:
+    """프로세스 전체에서 공유하는 번역 캐시를 반환합니다.
+
+    st.cache_resource로 한 번만 생성되어 모든 세션과 rerun에서 재사용됩니다.
+    """
+    return TranslationCache.from_config(config)
+
+
+@st.cache_resource
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """프로세스 전체에서 공유하는 문장 단위 번역 메모리를 반환합니다 (TRANSLATION_MEMORY_ENABLED=false이면 None).
+
+    모든 세션이 같은 저장소를 사용하므로 다른 사용자가 번역한 문장도 재사용됩니다.
+    """
+    return TranslationMemory.from_config(config)
+
+
+@st.cache_resource
+def get_glossary() -> Optional[GlossaryRegistry]:
+    """프로세스 전체에서 공유하는 용어집 레지스트리를 반환합니다 (GLOSSARY_ENABLED=false이면 None).
+
+    용어집 파일이 바뀌면 요청 시점에 다시 불러오므로 앱을 재시작할 필요가 없습니다.
+    """
+    return GlossaryRegistry.from_config(config)
+
+
+@st.cache_resource
+def get_placeholder_protector() -> Optional[PlaceholderProtector]:
+    """번역하지 않는 구간을 플레이스홀더로 바꾸는 보호기를 반환합니다 (PLACEHOLDER_PROTECTION_ENABLED=false이면 None)."""
+    return PlaceholderProtector.from_config(config)
+
+
+@st.cache_resource
+def get_single_flight() -> Optional[SingleFlight]:
+    """프로세스 전체에서 공유하는 동일 요청 합치기(SingleFlight)를 반환합니다.
+
+    모든 세션이 같은 인스턴스를 사용하므로, 여러 사용자가 동시에 같은 텍스트를 번역하면 API를 한 번만 호출합니다.
+    """
+    return SingleFlight.from_config(config)
+
+
+@st.cache_resource
+def get_token_counter() -> TokenCounter:
+    """프로세스 전체에서 공유하는 토큰 카운터를 반환합니다.
+
+    사용 가능한 모델의 인코더를 미리 로드하여 첫 입력 시 지연을 없앱니다.
+    """
+    token_counter = TokenCounter(
+        memo_size=config.TOKEN_COUNT_MEMO_SIZE,
+        approximate_threshold=config.TOKEN_COUNT_APPROX_THRESHOLD
+    )
+    token_counter.warm_up(config.get_available_openai_models().values())
+    return token_counter
+
+
+@st.cache_resource
+def get_token_budget() -> Optional[TokenBudget]:
+    """프로세스 전체에서 공유하는 출력 토큰 예산(TokenBudget)을 반환합니다.
+
+    요청별 max_tokens 추정값과 실제 출력 토큰 기록이 세션 사이에서 누적됩니다.
+    """
+    return TokenBudget.from_config(config, token_counter=get_token_counter())
+
+
+@st.cache_resource
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """프로세스 전체에서 공유하는 요청 한도 제한기를 반환합니다.
+
+    모든 세션이 같은 버킷을 사용하므로 여러 사용자의 요청을 합쳐서 RPM/TPM 한도를 지킵니다.
+    """
+    return RateLimiter.from_config(config, token_counter=get_token_counter())
+
+
+def notify_rate_limit_wait(wait_seconds: float) -> None:
+    """요청 한도 때문에 대기 중임을 화면에 알립니다.
+
+    Streamlit 요소는 스크립트 스레드에서만 그릴 수 있으므로 작업 스레드(구간 번역 등)에서는 표시하지 않습니다.
+    """
+    if get_script_run_ctx() is None:
+        return
+    st.toast(f"⏳ 대기 중... 요청 한도로 약 {wait_seconds:.1f}초 후 번역합니다.")
+
+
+@st.cache_resource
+def get_model_router() -> Optional[ModelRouter]:
+    """프로세스 전체에서 공유하는 모델 라우터를 반환합니다 (MODEL_ROUTES가 없으면 None)."""
+    return ModelRouter.from_config(config, token_counter=get_token_counter())
+
+
+@st.cache_resource
+def get_hedging_policy() -> Optional[HedgingPolicy]:
+    """프로세스 전체에서 공유하는 요청 헤징 정책을 반환합니다.
+
+    모델/deployment별 응답 시간 기록과 헤징 통계가 세션 사이에서 누적됩니다.
+    """
+    return HedgingPolicy.from_config(config)
+
+
+def show_rate_limit_status() -> None:
+    """사이드바에 요청 한도 대기열 상태(대기 중인 요청 수, 대기 시간)를 표시합니다."""
+    rate_limiter = get_rate_limiter()
+    if rate_limiter is None:
+        return
+
+    for key, stats in rate_limiter.stats().items():
+        st.sidebar.caption(
+            f"⏳ 요청 한도 `{key}`: 대기 중 {stats['queue_depth']}건, "
+            f"평균 대기 {stats['avg_wait_ms']:,}ms (최대 {stats['max_wait_ms']:,}ms)"
+        )
+
+
+def show_hedging_status() -> None:
+    """사이드바에 요청 헤징 통계(헤징 비율, 중복 요청으로 추가 사용한 토큰 수)를 표시합니다."""
+    hedging = get_hedging_policy()
+    if hedging is None:
+        return
+
+    stats = hedging.stats()
+    extra_tokens = stats["extra_prompt_tokens"] + stats["extra_completion_tokens"]
+    st.sidebar.caption(
+        f"🔀 헤징 {stats['hedged_requests']}/{stats['requests']}건 ({stats['hedge_rate']:.1%}), "
+        f"추가 토큰 {extra_tokens:,}"
+    )
+
+
+def show_translation_memory_status() -> None:
+    """사이드바에 번역 메모리 통계(재사용한 문장 수, 유사 문장 참고 수)를 표시합니다."""
+    translation_memory = get_translation_memory()
+    if translation_memory is None:
+        return
+
+    stats = translation_memory.stats()
+    st.sidebar.caption(
+        f"🧠 번역 메모리 재사용 {stats['memory_reused']:,}문장 ({stats['memory_reuse_ratio']:.1%}), "
+        f"유사 문장 참고 {stats['memory_fuzzy_hits']:,}문장"
+    )
+
+
+def show_glossary_status() -> None:
+    """사이드바에 적용 중인 용어집과 버전을 표시합니다."""
+    glossary = get_glossary()
+    if glossary is None:
+        return
+
+    versions = ", ".join(f"{name} v{version}" for name, version in glossary.versions().items())
+    st.sidebar.caption(f"📖 용어집 {versions or '없음'}")
+
+
+@st.cache_resource
+def get_client_registry() -> ClientRegistry:
+    """프로세스 전체에서 공유하는 API 클라이언트 레지스트리를 반환합니다.
+
+    클라이언트와 httpx 연결 풀이 rerun과 세션 사이에서 재사용됩니다.
+    """
+    return ClientRegistry.from_config(config)
+
+
+@st.cache_resource
+def get_deployment_pools() -> dict[str, DeploymentPool]:
+    """프로세스 전체에서 공유하는 모델별 Azure deployment 풀을 반환합니다.
+
+    AZURE_DEPLOYMENTS에 deployment가 여러 개인 모델만 포함되며,
+    deployment별 상태(연속 오류, 응답 시간)가 세션 사이에서 공유됩니다.
+    """
+    registry = get_client_registry()
+    return DeploymentPool.from_config(
+        config,
+        lambda endpoint, api_key: registry.get_client(
+            provider="azure",
+            api_key=api_key,
+            endpoint=endpoint,
+            api_version=config.AZURE_OPENAI_API_VERSION,
+            timeout=config.OPENAI_API_TIMEOUT,
+            max_retries=config.OPENAI_MAX_RETRIES
+        )
+    )
+
+
+def show_deployment_pool_status(deployment_pool: Optional[DeploymentPool]) -> None:
+    """사이드바에 deployment 풀의 deployment별 상태를 표시합니다."""
+    if deployment_pool is None:
+        return
+
+    for stats in deployment_pool.stats():
+        status = "🟢" if stats["healthy"] else "🔴 제외됨"
+        latency = f"{stats['latency_ms']:,}ms" if stats["latency_ms"] is not None else "-"
+        st.sidebar.caption(
+            f"{status} `{stats['deployment']}`: 진행 중 {stats['outstanding']}건, 응답 {latency}, "
+            f"오류 {stats['failures']}/{stats['requests']}건"
+        )
 
 
 def setup_api_client() -> tuple[Any, Literal["openai", "azure"]]:
     """OpenAI/Azure API 클라이언트를 설정하고 반환합니다.
 
+    클라이언트는 ClientRegistry에서 가져오므로 rerun마다 새로 생성되지 않습니다.
+
     Returns:
         (client, provider) 튜플
     """
     # 전역 config 사용
     provider = config.AI_PROVIDER
-
-    logger.info("API 클라이언트 초기화 시작", extra={"provider": provider})
+    registry = get_client_registry()
 
     if provider == "azure":
         # Azure 필수 파라미터 검증
@@ -225,29 +439,22 @@ def setup_api_client() -> tuple[Any, Literal["openai", "azure"]]:
             st.error("⚠️ AZURE_OPENAI_ENDPOINT가 설정되지 않았습니다.")
             st.stop()
 
-        # AzureOpenAI 클라이언트 생성
-        from openai import AzureOpenAI
-
-        azure_client: Any = AzureOpenAI(
+        azure_client = registry.get_client(
+            provider="azure",
             api_key=config.AZURE_OPENAI_API_KEY,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
+            endpoint=config.AZURE_OPENAI_ENDPOINT,
             api_version=config.AZURE_OPENAI_API_VERSION,
             timeout=config.OPENAI_API_TIMEOUT,
             max_retries=config.OPENAI_MAX_RETRIES
         )
 
-        # Azure deployment 목록 로드
+        # Azure deployment 목록 로드 (프로세스당 한 번)
         from components.translation import AzureTranslationManager
-        AzureTranslationManager.load_deployments(config)
-
-        logger.info("Azure API 클라이언트 생성 성공", extra={
-            "provider": "azure",
-            "api_version": config.AZURE_OPENAI_API_VERSION
-        })
+        if not AzureTranslationManager.SUPPORTED_DEPLOYMENTS:
+            AzureTranslationManager.load_deployments(config)
 
         return azure_client, "azure"
     else:
-        # OpenAI 클라이언트 생성
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             api_key = st.sidebar.text_input("OpenAI API Key", type="password")
@@ -255,16 +462,13 @@ def setup_api_client() -> tuple[Any, Literal["openai", "azure"]]:
                 st.warning("OpenAI API 키를 입력해주세요.")
                 st.stop()
 
-        from openai import OpenAI
-
-        openai_client: Any = OpenAI(
+        openai_client = registry.get_client(
+            provider="openai",
             api_key=api_key,
             timeout=config.OPENAI_API_TIMEOUT,
             max_retries=config.OPENAI_MAX_RETRIES
         )
 
-        logger.info("OpenAI API 클라이언트 생성 성공", extra={"provider": "openai"})
-
         return openai_client, "openai"
 
 
@@ -274,8 +478,8 @@ def initialize_components() -> tuple[LanguageDetector, TextAnalyzer]:
     Returns:
         (LanguageDetector, TextAnalyzer) 튜플
     """
-    language_detector = LanguageDetector()
-    text_analyzer = TextAnalyzer()
+    language_detector = LanguageDetector(threshold=config.LANGUAGE_DETECTION_THRESHOLD)
+    text_analyzer = TextAnalyzer(token_counter=get_token_counter())
     return language_detector, text_analyzer
 
 
@@ -593,7 +797,17 @@ def render_action_buttons(
         st.button("🗑️ 지우기", use_container_width=True, on_click=clear_inputs)
 
 
-def render_translation_result() -> None:
+def render_translation_result(translation_manager: Optional[TranslationManager] = None) -> None:
+    """번역 결과를 표시합니다.
+
+    대기 중인 스트리밍 번역 요청이 있으면 먼저 실행하여 번역문을 생성되는 대로 표시합니다.
+
+    Args:
+        translation_manager: 번역 관리자 인스턴스 (스트리밍 번역 실행용)
+    """
+    if st.session_state.get("pending_translation") and translation_manager is not None:
+        stream_translation(translation_manager)
+
     if st.session_state.translation_result:
         result = st.session_state.translation_result["text"]
         source_lang = st.session_state.translation_result["source"]
@@ -709,13 +923,20 @@ def update_statistics(
     max_length = config.MAX_INPUT_LENGTH
 
     if input_text:
-        # 언어 감지 및 번역 방향 결정
-        source_lang, target_lang, direction_arrow = language_detector.get_translation_direction(input_text)
-
-        # 통계 계산
+        # 통계 계산 (세션별 증분 계산기로 바뀐 구간만 다시 계산)
+        if 'text_statistics' not in st.session_state:
+            st.session_state.text_statistics = text_analyzer.create_incremental_statistics()
         text_analyzer.model = selected_model
-        input_length = len(input_text)
-        token_count = text_analyzer.count_tokens(input_text)
+        # 대용량 입력은 새 구간의 토큰 수를 전체 BPE 인코딩 대신 근사 카운트로 추정합니다
+        approximate = text_analyzer.token_counter.is_approximate(input_text)
+        stats = text_analyzer.get_statistics(
+            input_text, incremental=st.session_state.text_statistics, approximate=approximate
+        )
+        input_length = stats["characters"]
+        token_label = f"~{stats['tokens']:,}" if approximate else f"{stats['tokens']:,}"
+
+        # 언어 감지 및 번역 방향 결정 (구간별 한글/영문자 수 합계 사용)
+        source_lang, target_lang, direction_arrow = language_detector.get_translation_direction_from_statistics(stats)
 
         # 색상 결정
         length_color = "#888"
@@ -725,7 +946,7 @@ def update_statistics(
             length_color = "#ff8800"  # 주황색: 경고
 
         # 통합된 통계 표시 HTML 생성
-        stats_html = f"<div style='text-align: right; color: {length_color};'>{input_length:,} / {max_length:,}자 <span style='font-size: 0.85em;'>({token_count:,} 토큰)</span></div>"  # noqa: E501
+        stats_html = f"<div style='text-align: right; color: {length_color};'>{input_length:,} / {max_length:,}자 <span style='font-size: 0.85em;'>({token_label} 토큰)</span></div>"  # noqa: E501
 
         stats_placeholder.markdown(stats_html, unsafe_allow_html=True)
     else:
@@ -775,6 +996,23 @@ def handle_translation(
         st.error("언어를 감지할 수 없습니다. 한국어 또는 영어 텍스트를 입력해주세요.")
         return
 
+    # 긴 문서는 구간으로 나누어 병렬 번역합니다 (출력 잘림 방지)
+    document_translator = create_document_translator(translation_manager)
+    if use_document_translation(input_text, target_lang, translation_manager, document_translator):
+        translate_document(input_text, source_lang, target_lang, translation_manager, document_translator)
+        return
+
+    if config.TRANSLATION_STREAMING_ENABLED:
+        # 스트리밍 번역은 결과 영역(render_translation_result)에서 실행하여 번역문을 바로 표시합니다
+        st.session_state.pending_translation = {
+            "text": input_text,
+            "source": source_lang,
+            "target": target_lang
+        }
+        st.session_state.translation_result = None
+        st.session_state.multi_style_results = None
+        return
+
     with st.spinner("번역 중..."):
         try:
             result = translation_manager.translate(
@@ -783,86 +1021,233 @@ def handle_translation(
                 target_lang,
                 st.session_state.session_id
             )
-            st.session_state.translation_result = {
-                "text": result,
-                "source": source_lang,
-                "target": target_lang
-            }
-            # FEATURE-023: 번역 완료 상태 업데이트
-            st.session_state.translation_completed = True
-            st.session_state.source_language = source_lang
-            st.session_state.target_language = target_lang
+            store_translation_result(result, source_lang, target_lang)
+            run_multi_style_translation(input_text, source_lang, target_lang, translation_manager)
 
-            # FEATURE-024: 양방향 번역(한↔영) 모두 다중 스타일 번역 수행
-            from components.style_translator import StyleTranslator
+        except Exception as e:
+            st.error(f"번역 중 오류가 발생했습니다: {str(e)}")
 
-            # StyleTranslator 인스턴스 생성 (Azure인 경우 deployment 전달)
-            style_translator_kwargs = {
-                "client": translation_manager.client,
-                "model": translation_manager.model,
-                "temperature": 0.3,
-                "max_tokens": 2000,
-                "timeout": 30
-            }
-            if hasattr(translation_manager, 'deployment'):
-                style_translator_kwargs["deployment"] = translation_manager.deployment
 
-            style_translator = StyleTranslator(**style_translator_kwargs)
+def use_document_translation(
+    input_text: str,
+    target_lang: str,
+    translation_manager: TranslationManager,
+    document_translator: DocumentTranslator
+) -> bool:
+    """입력을 구간 번역(DocumentTranslator)으로 처리할지 결정합니다.
 
-            # 사용자가 선택한 스타일 사용 (최소 1개 이상)
-            selected_styles = st.session_state.selected_styles
-            if not selected_styles:
-                # 기본값: 직역 스타일
-                selected_styles = [StyleTranslator.STYLE_LITERAL]
+    입력이 DOCUMENT_TRANSLATION_THRESHOLD_TOKENS보다 길거나, 이미 대상 언어인 문단이
+    MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS 이상이면 구간 번역을 사용합니다.
+    유지할 문단이 짧으면 아끼는 토큰보다 요청이 여러 구간으로 나뉘는 비용이 크므로 한 번에 번역합니다.
 
-            # 다중 스타일 번역 수행
-            preserve_proper_nouns = st.session_state.get("preserve_proper_nouns", False)
-            include_alternatives = st.session_state.get("include_alternatives", False)
-            custom_instruction = st.session_state.get("custom_style_instruction", "")
+    Args:
+        input_text: 입력 텍스트
+        target_lang: 대상 언어
+        translation_manager: 번역 관리자 인스턴스
+        document_translator: 구간 번역기
 
-            # 커스텀 지침이 있으면 각 스타일마다 개별 번역
-            if custom_instruction.strip():
-                multi_style_results = {}
-                for style in selected_styles:
-                    translation = style_translator.translate_single_style(
-                        text=input_text,
-                        style=style,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        preserve_proper_nouns=preserve_proper_nouns,
-                        custom_instruction=custom_instruction
-                    )
-
-                    if include_alternatives:
-                        alternatives = style_translator._generate_alternatives(
-                            text=input_text,
-                            base_translation=translation,
-                            style=style,
-                            source_lang=source_lang,
-                            target_lang=target_lang
-                        )
-                        multi_style_results[style] = {
-                            "primary": translation,
-                            "alternatives": alternatives
-                        }
-                    else:
-                        multi_style_results[style] = translation
-            else:
-                # 일반 다중 스타일 번역
-                multi_style_results = style_translator.translate_multi_style(
-                    text=input_text,
-                    styles=selected_styles,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    preserve_proper_nouns=preserve_proper_nouns,
-                    include_alternatives=include_alternatives
-                )
+    Returns:
+        구간 번역을 사용하면 True
+    """
+    token_count = get_token_counter().count(input_text, translation_manager.model, approximate=None)
+    if token_count > config.DOCUMENT_TRANSLATION_THRESHOLD_TOKENS:
+        return True
+    if not config.MIXED_LANGUAGE_PASSTHROUGH_ENABLED:
+        return False
 
-            # 결과 저장
-            st.session_state.multi_style_results = multi_style_results
+    passthrough_tokens = document_translator.passthrough_tokens(input_text, target_lang)
+    return passthrough_tokens > 0 and passthrough_tokens >= config.MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS
+
+
+def create_document_translator(translation_manager: TranslationManager) -> DocumentTranslator:
+    """Config 설정으로 DocumentTranslator를 생성합니다.
+
+    MIXED_LANGUAGE_PASSTHROUGH_ENABLED가 켜져 있으면 대상 언어로 작성된 문단을 그대로 유지하도록
+    언어 감지기를 함께 전달합니다.
+
+    Args:
+        translation_manager: 구간 번역에 사용할 번역 관리자 인스턴스
+
+    Returns:
+        DocumentTranslator 인스턴스
+    """
+    language_detector = None
+    if config.MIXED_LANGUAGE_PASSTHROUGH_ENABLED:
+        language_detector = LanguageDetector(threshold=config.LANGUAGE_DETECTION_THRESHOLD)
+    return DocumentTranslator(
+        translation_manager,
+        max_segment_tokens=config.DOCUMENT_SEGMENT_MAX_TOKENS,
+        max_concurrency=config.DOCUMENT_MAX_CONCURRENCY,
+        token_counter=get_token_counter(),
+        language_detector=language_detector,
+        passthrough_min_confidence=config.MIXED_LANGUAGE_MIN_CONFIDENCE
+    )
+
+
+def translate_document(
+    input_text: str,
+    source_lang: str,
+    target_lang: str,
+    translation_manager: TranslationManager,
+    document_translator: Optional[DocumentTranslator] = None
+) -> None:
+    """긴 문서를 구간별로 병렬 번역하고 진행률을 표시합니다.
+
+    Args:
+        input_text: 입력 텍스트
+        source_lang: 원본 언어
+        target_lang: 대상 언어
+        translation_manager: 번역 관리자 인스턴스
+        document_translator: 사용할 DocumentTranslator (None이면 Config 설정으로 생성)
+    """
+    document_translator = document_translator or create_document_translator(translation_manager)
+    progress_bar = st.progress(0.0, text="긴 문서 번역 중...")
+
+    def update_progress(completed: int, total: int) -> None:
+        progress_bar.progress(completed / total, text=f"긴 문서 번역 중... ({completed}/{total} 구간)")
+
+    try:
+        result = document_translator.translate(
+            input_text,
+            source_lang,
+            target_lang,
+            st.session_state.session_id,
+            on_progress=update_progress
+        )
+        store_translation_result(result, source_lang, target_lang)
+
+        with st.spinner("스타일 번역 중..."):
+            run_multi_style_translation(input_text, source_lang, target_lang, translation_manager)
+
+    except Exception as e:
+        st.error(f"번역 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        progress_bar.empty()
+
+
+def stream_translation(translation_manager: TranslationManager) -> None:
+    """대기 중인 번역 요청을 스트리밍으로 실행하고 번역문을 생성되는 대로 표시합니다.
+
+    스트림이 끝나면 결과를 저장하고 다중 스타일 번역을 이어서 수행합니다.
+
+    Args:
+        translation_manager: 번역 관리자 인스턴스
+    """
+    pending = st.session_state.pending_translation
+    st.session_state.pending_translation = None
+    input_text = pending["text"]
+    source_lang = pending["source"]
+    target_lang = pending["target"]
+
+    stream_placeholder = st.empty()
+    try:
+        with stream_placeholder.container():
+            st.subheader(f"번역 결과 ({source_lang} → {target_lang})")
+            result = st.write_stream(translation_manager.translate_stream(
+                input_text,
+                source_lang,
+                target_lang,
+                st.session_state.session_id
+            ))
+    except StreamResultReplaced as replaced:
+        # 코드 블록/URL 등이 번역문에 제대로 돌아오지 않아 다시 번역한 결과로 바꿉니다
+        result = replaced.text
+    except Exception as e:
+        stream_placeholder.empty()
+        st.error(f"번역 중 오류가 발생했습니다: {str(e)}")
+        return
+
+    # 스트리밍 표시를 지우고 복사 버튼/탭이 있는 일반 결과 화면으로 다시 그립니다
+    stream_placeholder.empty()
+    store_translation_result(str(result), source_lang, target_lang)
 
+    with st.spinner("스타일 번역 중..."):
+        try:
+            run_multi_style_translation(input_text, source_lang, target_lang, translation_manager)
         except Exception as e:
-            st.error(f"번역 중 오류가 발생했습니다: {str(e)}")
+            st.error(f"스타일 번역 중 오류가 발생했습니다: {str(e)}")
+
+
+def store_translation_result(result: str, source_lang: str, target_lang: str) -> None:
+    st.session_state.translation_result = {
+        "text": result,
+        "source": source_lang,
+        "target": target_lang
+    }
+    # FEATURE-023: 번역 완료 상태 업데이트
+    st.session_state.translation_completed = True
+    st.session_state.source_language = source_lang
+    st.session_state.target_language = target_lang
+
+
+def run_multi_style_translation(
+    input_text: str,
+    source_lang: str,
+    target_lang: str,
+    translation_manager: TranslationManager
+) -> None:
+    """선택된 스타일로 다중 스타일 번역을 수행하고 결과를 저장합니다.
+
+    Args:
+        input_text: 입력 텍스트
+        source_lang: 원본 언어
+        target_lang: 대상 언어
+        translation_manager: 번역 관리자 인스턴스 (client, model, deployment 공유)
+    """
+    # FEATURE-024: 양방향 번역(한↔영) 모두 다중 스타일 번역 수행
+    from components.style_translator import StyleTranslator
+
+    # StyleTranslator 인스턴스 생성 (Azure인 경우 deployment 전달)
+    style_translator_kwargs = {
+        "client": translation_manager.client,
+        "model": translation_manager.model,
+        "temperature": 0.3,
+        "max_tokens": 2000,
+        "timeout": 30,
+        "max_concurrency": config.STYLE_MAX_CONCURRENCY,
+        "cache": get_translation_cache(),
+        "single_flight": get_single_flight(),
+        "token_budget": get_token_budget(),
+        "rate_limiter": get_rate_limiter(),
+        "router": get_model_router(),
+        "glossary": get_glossary()
+    }
+    if hasattr(translation_manager, 'deployment'):
+        style_translator_kwargs["deployment"] = translation_manager.deployment
+        # 번역 관리자와 같은 deployment 풀로 스타일/대안 요청도 분산합니다
+        style_translator_kwargs["deployment_pool"] = getattr(translation_manager, "deployment_pool", None)
+
+    style_translator = StyleTranslator(**style_translator_kwargs)
+
+    # 사용자가 선택한 스타일 사용 (최소 1개 이상)
+    selected_styles = st.session_state.selected_styles
+    if not selected_styles:
+        # 기본값: 직역 스타일
+        selected_styles = [StyleTranslator.STYLE_LITERAL]
+
+    # 다중 스타일 번역 수행
+    preserve_proper_nouns = st.session_state.get("preserve_proper_nouns", False)
+    include_alternatives = st.session_state.get("include_alternatives", False)
+    custom_instruction = st.session_state.get("custom_style_instruction", "")
+
+    # 다중 스타일 번역 (커스텀 지침이 있으면 모든 스타일에 적용)
+    # STYLE_TRANSLATION_MODE=batched이면 모든 스타일을 한 번의 API 호출로 생성
+    if config.STYLE_TRANSLATION_MODE == "batched":
+        translate_styles = style_translator.translate_multi_style_batched
+    else:
+        translate_styles = style_translator.translate_multi_style
+    multi_style_results = translate_styles(
+        text=input_text,
+        styles=selected_styles,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        preserve_proper_nouns=preserve_proper_nouns,
+        include_alternatives=include_alternatives,
+        custom_instruction=custom_instruction.strip() or None
+    )
+
+    # 결과 저장
+    st.session_state.multi_style_results = multi_style_results
 
 
 def regenerate_multi_style_translation() -> None:
@@ -912,10 +1297,18 @@ def regenerate_multi_style_translation() -> None:
                 "model": model,
                 "temperature": 0.3,
                 "max_tokens": 2000,
-                "timeout": 30
+                "timeout": 30,
+                "max_concurrency": config.STYLE_MAX_CONCURRENCY,
+                "cache": get_translation_cache(),
+                "single_flight": get_single_flight(),
+                "token_budget": get_token_budget(),
+                "rate_limiter": get_rate_limiter(),
+                "router": get_model_router(),
+                "glossary": get_glossary()
             }
             if deployment:
                 style_translator_kwargs["deployment"] = deployment
+                style_translator_kwargs["deployment_pool"] = get_deployment_pools().get(model)
 
             style_translator = StyleTranslator(**style_translator_kwargs)
 
@@ -924,43 +1317,21 @@ def regenerate_multi_style_translation() -> None:
             include_alternatives = st.session_state.get("include_alternatives", False)
             custom_instruction = st.session_state.get("custom_style_instruction", "")
 
-            # 커스텀 지침이 있으면 모든 스타일에 적용
-            if custom_instruction.strip():
-                multi_style_results = {}
-                for style in selected_styles:
-                    translation = style_translator.translate_single_style(
-                        text=input_text,
-                        style=style,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        preserve_proper_nouns=preserve_proper_nouns,
-                        custom_instruction=custom_instruction
-                    )
-
-                    if include_alternatives:
-                        alternatives = style_translator._generate_alternatives(
-                            text=input_text,
-                            base_translation=translation,
-                            style=style,
-                            source_lang=source_lang,
-                            target_lang=target_lang
-                        )
-                        multi_style_results[style] = {
-                            "primary": translation,
-                            "alternatives": alternatives
-                        }
-                    else:
-                        multi_style_results[style] = translation
+            # 다중 스타일 번역 (커스텀 지침이 있으면 모든 스타일에 적용)
+            # STYLE_TRANSLATION_MODE=batched이면 모든 스타일을 한 번의 API 호출로 생성
+            if config.STYLE_TRANSLATION_MODE == "batched":
+                translate_styles = style_translator.translate_multi_style_batched
             else:
-                # 일반 다중 스타일 번역
-                multi_style_results = style_translator.translate_multi_style(
-                    text=input_text,
-                    styles=selected_styles,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    preserve_proper_nouns=preserve_proper_nouns,
-                    include_alternatives=include_alternatives
-                )
+                translate_styles = style_translator.translate_multi_style
+            multi_style_results = translate_styles(
+                text=input_text,
+                styles=selected_styles,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                preserve_proper_nouns=preserve_proper_nouns,
+                include_alternatives=include_alternatives,
+                custom_instruction=custom_instruction.strip() or None
+            )
 
             # 결과 저장
             st.session_state.multi_style_results = multi_style_results
@@ -993,6 +1364,10 @@ def main() -> None:
 
     # 4. 사이드바 설정 및 번역 관리자 초기화
     selected_model_or_deployment, _ = setup_sidebar(provider)
+    show_rate_limit_status()
+    show_hedging_status()
+    show_translation_memory_status()
+    show_glossary_status()
 
     # FEATURE-023: API 클라이언트 및 모델 정보를 session_state에 저장 (스타일 재생성 버튼용)
     st.session_state.api_client = client
@@ -1010,12 +1385,26 @@ def main() -> None:
                 model_name = model
                 break
 
+        # 같은 모델의 deployment가 여러 개이면 풀로 요청을 분산합니다
+        deployment_pool = get_deployment_pools().get(model_name) if model_name else None
         translation_manager = TranslationManagerFactory.create(
             provider=provider,
             client=client,
             deployment=selected_model_or_deployment,
-            model=model_name  # 실제 모델명 전달
+            model=model_name,  # 실제 모델명 전달
+            cache=get_translation_cache(),
+            single_flight=get_single_flight(),
+            token_budget=get_token_budget(),
+            rate_limiter=get_rate_limiter(),
+            on_rate_limit_wait=notify_rate_limit_wait,
+            hedging=get_hedging_policy(),
+            deployment_pool=deployment_pool,
+            glossary=get_glossary(),
+            router=get_model_router(),
+            translation_memory=get_translation_memory(),
+            placeholder_protector=get_placeholder_protector()
         )
+        show_deployment_pool_status(deployment_pool)
         # FEATURE-023: 실제 모델명 및 deployment 저장
         st.session_state.selected_model = model_name if model_name else selected_model_or_deployment
         st.session_state.deployment = selected_model_or_deployment
@@ -1024,7 +1413,17 @@ def main() -> None:
         translation_manager = TranslationManagerFactory.create(
             provider=provider,
             client=client,
-            model=selected_model_or_deployment
+            model=selected_model_or_deployment,
+            cache=get_translation_cache(),
+            single_flight=get_single_flight(),
+            token_budget=get_token_budget(),
+            rate_limiter=get_rate_limiter(),
+            on_rate_limit_wait=notify_rate_limit_wait,
+            hedging=get_hedging_policy(),
+            glossary=get_glossary(),
+            router=get_model_router(),
+            translation_memory=get_translation_memory(),
+            placeholder_protector=get_placeholder_protector()
         )
         # FEATURE-023: 모델명 저장
         st.session_state.selected_model = selected_model_or_deployment
@@ -1046,8 +1445,8 @@ def main() -> None:
     # 7. 액션 버튼 렌더링
     render_action_buttons(input_text, source_lang, target_lang, translation_manager)
 
-    # 8. 번역 결과 표시
-    render_translation_result()
+    # 8. 번역 결과 표시 (스트리밍 번역 요청이 있으면 여기서 실행)
+    render_translation_result(translation_manager)
 
 
 if __name__ == "__main__":
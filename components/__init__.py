@@ -3,6 +3,7 @@
 TransBot의 핵심 비즈니스 로직 컴포넌트를 제공합니다.
 """
 
+from components.cache import TranslationCache
 from components.language import LanguageDetector
 from components.observability import configure_langfuse
 from components.text import TextAnalyzer
@@ -19,4 +20,5 @@ __all__ = [
     "TranslationManager",
     "AzureTranslationManager",
     "TranslationManagerFactory",
+    "TranslationCache",
 ]
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""출력 토큰 예산(max_tokens) 산정 모듈
+
+Azure/OpenAI의 분당 토큰(TPM) 한도는 실제 생성량이 아니라 요청한 max_tokens로 계산되므로,
+짧은 입력에 큰 max_tokens를 요청하면 한도를 낭비하고 긴 입력에 작은 값을 요청하면 출력이 잘립니다.
+TokenBudget은 입력 토큰 수, 번역 방향별 토큰 증감 비율, 스타일 계수로 출력 토큰을 추정하고
+모델의 최대 출력 토큰과 컨텍스트 윈도우 안으로 제한한 값을 max_tokens로 사용합니다.
+요청마다 추정값과 실제 출력 토큰 수를 기록하므로, 기록을 바탕으로 비율을 다시 보정할 수 있습니다.
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import Any, Optional
+
+from components.tokens import TokenCounter
+from config import Config
+
+logger = logging.getLogger("transbot.budget")
+
+# 모델별 컨텍스트 윈도우 및 최대 출력 토큰
+MODEL_TOKEN_LIMITS: dict[str, dict[str, int]] = {
+    "gpt-4o": {"context_window": 128000, "max_output_tokens": 16384},
+    "gpt-4o-mini": {"context_window": 128000, "max_output_tokens": 16384},
+    "gpt-4-turbo": {"context_window": 128000, "max_output_tokens": 4096},
+    "gpt-4": {"context_window": 8192, "max_output_tokens": 8192},
+    "gpt-3.5-turbo": {"context_window": 16385, "max_output_tokens": 4096},
+}
+# 알 수 없는 모델(예: 모델명 없이 등록된 Azure deployment)은 보수적인 값을 사용합니다
+_DEFAULT_MODEL_TOKEN_LIMITS = {"context_window": 8192, "max_output_tokens": 4096}
+
+# 번역 방향별 (출력 토큰 수 / 입력 토큰 수) 비율
+# 한국어는 영어보다 같은 내용에 토큰을 더 많이 사용하므로 한→영은 줄고 영→한은 늘어납니다
+DIRECTION_RATIOS: dict[tuple[str, str], float] = {
+    ("Korean", "English"): 0.9,
+    ("English", "Korean"): 1.6,
+}
+_DEFAULT_DIRECTION_RATIO = 1.3
+
+# 스타일별 출력 길이 계수
+STYLE_FACTORS: dict[str, float] = {
+    "conversational": 1.0,
+    "business": 1.0,
+    "formal": 1.1,
+    "literal": 1.0,
+    "concise": 0.7,
+}
+
+# 메시지당 역할/구분자 토큰 (OpenAI chat 형식 기준 근사값)
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class TokenBudget:
+    """입력에 맞춰 요청별 max_tokens를 산정하는 클래스"""
+
+    def __init__(
+        self,
+        token_counter: Optional[TokenCounter] = None,
+        safety_margin: float = 1.3,
+        min_tokens: int = 256,
+        ratios: Optional[dict[tuple[str, str], float]] = None,
+        history_size: int = 1000
+    ) -> None:
+        """
+        Args:
+            token_counter: 입력 토큰 계산에 사용할 TokenCounter (None이면 기본 설정으로 생성)
+            safety_margin: 추정 출력 토큰에 곱할 여유 배율 (1.0 이상)
+            min_tokens: 최소 max_tokens (짧은 입력에서도 이 값 이상 요청)
+            ratios: 번역 방향별 출력/입력 토큰 비율 (None이면 DIRECTION_RATIOS 사용)
+            history_size: 보관할 최근 기록 수
+        """
+        self.token_counter = token_counter or TokenCounter()
+        self.safety_margin = max(1.0, safety_margin)
+        self.min_tokens = max(1, min_tokens)
+        self.ratios = dict(ratios if ratios is not None else DIRECTION_RATIOS)
+        self._history: deque[dict[str, Any]] = deque(maxlen=max(1, history_size))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config, token_counter: Optional[TokenCounter] = None) -> Optional["TokenBudget"]:
+        """Config 설정으로 생성합니다 (TOKEN_BUDGET_ENABLED=false이면 None)."""
+        if not config.TOKEN_BUDGET_ENABLED:
+            return None
+        return cls(
+            token_counter=token_counter,
+            safety_margin=config.TOKEN_BUDGET_SAFETY_MARGIN,
+            min_tokens=config.TOKEN_BUDGET_MIN_TOKENS
+        )
+
+    def count(self, text: str, model: str) -> int:
+        return self.token_counter.count(text, model, approximate=None)
+
+    def count_messages(self, messages: list[dict[str, str]], model: str) -> int:
+        """chat messages 전체의 입력 토큰 수를 계산합니다 (메시지 구분 토큰 포함)."""
+        return sum(self.count(message["content"], model) + _MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+    def estimate(
+        self,
+        input_tokens: int,
+        source: str,
+        target: str,
+        model: str,
+        style: Optional[str] = None,
+        prompt_tokens: Optional[int] = None,
+        outputs: int = 1
+    ) -> int:
+        """출력 토큰 예산을 추정합니다.
+
+        Args:
+            input_tokens: 번역할 텍스트의 토큰 수
+            source: 원본 언어
+            target: 대상 언어 (원본 언어와 같으면 비율 1.0, 예: 대안 표현 생성)
+            model: 모델명 (모델별 출력 한도 적용)
+            style: 스타일 키 (StyleTranslator 사용 시)
+            prompt_tokens: 시스템 프롬프트를 포함한 전체 입력 토큰 수 (None이면 input_tokens)
+            outputs: 같은 길이의 결과를 몇 개 생성하는지 (예: 대안 표현 3개)
+
+        Returns:
+            요청에 사용할 max_tokens
+        """
+        expected = input_tokens * self.ratio(source, target) * STYLE_FACTORS.get(style or "", 1.0) * max(1, outputs)
+        # 부동소수점 오차로 1 토큰이 더해지지 않도록 반올림 후 올림합니다
+        budget = max(self.min_tokens, math.ceil(round(expected * self.safety_margin, 6)))
+        return self.clamp(budget, model, prompt_tokens if prompt_tokens is not None else input_tokens)
+
+    @staticmethod
+    def clamp(max_tokens: int, model: str, prompt_tokens: int = 0) -> int:
+        """max_tokens를 모델의 최대 출력 토큰과 남은 컨텍스트 윈도우 이하로 제한합니다.
+
+        TokenBudget 없이 고정 max_tokens를 쓰는 경우에도 TokenBudget.clamp()로 호출할 수 있습니다.
+        """
+        limits = MODEL_TOKEN_LIMITS.get(model, _DEFAULT_MODEL_TOKEN_LIMITS)
+        available = limits["context_window"] - prompt_tokens
+        return max(1, min(max_tokens, limits["max_output_tokens"], available))
+
+    def ratio(self, source: str, target: str) -> float:
+        if source == target:
+            return 1.0
+        return self.ratios.get((source, target), _DEFAULT_DIRECTION_RATIO)
+
+    def record(
+        self,
+        source: str,
+        target: str,
+        input_tokens: int,
+        estimated_tokens: int,
+        actual_tokens: int,
+        model: str,
+        style: Optional[str] = None
+    ) -> None:
+        """추정한 예산과 실제 출력 토큰 수를 기록합니다.
+
+        Args:
+            source: 원본 언어
+            target: 대상 언어
+            input_tokens: 번역할 텍스트의 토큰 수
+            estimated_tokens: 요청한 max_tokens
+            actual_tokens: 실제 출력 토큰 수 (usage.completion_tokens)
+            model: 모델명
+            style: 스타일 키
+        """
+        entry = {
+            "source_lang": source,
+            "target_lang": target,
+            "style": style,
+            "model": model,
+            "input_tokens": input_tokens,
+            "estimated_tokens": estimated_tokens,
+            "actual_tokens": actual_tokens,
+            # 예산을 모두 사용했으면 출력이 잘렸을 가능성이 큽니다
+            "truncated": actual_tokens >= estimated_tokens,
+        }
+        with self._lock:
+            self._history.append(entry)
+
+        log = logger.warning if entry["truncated"] else logger.info
+        log("출력 토큰 예산 기록", extra={
+            **entry,
+            "utilization": round(actual_tokens / estimated_tokens, 3) if estimated_tokens else None
+        })
+
+    def history(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self._history)
+
+    def calibrated_ratios(self, min_samples: int = 20) -> dict[tuple[str, str], float]:
+        """기록을 바탕으로 번역 방향별 출력/입력 토큰 비율을 다시 계산합니다.
+
+        스타일 계수를 제외한 평균 비율이며, 출력이 잘린 기록과 표본이 min_samples개 미만인 방향은 제외합니다.
+        결과를 ratios에 넣어 새 TokenBudget을 만들면 보정된 비율로 추정합니다.
+
+        Args:
+            min_samples: 방향별 최소 기록 수
+
+        Returns:
+            {(source, target): 비율}
+        """
+        samples: dict[tuple[str, str], list[float]] = {}
+        for entry in self.history():
+            if entry["truncated"] or entry["input_tokens"] <= 0 or entry["source_lang"] == entry["target_lang"]:
+                continue
+            style_factor = STYLE_FACTORS.get(entry["style"] or "", 1.0)
+            samples.setdefault((entry["source_lang"], entry["target_lang"]), []).append(
+                entry["actual_tokens"] / (entry["input_tokens"] * style_factor)
+            )
+
+        return {
+            direction: round(sum(values) / len(values), 3)
+            for direction, values in samples.items()
+            if len(values) >= min_samples
+        }
@@ -0,0 +1,363 @@
+"""번역 결과 캐시 모듈
+
+동일한 텍스트를 같은 설정(방향, 모델, temperature, 스타일, 프롬프트 버전)으로 다시 번역할 때
+API를 호출하지 않도록 번역 결과를 캐싱합니다.
+
+캐시는 여러 계층(tier)으로 구성되며, 앞 계층부터 차례로 조회합니다.
+- MemoryCacheTier: 프로세스 내 LRU 캐시
+- SQLiteCacheTier: 디스크 캐시 (TTL 및 항목 수 기반 제거)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from config import Config
+
+logger = logging.getLogger("transbot.cache")
+
+_LEADING_BLANK_LINES = re.compile(r"\A(?:[ \t]*\n)+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 생성을 위해 텍스트를 정규화합니다.
+
+    유니코드 NFC 정규화, 줄바꿈 통일(CRLF → LF), 앞쪽 빈 줄과 끝 공백 제거를 수행합니다.
+    줄 끝 공백(Markdown 강제 줄바꿈)과 첫 줄 들여쓰기(들여쓴 코드 블록)는 번역 결과에 영향을 주므로 유지합니다.
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return _LEADING_BLANK_LINES.sub("", text).rstrip()
+
+
+def make_cache_key(
+    text: str,
+    source: str,
+    target: str,
+    model: str,
+    temperature: float,
+    style: Optional[str] = None,
+    custom_instruction: Optional[str] = None,
+    prompt_version: str = "",
+    **extra: Any
+) -> str:
+    """번역 요청의 캐시 키(SHA-256)를 생성합니다.
+
+    Args:
+        text: 번역할 텍스트 (정규화 후 사용)
+        source: 원본 언어
+        target: 대상 언어
+        model: 모델명 또는 Azure deployment 이름
+        temperature: 생성 온도
+        style: 스타일 키 (StyleTranslator 사용 시)
+        custom_instruction: 커스텀 스타일 지침
+        prompt_version: 프롬프트 버전 (프롬프트 변경 시 기존 캐시 무효화)
+        **extra: 결과에 영향을 주는 추가 옵션 (예: preserve_proper_nouns)
+
+    Returns:
+        64자리 16진수 해시 문자열
+    """
+    payload = {
+        "text": normalize_text(text),
+        "source": source,
+        "target": target,
+        "model": model,
+        "temperature": round(float(temperature), 4),
+        "style": style,
+        "custom_instruction": custom_instruction or None,
+        "prompt_version": prompt_version,
+        "extra": extra,
+    }
+    serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class CacheTier(ABC):
+    """캐시 계층 인터페이스
+
+    새로운 저장소(예: Redis)를 추가하려면 이 클래스를 상속하여 get/set/clear/__len__을 구현합니다.
+    """
+
+    name = "tier"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값을 반환합니다. 없으면 None"""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """값을 저장합니다"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """저장된 항목 수를 반환합니다"""
+
+
+class MemoryCacheTier(CacheTier):
+    """프로세스 내 LRU 캐시 계층"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCacheTier(CacheTier):
+    """SQLite 기반 디스크 캐시 계층
+
+    TTL이 지난 항목은 조회 시 제거되며, 항목 수가 max_entries를 넘으면
+    마지막 접근 시각이 가장 오래된 항목부터 제거합니다.
+    """
+
+    name = "disk"
+
+    def __init__(self, path: str, ttl_seconds: int = 604800, max_entries: int = 10000) -> None:
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 사용 가능)
+            ttl_seconds: 항목 유효 시간 (초, 0 이하이면 만료 없음)
+            max_entries: 최대 항목 수
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Streamlit은 여러 스레드에서 호출하므로 lock으로 직렬화하여 연결을 공유합니다
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translation_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_cache_accessed_at"
+                " ON translation_cache (accessed_at)"
+            )
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM translation_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self._is_expired(created_at, now):
+                self._conn.execute("DELETE FROM translation_cache WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute(
+                "UPDATE translation_cache SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translation_cache (key, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """만료 항목과 최대 항목 수를 초과한 오래된 항목을 제거합니다 (lock 보유 상태에서 호출)."""
+        if self.ttl_seconds > 0:
+            self._conn.execute(
+                "DELETE FROM translation_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM translation_cache WHERE key IN ("
+                " SELECT key FROM translation_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM translation_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()
+            return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TranslationCache:
+    """다계층 번역 결과 캐시
+
+    앞 계층부터 조회하며, 뒤 계층에서 적중하면 앞 계층에도 채워 넣습니다(promote).
+    적중/미스 횟수를 집계하여 로그와 Langfuse 메타데이터에 제공합니다.
+    """
+
+    def __init__(self, tiers: list[CacheTier]) -> None:
+        """
+        Args:
+            tiers: 조회 순서대로 정렬된 캐시 계층 리스트
+        """
+        self.tiers = tiers
+        self.hits = 0
+        self.misses = 0
+        self.tier_hits: dict[str, int] = {tier.name: 0 for tier in tiers}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["TranslationCache"]:
+        """Config 설정으로 캐시를 생성합니다.
+
+        Args:
+            config: Config 인스턴스
+
+        Returns:
+            TranslationCache 인스턴스 (TRANSLATION_CACHE_ENABLED=false이면 None)
+        """
+        if not config.TRANSLATION_CACHE_ENABLED:
+            return None
+
+        tiers: list[CacheTier] = [MemoryCacheTier(config.TRANSLATION_CACHE_MEMORY_MAX_ENTRIES)]
+
+        if config.TRANSLATION_CACHE_PATH:
+            try:
+                tiers.append(SQLiteCacheTier(
+                    os.path.expanduser(config.TRANSLATION_CACHE_PATH),
+                    ttl_seconds=config.TRANSLATION_CACHE_TTL_SECONDS,
+                    max_entries=config.TRANSLATION_CACHE_MAX_DISK_ENTRIES
+                ))
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("디스크 캐시 초기화 실패 (메모리 캐시만 사용)", extra={
+                    "path": config.TRANSLATION_CACHE_PATH,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                })
+
+        logger.info("번역 캐시 초기화 완료", extra={
+            "tiers": [tier.name for tier in tiers],
+            "memory_max_entries": config.TRANSLATION_CACHE_MEMORY_MAX_ENTRIES,
+            "disk_path": config.TRANSLATION_CACHE_PATH
+        })
+        return cls(tiers)
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시에서 값을 조회합니다. 조회 오류는 미스로 처리합니다."""
+        for index, tier in enumerate(self.tiers):
+            try:
+                value = tier.get(key)
+            except Exception as e:
+                logger.warning("캐시 조회 실패", extra={
+                    "tier": tier.name,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                })
+                continue
+
+            if value is not None:
+                # 상위 계층에 채워 넣어 다음 조회를 빠르게 합니다
+                for upper in self.tiers[:index]:
+                    self._safe_set(upper, key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.tier_hits[tier.name] = self.tier_hits.get(tier.name, 0) + 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """모든 계층에 값을 저장합니다. 저장 오류는 무시하고 경고만 남깁니다."""
+        for tier in self.tiers:
+            self._safe_set(tier, key, value)
+
+    @staticmethod
+    def _safe_set(tier: CacheTier, key: str, value: str) -> None:
+        try:
+            tier.set(key, value)
+        except Exception as e:
+            logger.warning("캐시 저장 실패", extra={
+                "tier": tier.name,
+                "error_type": type(e).__name__,
+                "error_message": str(e)
+            })
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """적중/미스 통계를 반환합니다.
+
+        Returns:
+            {"cache_hits": int, "cache_misses": int, "cache_hit_ratio": float, "cache_tier_hits": dict}
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "cache_tier_hits": dict(self.tier_hits),
+            }
@@ -0,0 +1,209 @@
+"""API 클라이언트 레지스트리 모듈
+
+OpenAI/AzureOpenAI 클라이언트를 프로세스 전체에서 공유합니다.
+클라이언트를 rerun마다 새로 만들면 httpx 연결 풀이 버려져 TLS 핸드셰이크가 반복되므로,
+(provider, endpoint, API 버전, API 키 해시)별로 한 번만 생성하여 모든 세션에서 재사용합니다.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import threading
+from typing import Any, Literal, Optional
+
+import httpx
+
+from config import Config
+
+logger = logging.getLogger("transbot.client_registry")
+
+
+class ClientRegistry:
+    """공유 API 클라이언트 레지스트리
+
+    클라이언트마다 연결 풀 크기, keep-alive, HTTP/2 설정을 적용한 httpx.Client를 사용하며,
+    디버깅을 위해 httpx 이벤트 훅으로 집계한 요청 통계를 제공합니다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False
+    ) -> None:
+        """
+        Args:
+            max_connections: 클라이언트당 최대 동시 연결 수
+            max_keepalive_connections: 유지할 최대 유휴(keep-alive) 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+            http2: HTTP/2 사용 여부 (h2 패키지 필요, 없으면 HTTP/1.1 사용)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and self._http2_available()
+        self._clients: dict[tuple[str, ...], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ClientRegistry":
+        return cls(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            http2=config.HTTP2_ENABLED
+        )
+
+    def get_client(
+        self,
+        provider: Literal["openai", "azure"],
+        api_key: str,
+        endpoint: Optional[str] = None,
+        api_version: Optional[str] = None,
+        timeout: float = 60,
+        max_retries: int = 3
+    ) -> Any:
+        """공유 클라이언트를 반환합니다 (없으면 생성).
+
+        Args:
+            provider: "openai" 또는 "azure"
+            api_key: API 키 (키 자체는 저장하지 않고 해시만 키로 사용)
+            endpoint: Azure endpoint 또는 OpenAI 호환 base URL (선택)
+            api_version: Azure API 버전
+            timeout: API 타임아웃 (초)
+            max_retries: API 재시도 횟수
+
+        Returns:
+            OpenAI 또는 AzureOpenAI 클라이언트
+        """
+        key = (
+            provider,
+            endpoint or "",
+            api_version or "",
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+            str(timeout),
+            str(max_retries),
+        )
+
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                entry = self._create_client(provider, api_key, endpoint, api_version, timeout, max_retries)
+                self._clients[key] = entry
+            return entry["client"]
+
+    def _create_client(
+        self,
+        provider: str,
+        api_key: str,
+        endpoint: Optional[str],
+        api_version: Optional[str],
+        timeout: float,
+        max_retries: int
+    ) -> dict[str, Any]:
+        """연결 풀 설정을 적용한 클라이언트를 생성합니다 (lock 보유 상태에서 호출)."""
+        entry: dict[str, Any] = {
+            "provider": provider,
+            "endpoint": endpoint,
+            "requests": 0,
+            "responses": 0,
+            "http2_responses": 0
+        }
+        counts_lock = threading.Lock()
+
+        def count_request(request: httpx.Request) -> None:
+            with counts_lock:
+                entry["requests"] += 1
+
+        def count_response(response: httpx.Response) -> None:
+            with counts_lock:
+                entry["responses"] += 1
+                if response.http_version == "HTTP/2":
+                    entry["http2_responses"] += 1
+
+        http_client = httpx.Client(
+            limits=self.limits,
+            http2=self.http2,
+            timeout=timeout,
+            event_hooks={"request": [count_request], "response": [count_response]}
+        )
+
+        if provider == "azure":
+            from openai import AzureOpenAI
+
+            client: Any = AzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=endpoint,
+                api_version=api_version,
+                timeout=timeout,
+                max_retries=max_retries,
+                http_client=http_client
+            )
+        else:
+            from openai import OpenAI
+
+            client = OpenAI(
+                api_key=api_key,
+                base_url=endpoint,
+                timeout=timeout,
+                max_retries=max_retries,
+                http_client=http_client
+            )
+
+        entry["client"] = client
+        entry["http_client"] = http_client
+
+        logger.info("공유 API 클라이언트 생성", extra={
+            "provider": provider,
+            "endpoint": endpoint,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "http2": self.http2
+        })
+        return entry
+
+    def stats(self) -> list[dict[str, Any]]:
+        """클라이언트별 요청 통계를 반환합니다.
+
+        in_flight는 응답 헤더를 아직 받지 못한 요청 수이며, 전송 오류로 응답 없이 끝난 요청도 포함됩니다.
+        http2_responses는 실제로 HTTP/2로 협상된 응답 수입니다.
+
+        Returns:
+            [{"provider", "endpoint", "requests", "responses", "in_flight", "http2_responses", "http2"}, ...]
+        """
+        with self._lock:
+            entries = list(self._clients.values())
+
+        return [
+            {
+                "provider": entry["provider"],
+                "endpoint": entry["endpoint"],
+                "requests": entry["requests"],
+                "responses": entry["responses"],
+                "in_flight": entry["requests"] - entry["responses"],
+                "http2_responses": entry["http2_responses"],
+                "http2": self.http2,
+            }
+            for entry in entries
+        ]
+
+    def close(self) -> None:
+        """모든 클라이언트의 연결을 닫습니다."""
+        with self._lock:
+            for entry in self._clients.values():
+                entry["http_client"].close()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2를 사용하려면 h2 패키지가 필요합니다 (pip install httpx[http2]). HTTP/1.1을 사용합니다.")
+            return False
+        return True
@@ -0,0 +1,294 @@
+"""Azure deployment 풀 모듈
+
+같은 모델을 여러 지역/deployment에 배포해 할당량을 늘린 경우, 요청을 deployment 사이에 분산하고
+429/5xx/연결 오류가 이어지는 deployment는 잠시 순환에서 제외합니다.
+제외된 deployment는 일정 시간(probe interval)이 지나면 시험 요청 하나로 상태를 확인하고,
+성공하면 다시 순환에 포함합니다.
+
+분산 방식:
+    round_robin: 정상 deployment를 순서대로 사용
+    least_outstanding: 진행 중인 요청이 가장 적은 deployment 사용
+    latency_weighted: 최근 응답 시간(지수 이동 평균)이 짧을수록 높은 확률로 선택
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import openai
+
+from config import Config
+
+logger = logging.getLogger("transbot.deployment_pool")
+
+# 응답 시간 지수 이동 평균의 가중치 (최근 응답 비중)
+_LATENCY_EWMA_ALPHA = 0.3
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """deployment 상태에 영향을 주는 오류(429, 5xx, 연결/타임아웃 오류)인지 확인합니다."""
+    if isinstance(error, openai.APIConnectionError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class DeploymentPool:
+    """한 모델의 여러 deployment에 요청을 분산하는 풀"""
+
+    def __init__(
+        self,
+        model: str,
+        members: list[dict[str, Any]],
+        strategy: str = "round_robin",
+        unhealthy_threshold: int = 3,
+        probe_interval: float = 30.0
+    ) -> None:
+        """
+        Args:
+            model: 모델명
+            members: {"deployment": 이름, "client": API 클라이언트, "endpoint": endpoint(표시용)} 목록
+            strategy: 분산 방식 ("round_robin", "least_outstanding", "latency_weighted")
+            unhealthy_threshold: 순환에서 제외하기까지의 연속 오류 횟수
+            probe_interval: 제외된 deployment에 시험 요청을 보내기까지의 시간 (초)
+
+        Raises:
+            ValueError: deployment가 없거나 지원하지 않는 분산 방식인 경우
+        """
+        if not members:
+            raise ValueError(f"deployment가 없습니다: {model}")
+        if strategy not in ("round_robin", "least_outstanding", "latency_weighted"):
+            raise ValueError(f"지원하지 않는 deployment 분산 방식입니다: {strategy}")
+
+        self.model = model
+        self.strategy = strategy
+        self.unhealthy_threshold = max(1, unhealthy_threshold)
+        self.probe_interval = probe_interval
+        self._members = [
+            {
+                "deployment": member["deployment"],
+                "client": member["client"],
+                "endpoint": member.get("endpoint"),
+                "outstanding": 0,
+                "latency": None,
+                "consecutive_failures": 0,
+                "unhealthy_until": None,
+                "probing": False,
+                "requests": 0,
+                "failures": 0,
+            }
+            for member in members
+        ]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        get_client: Callable[[str, str], Any]
+    ) -> dict[str, "DeploymentPool"]:
+        """AZURE_DEPLOYMENTS에 deployment가 여러 개인 모델마다 풀을 생성합니다.
+
+        Args:
+            config: Config 인스턴스
+            get_client: (endpoint, api_key)로 Azure 클라이언트를 반환하는 함수 (예: ClientRegistry.get_client)
+
+        Returns:
+            {모델명: DeploymentPool} - deployment가 하나인 모델은 포함하지 않음
+
+        Raises:
+            ValueError: endpoint 또는 API 키를 찾을 수 없는 경우
+        """
+        endpoints = config.parse_azure_deployment_endpoints(config.AZURE_DEPLOYMENT_ENDPOINTS)
+        pools = {}
+        for model, deployments in config.parse_azure_deployment_pools(config.AZURE_DEPLOYMENTS).items():
+            if len(deployments) < 2:
+                continue
+
+            members = []
+            for deployment in deployments:
+                endpoint, key_env = endpoints.get(deployment, (config.AZURE_OPENAI_ENDPOINT, None))
+                api_key = os.getenv(key_env) if key_env else config.AZURE_OPENAI_API_KEY
+                if not endpoint or not api_key:
+                    raise ValueError(f"deployment의 endpoint 또는 API 키가 설정되지 않았습니다: {deployment}")
+                members.append({
+                    "deployment": deployment,
+                    "client": get_client(endpoint, api_key),
+                    "endpoint": endpoint
+                })
+
+            pools[model] = cls(
+                model,
+                members,
+                strategy=config.AZURE_BALANCING_STRATEGY,
+                unhealthy_threshold=config.AZURE_UNHEALTHY_THRESHOLD,
+                probe_interval=config.AZURE_PROBE_INTERVAL_SECONDS
+            )
+        return pools
+
+    def call(self, fn: Callable[[Any, str], Any]) -> Any:
+        """deployment를 골라 fn(client, deployment)을 호출합니다.
+
+        429/5xx/연결 오류가 나면 아직 시도하지 않은 다른 deployment로 다시 요청합니다 (failover).
+
+        Args:
+            fn: (클라이언트, deployment 이름)을 받아 API를 호출하는 함수
+
+        Returns:
+            fn의 결과
+
+        Raises:
+            Exception: 재시도할 수 없는 오류이거나 모든 deployment에서 실패한 경우 마지막 예외
+        """
+        tried: set[str] = set()
+        while True:
+            member = self._acquire(tried)
+            start = time.monotonic()
+            try:
+                result = fn(member["client"], member["deployment"])
+            except Exception as e:
+                if not self._release(member, time.monotonic() - start, e) or len(tried) >= len(self._members):
+                    raise
+                self._log_failover(member, e)
+                continue
+            self._release(member, time.monotonic() - start)
+            return result
+
+    async def call_async(self, fn: Callable[[Any, str], Awaitable[Any]]) -> Any:
+        """call()의 비동기 버전입니다 (풀의 클라이언트는 AsyncAzureOpenAI여야 합니다)."""
+        tried: set[str] = set()
+        while True:
+            member = self._acquire(tried)
+            start = time.monotonic()
+            try:
+                result = await fn(member["client"], member["deployment"])
+            except Exception as e:
+                if not self._release(member, time.monotonic() - start, e) or len(tried) >= len(self._members):
+                    raise
+                self._log_failover(member, e)
+                continue
+            self._release(member, time.monotonic() - start)
+            return result
+
+    def stats(self) -> list[dict[str, Any]]:
+        """deployment별 상태를 반환합니다.
+
+        Returns:
+            [{"deployment", "healthy", "outstanding", "latency_ms", "requests", "failures", "consecutive_failures"}]
+        """
+        with self._lock:
+            return [
+                {
+                    "deployment": member["deployment"],
+                    "healthy": member["unhealthy_until"] is None,
+                    "outstanding": member["outstanding"],
+                    "latency_ms": int(member["latency"] * 1000) if member["latency"] is not None else None,
+                    "requests": member["requests"],
+                    "failures": member["failures"],
+                    "consecutive_failures": member["consecutive_failures"],
+                }
+                for member in self._members
+            ]
+
+    def _acquire(self, tried: set[str]) -> dict[str, Any]:
+        """분산 방식에 따라 deployment를 고르고 진행 중인 요청 수를 늘립니다."""
+        now = time.monotonic()
+        with self._lock:
+            untried = [member for member in self._members if member["deployment"] not in tried]
+            healthy = [member for member in untried if member["unhealthy_until"] is None]
+            # 시험 시간이 된 제외 deployment는 한 번에 하나의 요청만 보내 상태를 확인합니다
+            probe = next(
+                (
+                    member for member in untried
+                    if member["unhealthy_until"] is not None
+                    and member["unhealthy_until"] <= now
+                    and not member["probing"]
+                ),
+                None
+            )
+
+            if probe is not None:
+                member = probe
+                member["probing"] = True
+            elif healthy:
+                member = self._select(healthy)
+            else:
+                # 모두 제외된 경우 가장 먼저 다시 시험할 deployment를 사용합니다
+                member = min(untried, key=lambda m: m["unhealthy_until"])
+
+            tried.add(member["deployment"])
+            member["outstanding"] += 1
+            member["requests"] += 1
+            return member
+
+    def _select(self, candidates: list[dict[str, Any]]) -> dict[str, Any]:
+        """정상 deployment 중 하나를 고릅니다 (lock 보유 상태에서 호출)."""
+        if self.strategy == "least_outstanding":
+            return min(candidates, key=lambda m: m["outstanding"])
+
+        if self.strategy == "latency_weighted":
+            known = [m["latency"] for m in candidates if m["latency"] is not None]
+            # 응답 기록이 없는 deployment는 평균 응답 시간으로 가정하여 한 번씩은 선택되도록 합니다
+            default = sum(known) / len(known) if known else 1.0
+            weights = [1 / max(m["latency"] if m["latency"] is not None else default, 0.001) for m in candidates]
+            return random.choices(candidates, weights=weights)[0]
+
+        member = candidates[self._next % len(candidates)]
+        self._next += 1
+        return member
+
+    def _release(self, member: dict[str, Any], elapsed: float, error: Optional[Exception] = None) -> bool:
+        """요청 결과를 기록합니다.
+
+        Returns:
+            deployment 상태에 영향을 주는 오류(다른 deployment로 재시도할 오류)이면 True
+        """
+        retryable = error is not None and is_retryable_error(error)
+        with self._lock:
+            member["outstanding"] -= 1
+            was_probing = member["probing"]
+            member["probing"] = False
+
+            if not retryable:
+                # 성공 또는 요청 자체의 오류(400 등)는 deployment 상태와 무관하므로 정상으로 봅니다
+                if error is None:
+                    previous = member["latency"]
+                    member["latency"] = elapsed if previous is None else (
+                        _LATENCY_EWMA_ALPHA * elapsed + (1 - _LATENCY_EWMA_ALPHA) * previous
+                    )
+                recovered = member["unhealthy_until"] is not None
+                member["consecutive_failures"] = 0
+                member["unhealthy_until"] = None
+            else:
+                recovered = False
+                member["failures"] += 1
+                member["consecutive_failures"] += 1
+                if was_probing or member["consecutive_failures"] >= self.unhealthy_threshold:
+                    member["unhealthy_until"] = time.monotonic() + self.probe_interval
+                    excluded = True
+                else:
+                    excluded = False
+
+        if recovered:
+            logger.info("deployment 순환 복귀", extra={"model": self.model, "deployment": member["deployment"]})
+        elif retryable and excluded:
+            logger.warning("deployment 순환 제외", extra={
+                "model": self.model,
+                "deployment": member["deployment"],
+                "consecutive_failures": member["consecutive_failures"],
+                "probe_interval_seconds": self.probe_interval,
+                "error_type": type(error).__name__
+            })
+        return retryable
+
+    def _log_failover(self, member: dict[str, Any], error: Exception) -> None:
+        logger.warning("다른 deployment로 재시도", extra={
+            "model": self.model,
+            "deployment": member["deployment"],
+            "error_type": type(error).__name__,
+            "error_message": str(error)
+        })
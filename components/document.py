@@ -0,0 +1,344 @@
+"""긴 문서 번역 파이프라인 모듈
+
+긴 입력을 한 번의 요청으로 보내면 max_tokens에 걸려 출력이 잘리고 병렬 처리도 할 수 없습니다.
+이 모듈은 Markdown 구조(제목, 문단, 펜스 코드 블록)를 기준으로 입력을 토큰 상한 이하의 구간으로 나누고,
+구간들을 제한된 동시성으로 번역한 뒤 원래 순서대로 이어 붙입니다.
+코드 블록은 번역하지 않고 그대로 유지합니다.
+
+언어 감지기(LanguageDetector)를 주면 이미 대상 언어로 작성된 제목/문단(인용한 영문 메일 등)도
+모델에 보내지 않고 그대로 유지하여, 혼합 언어 문서의 입력/출력 토큰을 줄입니다.
+"""
+
+import logging
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional
+
+from components.language import LanguageDetector
+from components.tokens import TokenCounter
+
+logger = logging.getLogger("transbot.document")
+
+_FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_HEADING_PATTERN = re.compile(r'^ {0,3}#{1,6}(\s|$)')
+_SENTENCE_PATTERN = re.compile(r'[^.!?。]*(?:[.!?。]+\s*|$)')
+_SURROUNDING_WHITESPACE_PATTERN = re.compile(r'^(\s*)(.*?)(\s*)$', re.DOTALL)
+
+
+def split_markdown_blocks(text: str) -> list[dict[str, str]]:
+    """텍스트를 Markdown 블록 단위로 나눕니다.
+
+    블록 종류는 "heading"(제목 한 줄), "paragraph"(빈 줄로 구분된 문단), "code"(펜스 코드 블록)이며,
+    블록 뒤의 빈 줄은 해당 블록에 포함되므로 블록을 이어 붙이면 원문과 같습니다.
+
+    Args:
+        text: 나눌 텍스트
+
+    Returns:
+        [{"type": 블록 종류, "content": 블록 원문}, ...]
+    """
+    blocks: list[dict[str, str]] = []
+    current: list[str] = []
+    current_type = "paragraph"
+    fence: Optional[str] = None
+    # True이면 다음 내용 줄에서 새 블록을 시작합니다 (빈 줄, 제목, 코드 블록 종료 이후)
+    boundary = False
+
+    def flush() -> None:
+        nonlocal current_type
+        if current:
+            blocks.append({"type": current_type, "content": "".join(current)})
+            current.clear()
+        current_type = "paragraph"
+
+    for line in text.splitlines(keepends=True):
+        if fence is not None:
+            current.append(line)
+            stripped = line.strip()
+            # 여는 펜스와 같은 문자, 같거나 긴 길이의 펜스만 코드 블록을 닫습니다
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+                boundary = True
+            continue
+
+        if not line.strip():
+            current.append(line)
+            boundary = True
+            continue
+
+        fence_match = _FENCE_PATTERN.match(line)
+        if fence_match:
+            flush()
+            current_type = "code"
+            fence = fence_match.group(1)
+            current.append(line)
+            boundary = False
+            continue
+
+        if _HEADING_PATTERN.match(line):
+            flush()
+            current_type = "heading"
+            current.append(line)
+            boundary = True
+            continue
+
+        if boundary:
+            flush()
+            boundary = False
+        current.append(line)
+
+    flush()
+    return blocks
+
+
+class DocumentTranslator:
+    """긴 문서를 구간 단위로 나누어 병렬 번역하는 클래스
+
+    구간 번역에는 주어진 TranslationManager.translate()를 그대로 사용하므로
+    캐시, 로깅, Langfuse 추적이 구간마다 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        translation_manager: Any,
+        max_segment_tokens: int = 1500,
+        max_concurrency: int = 4,
+        context_chars: int = 300,
+        token_counter: Optional[TokenCounter] = None,
+        language_detector: Optional[LanguageDetector] = None,
+        passthrough_min_confidence: float = 0.8
+    ) -> None:
+        """
+        Args:
+            translation_manager: 구간 번역에 사용할 TranslationManager 인스턴스
+            max_segment_tokens: 구간당 최대 입력 토큰 수
+            max_concurrency: 동시에 번역할 최대 구간 수 (1이면 순차 실행)
+            context_chars: 다음 구간에 참고 문맥으로 전달할 앞 구간 원문 길이 (0이면 전달 안 함)
+            token_counter: 구간 분할에 사용할 TokenCounter (None이면 기본 설정으로 생성)
+            language_detector: 대상 언어로 작성된 블록을 그대로 유지할 때 사용할 언어 감지기
+                (None이면 모든 제목/문단을 번역)
+            passthrough_min_confidence: 블록을 대상 언어로 판단할 최소 신뢰도 (LanguageDetector.label 기준)
+        """
+        self.translation_manager = translation_manager
+        self.max_segment_tokens = max(1, max_segment_tokens)
+        self.max_concurrency = max(1, max_concurrency)
+        self.context_chars = max(0, context_chars)
+        self.token_counter = token_counter or TokenCounter()
+        self.language_detector = language_detector
+        self.passthrough_min_confidence = passthrough_min_confidence
+
+    def split_segments(self, text: str, target: Optional[str] = None) -> list[dict[str, Any]]:
+        """텍스트를 번역 구간으로 나눕니다.
+
+        연속된 제목/문단 블록을 max_segment_tokens 이하로 묶고, 코드 블록은 번역하지 않는 독립 구간으로 둡니다.
+        구간이 절반 이상 찼을 때 제목을 만나면 제목에서 새 구간을 시작하여 섹션 경계를 유지합니다.
+        언어 감지기가 있고 target이 주어지면 이미 대상 언어인 블록도 번역하지 않는 독립 구간으로 둡니다.
+
+        Args:
+            text: 나눌 텍스트
+            target: 대상 언어 (None이면 언어별 유지를 하지 않음)
+
+        Returns:
+            [{"text": 구간 원문, "translate": 번역 여부}, ...] (이어 붙이면 원문과 같음)
+            대상 언어라서 유지하는 구간에는 "passthrough": True가 추가됩니다.
+        """
+        segments: list[dict[str, Any]] = []
+        buffer: list[str] = []
+        buffer_tokens = 0
+
+        def flush() -> None:
+            nonlocal buffer_tokens
+            if buffer:
+                segments.append({"text": "".join(buffer), "translate": True})
+                buffer.clear()
+            buffer_tokens = 0
+
+        for block in split_markdown_blocks(text):
+            content = block["content"]
+            if block["type"] == "code":
+                flush()
+                segments.append({"text": content, "translate": False})
+                continue
+
+            if self._is_passthrough(content, target):
+                flush()
+                segments.append({"text": content, "translate": False, "passthrough": True})
+                continue
+
+            tokens = self._count(content)
+            if tokens > self.max_segment_tokens:
+                flush()
+                for piece in self._split_oversized(content):
+                    segments.append({"text": piece, "translate": True})
+                continue
+
+            heading_break = block["type"] == "heading" and buffer_tokens >= self.max_segment_tokens / 2
+            if buffer_tokens + tokens > self.max_segment_tokens or heading_break:
+                flush()
+            buffer.append(content)
+            buffer_tokens += tokens
+
+        flush()
+        return segments
+
+    def passthrough_tokens(self, text: str, target: str) -> int:
+        """이미 대상 언어로 작성되어 번역하지 않고 유지할 블록의 토큰 수 합계를 반환합니다.
+
+        Args:
+            text: 입력 텍스트
+            target: 대상 언어
+
+        Returns:
+            유지할 블록의 토큰 수 합계 (언어 감지기가 없으면 0)
+        """
+        if self.language_detector is None:
+            return 0
+        return sum(
+            self._count(block["content"])
+            for block in split_markdown_blocks(text)
+            if block["type"] != "code" and self._is_passthrough(block["content"], target)
+        )
+
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """문서를 구간별로 번역하여 원래 순서대로 합친 결과를 반환합니다.
+
+        Args:
+            text: 번역할 문서
+            source: 원본 언어
+            target: 대상 언어
+            session_id: 세션 ID (Langfuse 추적용)
+            on_progress: 구간 번역이 끝날 때마다 (완료 구간 수, 전체 번역 구간 수)로 호출되는 콜백
+                (호출한 스레드에서 실행되므로 Streamlit 요소를 갱신해도 안전합니다)
+
+        Returns:
+            번역된 문서
+
+        Raises:
+            Exception: 구간 번역이 하나라도 실패한 경우 (남은 구간은 취소)
+        """
+        start_time = time.time()
+        segments = self.split_segments(text, target)
+        jobs = [
+            (index, self._build_context(segments, index))
+            for index, segment in enumerate(segments)
+            if segment["translate"] and segment["text"].strip()
+        ]
+        results = [segment["text"] for segment in segments]
+        passthrough = [segment["text"] for segment in segments if segment.get("passthrough")]
+
+        logger.info("문서 번역 시작", extra={
+            "input_length": len(text),
+            "segments": len(segments),
+            "translated_segments": len(jobs),
+            "passthrough_segments": len(passthrough),
+            "passthrough_chars": sum(len(segment_text) for segment_text in passthrough),
+            "max_concurrency": self.max_concurrency
+        })
+
+        def run(job: tuple[int, Optional[str]]) -> str:
+            index, context = job
+            return self._translate_segment(segments[index]["text"], source, target, session_id, context)
+
+        completed = 0
+        workers = min(self.max_concurrency, len(jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="document-translator") as executor:
+                futures: dict[Future, int] = {executor.submit(run, job): job[0] for job in jobs}
+                try:
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                        completed += 1
+                        if on_progress is not None:
+                            on_progress(completed, len(jobs))
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        else:
+            for job in jobs:
+                results[job[0]] = run(job)
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(jobs))
+
+        logger.info("문서 번역 완료", extra={
+            "segments": len(segments),
+            "translated_segments": len(jobs),
+            "response_time_ms": int((time.time() - start_time) * 1000)
+        })
+
+        return "".join(results)
+
+    def _translate_segment(
+        self,
+        segment_text: str,
+        source: str,
+        target: str,
+        session_id: str,
+        context: Optional[str]
+    ) -> str:
+        """구간 앞뒤 공백을 유지한 채 본문만 번역합니다."""
+        match = _SURROUNDING_WHITESPACE_PATTERN.match(segment_text)
+        leading, body, trailing = match.groups() if match else ("", segment_text, "")
+        translated = self.translation_manager.translate(body, source, target, session_id, context=context)
+        return f"{leading}{translated.strip()}{trailing}"
+
+    def _build_context(self, segments: list[dict[str, Any]], index: int) -> Optional[str]:
+        """구간에 전달할 참고 문맥(앞 구간 원문 끝부분)을 만듭니다.
+
+        구간들은 병렬로 번역되므로 앞 구간의 번역문 대신 원문을 문맥으로 사용합니다.
+        용어집은 번역 관리자(glossary)가 구간마다 등장한 용어만 프롬프트에 넣습니다.
+        """
+        if not self.context_chars:
+            return None
+
+        previous = next(
+            (segments[i]["text"] for i in range(index - 1, -1, -1) if segments[i]["translate"]),
+            ""
+        ).strip()
+        if not previous:
+            return None
+        return "Preceding text:\n" + previous[-self.context_chars:]
+
+    def _is_passthrough(self, content: str, target: Optional[str]) -> bool:
+        """블록이 이미 대상 언어로 작성되어 그대로 유지할 수 있는지 확인합니다."""
+        if self.language_detector is None or target is None:
+            return False
+        label = self.language_detector.label(content)
+        return label["language"] == target and label["confidence"] >= self.passthrough_min_confidence
+
+    def _split_oversized(self, content: str) -> list[str]:
+        """max_segment_tokens를 넘는 문단을 줄, 문장 단위로 나누어 상한 이하로 묶습니다."""
+        pieces: list[str] = []
+        for line in content.splitlines(keepends=True):
+            if self._count(line) <= self.max_segment_tokens:
+                pieces.append(line)
+            else:
+                pieces.extend(sentence for sentence in _SENTENCE_PATTERN.findall(line) if sentence)
+
+        chunks: list[str] = []
+        buffer: list[str] = []
+        buffer_tokens = 0
+        for piece in pieces:
+            tokens = self._count(piece)
+            if buffer and buffer_tokens + tokens > self.max_segment_tokens:
+                chunks.append("".join(buffer))
+                buffer = []
+                buffer_tokens = 0
+            buffer.append(piece)
+            buffer_tokens += tokens
+        if buffer:
+            chunks.append("".join(buffer))
+
+        return chunks
+
+    def _count(self, text: str) -> int:
+        return self.token_counter.count(text, self.translation_manager.model)
@@ -0,0 +1,463 @@
+"""용어집 모듈
+
+용어집 전체를 프롬프트에 넣으면 용어가 수천 개일 때 요청마다 수만 토큰을 낭비하고,
+입력마다 용어를 하나씩 `term in text`로 찾으면 용어 수에 비례해 느려집니다.
+Glossary는 용어를 Aho-Corasick 오토마톤으로 한 번만 컴파일하고 입력을 한 번 훑어(입력 길이에 선형)
+실제로 등장한 용어만 찾습니다. GlossaryRegistry는 여러 용어집 파일을 버전과 함께 관리하고,
+파일이 바뀌면 재시작 없이 다시 불러오며, 번역 결과가 찾은 용어의 번역어를 지키지 않았는지 검사합니다.
+
+용어집 파일 형식 (JSON):
+    {
+        "name": "product",
+        "version": "2024-06-01",
+        "source": "Korean",
+        "target": "English",
+        "terms": {"트랜스봇": "TransBot", "번역 메모리": "translation memory"}
+    }
+
+name은 생략하면 파일 이름, version은 생략하면 파일 내용의 해시를 사용합니다.
+source/target을 생략하면 모든 번역 방향에 적용합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Iterator, Optional
+
+from config import Config
+
+logger = logging.getLogger("transbot.glossary")
+
+# 영어 용어 뒤에 붙어도 같은 용어로 보는 복수형 접미사 (예: "API" → "APIs")
+_PLURAL_SUFFIXES = ("s", "es")
+
+
+def _is_word_char(char: str) -> bool:
+    """단어 경계 검사 대상인 ASCII 영문자/숫자인지 확인합니다.
+
+    한국어는 조사가 단어에 바로 붙으므로("트랜스봇은") 경계를 검사하지 않습니다.
+    """
+    return char.isascii() and char.isalnum()
+
+
+class AhoCorasick:
+    """여러 패턴을 입력 한 번 훑기로 찾는 Aho-Corasick 오토마톤 (대소문자 무시)"""
+
+    def __init__(self, patterns: list[str]) -> None:
+        """
+        Args:
+            patterns: 찾을 패턴 목록 (빈 문자열은 무시)
+        """
+        self.patterns = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 상태에서 끝나는 패턴 인덱스 (-1이면 없음)와 출력이 있는 가장 가까운 실패 상태
+        self._output: list[int] = [-1]
+        self._output_link: list[int] = [0]
+        self._lengths: list[int] = []
+
+        for index, pattern in enumerate(self.patterns):
+            lowered = pattern.lower()
+            self._lengths.append(len(lowered))
+            if lowered:
+                self._insert(lowered, index)
+        self._build_links()
+
+    def _insert(self, pattern: str, index: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._output_link.append(0)
+            state = next_state
+        # 대소문자만 다른 중복 패턴은 나중 패턴이 우선합니다
+        self._output[state] = index
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                link = self._fail[next_state]
+                self._output_link[next_state] = link if self._output[link] != -1 else self._output_link[link]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """입력에서 패턴이 등장하는 모든 위치를 찾습니다 (겹치는 등장 포함).
+
+        Yields:
+            (시작 위치, 끝 위치, 패턴 인덱스) - 위치는 원본 text 기준
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자(예: "İ")가 있으면 위치가 어긋나므로 문자별로 변환합니다
+            lowered = "".join(char.lower()[:1] or char for char in text)
+
+        goto, fail, output, output_link, lengths = (
+            self._goto, self._fail, self._output, self._output_link, self._lengths
+        )
+        state = 0
+        for position, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            found = state if output[state] != -1 else output_link[state]
+            while found:
+                index = output[found]
+                yield position + 1 - lengths[index], position + 1, index
+                found = output_link[found]
+
+
+class Glossary:
+    """버전이 있는 용어집 하나 (용어 → 번역어)"""
+
+    def __init__(
+        self,
+        name: str,
+        terms: dict[str, str],
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        version: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            name: 용어집 이름
+            terms: 원문 용어와 번역어 매핑
+            source: 적용할 원본 언어 (None이면 모든 언어)
+            target: 적용할 대상 언어 (None이면 모든 언어)
+            version: 용어집 버전 (None이면 용어 내용의 해시)
+        """
+        self.name = name
+        self.terms = {term.strip(): translation.strip() for term, translation in terms.items() if term.strip()}
+        self.source = source
+        self.target = target
+        if version is None:
+            digest = hashlib.sha256(json.dumps(self.terms, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+            version = digest.hexdigest()[:12]
+        self.version = version
+        self._terms = list(self.terms)
+        self._automaton = AhoCorasick(self._terms)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Glossary":
+        """JSON 용어집 파일을 읽습니다.
+
+        Raises:
+            ValueError: 파일 형식이 잘못된 경우
+        """
+        with open(path, "rb") as file:
+            raw = file.read()
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"용어집 파일을 읽을 수 없습니다: {path} ({e})") from e
+        if not isinstance(data, dict) or not isinstance(data.get("terms"), dict):
+            raise ValueError(f"용어집 파일에 terms 객체가 없습니다: {path}")
+
+        name = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+        version = data.get("version")
+        return cls(
+            name=str(name),
+            terms={str(term): str(translation) for term, translation in data["terms"].items()},
+            source=data.get("source"),
+            target=data.get("target"),
+            version=str(version) if version is not None else hashlib.sha256(raw).hexdigest()[:12]
+        )
+
+    def applies_to(self, source: str, target: str) -> bool:
+        """번역 방향에 적용되는 용어집인지 확인합니다."""
+        return self.source in (None, source) and self.target in (None, target)
+
+    def find(self, text: str) -> list[dict[str, Any]]:
+        """입력에 등장한 용어를 찾습니다.
+
+        겹치는 등장은 먼저 시작하는 용어를, 같은 위치에서는 가장 긴 용어를 고릅니다
+        (예: "번역 메모리"가 있으면 "번역"은 따로 찾지 않음). 영어 용어는 단어 경계에서만 찾습니다.
+
+        Returns:
+            [{"term": 용어집의 용어, "translation": 번역어, "start": 시작 위치, "end": 끝 위치}, ...] (등장 순서)
+        """
+        candidates = [
+            (start, end, index)
+            for start, end, index in self._automaton.iter_matches(text)
+            if self._at_word_boundary(text, start, end)
+        ]
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+
+        matches = []
+        covered_until = 0
+        for start, end, index in candidates:
+            if start < covered_until:
+                continue
+            term = self._terms[index]
+            matches.append({"term": term, "translation": self.terms[term], "start": start, "end": end})
+            covered_until = end
+        return matches
+
+    @staticmethod
+    def _at_word_boundary(text: str, start: int, end: int) -> bool:
+        if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+            for suffix in _PLURAL_SUFFIXES:
+                suffix_end = end + len(suffix)
+                if text[end:suffix_end].lower() == suffix and (
+                    suffix_end == len(text) or not _is_word_char(text[suffix_end])
+                ):
+                    return True
+            return False
+        return True
+
+
+class GlossaryRegistry:
+    """여러 용어집을 관리하고 입력에 등장한 용어만 골라 주는 레지스트리
+
+    용어집 파일의 수정 시각을 reload_interval초마다 확인하여, 바뀐 파일만 다시 컴파일하고
+    원자적으로 교체합니다. 파일이 잘못되었으면 이전 버전을 계속 사용합니다.
+    """
+
+    def __init__(
+        self,
+        glossaries: Optional[list[Glossary]] = None,
+        paths: Optional[list[str]] = None,
+        reload_interval: float = 5.0,
+        max_terms: int = 50,
+        memo_size: int = 128
+    ) -> None:
+        """
+        Args:
+            glossaries: 파일 없이 등록할 용어집 목록
+            paths: 용어집 JSON 파일 또는 디렉터리 경로 목록 (디렉터리는 안의 *.json 파일)
+            reload_interval: 파일 변경을 확인하는 최소 간격(초, 0이면 자동으로 다시 불러오지 않음)
+            max_terms: 요청 하나에 넣을 최대 용어 수
+            memo_size: 최근 입력별 용어 검색 결과를 기억할 개수 (같은 입력의 키/프롬프트/검사 재사용)
+        """
+        self.paths = list(paths or [])
+        self.reload_interval = reload_interval
+        self.max_terms = max_terms
+        self.memo_size = memo_size
+
+        self._lock = threading.Lock()
+        self._static = list(glossaries or [])
+        # 파일 경로 -> (수정 시각, Glossary)
+        self._loaded: dict[str, tuple[float, Glossary]] = {}
+        self._glossaries: list[Glossary] = list(self._static)
+        self._generation = 0
+        self._last_checked = time.monotonic()
+        self._memo: OrderedDict[tuple[int, str, str, str], list[dict[str, str]]] = OrderedDict()
+
+        if self.paths:
+            self.reload(force=True)
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["GlossaryRegistry"]:
+        """Config 설정으로 생성합니다 (GLOSSARY_ENABLED가 꺼져 있거나 경로가 없으면 None)."""
+        if not config.GLOSSARY_ENABLED:
+            return None
+        paths = [path.strip() for path in config.GLOSSARY_PATHS.split(",") if path.strip()]
+        if not paths:
+            logger.warning("용어집이 켜져 있지만 GLOSSARY_PATHS가 비어 있습니다")
+            return None
+        return cls(
+            paths=paths,
+            reload_interval=config.GLOSSARY_RELOAD_INTERVAL_SECONDS,
+            max_terms=config.GLOSSARY_MAX_TERMS
+        )
+
+    @property
+    def glossaries(self) -> list[Glossary]:
+        """현재 적용 중인 용어집 목록"""
+        return list(self._glossaries)
+
+    def versions(self) -> dict[str, str]:
+        """용어집 이름별 현재 버전을 반환합니다."""
+        return {glossary.name: glossary.version for glossary in self._glossaries}
+
+    def reload(self, force: bool = False) -> list[str]:
+        """용어집 파일을 다시 불러옵니다.
+
+        Args:
+            force: True이면 수정 시각과 관계없이 모든 파일을 다시 읽음
+
+        Returns:
+            버전이 바뀐 용어집 이름 목록
+        """
+        with self._lock:
+            self._last_checked = time.monotonic()
+            loaded: dict[str, tuple[float, Glossary]] = {}
+            changed = []
+
+            for path in self._list_files():
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                previous = self._loaded.get(path)
+                if previous is not None and previous[0] == mtime and not force:
+                    loaded[path] = previous
+                    continue
+                try:
+                    glossary = Glossary.from_file(path)
+                except (OSError, ValueError) as e:
+                    logger.warning("용어집을 불러오지 못했습니다", extra={"path": path, "error": str(e)})
+                    if previous is not None:
+                        loaded[path] = previous
+                    continue
+
+                loaded[path] = (mtime, glossary)
+                old_version = previous[1].version if previous is not None else None
+                if glossary.version != old_version:
+                    changed.append(glossary.name)
+                    logger.info(
+                        "용어집 적용",
+                        extra={
+                            "glossary": glossary.name,
+                            "version": glossary.version,
+                            "previous_version": old_version,
+                            "terms": len(glossary.terms),
+                        }
+                    )
+
+            removed = set(self._loaded) - set(loaded)
+            if changed or removed:
+                # 리스트를 통째로 교체하므로 검색 중인 요청은 이전 용어집을 끝까지 사용합니다
+                self._glossaries = self._static + [glossary for _, glossary in loaded.values()]
+                self._generation += 1
+                self._memo.clear()
+            self._loaded = loaded
+            return changed
+
+    def reload_if_changed(self) -> list[str]:
+        """reload_interval이 지났으면 바뀐 용어집 파일만 다시 불러옵니다."""
+        if not self.paths or self.reload_interval <= 0:
+            return []
+        if time.monotonic() - self._last_checked < self.reload_interval:
+            return []
+        return self.reload()
+
+    def _list_files(self) -> list[str]:
+        files = []
+        for path in self.paths:
+            if os.path.isdir(path):
+                files.extend(
+                    os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".json")
+                )
+            else:
+                files.append(path)
+        return files
+
+    def lookup(self, text: str, source: str, target: str) -> list[dict[str, str]]:
+        """입력에 등장한 용어와 번역어를 찾습니다.
+
+        같은 요청의 키 생성, 프롬프트 구성, 결과 검사가 같은 입력으로 여러 번 부르므로
+        최근 결과를 기억해 두고 재사용합니다.
+
+        Args:
+            text: 번역할 텍스트
+            source: 원본 언어
+            target: 대상 언어
+
+        Returns:
+            [{"term": 용어, "translation": 번역어, "glossary": 용어집 이름}, ...]
+            (처음 등장한 순서, 용어별 한 번, 최대 max_terms개)
+        """
+        self.reload_if_changed()
+
+        glossaries = self._glossaries
+        memo_key = (self._generation, source, target, text)
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                return cached
+
+        found: dict[str, tuple[int, dict[str, str]]] = {}
+        for glossary in glossaries:
+            if not glossary.applies_to(source, target):
+                continue
+            for match in glossary.find(text):
+                # 여러 용어집에 같은 용어가 있으면 먼저 등록된 용어집이 우선합니다
+                if match["term"] not in found:
+                    found[match["term"]] = (match["start"], {
+                        "term": match["term"],
+                        "translation": match["translation"],
+                        "glossary": glossary.name,
+                    })
+        terms = [entry for _, entry in sorted(found.values(), key=lambda item: item[0])][:self.max_terms]
+
+        with self._lock:
+            self._memo[memo_key] = terms
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return terms
+
+    @staticmethod
+    def format_prompt(terms: list[dict[str, str]]) -> str:
+        """찾은 용어를 시스템 프롬프트에 덧붙일 용어집 지시문으로 만듭니다 (용어가 없으면 빈 문자열)."""
+        if not terms:
+            return ""
+        lines = "\n".join(f"- {entry['term']} → {entry['translation']}" for entry in terms)
+        return (
+            "\n\nGlossary: always translate the following terms exactly as given.\n"
+            f"<glossary>\n{lines}\n</glossary>"
+        )
+
+    @staticmethod
+    def request_key(terms: list[dict[str, str]]) -> list[str]:
+        """캐시 키에 넣을 용어 쌍 목록을 만듭니다 (용어집이 바뀌면 캐시 키도 바뀜)."""
+        return [f"{entry['term']}→{entry['translation']}" for entry in terms]
+
+    @staticmethod
+    def check(output: str, terms: list[dict[str, str]]) -> list[dict[str, str]]:
+        """번역 결과가 찾은 용어의 번역어를 지켰는지 검사합니다.
+
+        번역어가 결과에 (대소문자 무시) 포함되지 않으면 위반으로 봅니다.
+        한국어 조사나 영어 복수형이 붙은 경우도 포함으로 인정됩니다.
+
+        Returns:
+            [{"term": 용어, "expected": 기대한 번역어, "glossary": 용어집 이름}, ...]
+        """
+        lowered = output.lower()
+        return [
+            {"term": entry["term"], "expected": entry["translation"], "glossary": entry["glossary"]}
+            for entry in terms
+            if entry["translation"].lower() not in lowered
+        ]
+
+    def metadata(self, text: str, source: str, target: str, output: str) -> dict[str, Any]:
+        """결과를 검사하고 로그 및 Langfuse 메타데이터용 용어집 정보를 반환합니다 (찾은 용어가 없으면 빈 dict).
+
+        위반이 있으면 경고 로그를 남깁니다.
+        """
+        terms = self.lookup(text, source, target)
+        if not terms:
+            return {}
+        violations = self.check(output, terms)
+        if violations:
+            logger.warning(
+                "용어집 위반",
+                extra={
+                    "direction": f"{source}→{target}",
+                    "violations": [f"{entry['term']}→{entry['expected']}" for entry in violations],
+                    "glossary_versions": self.versions(),
+                }
+            )
+        return {
+            "glossary_terms": len(terms),
+            "glossary_violations": [entry["term"] for entry in violations],
+            "glossary_versions": self.versions(),
+        }
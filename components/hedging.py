@@ -0,0 +1,287 @@
+"""요청 헤징(hedged request) 모듈
+
+번역 응답 시간의 중앙값은 안정적이지만, 가끔 느린 응답이 p99 지연을 크게 늘립니다.
+HedgingPolicy는 요청이 지연 기준 시간 안에 끝나지 않으면 같은 요청을 한 번 더 보내고,
+먼저 성공한 응답을 사용합니다. 비동기 호출은 나머지 요청을 취소하지만, 동기 호출은 이미 전송된
+HTTP 요청을 중단할 수 없으므로 나머지 요청이 끝날 때까지 실행되고 결과만 버립니다.
+스트리밍 번역은 첫 번역문 조각이 도착할 때까지를 하나의 호출로 보고 헤징하며, 늦은 스트림은 on_discard로 닫습니다.
+지연 기준은 고정값(ms) 또는 모델/deployment별 최근 응답 시간의 백분위수(예: p95)이며,
+헤징 비율과 중복 요청으로 추가 사용한 토큰 수를 기록하여 지연과 비용 사이를 조정할 수 있게 합니다.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Optional
+
+from config import Config
+
+logger = logging.getLogger("transbot.hedging")
+
+
+def _usage_tokens(response: Any) -> tuple[int, int]:
+    """응답의 (입력 토큰 수, 출력 토큰 수)를 반환합니다 (알 수 없는 값은 0)."""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    return (
+        prompt_tokens if isinstance(prompt_tokens, int) else 0,
+        completion_tokens if isinstance(completion_tokens, int) else 0,
+    )
+
+
+class HedgingPolicy:
+    """지연 기준 시간이 지나면 중복 요청을 보내는 헤징 정책
+
+    동기 호출은 스레드 풀에서 실행합니다. 이미 시작된 동기 HTTP 요청은 중단할 수 없으므로
+    늦은 요청은 결과만 버리고, 완료되면 실제 사용량을 추가 토큰으로 기록합니다.
+    비동기 호출은 늦은 요청의 태스크를 취소하며, 이미 전송된 입력 토큰을 추가 토큰으로 추정합니다.
+    """
+
+    def __init__(
+        self,
+        delay_ms: int = 0,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        history_size: int = 200,
+        max_workers: int = 32
+    ) -> None:
+        """
+        Args:
+            delay_ms: 중복 요청을 보내기까지 기다릴 시간 (0이면 최근 응답 시간의 백분위수 사용)
+            percentile: 지연 기준으로 사용할 응답 시간 백분위수 (0.0 초과 1.0 미만)
+            min_samples: 백분위수 계산에 필요한 최소 응답 수 (부족하면 헤징하지 않음)
+            history_size: 키별로 보관할 최근 응답 시간 수
+            max_workers: 동기 호출에 사용할 스레드 수
+        """
+        self.delay_ms = max(0, delay_ms)
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.history_size = max(1, history_size)
+        self._latencies: dict[str, deque[float]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedging")
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedged_requests = 0
+        self._hedge_wins = 0
+        self._extra_prompt_tokens = 0
+        self._extra_completion_tokens = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["HedgingPolicy"]:
+        """Config 설정으로 생성합니다 (HEDGING_ENABLED=false이면 None)."""
+        if not config.HEDGING_ENABLED:
+            return None
+        return cls(
+            delay_ms=config.HEDGING_DELAY_MS,
+            percentile=config.HEDGING_PERCENTILE,
+            min_samples=config.HEDGING_MIN_SAMPLES
+        )
+
+    def delay(self, key: str) -> Optional[float]:
+        """중복 요청을 보내기까지 기다릴 시간(초)을 반환합니다.
+
+        Args:
+            key: "provider:모델/deployment" 형식의 키
+
+        Returns:
+            대기 시간 (초) - 백분위수를 계산할 응답 기록이 부족하면 None (헤징하지 않음)
+        """
+        if self.delay_ms:
+            return self.delay_ms / 1000
+
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, math.ceil(self.percentile * len(samples)) - 1)
+        return samples[index]
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        """성공한 응답의 응답 시간을 기록합니다."""
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.history_size)
+            latencies.append(seconds)
+
+    def run(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        hedge_fn: Optional[Callable[[], Any]] = None,
+        can_hedge: Optional[Callable[[], bool]] = None,
+        on_discard: Optional[Callable[[Any], None]] = None
+    ) -> Any:
+        """fn을 실행하고, 지연 기준 시간 안에 끝나지 않으면 중복 요청을 보내 먼저 성공한 결과를 반환합니다.
+
+        결과를 버린 요청이 이미 전송 중이면 중단하지 않고 끝날 때까지 실행됩니다.
+
+        Args:
+            key: "provider:모델/deployment" 형식의 키 (응답 시간 기록 단위)
+            fn: 실제 호출 함수 (chat.completions 응답 반환)
+            hedge_fn: 중복 요청에 사용할 함수 (None이면 fn)
+            can_hedge: 중복 요청 직전에 호출되며, False를 반환하면 중복 요청을 보내지 않음 (요청 한도 확인용)
+            on_discard: 결과를 버린 요청이 성공하면 그 결과로 호출됨 (스트림 닫기 등 정리용)
+
+        Returns:
+            먼저 성공한 호출의 결과
+
+        Raises:
+            Exception: 모든 호출이 실패한 경우 첫 번째 호출의 예외
+        """
+        delay = self.delay(key)
+        futures = [self._executor.submit(self._timed, fn)]
+        if delay is not None and not wait(futures, timeout=delay).done and (can_hedge is None or can_hedge()):
+            futures.append(self._executor.submit(self._timed, hedge_fn or fn))
+
+        winner: Optional[Future] = None
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+
+        for future in futures:
+            # 이미 시작된 요청은 중단할 수 없으므로, 끝나면 사용량을 추가 토큰으로 기록합니다
+            if future is not winner and not future.cancel():
+                future.add_done_callback(lambda done: self._record_discarded(done, on_discard))
+
+        if winner is None:
+            self._finish(key, hedged=len(futures) > 1, hedge_won=False)
+            raise futures[0].exception()
+
+        result, elapsed = winner.result()
+        self.record_latency(key, elapsed)
+        self._finish(key, hedged=len(futures) > 1, hedge_won=winner is not futures[0], delay=delay)
+        return result
+
+    async def run_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        hedge_fn: Optional[Callable[[], Awaitable[Any]]] = None,
+        can_hedge: Optional[Callable[[], bool]] = None,
+        on_discard: Optional[Callable[[Any], Awaitable[None]]] = None
+    ) -> Any:
+        """run()의 비동기 버전입니다 (늦은 요청의 태스크는 취소합니다).
+
+        Args:
+            key: "provider:모델/deployment" 형식의 키
+            fn: 실제 호출 코루틴 함수
+            hedge_fn: 중복 요청에 사용할 코루틴 함수 (None이면 fn)
+            can_hedge: 중복 요청 직전에 호출되며, False를 반환하면 중복 요청을 보내지 않음
+            on_discard: 취소되기 전에 끝난 요청의 결과를 버릴 때 그 결과로 호출되는 코루틴 함수
+
+        Returns:
+            먼저 성공한 호출의 결과
+
+        Raises:
+            Exception: 모든 호출이 실패한 경우 첫 번째 호출의 예외
+        """
+        delay = self.delay(key)
+        tasks = [asyncio.ensure_future(self._timed_async(fn))]
+        winner: Optional[asyncio.Future] = None
+        cancelled: list[asyncio.Future] = []
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and (can_hedge is None or can_hedge()):
+                    tasks.append(asyncio.ensure_future(self._timed_async(hedge_fn or fn)))
+
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+        finally:
+            for task in tasks:
+                if task is not winner and not task.done():
+                    task.cancel()
+                    cancelled.append(task)
+
+        if winner is None:
+            self._finish(key, hedged=len(tasks) > 1, hedge_won=False)
+            raise tasks[0].exception()
+
+        result, elapsed = winner.result()
+        for task in tasks:
+            if task is winner:
+                continue
+            if task in cancelled:
+                # 취소된 요청도 입력 토큰은 이미 전송되었으므로 같은 입력 토큰 수로 추정합니다
+                self._add_extra_tokens(_usage_tokens(result)[0], 0)
+            elif task.exception() is None:
+                self._add_extra_tokens(*_usage_tokens(task.result()[0]))
+                if on_discard is not None:
+                    await on_discard(task.result()[0])
+
+        self.record_latency(key, elapsed)
+        self._finish(key, hedged=len(tasks) > 1, hedge_won=winner is not tasks[0], delay=delay)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """헤징 통계를 반환합니다.
+
+        Returns:
+            {"requests", "hedged_requests", "hedge_rate", "hedge_wins",
+             "extra_prompt_tokens", "extra_completion_tokens", "delay_ms": {키: 현재 지연 기준(ms) 또는 None}}
+        """
+        with self._lock:
+            keys = list(self._latencies)
+            stats = {
+                "requests": self._requests,
+                "hedged_requests": self._hedged_requests,
+                "hedge_rate": round(self._hedged_requests / self._requests, 3) if self._requests else 0.0,
+                "hedge_wins": self._hedge_wins,
+                "extra_prompt_tokens": self._extra_prompt_tokens,
+                "extra_completion_tokens": self._extra_completion_tokens,
+            }
+
+        delays = {key: self.delay(key) for key in keys}
+        stats["delay_ms"] = {key: int(delay * 1000) if delay is not None else None for key, delay in delays.items()}
+        return stats
+
+    @staticmethod
+    def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+        start = time.monotonic()
+        return fn(), time.monotonic() - start
+
+    @staticmethod
+    async def _timed_async(fn: Callable[[], Awaitable[Any]]) -> tuple[Any, float]:
+        start = time.monotonic()
+        return await fn(), time.monotonic() - start
+
+    def _record_discarded(self, future: Future, on_discard: Optional[Callable[[Any], None]] = None) -> None:
+        """결과를 버린 동기 요청이 끝나면 실제 사용량을 추가 토큰으로 기록합니다."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()[0]
+        self._add_extra_tokens(*_usage_tokens(result))
+        if on_discard is not None:
+            on_discard(result)
+
+    def _add_extra_tokens(self, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            self._extra_prompt_tokens += prompt_tokens
+            self._extra_completion_tokens += completion_tokens
+
+    def _finish(self, key: str, hedged: bool, hedge_won: bool, delay: Optional[float] = None) -> None:
+        with self._lock:
+            self._requests += 1
+            if hedged:
+                self._hedged_requests += 1
+            if hedge_won:
+                self._hedge_wins += 1
+            hedge_rate = round(self._hedged_requests / self._requests, 3)
+
+        if hedged:
+            logger.info("중복 요청 전송 (헤징)", extra={
+                "key": key,
+                "delay_ms": int(delay * 1000) if delay is not None else None,
+                "hedge_won": hedge_won,
+                "hedge_rate": hedge_rate
+            })
@@ -1,5 +1,16 @@
 """언어 감지 및 번역 방향 관리 기능을 제공하는 모듈"""
-from utils import detect_language
+import re
+from typing import Any, Iterable, Optional
+
+from config import Config
+from utils import classify_language, count_script_letters, detect_language, detect_many
+
+# 문단: 빈 줄(공백만 있는 줄 포함)까지, 문장: 종결 부호 뒤 공백 또는 줄바꿈까지
+# 구분자(빈 줄, 공백)는 앞 구간에 포함되므로 구간을 이어 붙이면 원문과 같습니다
+_SEGMENT_PATTERNS = {
+    "paragraph": re.compile(r'[\s\S]*?(?:\n[^\S\n]*\n\s*|\Z)'),
+    "sentence": re.compile(r'[\s\S]*?(?:[.!?。]+(?=\s|\Z)\s*|\n\s*|\Z)'),
+}
 
 
 class LanguageDetector:
@@ -30,15 +41,65 @@ class LanguageDetector:
         }
     }
 
-    def __init__(self, threshold: float = 0.5):
+    def __init__(self, threshold: Optional[float] = None, sample_chars: Optional[int] = None):
         """
         Args:
-            threshold: 한국어 감지 임계값 (기본 0.5, 현재 미사용)
+            threshold: 한국어 감지 임계값 (None이면 Config의 LANGUAGE_DETECTION_THRESHOLD 사용)
+            sample_chars: 이보다 긴 텍스트는 구간별 표본만 읽어 감지 (None이면 항상 전체 사용)
         """
-        self.threshold = threshold
+        self.threshold = threshold if threshold is not None else Config.get().LANGUAGE_DETECTION_THRESHOLD
+        self.sample_chars = sample_chars
 
     def detect(self, text: str) -> str:
-        return detect_language(text)
+        return detect_language(text, self.threshold, self.sample_chars)
+
+    def detect_many(self, texts: Iterable[str]) -> list[str]:
+        return detect_many(texts, self.threshold, self.sample_chars)
+
+    def label(self, text: str) -> dict[str, Any]:
+        """텍스트의 언어와 신뢰도를 반환합니다.
+
+        신뢰도는 한글 음절과 ASCII 영문자 중 감지된 언어의 문자가 차지하는 비율입니다.
+        인용된 영문 메일처럼 한 언어로만 쓰인 구간은 1.0에 가깝고, 두 언어가 섞인 구간은 낮아집니다.
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            {"language": 감지된 언어, "confidence": 0.0~1.0 (문자가 없으면 0.0)}
+        """
+        korean_chars, english_chars = count_script_letters(text)
+        language = classify_language(korean_chars, english_chars, self.threshold)
+        if language == "unknown":
+            return {"language": language, "confidence": 0.0}
+        matched = korean_chars if language == "Korean" else english_chars
+        return {"language": language, "confidence": matched / (korean_chars + english_chars)}
+
+    def detect_segments(self, text: str, granularity: str = "paragraph") -> list[dict[str, Any]]:
+        """텍스트를 문단 또는 문장 단위로 나누어 구간별 언어를 감지합니다.
+
+        한국어 문서에 영문 메일 인용, 코드 주석 등이 섞여 있으면 문서 전체의 언어 하나로는
+        어느 부분을 번역해야 하는지 알 수 없으므로 구간마다 언어와 신뢰도를 붙입니다.
+
+        Args:
+            text: 입력 텍스트
+            granularity: 구간 단위 ("paragraph" 또는 "sentence")
+
+        Returns:
+            [{"text": 구간 원문, "language": 감지된 언어, "confidence": 신뢰도}, ...]
+            (구간을 이어 붙이면 원문과 같음)
+
+        Raises:
+            ValueError: 지원하지 않는 구간 단위인 경우
+        """
+        pattern = _SEGMENT_PATTERNS.get(granularity)
+        if pattern is None:
+            raise ValueError(f"지원하지 않는 구간 단위입니다: {granularity}")
+        return [
+            {"text": segment, **self.label(segment)}
+            for segment in pattern.findall(text)
+            if segment
+        ]
 
     def get_translation_direction(self, text: str) -> tuple[str, str, str]:
         """텍스트를 분석하여 번역 방향을 결정합니다.
@@ -50,7 +111,31 @@ class LanguageDetector:
             (source_lang, target_lang, direction_arrow) 튜플
             예: ("Korean", "English", "🇰🇷 → 🇺🇸")
         """
-        detected = self.detect(text)
+        return self._get_direction(self.detect(text))
+
+    def detect_from_statistics(self, statistics: dict) -> str:
+        """증분 통계의 한글/영문자 수로 언어를 감지합니다.
+
+        Args:
+            statistics: IncrementalTextStatistics.update() 결과 ("korean_chars", "english_chars" 포함)
+
+        Returns:
+            감지된 언어 ("Korean", "English", "unknown")
+        """
+        return classify_language(statistics["korean_chars"], statistics["english_chars"], self.threshold)
+
+    def get_translation_direction_from_statistics(self, statistics: dict) -> tuple[str, str, str]:
+        """증분 통계로 번역 방향을 결정합니다. 텍스트 전체를 다시 스캔하지 않습니다.
+
+        Args:
+            statistics: IncrementalTextStatistics.update() 결과
+
+        Returns:
+            (source_lang, target_lang, direction_arrow) 튜플
+        """
+        return self._get_direction(self.detect_from_statistics(statistics))
+
+    def _get_direction(self, detected: str) -> tuple[str, str, str]:
         config = self.DIRECTION_CONFIG.get(detected, self.DIRECTION_CONFIG["unknown"])
         return (config["source"], config["target"], config["arrow"])
 
@@ -1,16 +1,44 @@
 """LLM 관찰성 모듈
 
 Langfuse @observe 데코레이터를 통한 LLM 사용 추적 및 모니터링 기능을 제공합니다.
+
+추적 데이터는 기본적으로 백그라운드로 전송됩니다(LANGFUSE_FLUSH_MODE=background).
+Langfuse SDK의 전송 스레드가 큐에 쌓인 이벤트를 LANGFUSE_FLUSH_AT개 또는
+LANGFUSE_FLUSH_INTERVAL초 단위로 묶어 보내므로, 번역 경로에서는 전송을 기다리지 않습니다.
+
+SDK 전송 큐의 상한은 공개 설정으로 바꿀 수 없으므로, 큐 상한과 버림 집계는 SDK 내부 대신
+traced 데코레이터(번역 경로의 @observe 래퍼)에서 적용합니다. 완료된 추적 중 전송이 확인되지 않은
+추적이 LANGFUSE_MAX_QUEUE_SIZE개에 도달하면 새 호출은 추적 없이 실행하고 개수를 집계합니다.
+전송 확인은 공개 API인 flush()로 하며, background 모드에서는 별도 스레드가 주기적으로 수행합니다.
+프로세스 종료 시 남은 이벤트를 전송합니다.
 """
 
+import atexit
+import functools
+import inspect
 import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 
-from langfuse.decorators import langfuse_context
+from langfuse.decorators import langfuse_context, observe
 
 from config import Config
 
 logger = logging.getLogger("transbot.observability")
 
+# 전송 상태 (configure_langfuse에서 설정)
+_enabled = False
+_flush_synchronously = False
+_flush_interval = Config._DEFAULT_LANGFUSE_FLUSH_INTERVAL
+_max_queue_size = Config._DEFAULT_LANGFUSE_MAX_QUEUE_SIZE
+_queued_traces = 0
+_dropped_traces = 0
+_exporter: Optional[threading.Thread] = None
+_shutdown_registered = False
+_stats_lock = threading.Lock()
+_flush_lock = threading.Lock()
+
 
 def configure_langfuse(config: Config) -> bool:
     """Langfuse 클라이언트를 설정합니다.
@@ -25,6 +53,13 @@ def configure_langfuse(config: Config) -> bool:
     Returns:
         bool: Langfuse 활성화 여부
     """
+    global _enabled, _flush_synchronously, _flush_interval, _max_queue_size
+
+    _enabled = False
+    _flush_synchronously = config.LANGFUSE_FLUSH_MODE == "sync"
+    _flush_interval = config.LANGFUSE_FLUSH_INTERVAL
+    _max_queue_size = config.LANGFUSE_MAX_QUEUE_SIZE
+
     if not config.langfuse_enabled:
         langfuse_context.configure(enabled=False)
         return False
@@ -35,8 +70,14 @@ def configure_langfuse(config: Config) -> bool:
             secret_key=config.LANGFUSE_SECRET_KEY,
             host=config.LANGFUSE_HOST,
             timeout=5,
+            flush_at=config.LANGFUSE_FLUSH_AT,
+            flush_interval=config.LANGFUSE_FLUSH_INTERVAL,
             enabled=True,
         )
+        _enabled = True
+        if not _flush_synchronously:
+            _start_exporter()
+        _register_shutdown()
         return True
     except Exception as e:
         logger.warning("Langfuse 초기화 실패 (추적 비활성화)", extra={
@@ -44,4 +85,171 @@ def configure_langfuse(config: Config) -> bool:
             "error_message": str(e)
         }, exc_info=True)
         langfuse_context.configure(enabled=False)
-        return False
\ No newline at end of file
+        return False
+
+
+def traced(name: str, as_type: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """LANGFUSE_MAX_QUEUE_SIZE 상한을 적용하는 @observe 래퍼입니다.
+
+    전송이 확인되지 않은 추적이 상한에 도달하면 함수를 추적 없이 실행하고 버린 추적 수를 집계합니다.
+    추적은 호출이 끝날 때(제너레이터는 소진될 때) 전송 대기 수에 더해집니다.
+
+    Args:
+        name: Langfuse observation 이름
+        as_type: observation 종류 (예: "generation")
+
+    Returns:
+        함수 데코레이터 (일반 함수, 코루틴 함수, 제너레이터 및 비동기 제너레이터 함수 지원)
+    """
+    def decorator(func: Callable) -> Callable:
+        observed = observe(name=name, as_type=as_type)(func)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _reserve_trace():
+                    return await func(*args, **kwargs)
+                try:
+                    return await observed(*args, **kwargs)
+                finally:
+                    _record_trace()
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _reserve_trace():
+                return func(*args, **kwargs)
+            try:
+                result = observed(*args, **kwargs)
+            except BaseException:
+                _record_trace()
+                raise
+            if inspect.isgenerator(result):
+                return _record_when_exhausted(result)
+            if inspect.isasyncgen(result):
+                return _record_when_exhausted_async(result)
+            _record_trace()
+            return result
+        return wrapper
+
+    return decorator
+
+
+def flush_observations() -> None:
+    """추적 데이터 전송을 요청합니다.
+
+    sync 모드에서는 큐의 이벤트가 모두 전송될 때까지 기다리고,
+    background 모드에서는 전송 스레드에 맡기고 바로 반환합니다.
+    """
+    if _flush_synchronously:
+        _flush_completed_traces()
+
+
+def get_observability_stats() -> dict[str, Any]:
+    """추적 데이터 전송 큐 통계를 반환합니다.
+
+    Returns:
+        {"flush_mode": str, "queued_traces": int, "dropped_traces": int, "max_queue_size": int}
+    """
+    with _stats_lock:
+        return {
+            "flush_mode": "sync" if _flush_synchronously else "background",
+            "queued_traces": _queued_traces,
+            "dropped_traces": _dropped_traces,
+            "max_queue_size": _max_queue_size,
+        }
+
+
+def shutdown_langfuse() -> None:
+    """남은 추적 데이터를 모두 전송합니다 (프로세스 종료 시 호출)."""
+    try:
+        _flush_completed_traces()
+    except Exception as e:
+        logger.warning("Langfuse 종료 전송 실패", extra={
+            "error_type": type(e).__name__,
+            "error_message": str(e)
+        })
+        return
+
+    stats = get_observability_stats()
+    if stats["dropped_traces"]:
+        logger.warning("전송 큐 초과로 버려진 추적이 있습니다", extra=stats)
+
+
+def _reserve_trace() -> bool:
+    """새 호출을 추적해도 되는지 확인합니다 (상한 초과 시 버림으로 집계하고 False)."""
+    global _dropped_traces
+    if not _enabled:
+        return True
+    with _stats_lock:
+        if _queued_traces >= _max_queue_size:
+            _dropped_traces += 1
+            return False
+    return True
+
+
+def _record_trace() -> None:
+    """끝난 추적을 전송 대기 수에 더합니다."""
+    global _queued_traces
+    if not _enabled:
+        return
+    with _stats_lock:
+        _queued_traces += 1
+
+
+def _record_when_exhausted(generator: Iterator[Any]) -> Iterator[Any]:
+    """제너레이터가 끝나면 추적을 기록합니다 (스트리밍 추적은 소진될 때 전송 큐에 들어감)."""
+    try:
+        yield from generator
+    finally:
+        _record_trace()
+
+
+async def _record_when_exhausted_async(generator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """_record_when_exhausted()의 비동기 제너레이터 버전입니다."""
+    try:
+        async for item in generator:
+            yield item
+    finally:
+        _record_trace()
+
+
+def _flush_completed_traces() -> None:
+    """flush() 시작 전에 끝난 추적을 전송하고 전송 대기 수에서 뺍니다."""
+    global _queued_traces
+    with _flush_lock:
+        with _stats_lock:
+            pending = _queued_traces
+        langfuse_context.flush()
+        with _stats_lock:
+            _queued_traces -= pending
+
+
+def _start_exporter() -> None:
+    """LANGFUSE_FLUSH_INTERVAL마다 전송을 확인하는 백그라운드 스레드를 시작합니다."""
+    global _exporter
+    if _exporter is not None and _exporter.is_alive():
+        return
+
+    def run() -> None:
+        while True:
+            time.sleep(_flush_interval)
+            if not _queued_traces:
+                continue
+            try:
+                _flush_completed_traces()
+            except Exception as e:
+                logger.warning("Langfuse 전송 확인 실패", extra={
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                })
+
+    _exporter = threading.Thread(target=run, name="langfuse-exporter", daemon=True)
+    _exporter.start()
+
+
+def _register_shutdown() -> None:
+    global _shutdown_registered
+    if not _shutdown_registered:
+        atexit.register(shutdown_langfuse)
+        _shutdown_registered = True
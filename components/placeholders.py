@@ -0,0 +1,142 @@
+"""번역하지 않는 구간의 플레이스홀더 보호 모듈
+
+코드 블록, 인라인 코드, URL, 이미지, HTML 태그는 번역하지 않아야 하지만 그대로 모델에 보내면
+입력/출력 토큰을 그대로 소모하고, 모델이 코드를 번역하거나 URL을 고치는 등 내용이 손상될 수 있습니다.
+PlaceholderProtector는 번역 전에 이런 구간을 짧은 플레이스홀더(⟦0⟧, ⟦1⟧, ...)로 바꾸고,
+번역 후 원래 내용으로 되돌리며 모든 플레이스홀더가 정확히 한 번씩 돌아왔는지 검증합니다.
+"""
+
+import re
+from typing import Iterator, Optional
+
+from config import Config
+from utils import find_protected_spans
+
+PLACEHOLDER_OPEN = "⟦"
+PLACEHOLDER_CLOSE = "⟧"
+# 모델이 괄호 안에 공백을 넣어도 인식합니다
+_PLACEHOLDER_PATTERN = re.compile(rf'{PLACEHOLDER_OPEN}\s*(\d+)\s*{PLACEHOLDER_CLOSE}')
+# 스트리밍 중 닫히지 않은 플레이스홀더를 기다릴 최대 글자 수 (넘으면 플레이스홀더가 아닌 것으로 봄)
+_MAX_PENDING_CHARS = 16
+
+PLACEHOLDER_INSTRUCTION = (
+    f"\n\nTokens like {PLACEHOLDER_OPEN}0{PLACEHOLDER_CLOSE} are placeholders for code, URLs or markup. "
+    "Keep every placeholder exactly as it is, once each, in the matching position of the translation."
+)
+
+
+def _replace_placeholders(text: str, spans: list[str], counts: list[int], unknown: list[int]) -> str:
+    """플레이스홀더를 원래 구간으로 바꾸고 번호별 등장 횟수(counts)와 알 수 없는 번호(unknown)를 기록합니다."""
+    def replace(match: re.Match) -> str:
+        index = int(match.group(1))
+        if index >= len(spans):
+            unknown.append(index)
+            return match.group(0)
+        counts[index] += 1
+        return spans[index]
+
+    return _PLACEHOLDER_PATTERN.sub(replace, text)
+
+
+class PlaceholderProtector:
+    """번역하지 않는 구간을 플레이스홀더로 바꾸고 되돌리는 클래스"""
+
+    def __init__(self, min_chars: int = 8) -> None:
+        """
+        Args:
+            min_chars: 플레이스홀더로 바꿀 최소 구간 길이 (더 짧은 구간은 플레이스홀더가 토큰을 더 쓰므로 그대로 둠)
+        """
+        self.min_chars = min_chars
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["PlaceholderProtector"]:
+        """Config 설정으로 생성합니다 (PLACEHOLDER_PROTECTION_ENABLED가 꺼져 있으면 None)."""
+        if not config.PLACEHOLDER_PROTECTION_ENABLED:
+            return None
+        return cls(min_chars=config.PLACEHOLDER_MIN_CHARS)
+
+    def protect(self, text: str) -> tuple[str, list[str]]:
+        """번역하지 않는 구간을 플레이스홀더로 바꿉니다.
+
+        입력에 이미 플레이스홀더 괄호 문자가 있으면 되돌릴 때 혼동되므로 바꾸지 않습니다.
+
+        Args:
+            text: 번역할 텍스트
+
+        Returns:
+            (플레이스홀더로 바꾼 텍스트, 플레이스홀더 번호 순서의 원래 구간 리스트)
+        """
+        if PLACEHOLDER_OPEN in text or PLACEHOLDER_CLOSE in text:
+            return text, []
+
+        parts = []
+        spans: list[str] = []
+        position = 0
+        for start, end in find_protected_spans(text):
+            if end - start < self.min_chars:
+                continue
+            parts.append(text[position:start])
+            parts.append(f"{PLACEHOLDER_OPEN}{len(spans)}{PLACEHOLDER_CLOSE}")
+            spans.append(text[start:end])
+            position = end
+        if not spans:
+            return text, []
+        parts.append(text[position:])
+        return "".join(parts), spans
+
+    @staticmethod
+    def restore(text: str, spans: list[str]) -> tuple[str, list[int]]:
+        """플레이스홀더를 원래 구간으로 되돌립니다.
+
+        Args:
+            text: 번역 결과
+            spans: protect가 반환한 원래 구간 리스트
+
+        Returns:
+            (되돌린 텍스트, 누락/중복/알 수 없는 플레이스홀더 번호 리스트 - 비어 있으면 검증 통과)
+        """
+        counts = [0] * len(spans)
+        unknown: list[int] = []
+        restored = _replace_placeholders(text, spans, counts, unknown)
+        invalid = [index for index, count in enumerate(counts) if count != 1]
+        return restored, invalid + unknown
+
+    @staticmethod
+    def restore_stream(chunks: Iterator[str], spans: list[str], invalid: list[int]) -> Iterator[str]:
+        """스트리밍 번역 조각의 플레이스홀더를 되돌리며 내보냅니다.
+
+        플레이스홀더가 조각 사이에 걸쳐 도착할 수 있으므로 닫히지 않은 플레이스홀더 부분만 잠시 보관합니다.
+        스트림이 끝나면 검증에 실패한 플레이스홀더 번호를 invalid에 채웁니다.
+
+        Args:
+            chunks: 번역 결과 조각
+            spans: protect가 반환한 원래 구간 리스트
+            invalid: 검증 결과를 받을 리스트 (누락/중복/알 수 없는 플레이스홀더 번호)
+
+        Yields:
+            플레이스홀더를 되돌린 번역 결과 조각
+        """
+        counts = [0] * len(spans)
+        pending = ""
+
+        for chunk in chunks:
+            pending += chunk
+            open_at = pending.rfind(PLACEHOLDER_OPEN)
+            if open_at != -1 and PLACEHOLDER_CLOSE not in pending[open_at:] \
+                    and len(pending) - open_at <= _MAX_PENDING_CHARS:
+                ready, pending = pending[:open_at], pending[open_at:]
+            else:
+                ready, pending = pending, ""
+            if ready:
+                yield _replace_placeholders(ready, spans, counts, invalid)
+
+        if pending:
+            yield _replace_placeholders(pending, spans, counts, invalid)
+        invalid[:0] = [index for index, count in enumerate(counts) if count != 1]
+
+    @staticmethod
+    def format_prompt(text: str) -> str:
+        """입력에 플레이스홀더가 있으면 시스템 프롬프트에 덧붙일 보존 지시문을 반환합니다 (없으면 빈 문자열)."""
+        if _PLACEHOLDER_PATTERN.search(text) is None:
+            return ""
+        return PLACEHOLDER_INSTRUCTION
@@ -0,0 +1,246 @@
+"""프롬프트 템플릿 레지스트리 모듈
+
+시스템 프롬프트를 버전이 있는 템플릿으로 관리합니다.
+템플릿은 모든 요청에 공통인 정적 지침을 앞에, 언어/스타일 등 가변 부분을 뒤에 둡니다.
+정적 부분은 등록 시 한 번만 만들어지고, 요청마다 가변 부분만 채워 붙입니다.
+
+OpenAI/Azure의 프롬프트 캐싱은 1024 토큰 이상의 같은 앞부분(prefix)에만 적용됩니다.
+현재 정적 지침은 수십 토큰 정도라 그 자체로는 캐시 대상이 아니며,
+cached_prompt_tokens로 실제 캐시 적용 여부를 확인할 수 있습니다.
+
+프롬프트 내용을 바꿀 때는 새 버전으로 등록합니다. 버전은 번역 캐시 키에 포함되므로
+버전이 바뀌면 이전 프롬프트로 만든 캐시 결과는 사용되지 않습니다.
+v1은 템플릿 도입 전의 원래 프롬프트이며, PROMPT_VERSION 설정으로 비교하거나 되돌릴 수 있습니다.
+"""
+
+import logging
+from typing import Any, Optional
+
+from config import Config
+
+logger = logging.getLogger("transbot.prompts")
+
+
+class PromptTemplate:
+    """버전이 있는 시스템 프롬프트 템플릿"""
+
+    def __init__(self, name: str, version: str, static: str, variable: str = "") -> None:
+        """
+        Args:
+            name: 템플릿 이름 (예: "translation")
+            version: 템플릿 버전 (예: "v2")
+            static: 모든 요청에 공통인 정적 지침 (프롬프트 앞부분)
+            variable: str.format 형식의 가변 부분 (프롬프트 뒷부분)
+        """
+        self.name = name
+        self.version = version
+        self.static = static
+        self.variable = variable
+
+    def render(self, **values: Any) -> str:
+        """가변 부분을 채워 시스템 프롬프트를 만듭니다.
+
+        Args:
+            **values: 가변 부분에 채울 값
+
+        Returns:
+            정적 지침 + 가변 부분
+        """
+        return self.static + self.variable.format(**values)
+
+
+class PromptRegistry:
+    """프롬프트 템플릿 레지스트리
+
+    이름별로 여러 버전을 등록할 수 있으며, 버전을 지정하지 않으면 활성 버전을 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[str, dict[str, PromptTemplate]] = {}
+        self._active: dict[str, str] = {}
+
+    def register(self, template: PromptTemplate, activate: bool = True) -> PromptTemplate:
+        """템플릿을 등록합니다.
+
+        Args:
+            template: 등록할 템플릿
+            activate: True이면 등록한 버전을 활성 버전으로 설정
+
+        Returns:
+            등록한 템플릿
+
+        Raises:
+            ValueError: 같은 이름과 버전의 템플릿이 이미 등록된 경우
+        """
+        versions = self._templates.setdefault(template.name, {})
+        if template.version in versions:
+            raise ValueError(f"이미 등록된 프롬프트 템플릿입니다: {template.name} {template.version}")
+
+        versions[template.version] = template
+        if activate or template.name not in self._active:
+            self._active[template.name] = template.version
+        return template
+
+    def get(self, name: str, version: Optional[str] = None) -> PromptTemplate:
+        """템플릿을 조회합니다.
+
+        Args:
+            name: 템플릿 이름
+            version: 템플릿 버전 (None이면 활성 버전)
+
+        Returns:
+            PromptTemplate
+
+        Raises:
+            ValueError: 등록되지 않은 템플릿인 경우
+        """
+        version = version if version is not None else self._active.get(name)
+        template = self._templates.get(name, {}).get(version or "")
+        if template is None:
+            raise ValueError(f"등록되지 않은 프롬프트 템플릿입니다: {name} {version}")
+        return template
+
+    def activate(self, name: str, version: str) -> None:
+        """활성 버전을 변경합니다 (이전 버전으로 되돌릴 때 사용).
+
+        Raises:
+            ValueError: 등록되지 않은 템플릿인 경우
+        """
+        self.get(name, version)
+        self._active[name] = version
+
+    def versions(self, name: str) -> list[str]:
+        return list(self._templates.get(name, {}))
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """응답 usage에서 프롬프트 캐시로 처리된 입력 토큰 수를 읽습니다.
+
+    usage.prompt_tokens_details.cached_tokens를 지원하지 않는 API 버전이나 모델에서는 0을 반환합니다.
+
+    Args:
+        usage: chat.completions 응답의 usage 객체
+
+    Returns:
+        캐시된 입력 토큰 수
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None)
+    return cached_tokens if isinstance(cached_tokens, int) else 0
+
+
+def prompt_cache_stats(usage: Any) -> dict[str, int]:
+    """로그용 입력 토큰 수와 프롬프트 캐시 토큰 수를 반환합니다 (알 수 없는 값은 0).
+
+    Args:
+        usage: chat.completions 응답의 usage 객체
+
+    Returns:
+        {"prompt_tokens": int, "cached_prompt_tokens": int}
+    """
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    return {
+        "prompt_tokens": prompt_tokens if isinstance(prompt_tokens, int) else 0,
+        "cached_prompt_tokens": cached_prompt_tokens(usage),
+    }
+
+
+PROMPT_REGISTRY = PromptRegistry()
+
+# v1: 템플릿 도입 전 프롬프트 (언어가 문장 중간에 들어가므로 전체가 가변 부분)
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="translation",
+    version="v1",
+    static="",
+    variable=(
+        "You are a professional translator. Translate the following {source} text to {target}. "
+        "IMPORTANT: Preserve all Markdown formatting (bold, italic, headings, lists, links, code blocks, "
+        "blockquotes, tables, etc.) in the translation. Only respond with the translation, nothing else."
+    )
+))
+
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="style_translation",
+    version="v1",
+    static="",
+    variable=(
+        "You are a professional translator. Translate the following {source} text to {target}.\n"
+        "IMPORTANT: Preserve all Markdown formatting exactly as it appears in the original text.\n\n"
+        "STYLE INSTRUCTION: {style_instruction}{proper_noun_instruction}\n\n"
+        "Only respond with the translation, nothing else."
+    )
+))
+
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="style_translation_batch",
+    version="v1",
+    static="",
+    variable=(
+        "You are a professional translator. Translate the following {source} text to {target} "
+        "once for each of the styles below.\n"
+        "IMPORTANT: Preserve all Markdown formatting exactly as it appears in the original text."
+        "{proper_noun_instruction}\n\n"
+        "STYLES:\n{style_lines}\n{alternatives_instruction}\n"
+        "Respond with a JSON object only, using the style keys exactly as given:\n{response_shape}"
+    )
+))
+
+# v2: 정적 지침을 앞에 두고 언어/스타일을 뒤에 둔 프롬프트
+
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="translation",
+    version="v2",
+    static=(
+        "You are a professional translator. Translate the user's text from the source language "
+        "to the target language given at the end of this message. IMPORTANT: Preserve all Markdown formatting "
+        "(bold, italic, headings, lists, links, code blocks, blockquotes, tables, etc.) in the translation. "
+        "Only respond with the translation, nothing else."
+    ),
+    variable="\n\nSource language: {source}\nTarget language: {target}"
+))
+
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="style_translation",
+    version="v2",
+    static=(
+        "You are a professional translator. Translate the user's text from the source language "
+        "to the target language given at the end of this message, following the style instruction.\n"
+        "IMPORTANT: Preserve all Markdown formatting exactly as it appears in the original text.\n"
+        "Only respond with the translation, nothing else."
+    ),
+    variable=(
+        "\n\nSource language: {source}\nTarget language: {target}\n"
+        "STYLE INSTRUCTION: {style_instruction}{proper_noun_instruction}"
+    )
+))
+
+PROMPT_REGISTRY.register(PromptTemplate(
+    name="style_translation_batch",
+    version="v2",
+    static=(
+        "You are a professional translator. Translate the user's text from the source language "
+        "to the target language given at the end of this message, once for each of the listed styles.\n"
+        "IMPORTANT: Preserve all Markdown formatting exactly as it appears in the original text.\n"
+        "Respond with a JSON object only, using the style keys exactly as given."
+    ),
+    variable=(
+        "\n\nSource language: {source}\nTarget language: {target}{proper_noun_instruction}\n\n"
+        "STYLES:\n{style_lines}\n{alternatives_instruction}\n"
+        "Response format:\n{response_shape}"
+    )
+))
+
+
+def configure_prompts(config: Config) -> None:
+    """설정한 프롬프트 버전을 모든 기본 템플릿의 활성 버전으로 설정합니다.
+
+    Args:
+        config: 설정 객체 (PROMPT_VERSION 사용)
+
+    Raises:
+        ValueError: 등록되지 않은 버전인 경우
+    """
+    for name in ("translation", "style_translation", "style_translation_batch"):
+        PROMPT_REGISTRY.activate(name, config.PROMPT_VERSION)
+
+    logger.info("프롬프트 버전 설정", extra={"prompt_version": config.PROMPT_VERSION})
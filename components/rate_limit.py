@@ -0,0 +1,262 @@
+"""클라이언트 측 요청 한도(RPM/TPM) 제한 모듈
+
+SDK의 max_retries만으로는 부하가 몰릴 때 429 응답과 재시도가 한꺼번에 반복됩니다.
+RateLimiter는 provider + 모델/deployment별 토큰 버킷으로 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 제한하고,
+한도를 넘는 요청은 바로 보내지 않고 대기시킵니다 (대기 시간 초과 시 RateLimitTimeout).
+TPM은 Azure/OpenAI와 같은 방식으로 추정 입력 토큰 + max_tokens를 차감합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from components.tokens import TokenCounter
+from config import Config
+
+logger = logging.getLogger("transbot.rate_limit")
+
+
+class RateLimitTimeout(TimeoutError):
+    """요청 한도 대기 시간을 초과한 경우 발생하는 예외"""
+
+
+class RateLimiter:
+    """provider + 모델/deployment별 RPM/TPM 토큰 버킷 제한기
+
+    버킷 용량은 분당 한도이며 초당 (한도 / 60)씩 채워집니다. 한도가 0이면 해당 항목은 제한하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        timeout: float = 30.0,
+        overrides: Optional[dict[str, tuple[int, int]]] = None,
+        token_counter: Optional[TokenCounter] = None
+    ) -> None:
+        """
+        Args:
+            rpm: 기본 분당 요청 수 한도 (0이면 제한 없음)
+            tpm: 기본 분당 토큰 수 한도 (0이면 제한 없음)
+            timeout: 최대 대기 시간 (초)
+            overrides: 모델/deployment 이름별 (RPM, TPM) 한도
+            token_counter: 입력 토큰 추정에 사용할 TokenCounter (None이면 문자 수로 추정)
+        """
+        self.rpm = max(0, rpm)
+        self.tpm = max(0, tpm)
+        self.timeout = timeout
+        self.overrides = dict(overrides or {})
+        self.token_counter = token_counter
+        self._buckets: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config, token_counter: Optional[TokenCounter] = None) -> Optional["RateLimiter"]:
+        """Config 설정으로 생성합니다 (설정된 한도가 없으면 None)."""
+        overrides = config.parse_rate_limit_overrides(config.RATE_LIMIT_OVERRIDES)
+        if not config.RATE_LIMIT_RPM and not config.RATE_LIMIT_TPM and not overrides:
+            return None
+        return cls(
+            rpm=config.RATE_LIMIT_RPM,
+            tpm=config.RATE_LIMIT_TPM,
+            timeout=config.RATE_LIMIT_TIMEOUT_SECONDS,
+            overrides=overrides,
+            token_counter=token_counter
+        )
+
+    def estimate_tokens(self, messages: list[dict[str, str]], max_tokens: int, model: str) -> int:
+        """요청이 TPM에서 차감될 토큰 수(추정 입력 토큰 + max_tokens)를 계산합니다."""
+        if self.token_counter is not None:
+            prompt_tokens = sum(
+                self.token_counter.count(message["content"], model, approximate=None) for message in messages
+            )
+        else:
+            # 토큰 카운터가 없으면 문자 수를 상한으로 사용합니다 (한국어는 대략 문자당 1토큰)
+            prompt_tokens = sum(len(message["content"]) for message in messages)
+        return prompt_tokens + max_tokens
+
+    def acquire(
+        self,
+        provider: str,
+        name: str,
+        tokens: int,
+        timeout: Optional[float] = None,
+        on_wait: Optional[Callable[[float], None]] = None
+    ) -> float:
+        """요청 한도를 확보할 때까지 대기합니다.
+
+        Args:
+            provider: "openai" 또는 "azure"
+            name: 모델명 또는 deployment 이름
+            tokens: 차감할 토큰 수 (estimate_tokens 결과)
+            timeout: 최대 대기 시간 (None이면 기본값)
+            on_wait: 대기가 필요할 때 예상 대기 시간(초)으로 한 번 호출되는 콜백 (UI 표시용)
+
+        Returns:
+            실제 대기 시간 (초)
+
+        Raises:
+            RateLimitTimeout: 최대 대기 시간 안에 한도를 확보하지 못한 경우
+        """
+        key = f"{provider}:{name}"
+        start = time.monotonic()
+        deadline = start + (timeout if timeout is not None else self.timeout)
+        waiting = False
+        notified = False
+
+        try:
+            while True:
+                wait = self._reserve(key, name, tokens, waiting)
+                if wait <= 0:
+                    return self._finish(key, time.monotonic() - start, waiting)
+
+                waiting = True
+                remaining = deadline - time.monotonic()
+                if wait > remaining:
+                    self._timeout(key, tokens, time.monotonic() - start)
+
+                if on_wait is not None and not notified:
+                    notified = True
+                    on_wait(wait)
+                time.sleep(wait)
+        finally:
+            if waiting:
+                self._leave_queue(key)
+
+    def try_acquire(self, provider: str, name: str, tokens: int) -> bool:
+        """대기 없이 요청 한도를 확보합니다 (헤징의 중복 요청처럼 한도가 남을 때만 보내는 요청용).
+
+        한도가 부족해도 대기열에 들어가지 않으며 대기 시간 초과로 집계하지 않습니다.
+
+        Args:
+            provider: "openai" 또는 "azure"
+            name: 모델명 또는 deployment 이름
+            tokens: 차감할 토큰 수 (estimate_tokens 결과)
+
+        Returns:
+            한도를 확보했으면 True, 부족하면 False
+        """
+        key = f"{provider}:{name}"
+        # waiting=True로 예약하면 한도가 부족해도 대기열 깊이를 늘리지 않습니다
+        if self._reserve(key, name, tokens, waiting=True) > 0:
+            return False
+        self._finish(key, 0.0, waiting=False)
+        return True
+
+    async def acquire_async(self, provider: str, name: str, tokens: int, timeout: Optional[float] = None) -> float:
+        """acquire()의 비동기 버전입니다 (이벤트 루프를 막지 않고 대기)."""
+        key = f"{provider}:{name}"
+        start = time.monotonic()
+        deadline = start + (timeout if timeout is not None else self.timeout)
+        waiting = False
+
+        try:
+            while True:
+                wait = self._reserve(key, name, tokens, waiting)
+                if wait <= 0:
+                    return self._finish(key, time.monotonic() - start, waiting)
+
+                waiting = True
+                if wait > deadline - time.monotonic():
+                    self._timeout(key, tokens, time.monotonic() - start)
+                await asyncio.sleep(wait)
+        finally:
+            if waiting:
+                self._leave_queue(key)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """키별 대기열 통계를 반환합니다.
+
+        Returns:
+            {"provider:name": {"queue_depth", "requests", "waited_requests", "avg_wait_ms", "max_wait_ms", "timeouts"}}
+        """
+        with self._lock:
+            return {
+                key: {
+                    "queue_depth": bucket["queue_depth"],
+                    "requests": bucket["requests"],
+                    "waited_requests": bucket["waited_requests"],
+                    "avg_wait_ms": int(bucket["total_wait"] * 1000 / bucket["requests"]) if bucket["requests"] else 0,
+                    "max_wait_ms": int(bucket["max_wait"] * 1000),
+                    "timeouts": bucket["timeouts"],
+                }
+                for key, bucket in self._buckets.items()
+            }
+
+    def limits_for(self, name: str) -> tuple[int, int]:
+        return self.overrides.get(name, (self.rpm, self.tpm))
+
+    def _reserve(self, key: str, name: str, tokens: int, waiting: bool) -> float:
+        """한도가 남아 있으면 차감하고 0을, 부족하면 필요한 대기 시간(초)을 반환합니다."""
+        rpm, tpm = self.limits_for(name)
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = {
+                    "request_level": float(rpm),
+                    "token_level": float(tpm),
+                    "updated": now,
+                    "queue_depth": 0,
+                    "requests": 0,
+                    "waited_requests": 0,
+                    "total_wait": 0.0,
+                    "max_wait": 0.0,
+                    "timeouts": 0,
+                }
+                self._buckets[key] = bucket
+
+            # 경과 시간만큼 버킷을 채웁니다 (용량 = 분당 한도)
+            elapsed = now - bucket["updated"]
+            bucket["updated"] = now
+            bucket["request_level"] = min(float(rpm), bucket["request_level"] + elapsed * rpm / 60)
+            bucket["token_level"] = min(float(tpm), bucket["token_level"] + elapsed * tpm / 60)
+
+            # 분당 한도보다 큰 요청은 버킷이 가득 찼을 때 보낼 수 있도록 용량만큼만 차감합니다
+            needed_tokens = min(tokens, tpm)
+            wait = 0.0
+            if rpm and bucket["request_level"] < 1:
+                wait = max(wait, (1 - bucket["request_level"]) * 60 / rpm)
+            if tpm and bucket["token_level"] < needed_tokens:
+                wait = max(wait, (needed_tokens - bucket["token_level"]) * 60 / tpm)
+
+            if wait <= 0:
+                if rpm:
+                    bucket["request_level"] -= 1
+                if tpm:
+                    bucket["token_level"] -= needed_tokens
+            elif not waiting:
+                bucket["queue_depth"] += 1
+
+            return wait
+
+    def _finish(self, key: str, waited: float, waiting: bool) -> float:
+        with self._lock:
+            bucket = self._buckets[key]
+            bucket["requests"] += 1
+            bucket["total_wait"] += waited
+            bucket["max_wait"] = max(bucket["max_wait"], waited)
+            if waiting:
+                bucket["waited_requests"] += 1
+
+        if waiting:
+            logger.info("요청 한도 대기 후 요청", extra={"key": key, "wait_ms": int(waited * 1000)})
+        return waited
+
+    def _leave_queue(self, key: str) -> None:
+        with self._lock:
+            self._buckets[key]["queue_depth"] -= 1
+
+    def _timeout(self, key: str, tokens: int, waited: float) -> None:
+        with self._lock:
+            self._buckets[key]["timeouts"] += 1
+
+        logger.warning("요청 한도 대기 시간 초과", extra={
+            "key": key,
+            "tokens": tokens,
+            "wait_ms": int(waited * 1000)
+        })
+        raise RateLimitTimeout(f"요청 한도 대기 시간을 초과했습니다: {key}")
@@ -0,0 +1,129 @@
+"""요청별 모델 라우팅 모듈
+
+사이드바에서 고른 모델 하나로 모든 요청(기본 번역, 스타일 번역, 대안 표현)을 보내면
+세 단어짜리 채팅 문장도 gpt-4o로 번역됩니다. ModelRouter는 Config의 선언형 규칙 표(MODEL_ROUTES)로
+입력 토큰 수, 감지된 언어, 스타일, 요청 종류에 따라 요청마다 모델을 고릅니다.
+규칙은 위에서부터 순서대로 비교하며 처음 일치하는 규칙의 모델을 사용하고,
+일치하는 규칙이 없으면 사용자가 고른 모델을 그대로 사용합니다.
+
+요청 종류:
+    primary: 기본 번역 (TranslationManager)
+    style: 스타일 번역 (StyleTranslator)
+    alternatives: 대안 표현 생성 (StyleTranslator)
+"""
+
+import logging
+from typing import Any, Optional
+
+from components.tokens import TokenCounter
+from config import Config
+
+logger = logging.getLogger("transbot.router")
+
+REQUEST_TYPES = ("primary", "style", "alternatives")
+
+
+class ModelRouter:
+    """선언형 규칙 표로 요청별 모델을 고르는 라우터"""
+
+    def __init__(
+        self,
+        rules: list[dict[str, Any]],
+        token_counter: Optional[TokenCounter] = None,
+        deployments: Optional[dict[str, str]] = None
+    ) -> None:
+        """
+        Args:
+            rules: Config.parse_model_routes() 형식의 규칙 목록 (순서대로 비교)
+            token_counter: 입력 토큰 수 계산에 사용할 TokenCounter (None이면 기본 설정으로 생성)
+            deployments: Azure 사용 시 모델명과 deployment 이름 매핑 (deployment가 없는 모델의 규칙은 건너뜀)
+        """
+        self.rules = list(rules)
+        self.token_counter = token_counter or TokenCounter()
+        self.deployments = deployments
+
+    @classmethod
+    def from_config(cls, config: Config, token_counter: Optional[TokenCounter] = None) -> Optional["ModelRouter"]:
+        """Config 설정으로 생성합니다 (MODEL_ROUTES가 없으면 None)."""
+        rules = config.parse_model_routes(config.MODEL_ROUTES)
+        if not rules:
+            return None
+        deployments = None
+        if config.AI_PROVIDER == "azure":
+            deployments = config.parse_azure_deployments(config.AZURE_DEPLOYMENTS)
+        return cls(rules, token_counter=token_counter, deployments=deployments)
+
+    def route(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        default_model: str,
+        style: Optional[str] = None,
+        request_type: str = "primary"
+    ) -> dict[str, Any]:
+        """요청에 사용할 모델을 고릅니다.
+
+        Args:
+            text: 번역할 텍스트 (입력 토큰 수 계산용)
+            source: 감지된 원본 언어
+            target: 대상 언어
+            default_model: 사용자가 고른 모델 (일치하는 규칙이 없을 때 사용)
+            style: 스타일 키 (스타일 번역/대안 표현인 경우)
+            request_type: 요청 종류 ("primary", "style", "alternatives")
+
+        Returns:
+            {"model": 모델명, "deployment": Azure deployment 이름 또는 None,
+             "rule": 일치한 규칙 이름 또는 None, "input_tokens": 입력 토큰 수, "request_type": 요청 종류}
+        """
+        input_tokens = self.token_counter.count(text, default_model, approximate=None)
+        values = {"source": source, "target": target, "style": style, "type": request_type}
+
+        for rule in self.rules:
+            if not self._matches(rule, input_tokens, values):
+                continue
+            deployment = None
+            if self.deployments is not None:
+                deployment = self.deployments.get(rule["model"])
+                if deployment is None:
+                    continue
+
+            route = {
+                "model": rule["model"],
+                "deployment": deployment,
+                "rule": rule["name"],
+                "input_tokens": input_tokens,
+                "request_type": request_type,
+            }
+            if rule["model"] != default_model:
+                logger.info("모델 라우팅", extra={
+                    **route,
+                    "default_model": default_model,
+                    "style": style,
+                    "source_lang": source,
+                    "target_lang": target
+                })
+            return route
+
+        return {
+            "model": default_model,
+            "deployment": None,
+            "rule": None,
+            "input_tokens": input_tokens,
+            "request_type": request_type,
+        }
+
+    @staticmethod
+    def _matches(rule: dict[str, Any], input_tokens: int, values: dict[str, Optional[str]]) -> bool:
+        """규칙의 모든 조건이 일치하는지 확인합니다."""
+        for op, limit in rule["tokens"]:
+            if op == "<=" and not input_tokens <= limit:
+                return False
+            if op == "<" and not input_tokens < limit:
+                return False
+            if op == ">=" and not input_tokens >= limit:
+                return False
+            if op == ">" and not input_tokens > limit:
+                return False
+
+        return all(values.get(key) in allowed for key, allowed in rule["match"].items())
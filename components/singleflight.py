@@ -0,0 +1,125 @@
+"""동일 요청 합치기(single-flight) 모듈
+
+여러 세션이 같은 텍스트를 같은 설정으로 동시에 번역하면 요청마다 API가 호출됩니다.
+SingleFlight는 진행 중인 요청과 키가 같은 요청을 새로 보내지 않고,
+먼저 시작된 호출(leader)이 끝나기를 기다려 그 결과 또는 예외를 함께 받도록 합니다.
+Streamlit 세션은 스레드로 실행되므로 threading 기반으로 동작합니다.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from config import Config
+
+logger = logging.getLogger("transbot.singleflight")
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나로 합치는 클래스"""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._upstream_calls = 0
+        self._coalesced_requests = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["SingleFlight"]:
+        """Config 설정으로 생성합니다 (TRANSLATION_SINGLE_FLIGHT_ENABLED=false이면 None)."""
+        if not config.TRANSLATION_SINGLE_FLIGHT_ENABLED:
+            return None
+        return cls()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """같은 키의 호출이 진행 중이면 그 결과를 기다리고, 아니면 fn을 실행합니다.
+
+        Args:
+            key: 정규화된 요청 키 (예: make_cache_key 결과)
+            fn: 실제 호출 함수
+
+        Returns:
+            (결과, 합류 여부) 튜플 - 다른 호출의 결과를 받은 경우 합류 여부가 True
+
+        Raises:
+            Exception: fn 또는 합류한 호출에서 발생한 예외
+        """
+        call, leader = self.begin(key)
+        if not leader:
+            return self.wait(call), True
+
+        try:
+            result = fn()
+        except Exception as e:
+            self.finish(key, call, error=e)
+            raise
+        except BaseException:
+            self.finish(key, call)
+            raise
+        self.finish(key, call, result=result)
+        return result, False
+
+    def begin(self, key: str) -> tuple[dict[str, Any], bool]:
+        """같은 키의 호출을 시작하거나 진행 중인 호출에 합류합니다.
+
+        스트리밍처럼 결과가 한 번의 함수 호출로 끝나지 않는 경우 do() 대신 사용합니다.
+        leader는 호출이 끝나면 반드시 finish()를 호출해야 하며, 합류한 쪽은 wait()로 결과를 받습니다.
+
+        Returns:
+            (호출 상태, leader 여부) 튜플
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = {"done": threading.Event(), "result": None, "error": None, "waiters": 0}
+                self._calls[key] = call
+                self._upstream_calls += 1
+                return call, True
+            call["waiters"] += 1
+            self._coalesced_requests += 1
+            coalesced_requests = self._coalesced_requests
+
+        logger.info("진행 중인 동일 요청에 합류", extra={
+            "waiters": call["waiters"],
+            "coalesced_requests": coalesced_requests
+        })
+        return call, False
+
+    def wait(self, call: dict[str, Any]) -> Any:
+        """합류한 호출이 끝나기를 기다려 결과를 반환합니다.
+
+        Returns:
+            leader의 결과 (leader가 결과 없이 중단되었으면 None)
+
+        Raises:
+            Exception: leader에서 발생한 예외
+        """
+        call["done"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+
+    def finish(self, key: str, call: dict[str, Any], result: Any = None, error: Optional[Exception] = None) -> None:
+        """leader의 호출을 끝내고 기다리는 요청에 결과 또는 예외를 전달합니다.
+
+        결과와 예외가 모두 없으면(스트림 소비 중단 등) 합류한 요청은 None을 받습니다.
+        """
+        call["result"] = result
+        call["error"] = error
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call["done"].set()
+
+    def stats(self) -> dict[str, int]:
+        """합치기 통계를 반환합니다.
+
+        Returns:
+            {"in_flight": 진행 중인 호출 수, "upstream_calls": 실제 호출 수, "coalesced_requests": 합류한 요청 수}
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "upstream_calls": self._upstream_calls,
+                "coalesced_requests": self._coalesced_requests,
+            }
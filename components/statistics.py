@@ -0,0 +1,172 @@
+"""증분 텍스트 통계 모듈
+
+입력창에 한 글자를 추가할 때마다 전체 문서의 토큰 수와 언어를 다시 계산하지 않도록
+텍스트를 문단(구간) 단위로 나누고, 구간 해시별로 통계를 캐싱합니다.
+편집 후에는 내용이 바뀐 구간만 다시 계산하고 전체 합계를 구합니다.
+"""
+
+import hashlib
+import logging
+import re
+from typing import Any, Optional
+
+from components.tokens import TokenCounter
+from utils import count_script_letters
+
+logger = logging.getLogger("transbot.statistics")
+
+# 문단 경계: 빈 줄(공백만 있는 줄 포함)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r'\n[ \t]*\n')
+_WHITESPACE_PATTERN = re.compile(r'\r\n|\s')
+
+_STATISTIC_KEYS = ("characters", "tokens", "words", "lines", "korean_chars", "english_chars")
+
+
+def split_into_chunks(text: str, max_chunk_chars: int = 2000) -> list[str]:
+    """텍스트를 문단 경계 기준으로 구간을 나눕니다.
+
+    구간을 이어 붙이면 원문과 정확히 같으며, 모든 경계가 공백 문자 바로 뒤에 위치하므로
+    구간별 단어 수의 합이 전체 단어 수와 같습니다.
+    max_chunk_chars보다 긴 문단은 그 이후의 첫 공백 문자 뒤에서 다시 나눕니다.
+
+    Args:
+        text: 나눌 텍스트
+        max_chunk_chars: 구간의 목표 최대 길이 (문자 수)
+
+    Returns:
+        구간 문자열 리스트
+    """
+    chunks = []
+    start = 0
+    length = len(text)
+
+    while start < length:
+        match = _PARAGRAPH_BREAK_PATTERN.search(text, start, min(length, start + max_chunk_chars))
+        if match:
+            end = match.end()
+        elif length - start <= max_chunk_chars:
+            end = length
+        else:
+            # 긴 문단은 목표 길이 이후 첫 공백 뒤에서 자릅니다 (단어 중간에서 자르지 않음)
+            space = _WHITESPACE_PATTERN.search(text, start + max_chunk_chars)
+            end = space.end() if space else length
+        chunks.append(text[start:end])
+        start = end
+
+    return chunks
+
+
+class IncrementalTextStatistics:
+    """구간 해시 기반 증분 텍스트 통계 계산기
+
+    세션마다 하나씩 유지하며, update()에 최신 입력 전체를 전달하면
+    이전 호출과 달라진 구간만 다시 계산합니다.
+
+    토큰 수는 구간별 토큰 수의 합이므로 전체를 한 번에 인코딩한 값과 구간 경계에서
+    약간 다를 수 있습니다 (경계가 문단 사이 공백이므로 차이는 매우 작습니다).
+    """
+
+    def __init__(self, token_counter: Optional[TokenCounter] = None, max_chunk_chars: int = 2000) -> None:
+        """
+        Args:
+            token_counter: 구간 토큰 수 계산에 사용할 TokenCounter (None이면 기본 설정으로 생성)
+            max_chunk_chars: 구간의 목표 최대 길이 (문자 수)
+        """
+        self.token_counter = token_counter or TokenCounter()
+        self.max_chunk_chars = max(1, max_chunk_chars)
+        self._chunk_stats: dict[tuple[str, str], dict[str, Any]] = {}
+        self.last_recomputed_chunks = 0
+
+    def update(self, text: str, model: str = "gpt-4o", approximate: bool = False) -> dict[str, int]:
+        """최신 텍스트의 통계를 계산합니다.
+
+        Args:
+            text: 현재 입력 텍스트 전체
+            model: 토큰화 기준 모델명
+            approximate: True이면 새로 계산하는 구간의 토큰 수를 근사 카운트로 추정
+                (대용량 입력을 처음 붙여 넣었을 때 전체 BPE 인코딩을 피함)
+
+        Returns:
+            통계 정보 딕셔너리 {
+                "characters": 문자 수,
+                "tokens": 토큰 수 (approximate=True이면 추정값),
+                "words": 단어 수 (공백 기준),
+                "lines": 줄 수,
+                "korean_chars": 한글 음절 수,
+                "english_chars": ASCII 영문자 수
+            }
+        """
+        chunks = split_into_chunks(text, self.max_chunk_chars)
+        current: dict[tuple[str, bool, str], dict[str, Any]] = {}
+        chunk_stats = []
+        new_chunks: list[tuple[str, dict[str, Any]]] = []
+
+        for chunk in chunks:
+            # 근사 카운트 결과는 정확한 카운트와 섞이지 않도록 따로 캐싱합니다
+            key = (model, approximate, hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest())
+            stats = current.get(key) or self._chunk_stats.get(key)
+            if stats is None:
+                stats = self._compute_chunk(chunk, model, count_tokens=not approximate)
+                new_chunks.append((chunk, stats))
+            current[key] = stats
+            chunk_stats.append(stats)
+
+        if approximate and new_chunks:
+            self._estimate_tokens(new_chunks, model)
+
+        totals = dict.fromkeys(_STATISTIC_KEYS, 0)
+        # 줄바꿈으로 끝나지 않은 구간은 다음 구간과 같은 줄을 이어서 셉니다
+        continued_lines = 0
+        for stats in chunk_stats:
+            for name in _STATISTIC_KEYS:
+                totals[name] += stats[name]
+            if not stats["ends_with_break"]:
+                continued_lines += 1
+
+        if chunk_stats and not chunk_stats[-1]["ends_with_break"]:
+            # 마지막 구간은 이어지는 구간이 없습니다
+            continued_lines -= 1
+        totals["lines"] -= continued_lines
+
+        # 현재 텍스트에 없는 구간은 버려 메모리를 입력 크기에 비례하게 유지합니다
+        self._chunk_stats = current
+        self.last_recomputed_chunks = len(new_chunks)
+
+        logger.debug("증분 통계 계산", extra={
+            "chunks": len(chunks),
+            "recomputed_chunks": len(new_chunks),
+            "approximate": approximate
+        })
+
+        return totals
+
+    def reset(self) -> None:
+        self._chunk_stats.clear()
+        self.last_recomputed_chunks = 0
+
+    def _compute_chunk(self, chunk: str, model: str, count_tokens: bool = True) -> dict[str, Any]:
+        """구간 통계를 계산합니다 (count_tokens=False이면 토큰 수는 0으로 두고 _estimate_tokens에서 채움)."""
+        korean_chars, english_chars = count_script_letters(chunk)
+        return {
+            "characters": len(chunk),
+            "tokens": self.token_counter.count(chunk, model) if count_tokens else 0,
+            "words": len(chunk.split()),
+            "lines": len(chunk.splitlines()),
+            "korean_chars": korean_chars,
+            "english_chars": english_chars,
+            "ends_with_break": chunk.splitlines(keepends=True)[-1] != chunk.splitlines()[-1],
+        }
+
+    def _estimate_tokens(self, new_chunks: list[tuple[str, dict[str, Any]]], model: str) -> None:
+        """새 구간들을 이어 붙여 한 번에 근사 카운트하고, 추정값을 구간 길이에 비례해 나눠 기록합니다.
+
+        구간이 짧아 구간별 근사 카운트는 전체 인코딩과 다르지 않으므로, 이어 붙인 텍스트의 표본 구간만 인코딩합니다.
+        """
+        joined = "".join(chunk for chunk, _ in new_chunks)
+        total_tokens = self.token_counter.count(joined, model, approximate=True)
+        total_chars = len(joined)
+        position = 0
+        for chunk, stats in new_chunks:
+            start = round(total_tokens * position / total_chars)
+            position += len(chunk)
+            stats["tokens"] = round(total_tokens * position / total_chars) - start
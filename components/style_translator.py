@@ -4,10 +4,22 @@
 제공하는 StyleTranslator 클래스를 포함합니다.
 """
 
+import copy
+import json
 import logging
-from typing import List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Union
 from openai import OpenAI
 
+from components.budget import TokenBudget
+from components.cache import TranslationCache, make_cache_key
+from components.deployment_pool import DeploymentPool
+from components.glossary import GlossaryRegistry
+from components.prompts import PROMPT_REGISTRY, prompt_cache_stats
+from components.rate_limit import RateLimiter
+from components.router import ModelRouter
+from components.singleflight import SingleFlight
+
 logger = logging.getLogger("transbot.style_translator")
 
 
@@ -47,6 +59,10 @@ class StyleTranslator:
         STYLE_CONCISE: "핵심 메시지만 전달하는 간결한 한국어로 번역하세요."
     }
 
+    # 일괄 번역 시 요청 토큰 상한 및 스타일당 대안 표현 토큰
+    _BATCH_MAX_TOKENS = 16000
+    _ALTERNATIVES_MAX_TOKENS = 500
+
     def __init__(
         self,
         client: OpenAI,
@@ -54,16 +70,33 @@ class StyleTranslator:
         temperature: float = 0.3,
         max_tokens: int = 2000,
         timeout: int = 30,
-        deployment: Optional[str] = None
+        deployment: Optional[str] = None,
+        max_concurrency: int = 1,
+        cache: Optional[TranslationCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        token_budget: Optional[TokenBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        router: Optional[ModelRouter] = None,
+        glossary: Optional[GlossaryRegistry] = None,
+        deployment_pool: Optional[DeploymentPool] = None
     ):
         """
         Args:
             client: OpenAI 클라이언트
             model: 사용할 AI 모델 (표시용)
             temperature: 생성 온도 (0-1)
-            max_tokens: 최대 토큰 수
+            max_tokens: 최대 토큰 수 (token_budget이 없을 때 사용)
             timeout: 타임아웃 (초)
             deployment: Azure deployment 이름 (Azure 사용 시 필수)
+            max_concurrency: 다중 스타일 번역 시 동시 API 호출 한도 (1이면 순차 실행)
+            cache: 번역 결과 캐시 (None이면 캐시 미사용)
+            single_flight: 동시에 들어온 동일 요청을 하나의 API 호출로 합치는 SingleFlight (None이면 미사용)
+            token_budget: 입력, 번역 방향, 스타일에 맞춰 요청별 max_tokens를 정하는 TokenBudget (None이면 고정값 사용)
+            rate_limiter: 요청 전에 RPM/TPM 한도를 확보하는 RateLimiter (None이면 제한 없음)
+            router: 입력 길이, 스타일, 요청 종류에 따라 모델을 고르는 ModelRouter (None이면 model 고정)
+            glossary: 입력에 등장한 용어만 프롬프트에 넣고 결과를 검사하는 GlossaryRegistry (None이면 미사용)
+            deployment_pool: 같은 모델의 여러 deployment에 요청을 분산하는 DeploymentPool
+                             (None이면 deployment 하나만 사용, 라우팅된 모델에는 적용 안 됨)
         """
         self.client = client
         self.model = model
@@ -71,6 +104,37 @@ class StyleTranslator:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        self.single_flight = single_flight
+        self.token_budget = token_budget
+        self.rate_limiter = rate_limiter
+        self.router = router
+        self.glossary = glossary
+        self.deployment_pool = deployment_pool
+
+    def _get_style_instruction(
+        self,
+        style: str,
+        target_lang: str,
+        custom_instruction: Optional[str] = None
+    ) -> str:
+        """번역 방향과 스타일에 맞는 스타일 지침을 반환합니다 (커스텀 지침 우선)."""
+        if custom_instruction:
+            return custom_instruction
+
+        # 번역 방향에 따라 적절한 스타일 지침 선택
+        if target_lang == "Korean" or target_lang == "한국어":
+            # 영→한 번역
+            instructions_dict = self.STYLE_INSTRUCTIONS_EN_TO_KO
+        else:
+            # 한→영 번역 (기본값)
+            instructions_dict = self.STYLE_INSTRUCTIONS
+
+        return instructions_dict.get(
+            style,
+            instructions_dict[self.STYLE_BUSINESS]  # 기본값
+        )
 
     def translate_single_style(
         self,
@@ -97,60 +161,119 @@ class StyleTranslator:
         Raises:
             Exception: API 호출 실패 시
         """
+        routed = self._routed(text, source_lang, target_lang, style, "style")
+        if routed is not self:
+            return routed.translate_single_style(
+                text, style, source_lang, target_lang, preserve_proper_nouns, custom_instruction
+            )
+
         try:
+            # 입력에 등장한 용어집 용어 (없으면 기존 캐시 키와 프롬프트를 그대로 유지)
+            glossary_terms = self._glossary_terms(text, source_lang, target_lang)
+            glossary_extra = {"glossary": GlossaryRegistry.request_key(glossary_terms)} if glossary_terms else {}
+
+            # 요청 키 (캐시 키 및 동일 요청 합치기 키)
+            request_key = make_cache_key(
+                text=text,
+                source=source_lang,
+                target=target_lang,
+                model=self.deployment if self.deployment else self.model,
+                temperature=self.temperature,
+                style=style,
+                custom_instruction=custom_instruction,
+                prompt_version=PROMPT_REGISTRY.get("style_translation").version,
+                preserve_proper_nouns=preserve_proper_nouns,
+                **glossary_extra
+            )
+
+            # 캐시 조회 (적중 시 API 호출 생략)
+            cache_key = None
+            if self.cache is not None:
+                cache_key = request_key
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info(
+                        "스타일 번역 캐시 적중",
+                        extra={"style": style, "output_length": len(cached), **self.cache.stats()}
+                    )
+                    return cached
+
             # 스타일 지침 생성
-            if custom_instruction:
-                style_instruction = custom_instruction
-            else:
-                # 번역 방향에 따라 적절한 스타일 지침 선택
-                if target_lang == "Korean" or target_lang == "한국어":
-                    # 영→한 번역
-                    instructions_dict = self.STYLE_INSTRUCTIONS_EN_TO_KO
-                    default_style = self.STYLE_BUSINESS
-                else:
-                    # 한→영 번역 (기본값)
-                    instructions_dict = self.STYLE_INSTRUCTIONS
-                    default_style = self.STYLE_BUSINESS
-
-                style_instruction = instructions_dict.get(
-                    style,
-                    instructions_dict[default_style]  # 기본값
-                )
+            style_instruction = self._get_style_instruction(style, target_lang, custom_instruction)
 
             # 고유명사 유지 옵션
             proper_noun_instruction = ""
             if preserve_proper_nouns:
                 proper_noun_instruction = "\nIMPORTANT: Preserve all proper nouns (names, places, brands) in their original form."
 
-            # 시스템 프롬프트 구성
-            system_prompt = f"""You are a professional translator. Translate the following {source_lang} text to {target_lang}.
-IMPORTANT: Preserve all Markdown formatting exactly as it appears in the original text.
-
-STYLE INSTRUCTION: {style_instruction}{proper_noun_instruction}
-
-Only respond with the translation, nothing else."""
+            # 시스템 프롬프트 구성 (정적 지침이 앞, 언어/스타일 지침이 뒤)
+            system_prompt = PROMPT_REGISTRY.get("style_translation").render(
+                source=source_lang,
+                target=target_lang,
+                style_instruction=style_instruction,
+                proper_noun_instruction=proper_noun_instruction
+            ) + GlossaryRegistry.format_prompt(glossary_terms)
+
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text}
+            ]
+
+            # 출력 토큰 예산 (token_budget이 없으면 고정값)
+            input_tokens = None
+            max_tokens = self.max_tokens
+            if self.token_budget is not None:
+                input_tokens = self.token_budget.count(text, self.model)
+                max_tokens = self.token_budget.estimate(
+                    input_tokens,
+                    source_lang,
+                    target_lang,
+                    self.model,
+                    style=style,
+                    prompt_tokens=self.token_budget.count_messages(messages, self.model)
+                )
 
             # API 호출 (Azure인 경우 deployment 사용, 아니면 model 사용)
             model_or_deployment = self.deployment if self.deployment else self.model
-            response = self.client.chat.completions.create(
-                model=model_or_deployment,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout
-            )
+
+            def create_completion():
+                self._acquire_rate_limit(messages, max_tokens)
+                return self._send(
+                    model=model_or_deployment,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout
+                )
+
+            # 같은 요청이 진행 중이면 그 호출 결과를 함께 사용
+            coalesced = False
+            if self.single_flight is not None:
+                response, coalesced = self.single_flight.do(request_key, create_completion)
+            else:
+                response = create_completion()
 
             translation = response.choices[0].message.content
 
+            output_tokens = getattr(response.usage, "completion_tokens", None)
+            if self.token_budget is not None and not coalesced and isinstance(output_tokens, int):
+                self.token_budget.record(
+                    source_lang, target_lang, input_tokens, max_tokens, output_tokens, self.model, style=style
+                )
+
+            if cache_key is not None:
+                self.cache.set(cache_key, translation)
+
             logger.info(
                 "스타일 번역 완료",
                 extra={
                     "style": style,
                     "input_length": len(text),
-                    "output_length": len(translation)
+                    "output_length": len(translation),
+                    **prompt_cache_stats(None if coalesced else response.usage),
+                    **self._glossary_metadata(text, source_lang, target_lang, translation),
+                    **({"coalesced": coalesced} if self.single_flight is not None else {}),
+                    **(self.cache.stats() if self.cache is not None else {})
                 }
             )
 
@@ -171,10 +294,15 @@ Only respond with the translation, nothing else."""
         source_lang: str = "Korean",
         target_lang: str = "English",
         preserve_proper_nouns: bool = False,
-        include_alternatives: bool = False
+        include_alternatives: bool = False,
+        custom_instruction: Optional[str] = None
     ) -> Dict[str, Union[str, Dict[str, Union[str, List[str]]]]]:
         """여러 스타일로 번역 생성
 
+        max_concurrency가 2 이상이면 스타일별 요청을 스레드 풀로 동시에 실행합니다.
+        각 스타일의 대안 표현 요청은 해당 스타일 번역 직후 같은 작업 안에서 이어서 실행되므로,
+        전체 소요 시간은 가장 느린 스타일 하나의 (번역 + 대안) 시간에 가까워집니다.
+
         Args:
             text: 번역할 텍스트
             styles: 스타일 키 리스트
@@ -182,6 +310,7 @@ Only respond with the translation, nothing else."""
             target_lang: 대상 언어
             preserve_proper_nouns: 고유명사 유지 여부
             include_alternatives: 대안 표현 포함 여부 (각 스타일당 2-3개)
+            custom_instruction: 커스텀 스타일 지침 (있으면 모든 스타일에 적용)
 
         Returns:
             {
@@ -197,51 +326,429 @@ Only respond with the translation, nothing else."""
                 },
                 ...
             }
+            결과 순서는 styles 순서를 따르며, 실패한 스타일은 "[{style} 번역 실패]"로 채워집니다.
         """
-        results = {}
-
         logger.info(
             "다중 스타일 번역 시작",
+            extra={
+                "styles": styles,
+                "include_alternatives": include_alternatives,
+                "max_concurrency": self.max_concurrency
+            }
+        )
+
+        def run(style: str) -> Union[str, Dict[str, Union[str, List[str]]]]:
+            return self._translate_style_with_alternatives(
+                text=text,
+                style=style,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                preserve_proper_nouns=preserve_proper_nouns,
+                include_alternatives=include_alternatives,
+                custom_instruction=custom_instruction
+            )
+
+        workers = min(self.max_concurrency, len(styles))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="style-translator") as executor:
+                # map은 입력 순서대로 결과를 반환하므로 스타일 순서가 유지됩니다
+                outputs = list(executor.map(run, styles))
+        else:
+            outputs = [run(style) for style in styles]
+
+        results: Dict[str, Union[str, Dict[str, Union[str, List[str]]]]] = {}
+        for style, output in zip(styles, outputs):
+            results[style] = output
+
+        return results
+
+    def translate_multi_style_batched(
+        self,
+        text: str,
+        styles: List[str],
+        source_lang: str = "Korean",
+        target_lang: str = "English",
+        preserve_proper_nouns: bool = False,
+        include_alternatives: bool = False,
+        custom_instruction: Optional[str] = None
+    ) -> Dict[str, Union[str, Dict[str, Union[str, List[str]]]]]:
+        """선택된 모든 스타일(및 대안 표현)을 한 번의 API 호출로 생성
+
+        원문을 스타일 수만큼 반복 전송하지 않도록 JSON 응답 형식으로 모든 스타일을 한 번에 요청합니다.
+        응답 파싱에 실패하거나 일부 스타일이 누락되면 해당 스타일만 translate_multi_style로 다시 번역합니다.
+
+        Args:
+            text: 번역할 텍스트
+            styles: 스타일 키 리스트
+            source_lang: 원본 언어
+            target_lang: 대상 언어
+            preserve_proper_nouns: 고유명사 유지 여부
+            include_alternatives: 대안 표현 포함 여부 (각 스타일당 2-3개)
+            custom_instruction: 커스텀 스타일 지침 (있으면 모든 스타일에 적용)
+
+        Returns:
+            translate_multi_style과 동일한 형식의 딕셔너리
+        """
+        if not styles:
+            return {}
+
+        routed = self._routed(text, source_lang, target_lang, None, "style")
+        if routed is not self:
+            return routed.translate_multi_style_batched(
+                text, styles, source_lang, target_lang, preserve_proper_nouns, include_alternatives, custom_instruction
+            )
+
+        logger.info(
+            "다중 스타일 일괄 번역 시작",
             extra={
                 "styles": styles,
                 "include_alternatives": include_alternatives
             }
         )
 
+        # 입력에 등장한 용어집 용어 (없으면 기존 캐시 키와 프롬프트를 그대로 유지)
+        glossary_terms = self._glossary_terms(text, source_lang, target_lang)
+        glossary_extra = {"glossary": GlossaryRegistry.request_key(glossary_terms)} if glossary_terms else {}
+
+        # 요청 키 (캐시 키 및 동일 요청 합치기 키) - 스타일 조합과 대안 포함 여부가 결과를 결정합니다
+        request_key = make_cache_key(
+            text=text,
+            source=source_lang,
+            target=target_lang,
+            model=self.deployment if self.deployment else self.model,
+            temperature=self.temperature,
+            style=",".join(styles),
+            custom_instruction=custom_instruction,
+            prompt_version=PROMPT_REGISTRY.get("style_translation_batch").version,
+            preserve_proper_nouns=preserve_proper_nouns,
+            include_alternatives=include_alternatives,
+            batched=True,
+            **glossary_extra
+        )
+
+        # 캐시 조회 (적중 시 API 호출 생략)
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                results = json.loads(cached)
+                logger.info(
+                    "다중 스타일 일괄 번역 캐시 적중",
+                    extra={"styles": styles, **self.cache.stats()}
+                )
+                return {style: results[style] for style in styles}
+
+        parsed: Dict[str, Union[str, Dict[str, Union[str, List[str]]]]] = {}
+        batch_usage: Dict[str, Union[int, bool, Dict]] = {}
+        try:
+            messages = self._build_batched_messages(
+                text, styles, source_lang, target_lang, preserve_proper_nouns, include_alternatives,
+                custom_instruction, glossary_terms
+            )
+            max_tokens = self._batched_max_tokens(
+                text, styles, source_lang, target_lang, include_alternatives, messages
+            )
+
+            model_or_deployment = self.deployment if self.deployment else self.model
+
+            def create_completion():
+                self._acquire_rate_limit(messages, max_tokens)
+                return self._send(
+                    model=model_or_deployment,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    response_format={"type": "json_object"}
+                )
+
+            # 같은 요청이 진행 중이면 그 호출 결과를 함께 사용
+            coalesced = False
+            if self.single_flight is not None:
+                response, coalesced = self.single_flight.do(request_key, create_completion)
+            else:
+                response = create_completion()
+
+            parsed = self._parse_batched_response(
+                response.choices[0].message.content, styles, include_alternatives
+            )
+            batch_usage = prompt_cache_stats(None if coalesced else response.usage)
+            batch_usage.update(self._batched_glossary_metadata(text, source_lang, target_lang, parsed))
+            if self.single_flight is not None:
+                batch_usage["coalesced"] = coalesced
+        except Exception as e:
+            logger.warning(
+                "다중 스타일 일괄 번역 실패, 스타일별 번역으로 대체",
+                extra={"error_type": type(e).__name__, "error": str(e)}
+            )
+
+        missing_styles = [style for style in styles if style not in parsed]
+        if missing_styles:
+            if parsed:
+                logger.warning(
+                    "일괄 번역 응답에 누락된 스타일을 개별 번역",
+                    extra={"missing_styles": missing_styles}
+                )
+            parsed.update(self.translate_multi_style(
+                text=text,
+                styles=missing_styles,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                preserve_proper_nouns=preserve_proper_nouns,
+                include_alternatives=include_alternatives,
+                custom_instruction=custom_instruction
+            ))
+        else:
+            # 일괄 응답이 모든 스타일을 담은 경우에만 캐시합니다 (개별 대체 번역은 스타일별 캐시에 저장됨)
+            if self.cache is not None:
+                self.cache.set(request_key, json.dumps(parsed, ensure_ascii=False))
+            logger.info(
+                "다중 스타일 일괄 번역 완료",
+                extra={
+                    "styles": styles,
+                    "input_length": len(text),
+                    **batch_usage,
+                    **(self.cache.stats() if self.cache is not None else {})
+                }
+            )
+
+        # styles 순서대로 재정렬
+        return {style: parsed[style] for style in styles}
+
+    def _build_batched_messages(
+        self,
+        text: str,
+        styles: List[str],
+        source_lang: str,
+        target_lang: str,
+        preserve_proper_nouns: bool,
+        include_alternatives: bool,
+        custom_instruction: Optional[str],
+        glossary_terms: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """일괄 번역용 messages를 구성합니다 (glossary_terms가 없으면 입력에서 용어를 찾음)."""
+        if glossary_terms is None:
+            glossary_terms = self._glossary_terms(text, source_lang, target_lang)
+
+        style_lines = "\n".join(
+            f"- {style}: {self._get_style_instruction(style, target_lang, custom_instruction)}"
+            for style in styles
+        )
+
+        proper_noun_instruction = ""
+        if preserve_proper_nouns:
+            proper_noun_instruction = (
+                "\nIMPORTANT: Preserve all proper nouns (names, places, brands) in their original form."
+            )
+
+        if include_alternatives:
+            entry_shape = '{"primary": "<translation>", "alternatives": ["<alternative>", "<alternative>"]}'
+            alternatives_instruction = (
+                "\nFor each style, also provide 2-3 alternative ways to express the same meaning "
+                "in the same style in \"alternatives\"."
+            )
+        else:
+            entry_shape = '{"primary": "<translation>"}'
+            alternatives_instruction = ""
+
+        system_prompt = PROMPT_REGISTRY.get("style_translation_batch").render(
+            source=source_lang,
+            target=target_lang,
+            proper_noun_instruction=proper_noun_instruction,
+            style_lines=style_lines,
+            alternatives_instruction=alternatives_instruction,
+            response_shape=f'{{"translations": {{"<style key>": {entry_shape}}}}}'
+        ) + GlossaryRegistry.format_prompt(glossary_terms)
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": text}
+        ]
+
+    def _routed(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        style: Optional[str],
+        request_type: str
+    ) -> "StyleTranslator":
+        """router가 다른 모델을 고르면 그 모델을 사용하는 복사본을, 아니면 self를 반환합니다."""
+        if self.router is None:
+            return self
+
+        route = self.router.route(text, source_lang, target_lang, self.model, style=style, request_type=request_type)
+        if route["rule"] is None or route["model"] == self.model:
+            return self
+        if self.deployment and route["deployment"] is None:
+            return self
+
+        routed = copy.copy(self)
+        routed.model = route["model"]
+        routed.deployment = route["deployment"] if self.deployment else None
+        # deployment 풀은 기본 모델용이므로 라우팅된 모델에는 사용하지 않습니다
+        routed.deployment_pool = None
+        routed.router = None
+        return routed
+
+    def _send(self, **kwargs: Any) -> Any:
+        """chat.completions.create 요청을 보냅니다 (deployment_pool이 있으면 풀에서 고른 deployment 사용)."""
+        if self.deployment_pool is None:
+            return self.client.chat.completions.create(**kwargs)
+        return self.deployment_pool.call(
+            lambda client, deployment: client.chat.completions.create(**{**kwargs, "model": deployment})
+        )
+
+    def _glossary_terms(self, text: str, source_lang: str, target_lang: str) -> List[Dict[str, str]]:
+        """입력에 등장한 용어집 용어를 찾습니다 (glossary 미사용 시 빈 목록)."""
+        if self.glossary is None:
+            return []
+        return self.glossary.lookup(text, source_lang, target_lang)
+
+    def _glossary_metadata(self, text: str, source_lang: str, target_lang: str, translation: str) -> Dict:
+        """번역 결과의 용어집 위반을 검사하고 로그용 메타데이터를 반환합니다 (glossary 사용 시)."""
+        if self.glossary is None:
+            return {}
+        return self.glossary.metadata(text, source_lang, target_lang, translation)
+
+    def _batched_glossary_metadata(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        parsed: Dict[str, Union[str, Dict[str, Union[str, List[str]]]]]
+    ) -> Dict:
+        """일괄 번역 결과를 스타일별로 검사하고 위반한 스타일과 용어를 반환합니다 (위반이 없으면 빈 dict)."""
+        violations = {}
+        for style, result in parsed.items():
+            translation = result["primary"] if isinstance(result, dict) else result
+            metadata = self._glossary_metadata(text, source_lang, target_lang, str(translation))
+            if metadata.get("glossary_violations"):
+                violations[style] = metadata["glossary_violations"]
+        return {"glossary_violations": violations} if violations else {}
+
+    def _acquire_rate_limit(self, messages: List[Dict[str, str]], max_tokens: int) -> None:
+        """요청 한도(RPM/TPM)를 확보할 때까지 대기합니다 (rate_limiter 사용 시)."""
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.acquire(
+            "azure" if self.deployment else "openai",
+            self.deployment if self.deployment else self.model,
+            self.rate_limiter.estimate_tokens(messages, max_tokens, self.model)
+        )
+
+    def _batched_max_tokens(
+        self,
+        text: str,
+        styles: List[str],
+        source_lang: str,
+        target_lang: str,
+        include_alternatives: bool,
+        messages: List[Dict[str, str]]
+    ) -> int:
+        """일괄 번역 요청의 max_tokens를 정합니다 (스타일별 예산의 합)."""
+        if self.token_budget is None:
+            per_style_budget = self.max_tokens + (self._ALTERNATIVES_MAX_TOKENS if include_alternatives else 0)
+            # 스타일 수만큼 늘린 값이 모델의 최대 출력 토큰(예: gpt-4-turbo 4096)을 넘지 않도록 제한
+            return TokenBudget.clamp(min(per_style_budget * len(styles), self._BATCH_MAX_TOKENS), self.model)
+
+        input_tokens = self.token_budget.count(text, self.model)
+        # 대안 표현을 포함하면 스타일마다 기본 번역 1개 + 대안 3개를 생성합니다
+        outputs = 4 if include_alternatives else 1
+        total = sum(
+            self.token_budget.estimate(input_tokens, source_lang, target_lang, self.model, style=style, outputs=outputs)
+            for style in styles
+        )
+        return self.token_budget.clamp(total, self.model, self.token_budget.count_messages(messages, self.model))
+
+    @staticmethod
+    def _parse_batched_response(
+        content: str,
+        styles: List[str],
+        include_alternatives: bool
+    ) -> Dict[str, Union[str, Dict[str, Union[str, List[str]]]]]:
+        """일괄 번역 JSON 응답을 translate_multi_style 형식으로 변환합니다.
+
+        형식이 올바르지 않은 스타일은 결과에서 제외되며, JSON 자체가 잘못된 경우 ValueError가 발생합니다.
+        """
+        data = json.loads(content)
+        translations = data.get("translations") if isinstance(data, dict) else None
+        if not isinstance(translations, dict):
+            raise ValueError("응답에 translations 객체가 없습니다")
+
+        results: Dict[str, Union[str, Dict[str, Union[str, List[str]]]]] = {}
         for style in styles:
-            try:
-                translation = self.translate_single_style(
+            entry = translations.get(style)
+            if isinstance(entry, str):
+                primary, alternatives = entry, []
+            elif isinstance(entry, dict) and isinstance(entry.get("primary"), str):
+                primary = entry["primary"]
+                raw_alternatives = entry.get("alternatives") or []
+                alternatives = [
+                    alt.strip() for alt in raw_alternatives
+                    if isinstance(alt, str) and alt.strip()
+                ] if isinstance(raw_alternatives, list) else []
+            else:
+                continue
+
+            if not primary.strip():
+                continue
+
+            if include_alternatives:
+                results[style] = {
+                    "primary": primary,
+                    "alternatives": alternatives[:3]  # 최대 3개
+                }
+            else:
+                results[style] = primary
+
+        return results
+
+    def _translate_style_with_alternatives(
+        self,
+        text: str,
+        style: str,
+        source_lang: str,
+        target_lang: str,
+        preserve_proper_nouns: bool,
+        include_alternatives: bool,
+        custom_instruction: Optional[str] = None
+    ) -> Union[str, Dict[str, Union[str, List[str]]]]:
+        """스타일 하나를 번역하고 필요하면 대안 표현까지 생성합니다.
+
+        예외를 밖으로 전파하지 않고 "[{style} 번역 실패]" 문자열로 대체하여
+        한 스타일의 실패가 다른 스타일 결과에 영향을 주지 않도록 합니다.
+        """
+        try:
+            translation = self.translate_single_style(
+                text=text,
+                style=style,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                preserve_proper_nouns=preserve_proper_nouns,
+                custom_instruction=custom_instruction
+            )
+
+            # 대안 표현 생성 (옵션)
+            if include_alternatives:
+                alternatives = self._generate_alternatives(
                     text=text,
+                    base_translation=translation,
                     style=style,
                     source_lang=source_lang,
-                    target_lang=target_lang,
-                    preserve_proper_nouns=preserve_proper_nouns
+                    target_lang=target_lang
                 )
+                return {
+                    "primary": translation,
+                    "alternatives": alternatives
+                }
+            return translation
 
-                # 대안 표현 생성 (옵션)
-                if include_alternatives:
-                    alternatives = self._generate_alternatives(
-                        text=text,
-                        base_translation=translation,
-                        style=style,
-                        source_lang=source_lang,
-                        target_lang=target_lang
-                    )
-                    results[style] = {
-                        "primary": translation,
-                        "alternatives": alternatives
-                    }
-                else:
-                    results[style] = translation
-
-            except Exception as e:
-                logger.error(
-                    f"{style} 스타일 번역 실패, 건너뜀",
-                    extra={"error": str(e)}
-                )
-                results[style] = f"[{style} 번역 실패]"
-
-        return results
+        except Exception as e:
+            logger.error(
+                f"{style} 스타일 번역 실패, 건너뜀",
+                extra={"error": str(e)}
+            )
+            return f"[{style} 번역 실패]"
 
     def _generate_alternatives(
         self,
@@ -263,6 +770,10 @@ Only respond with the translation, nothing else."""
         Returns:
             대안 표현 리스트 (2-3개)
         """
+        routed = self._routed(text, source_lang, target_lang, style, "alternatives")
+        if routed is not self:
+            return routed._generate_alternatives(text, base_translation, style, source_lang, target_lang)
+
         try:
             style_instruction = self.STYLE_INSTRUCTIONS.get(style, "")
 
@@ -273,16 +784,30 @@ Provide 2-3 alternative ways to express the same meaning in {target_lang}, follo
 
 Only output the alternatives, one per line, without numbering or explanation."""
 
+            # 대안 표현 2-3개는 기본 번역과 같은 언어이므로 기본 번역 길이로 예산을 정합니다
+            max_tokens = self._ALTERNATIVES_MAX_TOKENS
+            if self.token_budget is not None:
+                max_tokens = self.token_budget.estimate(
+                    self.token_budget.count(base_translation, self.model),
+                    target_lang,
+                    target_lang,
+                    self.model,
+                    outputs=3
+                )
+
+            messages = [
+                {"role": "system", "content": "You are a professional translator providing alternative expressions."},
+                {"role": "user", "content": prompt}
+            ]
+            self._acquire_rate_limit(messages, max_tokens)
+
             # API 호출 (Azure인 경우 deployment 사용, 아니면 model 사용)
             model_or_deployment = self.deployment if self.deployment else self.model
-            response = self.client.chat.completions.create(
+            response = self._send(
                 model=model_or_deployment,
-                messages=[
-                    {"role": "system", "content": "You are a professional translator providing alternative expressions."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.7,  # 다양성을 위해 높은 온도
-                max_tokens=500,
+                max_tokens=max_tokens,
                 timeout=self.timeout
             )
 
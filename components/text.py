@@ -1,28 +1,50 @@
 """텍스트 분석 및 처리 기능을 제공하는 모듈"""
-from utils import count_tokens, strip_markdown
+from typing import Optional
+
+from components.statistics import IncrementalTextStatistics
+from components.tokens import TokenCounter
+from utils import has_markdown, strip_markdown
 
 
 class TextAnalyzer:
     """텍스트 분석 및 Markdown 처리를 담당하는 클래스"""
 
-    def __init__(self, model: str = "gpt-4o"):
+    def __init__(self, model: str = "gpt-4o", token_counter: Optional[TokenCounter] = None):
         """
         Args:
             model: 토큰 카운팅에 사용할 모델명 (기본 gpt-4o)
+            token_counter: 토큰 카운팅 서비스 (None이면 기본 설정으로 생성)
         """
         self.model = model
+        self.token_counter = token_counter or TokenCounter()
 
-    def count_tokens(self, text: str) -> int:
-        return count_tokens(text, self.model)
+    def count_tokens(self, text: str, approximate: Optional[bool] = False) -> int:
+        """텍스트의 토큰 수를 반환합니다.
+
+        Args:
+            text: 분석할 텍스트
+            approximate: True이면 근사 카운트, None이면 텍스트 길이에 따라 자동 선택
+
+        Returns:
+            토큰 수
+        """
+        return self.token_counter.count(text, self.model, approximate=approximate)
 
     def count_characters(self, text: str) -> int:
         return len(text)
 
-    def get_statistics(self, text: str) -> dict:
+    def get_statistics(
+        self,
+        text: str,
+        incremental: Optional[IncrementalTextStatistics] = None,
+        approximate: bool = False
+    ) -> dict:
         """텍스트의 통계 정보를 반환합니다.
 
         Args:
             text: 분석할 텍스트
+            incremental: 증분 통계 계산기 (지정 시 이전 호출 이후 바뀐 구간만 다시 계산)
+            approximate: True이면 토큰 수를 근사 카운트로 추정
 
         Returns:
             통계 정보 딕셔너리 {
@@ -31,20 +53,27 @@ class TextAnalyzer:
                 "words": 단어 수 (공백 기준),
                 "lines": 줄 수
             }
+            incremental 지정 시 "korean_chars", "english_chars"가 추가됩니다.
         """
+        if incremental is not None:
+            return incremental.update(text, self.model, approximate=approximate)
+
         return {
             "characters": len(text),
-            "tokens": self.count_tokens(text),
+            "tokens": self.count_tokens(text, approximate=approximate),
             "words": len(text.split()),
             "lines": len(text.splitlines())
         }
 
+    def create_incremental_statistics(self) -> IncrementalTextStatistics:
+        """이 분석기의 TokenCounter를 공유하는 증분 통계 계산기를 생성합니다."""
+        return IncrementalTextStatistics(token_counter=self.token_counter)
+
     def strip_markdown(self, text: str) -> str:
         return strip_markdown(text)
 
     def has_markdown(self, text: str) -> bool:
-        stripped = self.strip_markdown(text)
-        return stripped != text
+        return has_markdown(text)
 
     def format_statistics_display(self, text: str, direction_arrow: str = "") -> str:
         """통계 정보를 UI 표시용 HTML로 포맷합니다.
@@ -57,9 +86,12 @@ class TextAnalyzer:
             HTML 형식의 통계 문자열
         """
         char_count = len(text)
-        token_count = self.count_tokens(text)
+        # 대용량 입력은 근사 카운트로 표시하여 입력 중 지연을 줄입니다
+        approximate = self.token_counter.is_approximate(text)
+        token_count = self.count_tokens(text, approximate=approximate)
+        token_label = f"~{token_count:,}" if approximate else f"{token_count:,}"
 
         if direction_arrow:
-            return f"<div style='text-align: right;'>{direction_arrow}<br/>{char_count:,}자 / {token_count:,} 토큰</div>"
+            return f"<div style='text-align: right;'>{direction_arrow}<br/>{char_count:,}자 / {token_label} 토큰</div>"
         else:
-            return f"<div style='text-align: right; color: #888;'>{char_count:,}자 / {token_count:,} 토큰</div>"
+            return f"<div style='text-align: right; color: #888;'>{char_count:,}자 / {token_label} 토큰</div>"
@@ -0,0 +1,174 @@
+"""토큰 카운팅 서비스 모듈
+
+모델별 tiktoken 인코더 캐시, 텍스트 해시 기반 카운트 메모이제이션, 일괄 인코딩,
+대용량 입력을 위한 근사 카운트 기능을 제공합니다.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from utils import get_encoding
+
+logger = logging.getLogger("transbot.tokens")
+
+
+class TokenCounter:
+    """토큰 수를 계산하는 서비스 클래스
+
+    Streamlit rerun마다 같은 입력의 토큰을 반복 계산하지 않도록 (인코딩, 텍스트 해시) 단위로 결과를 메모이제이션합니다.
+    approximate_threshold보다 긴 텍스트는 표본 구간만 인코딩하여 전체 토큰 수를 추정할 수 있습니다.
+    """
+
+    # 근사 카운트 시 표본 구간 수와 구간 길이 (문자 수)
+    _SAMPLE_WINDOWS = 4
+    _SAMPLE_WINDOW_SIZE = 1000
+
+    def __init__(
+        self,
+        memo_size: int = 256,
+        approximate_threshold: int = 20000,
+        encoding_getter: Callable[[str], Any] = get_encoding
+    ) -> None:
+        """
+        Args:
+            memo_size: 메모이제이션할 최대 카운트 결과 수
+            approximate_threshold: 근사 카운트를 사용할 최소 문자 수 (count(approximate=None)일 때)
+            encoding_getter: 모델명으로 인코더를 반환하는 함수 (기본: utils.get_encoding)
+        """
+        self.memo_size = max(1, memo_size)
+        self.approximate_threshold = approximate_threshold
+        self._encoding_getter = encoding_getter
+        self._memo: "OrderedDict[tuple[str, str, bool], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_encoding(self, model: str) -> Any:
+        return self._encoding_getter(model)
+
+    def warm_up(self, models: Iterable[str]) -> list[str]:
+        """지정한 모델들의 인코더를 미리 로드합니다.
+
+        첫 입력 시 인코더 로드 지연이 발생하지 않도록 애플리케이션 시작 시 호출합니다.
+        로드에 실패한 모델은 경고만 남기고 건너뜁니다.
+
+        Args:
+            models: 인코더를 로드할 모델명 목록
+
+        Returns:
+            로드에 성공한 모델명 리스트
+        """
+        loaded = []
+        for model in dict.fromkeys(models):
+            try:
+                self.get_encoding(model)
+                loaded.append(model)
+            except Exception as e:
+                logger.warning("토큰 인코더 사전 로드 실패", extra={
+                    "model": model,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                })
+
+        logger.info("토큰 인코더 사전 로드 완료", extra={"models": loaded})
+        return loaded
+
+    def count(self, text: str, model: str = "gpt-4o", approximate: Optional[bool] = False) -> int:
+        """텍스트의 토큰 수를 반환합니다.
+
+        Args:
+            text: 분석할 텍스트
+            model: 토큰화 기준 모델명
+            approximate: True이면 근사 카운트, False이면 정확한 카운트,
+                None이면 텍스트 길이가 approximate_threshold를 넘을 때만 근사 카운트
+
+        Returns:
+            토큰 수 (근사 모드에서는 추정값)
+        """
+        if not text:
+            return 0
+
+        if approximate is None:
+            approximate = len(text) > self.approximate_threshold
+
+        encoding = self.get_encoding(model)
+        memo_key = (getattr(encoding, "name", model), self._hash(text), approximate)
+
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                return cached
+
+        if approximate:
+            result = self._count_approximate(text, encoding)
+        else:
+            result = len(encoding.encode(text))
+
+        with self._lock:
+            self._memo[memo_key] = result
+            self._memo.move_to_end(memo_key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+        return result
+
+    def is_approximate(self, text: str, approximate: Optional[bool] = None) -> bool:
+        """count(text, approximate=...)가 근사 카운트를 사용하는지 반환합니다."""
+        if approximate is None:
+            return len(text) > self.approximate_threshold
+        return approximate
+
+    def encode_batch(self, texts: list[str], model: str = "gpt-4o") -> list[list[int]]:
+        """여러 텍스트를 한 번에 인코딩합니다.
+
+        tiktoken의 encode_batch는 내부 스레드 풀로 병렬 인코딩하므로 텍스트별 encode 호출보다 빠릅니다.
+
+        Args:
+            texts: 인코딩할 텍스트 리스트
+            model: 토큰화 기준 모델명
+
+        Returns:
+            텍스트별 토큰 ID 리스트 (입력 순서 유지)
+        """
+        if not texts:
+            return []
+
+        encoding = self.get_encoding(model)
+        if hasattr(encoding, "encode_batch"):
+            return encoding.encode_batch(texts)
+        return [encoding.encode(text) for text in texts]
+
+    def count_batch(self, texts: list[str], model: str = "gpt-4o") -> list[int]:
+        return [len(tokens) for tokens in self.encode_batch(texts, model)]
+
+    def _count_approximate(self, text: str, encoding: Any) -> int:
+        """텍스트 전체에 고르게 분포한 표본 구간만 인코딩하여 토큰 수를 추정합니다.
+
+        표본 구간의 문자당 토큰 비율을 전체 길이에 곱하므로, 한글/영문/코드 비율이
+        문서 전체에서 크게 다르지 않은 일반적인 입력에서 오차가 작습니다.
+        """
+        length = len(text)
+        sample_total = self._SAMPLE_WINDOWS * self._SAMPLE_WINDOW_SIZE
+        if length <= sample_total:
+            return len(encoding.encode(text))
+
+        stride = (length - self._SAMPLE_WINDOW_SIZE) / (self._SAMPLE_WINDOWS - 1)
+        samples = [
+            text[int(i * stride):int(i * stride) + self._SAMPLE_WINDOW_SIZE]
+            for i in range(self._SAMPLE_WINDOWS)
+        ]
+        sample_tokens = sum(len(tokens) for tokens in self._encode_samples(samples, encoding))
+        return math.ceil(sample_tokens * length / sample_total)
+
+    @staticmethod
+    def _encode_samples(samples: list[str], encoding: Any) -> list[list[int]]:
+        if hasattr(encoding, "encode_batch"):
+            return encoding.encode_batch(samples)
+        return [encoding.encode(sample) for sample in samples]
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
@@ -1,17 +1,55 @@
 """번역 관리 기능을 제공하는 모듈"""
 
+import asyncio
+import contextvars
+import inspect
+import itertools
 import logging
+import re
 import time
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Optional, Any
 from config import Config
-from langfuse.decorators import observe, langfuse_context
-from utils import count_tokens
+from langfuse.decorators import langfuse_context
+from components.budget import TokenBudget
+from components.cache import TranslationCache, make_cache_key
+from components.deployment_pool import DeploymentPool
+from components.glossary import GlossaryRegistry
+from components.hedging import HedgingPolicy
+from components.memory import TranslationMemory, make_memory_scope
+from components.observability import flush_observations, traced
+from components.placeholders import PlaceholderProtector
+from components.prompts import PROMPT_REGISTRY, cached_prompt_tokens
+from components.rate_limit import RateLimiter
+from components.router import ModelRouter
+from components.singleflight import SingleFlight
+from utils import count_script_letters, count_tokens, split_sentences
 
 logger = logging.getLogger("transbot.translation")
 
 # 상수 정의
 ERROR_OUTPUT_MESSAGE = "[Error occurred]"
 
+# RoutingTranslationManager가 고른 현재 요청의 라우팅 결과 (로그 및 Langfuse 메타데이터용)
+_current_route: contextvars.ContextVar[Optional[dict[str, Any]]] = contextvars.ContextVar(
+    "transbot_current_route", default=None
+)
+
+_SURROUNDING_WHITESPACE_PATTERN = re.compile(r'^(\s*)(.*?)(\s*)$', re.DOTALL)
+
+
+class StreamResultReplaced(Exception):
+    """스트리밍으로 내보낸 번역문을 다른 번역 결과로 바꿔야 할 때 발생하는 예외
+
+    ProtectedTranslationManager.translate_stream()에서 플레이스홀더 복원에 실패하면 보호 없이 다시 번역한 결과를
+    text에 담아 발생시킵니다. 호출한 쪽은 표시한 스트리밍 결과 대신 text를 사용해야 합니다.
+    """
+
+    def __init__(self, text: str) -> None:
+        super().__init__("스트리밍 번역 결과를 다시 번역한 결과로 바꿔야 합니다")
+        self.text = text
+
 
 class TranslationManager:
     """번역 작업을 관리하는 클래스
@@ -36,23 +74,37 @@ class TranslationManager:
         temperature: Optional[float] = None,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        cache: Optional[TranslationCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        token_budget: Optional[TokenBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        on_rate_limit_wait: Optional[Callable[[float], None]] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        glossary: Optional[GlossaryRegistry] = None
     ) -> None:
         """
         Args:
             client: OpenAI 클라이언트 인스턴스
-            config: Config 인스턴스 (None이면 Config.load() 호출)
+            config: Config 인스턴스 (None이면 Config.get() 사용)
             model: 사용할 AI 모델 (None이면 config에서 로드)
             temperature: 번역 창의성 설정 (None이면 config에서 로드)
             timeout: API 타임아웃 초 (None이면 config에서 로드)
             max_retries: API 재시도 횟수 (None이면 config에서 로드)
             max_tokens: 최대 출력 토큰 수 (None이면 config에서 로드)
+            cache: 번역 결과 캐시 (None이면 캐시 미사용)
+            single_flight: 동시에 들어온 동일 요청을 하나의 API 호출로 합치는 SingleFlight (None이면 미사용)
+            token_budget: 입력에 맞춰 요청별 max_tokens를 정하는 TokenBudget (None이면 max_tokens 고정)
+            rate_limiter: 요청 전에 RPM/TPM 한도를 확보하는 RateLimiter (None이면 제한 없음)
+            on_rate_limit_wait: 요청 한도 때문에 대기할 때 예상 대기 시간(초)으로 호출되는 콜백 (UI 표시용)
+            hedging: 응답이 늦으면 중복 요청을 보내는 HedgingPolicy (None이면 미사용, 스트리밍은 첫 조각까지의 시간 기준)
+            glossary: 입력에 등장한 용어만 프롬프트에 넣고 결과를 검사하는 GlossaryRegistry (None이면 미사용)
 
         Raises:
             ValueError: 지원하지 않는 모델인 경우
         """
         # Config에서 기본값 로드
-        self.config = config if config is not None else Config.load()
+        self.config = config if config is not None else Config.get()
 
         # 파라미터가 None이면 config 값 사용
         self.model = model if model is not None else self.config.DEFAULT_MODEL
@@ -66,139 +118,807 @@ class TranslationManager:
             raise ValueError(f"지원하지 않는 모델입니다: {self.model}")
 
         self.client = client
-
-    @observe(name="translation", as_type="generation")
-    def translate(self, text: str, source: str, target: str, session_id: str = "unknown") -> str:
+        self.cache = cache
+        self.single_flight = single_flight
+        self.token_budget = token_budget
+        self.rate_limiter = rate_limiter
+        self.on_rate_limit_wait = on_rate_limit_wait
+        self.hedging = hedging
+        self.glossary = glossary
+
+    @traced(name="translation", as_type="generation")
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> str:
         """텍스트를 번역합니다.
 
         Langfuse에서 GENERATION 타입으로 추적되며, 입력/출력, 사용량, 비용, 타이밍이 기록됩니다.
+        Azure는 model 파라미터에 deployment 이름을 사용합니다.
 
         Args:
             text: 번역할 텍스트
             source: 원본 언어 (예: "Korean", "English")
             target: 대상 언어 (예: "English", "Korean")
             session_id: 세션 ID (Langfuse 추적용)
+            context: 번역 일관성을 위한 참고 문맥 (앞 구간 원문, 용어집 등, 번역하지 않음)
 
         Returns:
             번역된 텍스트
         """
+        start_time, cache_key, cached = self._begin_translation(text, source, target, session_id, context)
+        if cached is not None:
+            return cached
+
+        try:
+            # messages 배열 준비 (Langfuse input으로 사용)
+            messages = self._build_messages(text, source, target, context)
+            max_tokens, budget_input_tokens = self._plan_max_tokens(text, source, target, messages)
+
+            response, coalesced = self._create_completion(
+                self._make_request_key(text, source, target, context),
+                model=getattr(self, "deployment", self.model),  # Azure는 deployment 이름 사용
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=max_tokens,
+                timeout=self.timeout
+            )
+            result = self._completion_text(response)
+            if coalesced:
+                # 다른 요청의 API 호출 결과를 함께 받았으므로 토큰을 사용하지 않았습니다
+                usage = {"input": 0, "output": 0, "cached": 0}
+            else:
+                usage = self._response_usage(response.usage)
+                self._record_budget(source, target, budget_input_tokens, max_tokens, usage["output"])
+
+            single_flight_metadata = self._single_flight_metadata(coalesced)
+            self._finish_translation(
+                text, source, target, messages, result, usage, start_time, cache_key,
+                metadata=single_flight_metadata,
+                log_extra=single_flight_metadata
+            )
+            return result
+
+        except Exception as e:
+            self._fail_translation(text, source, target, e)
+            raise
+
+    @traced(name="translation_stream", as_type="generation")
+    def translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> Iterator[str]:
+        """텍스트를 스트리밍으로 번역합니다.
+
+        stream=True로 API를 호출하여 생성되는 번역문 조각(delta)을 순서대로 yield합니다.
+        스트림이 끝나면 사용량(stream_options.include_usage), 첫 토큰까지의 시간,
+        전체 응답 시간을 translate()와 같은 형식으로 Langfuse와 로그에 기록합니다.
+        OpenAI와 Azure 모두 지원합니다 (Azure는 model 파라미터에 deployment 이름 사용).
+        single_flight가 설정되어 있으면 같은 요청의 스트림(또는 일반 호출)이 진행 중일 때
+        새 스트림을 열지 않고 그 결과를 기다려 전체 번역문을 한 번에 반환합니다.
+
+        Args:
+            text: 번역할 텍스트
+            source: 원본 언어 (예: "Korean", "English")
+            target: 대상 언어 (예: "English", "Korean")
+            session_id: 세션 ID (Langfuse 추적용)
+            context: 번역 일관성을 위한 참고 문맥 (번역하지 않음)
+
+        Yields:
+            번역문 조각 (이어 붙이면 전체 번역문)
+        """
+        start_time, cache_key, cached = self._begin_translation(
+            text, source, target, session_id, context, streaming=True
+        )
+        if cached is not None:
+            # 캐시 적중 시 API 호출 없이 전체 결과를 한 번에 반환
+            yield cached
+            return
+
+        try:
+            # messages 배열 준비 (Langfuse input으로 사용)
+            messages = self._build_messages(text, source, target, context)
+            max_tokens, budget_input_tokens = self._plan_max_tokens(text, source, target, messages)
+
+            # 같은 요청이 진행 중이면 새 스트림을 열지 않고 그 결과를 기다려 한 번에 반환합니다
+            request_key = self._make_request_key(text, source, target, context)
+            call = None
+            if self.single_flight is not None:
+                call, leader = self.single_flight.begin(request_key)
+                if not leader:
+                    coalesced = self.single_flight.wait(call)
+                    call = None
+                    if coalesced is not None:
+                        coalesced_text = self._completion_text(coalesced)
+                        self._finish_coalesced(
+                            text, source, target, messages, coalesced_text, start_time, streaming=True
+                        )
+                        yield coalesced_text
+                        return
+                    # 먼저 시작한 스트림이 결과 없이 중단되었으면 직접 스트리밍합니다
+
+            result: Optional[str] = None
+            error: Optional[Exception] = None
+            try:
+                self._acquire_rate_limit(messages, max_tokens, on_wait=self.on_rate_limit_wait)
+                stream = self._open_stream(messages, max_tokens)
+
+                parts: list[str] = []
+                usage = None
+                first_token_time: Optional[float] = None
+
+                for chunk in stream:
+                    delta, usage = self._read_stream_chunk(chunk, usage)
+                    if delta:
+                        if first_token_time is None:
+                            first_token_time = time.time()
+                        parts.append(delta)
+                        yield delta
+
+                result = "".join(parts)
+                self._finish_stream(
+                    text, source, target, messages, result, usage, start_time, first_token_time,
+                    cache_key, budget_input_tokens, max_tokens
+                )
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # 스트림을 끝까지 읽지 않고 중단되면 결과 없이 끝내 기다리던 요청이 직접 번역하게 합니다
+                if call is not None:
+                    self.single_flight.finish(request_key, call, result=result, error=error)
+
+        except Exception as e:
+            self._fail_translation(text, source, target, e, streaming=True)
+            raise
+
+    def _begin_translation(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str,
+        context: Optional[str] = None,
+        streaming: bool = False
+    ) -> tuple[float, Optional[str], Optional[str]]:
+        """번역 요청의 trace를 시작하고 캐시를 조회한 뒤 API 호출 시작을 로깅합니다.
+
+        Returns:
+            (시작 시각, 캐시 키, 캐시 적중 결과) 튜플 - 캐시 미사용 시 캐시 키는 None,
+            캐시에 없으면 결과는 None (적중 시 시작 로그 대신 캐시 적중이 기록됨)
+        """
         start_time = time.time()
-        input_length = len(text)
 
         # Langfuse trace에 session_id, input, metadata 설정
         langfuse_context.update_current_trace(
             session_id=session_id,
             input=text,
-            metadata={"direction": f"{source}→{target}"}
+            metadata={
+                "direction": f"{source}→{target}",
+                **({"streaming": True} if streaming else {}),
+                **self._deployment_metadata()
+            }
         )
 
+        # 캐시 조회 (적중 시 API 호출 생략)
+        cache_key = self._make_cache_key(text, source, target, context)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return start_time, cache_key, self._return_cached(cached, source, target, start_time)
+
         # API 호출 시작 로깅
         logger.info(
-            "번역 API 호출 시작",
+            "번역 스트리밍 API 호출 시작" if streaming else "번역 API 호출 시작",
             extra={
-                "provider": "openai" if not hasattr(self, 'deployment') else "azure",
+                "provider": self._provider(),
                 "model": self.model,
+                **self._deployment_metadata(),
                 "source_lang": source,
                 "target_lang": target,
-                "input_length": input_length,
+                "input_length": len(text),
                 "temperature": self.temperature
             }
         )
+        return start_time, cache_key, None
 
-        try:
-            # messages 배열 준비 (Langfuse input으로 사용)
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"You are a professional translator. Translate the following {source} text to {target}. IMPORTANT: Preserve all Markdown formatting (bold, italic, headings, lists, links, code blocks, blockquotes, tables, etc.) in the translation. Only respond with the translation, nothing else."  # noqa: E501
-                },
-                {
-                    "role": "user",
-                    "content": text
-                }
-            ]
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout
-            )
-            result = response.choices[0].message.content
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-
-            # Langfuse observation에 input, output, model, usage 정보 업데이트
-            langfuse_context.update_current_observation(
-                input=messages,  # Prompt 표시를 위해 messages 추가
-                output=result,
-                model=self.model,
-                usage={
-                    "input": input_tokens,
-                    "output": output_tokens,
-                    "total": input_tokens + output_tokens,
-                },
-                metadata={
-                    "direction": f"{source}→{target}",
-                }
-            )
+    def _finish_translation(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        messages: list[dict[str, str]],
+        result: str,
+        usage: dict[str, int],
+        start_time: float,
+        cache_key: Optional[str],
+        metadata: Optional[dict[str, Any]] = None,
+        log_extra: Optional[dict[str, Any]] = None,
+        completion_start_time: Optional[datetime] = None,
+        streaming: bool = False
+    ) -> None:
+        """성공한 번역의 사용량을 Langfuse와 로그에 기록하고 결과를 캐시합니다.
 
-            # Langfuse trace에 output 업데이트
-            langfuse_context.update_current_trace(output=result)
-
-            # API 호출 성공 로깅
-            response_time_ms = int((time.time() - start_time) * 1000)
-            logger.info(
-                "번역 API 호출 성공",
-                extra={
-                    "provider": "openai" if not hasattr(self, 'deployment') else "azure",
-                    "model": self.model,
-                    "response_time_ms": response_time_ms,
-                    "output_length": len(result),
-                    "prompt_tokens": input_tokens,
-                    "completion_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens
-                }
-            )
+        Args:
+            usage: {"input": 입력 토큰, "output": 출력 토큰, "cached": 프롬프트 캐시 적중 토큰}
+            metadata: Langfuse observation 메타데이터에 추가할 항목
+            log_extra: 성공 로그에 추가할 항목
+            completion_start_time: 첫 토큰 수신 시각 (스트리밍)
+            streaming: 스트리밍 번역 여부 (로그 메시지 구분)
+        """
+        glossary_metadata = self._glossary_metadata(text, source, target, result)
+        total_tokens = usage["input"] + usage["output"]
+
+        # Langfuse observation에 input, output, model, usage 정보 업데이트
+        observation: dict[str, Any] = {
+            "input": messages,  # Prompt 표시를 위해 messages 추가
+            "output": result,
+            "model": self.model,
+            "usage": {"input": usage["input"], "output": usage["output"], "total": total_tokens},
+            "metadata": {
+                "direction": f"{source}→{target}",
+                **self._deployment_metadata(),
+                **(metadata or {}),
+                "cached_prompt_tokens": usage["cached"],
+                **glossary_metadata,
+                **self._cache_metadata(),
+                **self._route_metadata(),
+            }
+        }
+        if completion_start_time is not None:
+            observation["completion_start_time"] = completion_start_time
+        langfuse_context.update_current_observation(**observation)
 
-            langfuse_context.flush()
-            return result
+        # Langfuse trace에 output 업데이트
+        langfuse_context.update_current_trace(output=result)
 
-        except Exception as e:
-            # 에러 발생 시 입력 토큰 추정 (Langfuse에 usage 정보 제공)
-            estimated_input_tokens = count_tokens(text, self.model)
-
-            # Langfuse observation에 output, model, usage 정보 업데이트 (에러 상태)
-            langfuse_context.update_current_observation(
-                output=ERROR_OUTPUT_MESSAGE,
-                model=self.model,
-                usage={
-                    "input": estimated_input_tokens,
-                    "output": 0,
-                    "total": estimated_input_tokens,
-                },
-                metadata={
-                    "direction": f"{source}→{target}",
-                    "error": str(e),
-                }
-            )
+        # API 호출 성공 로깅
+        logger.info(
+            "번역 스트리밍 API 호출 성공" if streaming else "번역 API 호출 성공",
+            extra={
+                "provider": self._provider(),
+                "model": self.model,
+                **self._deployment_metadata(),
+                "response_time_ms": int((time.time() - start_time) * 1000),
+                "output_length": len(result),
+                "prompt_tokens": usage["input"],
+                "completion_tokens": usage["output"],
+                "total_tokens": total_tokens,
+                "cached_prompt_tokens": usage["cached"],
+                **glossary_metadata,
+                **self._cache_metadata(),
+                **self._route_metadata(),
+                **(log_extra or {})
+            }
+        )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+
+        flush_observations()
 
-            # API 호출 실패 로깅
-            logger.error(
-                "번역 API 호출 실패",
-                extra={
-                    "provider": "openai" if not hasattr(self, 'deployment') else "azure",
-                    "model": self.model,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "input_length": input_length
-                },
-                exc_info=True
+    def _finish_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        messages: list[dict[str, str]],
+        result: str,
+        usage: Any,
+        start_time: float,
+        first_token_time: Optional[float],
+        cache_key: Optional[str],
+        budget_input_tokens: Optional[int],
+        max_tokens: int
+    ) -> None:
+        """끝난 스트림의 사용량을 정리하여 _finish_translation()으로 기록합니다.
+
+        usage를 반환하지 않는 API 버전에서는 토큰 수를 추정합니다.
+        """
+        if usage is not None:
+            tokens = self._response_usage(usage)
+        else:
+            tokens = {
+                "input": count_tokens("".join(message["content"] for message in messages), self.model),
+                "output": count_tokens(result, self.model),
+                "cached": 0
+            }
+        self._record_budget(source, target, budget_input_tokens, max_tokens, tokens["output"])
+
+        time_to_first_token_ms = (
+            int((first_token_time - start_time) * 1000) if first_token_time is not None else None
+        )
+        self._finish_translation(
+            text, source, target, messages, result, tokens, start_time, cache_key,
+            metadata={"streaming": True, "usage_estimated": usage is None},
+            log_extra={"time_to_first_token_ms": time_to_first_token_ms},
+            completion_start_time=(
+                datetime.fromtimestamp(first_token_time, tz=timezone.utc) if first_token_time is not None else None
+            ),
+            streaming=True
+        )
+
+    def _finish_coalesced(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        messages: list[dict[str, str]],
+        result: str,
+        start_time: float,
+        streaming: bool = False
+    ) -> None:
+        """진행 중인 동일 요청의 결과를 받은 번역을 기록합니다.
+
+        API를 호출하지 않았으므로 토큰 사용량은 0이며, 캐시는 먼저 시작한 요청이 저장합니다.
+        """
+        single_flight_metadata = self._single_flight_metadata(coalesced=True)
+        self._finish_translation(
+            text, source, target, messages, result, {"input": 0, "output": 0, "cached": 0}, start_time, None,
+            metadata={**({"streaming": True} if streaming else {}), **single_flight_metadata},
+            log_extra=single_flight_metadata,
+            streaming=streaming
+        )
+
+    def _fail_translation(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        error: Exception,
+        streaming: bool = False
+    ) -> None:
+        """실패한 번역을 Langfuse와 로그에 기록합니다 (예외는 호출한 쪽에서 다시 발생시킴)."""
+        # 에러 발생 시 입력 토큰 추정 (Langfuse에 usage 정보 제공)
+        estimated_input_tokens = count_tokens(text, self.model)
+
+        # Langfuse observation에 output, model, usage 정보 업데이트 (에러 상태)
+        langfuse_context.update_current_observation(
+            output=ERROR_OUTPUT_MESSAGE,
+            model=self.model,
+            usage={
+                "input": estimated_input_tokens,
+                "output": 0,
+                "total": estimated_input_tokens,
+            },
+            metadata={
+                "direction": f"{source}→{target}",
+                **self._deployment_metadata(),
+                **({"streaming": True} if streaming else {}),
+                "error": str(error),
+            }
+        )
+
+        # API 호출 실패 로깅
+        logger.error(
+            "번역 스트리밍 API 호출 실패" if streaming else "번역 API 호출 실패",
+            extra={
+                "provider": self._provider(),
+                "model": self.model,
+                **self._deployment_metadata(),
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "input_length": len(text)
+            },
+            exc_info=True
+        )
+
+        flush_observations()
+
+    def _stream_request(self, messages: list[dict[str, str]], max_tokens: int) -> dict[str, Any]:
+        """스트리밍 chat.completions.create 요청 파라미터를 반환합니다."""
+        return {
+            "model": getattr(self, "deployment", self.model),  # Azure는 deployment 이름 사용
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
+            "timeout": self.timeout,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+
+    def _open_stream(self, messages: list[dict[str, str]], max_tokens: int) -> Iterable[Any]:
+        """스트리밍 요청을 보내고 스트림 청크 iterator를 반환합니다.
+
+        연결 오류, 429, 5xx는 첫 청크 전에 create()에서 발생하므로 deployment 풀이 다른 deployment로 재시도합니다.
+        hedging이 설정되어 있으면 첫 번역문 조각까지의 시간이 지연 기준을 넘을 때 같은 스트림을 한 번 더 열고,
+        먼저 첫 조각이 도착한 스트림을 사용합니다 (늦은 스트림은 닫음).
+        """
+        request = self._stream_request(messages, max_tokens)
+        if self.hedging is None:
+            return self._send(request)
+
+        def call() -> tuple[Any, Iterator[Any]]:
+            stream = self._send(request)
+            return stream, self._read_first_delta(stream)
+
+        def can_hedge() -> bool:
+            return self._try_acquire_rate_limit(messages, max_tokens)
+
+        _, chunks = self.hedging.run(
+            self._stream_hedge_key(), call, can_hedge=can_hedge, on_discard=lambda opened: self._close_stream(opened[0])
+        )
+        return chunks
+
+    async def _open_stream_async(self, messages: list[dict[str, str]], max_tokens: int) -> AsyncIterable[Any]:
+        """_open_stream()의 비동기 버전입니다 (늦은 스트림의 태스크는 취소하고 스트림을 닫음)."""
+        request = self._stream_request(messages, max_tokens)
+        if self.hedging is None:
+            return await self._send_async(request)
+
+        async def call() -> tuple[Any, AsyncIterator[Any]]:
+            stream = await self._send_async(request)
+            try:
+                return stream, await self._read_first_delta_async(stream)
+            except asyncio.CancelledError:
+                await self._close_stream_async(stream)
+                raise
+
+        def can_hedge() -> bool:
+            return self._try_acquire_rate_limit(messages, max_tokens)
+
+        async def discard(opened: tuple[Any, AsyncIterator[Any]]) -> None:
+            await self._close_stream_async(opened[0])
+
+        _, chunks = await self.hedging.run_async(
+            self._stream_hedge_key(), call, can_hedge=can_hedge, on_discard=discard
+        )
+        return chunks
+
+    def _stream_hedge_key(self) -> str:
+        """스트리밍 헤징의 응답 시간(첫 번역문 조각까지의 시간) 기록 키를 반환합니다."""
+        return f"{self._upstream_key()}:stream"
+
+    @staticmethod
+    def _read_first_delta(stream: Any) -> Iterator[Any]:
+        """첫 번역문 조각이 담긴 청크까지 읽고, 읽은 청크부터 이어지는 iterator를 반환합니다."""
+        iterator = iter(stream)
+        received = []
+        for chunk in iterator:
+            received.append(chunk)
+            if chunk.choices and chunk.choices[0].delta.content:
+                break
+        return itertools.chain(received, iterator)
+
+    @staticmethod
+    async def _read_first_delta_async(stream: Any) -> AsyncIterator[Any]:
+        """_read_first_delta()의 비동기 버전입니다."""
+        iterator = stream.__aiter__()
+        received = []
+        async for chunk in iterator:
+            received.append(chunk)
+            if chunk.choices and chunk.choices[0].delta.content:
+                break
+
+        async def chunks() -> AsyncIterator[Any]:
+            for chunk in received:
+                yield chunk
+            async for chunk in iterator:
+                yield chunk
+
+        return chunks()
+
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        """결과를 버린 스트림의 연결을 닫습니다."""
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+
+    @staticmethod
+    async def _close_stream_async(stream: Any) -> None:
+        """결과를 버린 비동기 스트림의 연결을 닫습니다 (AsyncStream.close 또는 async generator aclose)."""
+        close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+        if callable(close):
+            closing = close()
+            if inspect.isawaitable(closing):
+                await closing
+
+    @staticmethod
+    def _read_stream_chunk(chunk: Any, usage: Any) -> tuple[Optional[str], Any]:
+        """스트림 청크에서 (번역문 조각, 지금까지의 usage)를 꺼냅니다.
+
+        include_usage 사용 시 마지막 청크는 choices 없이 usage만 포함합니다.
+        """
+        if getattr(chunk, "usage", None) is not None:
+            usage = chunk.usage
+        if not chunk.choices:
+            return None, usage
+        return chunk.choices[0].delta.content, usage
+
+    @staticmethod
+    def _completion_text(response: Any) -> str:
+        """응답의 번역문을 반환합니다 (스트리밍 요청에 합류한 경우 이미 문자열)."""
+        if isinstance(response, str):
+            return response
+        return response.choices[0].message.content
+
+    @staticmethod
+    def _response_usage(usage: Any) -> dict[str, int]:
+        """API 응답의 usage를 {"input", "output", "cached"} 토큰 수로 변환합니다."""
+        return {
+            "input": usage.prompt_tokens,
+            "output": usage.completion_tokens,
+            "cached": cached_prompt_tokens(usage)
+        }
+
+    def _provider(self) -> str:
+        return "openai" if not hasattr(self, 'deployment') else "azure"
+
+    def _deployment_metadata(self) -> dict[str, Any]:
+        """로그 및 Langfuse 메타데이터용 Azure deployment 이름을 반환합니다 (OpenAI는 빈 dict)."""
+        return {"deployment": self.deployment} if hasattr(self, 'deployment') else {}
+
+    def _build_messages(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        context: Optional[str] = None
+    ) -> list[dict[str, str]]:
+        """번역 요청 messages를 구성합니다.
+
+        시스템 프롬프트는 프롬프트 레지스트리의 "translation" 템플릿을 사용합니다.
+        context가 주어지면 번역하지 않는 참고 문맥으로 시스템 프롬프트에 덧붙입니다.
+        입력에 플레이스홀더가 있으면 보존 지시문을, glossary가 설정되어 있으면 입력에 등장한 용어와 번역어만 덧붙입니다.
+        """
+        system_prompt = PROMPT_REGISTRY.get("translation").render(source=source, target=target)
+        system_prompt += PlaceholderProtector.format_prompt(text)
+        system_prompt += self._glossary_prompt(text, source, target)
+        if context:
+            system_prompt += (
+                "\n\nThe text is part of a longer document. Use the following context only to keep "
+                "terminology and tone consistent. Do NOT translate or include it in your response.\n"
+                f"<context>\n{context}\n</context>"
             )
 
-            langfuse_context.flush()
-            raise
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": text
+            }
+        ]
+
+    def _make_cache_key(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        context: Optional[str] = None
+    ) -> Optional[str]:
+        """캐시 키를 생성합니다 (캐시 미사용 시 None)."""
+        if self.cache is None:
+            return None
+        return self._make_request_key(text, source, target, context)
+
+    def _make_request_key(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        context: Optional[str] = None
+    ) -> str:
+        """정규화된 요청 키를 생성합니다 (캐시 키, 동일 요청 합치기 키로 사용)."""
+        # context나 용어집 용어가 없는 요청은 기존 캐시 키를 그대로 유지합니다
+        extra: dict[str, Any] = {"context": context} if context else {}
+        glossary_terms = self._glossary_terms(text, source, target)
+        if glossary_terms:
+            extra["glossary"] = GlossaryRegistry.request_key(glossary_terms)
+        return make_cache_key(
+            text=text,
+            source=source,
+            target=target,
+            model=getattr(self, "deployment", self.model),
+            temperature=self.temperature,
+            prompt_version=PROMPT_REGISTRY.get("translation").version,
+            **extra
+        )
+
+    def _create_completion(self, request_key: str, **kwargs: Any) -> tuple[Any, bool]:
+        """chat.completions.create를 호출합니다.
+
+        single_flight가 설정되어 있으면 같은 요청 키로 진행 중인 호출에 합류하여 그 결과(또는 예외)를 받습니다.
+        진행 중인 호출이 스트리밍이면 응답 대신 전체 번역문 문자열을 받습니다 (_completion_text로 꺼냄).
+        hedging이 설정되어 있으면 응답이 늦을 때 중복 요청을 보내 먼저 도착한 응답을 사용합니다.
+
+        Returns:
+            (응답, 합류 여부) 튜플
+        """
+        def call() -> Any:
+            return self._send(kwargs)
+
+        def can_hedge() -> bool:
+            # 중복 요청은 요청 한도를 기다리지 않고, 한도가 남아 있을 때만 보냅니다
+            return self._try_acquire_rate_limit(kwargs["messages"], kwargs["max_tokens"])
+
+        def create() -> Any:
+            # 합류한 요청은 API를 호출하지 않으므로 요청 한도도 호출하는 쪽에서만 확보합니다
+            self._acquire_rate_limit(kwargs["messages"], kwargs["max_tokens"], on_wait=self.on_rate_limit_wait)
+            if self.hedging is None:
+                return call()
+            return self.hedging.run(self._upstream_key(), call, can_hedge=can_hedge)
+
+        if self.single_flight is None:
+            return create(), False
+        response, coalesced = self.single_flight.do(request_key, create)
+        if coalesced and response is None:
+            # 합류한 스트림이 결과 없이 중단되었으면 직접 호출합니다
+            return create(), False
+        return response, coalesced
+
+    def _send(self, kwargs: dict[str, Any]) -> Any:
+        """chat.completions.create 요청을 보냅니다 (AzureTranslationManager는 deployment 풀 사용)."""
+        return self.client.chat.completions.create(**kwargs)
+
+    async def _send_async(self, kwargs: dict[str, Any]) -> Any:
+        """_send()의 비동기 버전입니다 (AsyncTranslationManager용)."""
+        return await self.client.chat.completions.create(**kwargs)
+
+    def _acquire_rate_limit(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        on_wait: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """요청 한도(RPM/TPM)를 확보할 때까지 대기합니다 (rate_limiter 사용 시).
+
+        Args:
+            messages: 요청 messages
+            max_tokens: 요청 max_tokens
+            on_wait: 대기가 필요할 때 호출되는 콜백
+
+        Raises:
+            RateLimitTimeout: 최대 대기 시간 안에 한도를 확보하지 못한 경우
+        """
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.acquire(
+            self._provider(),
+            getattr(self, "deployment", self.model),
+            self.rate_limiter.estimate_tokens(messages, max_tokens, self.model),
+            on_wait=on_wait
+        )
+
+    def _try_acquire_rate_limit(self, messages: list[dict[str, str]], max_tokens: int) -> bool:
+        """대기 없이 요청 한도를 확보합니다 (rate_limiter가 없으면 항상 True).
+
+        Returns:
+            한도를 확보했으면 True, 부족하면 False (대기 시간 초과로 집계하지 않음)
+        """
+        if self.rate_limiter is None:
+            return True
+        return self.rate_limiter.try_acquire(
+            self._provider(),
+            getattr(self, "deployment", self.model),
+            self.rate_limiter.estimate_tokens(messages, max_tokens, self.model)
+        )
+
+    async def _acquire_rate_limit_async(self, messages: list[dict[str, str]], max_tokens: int) -> None:
+        """_acquire_rate_limit()의 비동기 버전입니다 (AsyncTranslationManager용)."""
+        if self.rate_limiter is None:
+            return
+        await self.rate_limiter.acquire_async(
+            self._provider(),
+            getattr(self, "deployment", self.model),
+            self.rate_limiter.estimate_tokens(messages, max_tokens, self.model)
+        )
+
+    def _upstream_key(self) -> str:
+        """응답 시간 기록 단위인 "provider:모델/deployment" 키를 반환합니다."""
+        return f"{self._provider()}:{getattr(self, 'deployment', self.model)}"
+
+    def _plan_max_tokens(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        messages: list[dict[str, str]]
+    ) -> tuple[int, Optional[int]]:
+        """요청에 사용할 max_tokens를 정합니다.
+
+        Returns:
+            (max_tokens, 번역할 텍스트의 토큰 수) 튜플 - token_budget이 없으면 (self.max_tokens, None)
+        """
+        if self.token_budget is None:
+            return self.max_tokens, None
+        input_tokens = self.token_budget.count(text, self.model)
+        max_tokens = self.token_budget.estimate(
+            input_tokens,
+            source,
+            target,
+            self.model,
+            prompt_tokens=self.token_budget.count_messages(messages, self.model)
+        )
+        return max_tokens, input_tokens
+
+    def _record_budget(
+        self,
+        source: str,
+        target: str,
+        input_tokens: Optional[int],
+        max_tokens: int,
+        output_tokens: int
+    ) -> None:
+        """출력 토큰 예산 추정값과 실제 출력 토큰 수를 기록합니다 (token_budget 사용 시)."""
+        if self.token_budget is not None and input_tokens is not None:
+            self.token_budget.record(source, target, input_tokens, max_tokens, output_tokens, self.model)
+
+    def _single_flight_metadata(self, coalesced: bool = False) -> dict[str, Any]:
+        """로그 및 Langfuse 메타데이터용 동일 요청 합치기 통계를 반환합니다."""
+        if self.single_flight is None:
+            return {}
+        return {"coalesced": coalesced, "coalesced_requests": self.single_flight.stats()["coalesced_requests"]}
+
+    def _route_metadata(self) -> dict[str, Any]:
+        """로그 및 Langfuse 메타데이터용 모델 라우팅 결과를 반환합니다 (RoutingTranslationManager 사용 시)."""
+        route = _current_route.get()
+        if route is None:
+            return {}
+        return {"route": route["rule"], "routed_model": route["model"], "route_request_type": route["request_type"]}
+
+    def _glossary_terms(self, text: str, source: str, target: str) -> list[dict[str, str]]:
+        """입력에 등장한 용어집 용어를 찾습니다 (glossary 미사용 시 빈 목록)."""
+        if self.glossary is None:
+            return []
+        return self.glossary.lookup(text, source, target)
+
+    def _glossary_prompt(self, text: str, source: str, target: str) -> str:
+        """시스템 프롬프트에 덧붙일 용어집 지시문을 반환합니다 (찾은 용어가 없으면 빈 문자열)."""
+        return GlossaryRegistry.format_prompt(self._glossary_terms(text, source, target))
+
+    def _glossary_metadata(self, text: str, source: str, target: str, result: str) -> dict[str, Any]:
+        """번역 결과의 용어집 위반을 검사하고 로그 및 Langfuse 메타데이터를 반환합니다 (glossary 사용 시)."""
+        if self.glossary is None:
+            return {}
+        return self.glossary.metadata(text, source, target, result)
+
+    def _cache_metadata(self, cache_hit: bool = False) -> dict[str, Any]:
+        """로그 및 Langfuse 메타데이터용 캐시 통계를 반환합니다."""
+        if self.cache is None:
+            return {}
+        return {"cache_hit": cache_hit, **self.cache.stats()}
+
+    def _return_cached(self, result: str, source: str, target: str, start_time: float) -> str:
+        """캐시 적중 결과를 Langfuse/로그에 기록하고 반환합니다."""
+        metadata: dict[str, Any] = {
+            "direction": f"{source}→{target}",
+            **self._deployment_metadata(),
+            **self._cache_metadata(cache_hit=True)
+        }
+
+        langfuse_context.update_current_observation(
+            output=result,
+            model=self.model,
+            usage={"input": 0, "output": 0, "total": 0},
+            metadata=metadata
+        )
+        langfuse_context.update_current_trace(output=result)
+
+        logger.info(
+            "번역 캐시 적중",
+            extra={
+                "provider": self._provider(),
+                "model": self.model,
+                "response_time_ms": int((time.time() - start_time) * 1000),
+                "output_length": len(result),
+                **self._cache_metadata(cache_hit=True)
+            }
+        )
+
+        flush_observations()
+        return result
 
     def set_model(self, model: str) -> None:
         """사용할 AI 모델을 변경합니다.
@@ -253,22 +973,39 @@ class AzureTranslationManager(TranslationManager):
         temperature: Optional[float] = None,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        cache: Optional[TranslationCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        token_budget: Optional[TokenBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        on_rate_limit_wait: Optional[Callable[[float], None]] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        deployment_pool: Optional[DeploymentPool] = None,
+        glossary: Optional[GlossaryRegistry] = None
     ) -> None:
         """Azure OpenAI용 초기화
 
         Args:
             client: AzureOpenAI 클라이언트 인스턴스
             deployment: Azure deployment 이름 (필수)
-            config: Config 인스턴스 (None이면 Config.load() 호출)
+            config: Config 인스턴스 (None이면 Config.get() 사용)
             model: 원래 모델명 (표시용, 선택)
             temperature: 번역 창의성 설정 (None이면 config에서 로드)
             timeout: API 타임아웃 초 (None이면 config에서 로드)
             max_retries: API 재시도 횟수 (None이면 config에서 로드)
             max_tokens: 최대 출력 토큰 수 (None이면 config에서 로드)
+            cache: 번역 결과 캐시 (None이면 캐시 미사용)
+            single_flight: 동시에 들어온 동일 요청을 하나의 API 호출로 합치는 SingleFlight (None이면 미사용)
+            token_budget: 입력에 맞춰 요청별 max_tokens를 정하는 TokenBudget (None이면 max_tokens 고정)
+            rate_limiter: 요청 전에 RPM/TPM 한도를 확보하는 RateLimiter (None이면 제한 없음)
+            on_rate_limit_wait: 요청 한도 때문에 대기할 때 예상 대기 시간(초)으로 호출되는 콜백 (UI 표시용)
+            hedging: 응답이 늦으면 중복 요청을 보내는 HedgingPolicy (None이면 미사용, 스트리밍은 첫 조각까지의 시간 기준)
+            deployment_pool: 같은 모델의 여러 deployment에 요청을 분산하는 DeploymentPool
+                             (None이면 deployment 하나만 사용)
+            glossary: 입력에 등장한 용어만 프롬프트에 넣고 결과를 검사하는 GlossaryRegistry (None이면 미사용)
         """
         # Config에서 기본값 로드
-        self.config = config if config is not None else Config.load()
+        self.config = config if config is not None else Config.get()
 
         # deployment 저장 (필수)
         self.deployment = deployment
@@ -282,171 +1019,639 @@ class AzureTranslationManager(TranslationManager):
         self.max_tokens = max_tokens if max_tokens is not None else self.config.MAX_TOKENS
 
         self.client = client
+        self.cache = cache
+        self.single_flight = single_flight
+        self.token_budget = token_budget
+        self.rate_limiter = rate_limiter
+        self.on_rate_limit_wait = on_rate_limit_wait
+        self.hedging = hedging
+        self.deployment_pool = deployment_pool
+        self.glossary = glossary
+
+    def _send(self, kwargs: dict[str, Any]) -> Any:
+        """deployment_pool이 있으면 풀에서 고른 deployment로 요청을 보냅니다."""
+        if self.deployment_pool is None:
+            return super()._send(kwargs)
+        return self.deployment_pool.call(
+            lambda client, deployment: client.chat.completions.create(**{**kwargs, "model": deployment})
+        )
 
-    @observe(name="translation", as_type="generation")
-    def translate(self, text: str, source: str, target: str, session_id: str = "unknown") -> str:
-        """텍스트를 번역합니다 (Azure 전용).
+    async def _send_async(self, kwargs: dict[str, Any]) -> Any:
+        """_send()의 비동기 버전입니다 (풀의 클라이언트는 AsyncAzureOpenAI여야 합니다)."""
+        if self.deployment_pool is None:
+            return await super()._send_async(kwargs)
+        return await self.deployment_pool.call_async(
+            lambda client, deployment: client.chat.completions.create(**{**kwargs, "model": deployment})
+        )
 
-        Langfuse에서 GENERATION 타입으로 추적되며, 입력/출력, 사용량, 비용, 타이밍이 기록됩니다.
-        OpenAI와 다른 점: model 파라미터에 deployment 이름을 사용합니다.
+    @classmethod
+    def load_deployments(cls, config: Config) -> None:
+        """Config에서 deployment 목록을 로드합니다.
+
+        Args:
+            config: Config 인스턴스
+        """
+        cls.SUPPORTED_DEPLOYMENTS = config.parse_azure_deployments(
+            config.AZURE_DEPLOYMENTS
+        )
+
+    @staticmethod
+    def validate_deployment(deployment: str) -> bool:
+        """Deployment가 유효한지 검증합니다.
+
+        Args:
+            deployment: 검증할 deployment 이름
+
+        Returns:
+            유효하면 True, 아니면 False
+        """
+        return deployment in AzureTranslationManager.SUPPORTED_DEPLOYMENTS.values()
+
+
+class AsyncTranslationManager(TranslationManager):
+    """비동기 번역 관리 클래스
+
+    AsyncOpenAI 클라이언트로 번역하며, translate_many()로 여러 텍스트를 동시에 번역합니다.
+    Streamlit 화면 밖의 스크립트에서 대량 번역할 때 사용합니다.
+    항목마다 translate()와 같은 Langfuse GENERATION과 로그가 기록됩니다.
+    single_flight는 스레드 기반이므로 비동기 번역에는 적용되지 않습니다.
+    """
+
+    @traced(name="translation", as_type="generation")
+    async def translate(  # type: ignore[override]
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> str:
+        """텍스트를 비동기로 번역합니다.
 
         Args:
             text: 번역할 텍스트
             source: 원본 언어 (예: "Korean", "English")
             target: 대상 언어 (예: "English", "Korean")
             session_id: 세션 ID (Langfuse 추적용)
+            context: 번역 일관성을 위한 참고 문맥 (번역하지 않음)
 
         Returns:
             번역된 텍스트
         """
-        start_time = time.time()
-        input_length = len(text)
-
-        # Langfuse trace에 session_id, input, metadata 설정
-        langfuse_context.update_current_trace(
-            session_id=session_id,
-            input=text,
-            metadata={
-                "direction": f"{source}→{target}",
-                "deployment": self.deployment,
-            }
-        )
-
-        # API 호출 시작 로깅
-        logger.info(
-            "번역 API 호출 시작",
-            extra={
-                "provider": "azure",
-                "model": self.model,
-                "deployment": self.deployment,
-                "source_lang": source,
-                "target_lang": target,
-                "input_length": input_length,
-                "temperature": self.temperature
-            }
-        )
+        start_time, cache_key, cached = self._begin_translation(text, source, target, session_id, context)
+        if cached is not None:
+            return cached
 
         try:
             # messages 배열 준비 (Langfuse input으로 사용)
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"You are a professional translator. Translate the following {source} text to {target}. IMPORTANT: Preserve all Markdown formatting (bold, italic, headings, lists, links, code blocks, blockquotes, tables, etc.) in the translation. Only respond with the translation, nothing else."  # noqa: E501
-                },
-                {
-                    "role": "user",
-                    "content": text
-                }
-            ]
-
-            response = self.client.chat.completions.create(
-                model=self.deployment,  # Azure는 deployment 이름 사용
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout
-            )
+            messages = self._build_messages(text, source, target, context)
+            max_tokens, budget_input_tokens = self._plan_max_tokens(text, source, target, messages)
+
+            await self._acquire_rate_limit_async(messages, max_tokens)
+
+            async def call() -> Any:
+                return await self._send_async({
+                    "model": getattr(self, "deployment", self.model),  # Azure는 deployment 이름 사용
+                    "messages": messages,
+                    "temperature": self.temperature,
+                    "max_tokens": max_tokens,
+                    "timeout": self.timeout
+                })
+
+            def can_hedge() -> bool:
+                # 중복 요청은 요청 한도를 기다리지 않고, 한도가 남아 있을 때만 보냅니다
+                return self._try_acquire_rate_limit(messages, max_tokens)
+
+            if self.hedging is None:
+                response = await call()
+            else:
+                response = await self.hedging.run_async(self._upstream_key(), call, can_hedge=can_hedge)
             result = response.choices[0].message.content
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-
-            # Langfuse observation에 input, output, model, usage 정보 업데이트
-            langfuse_context.update_current_observation(
-                input=messages,  # Prompt 표시를 위해 messages 추가
-                output=result,
-                model=self.model,
-                usage={
-                    "input": input_tokens,
-                    "output": output_tokens,
-                    "total": input_tokens + output_tokens,
-                },
-                metadata={
-                    "direction": f"{source}→{target}",
-                    "deployment": self.deployment,
-                }
-            )
-
-            # Langfuse trace에 output 업데이트
-            langfuse_context.update_current_trace(output=result)
-
-            # API 호출 성공 로깅
-            response_time_ms = int((time.time() - start_time) * 1000)
-            logger.info(
-                "번역 API 호출 성공",
-                extra={
-                    "provider": "azure",
-                    "model": self.model,
-                    "deployment": self.deployment,
-                    "response_time_ms": response_time_ms,
-                    "output_length": len(result),
-                    "prompt_tokens": input_tokens,
-                    "completion_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens
-                }
-            )
+            usage = self._response_usage(response.usage)
+            self._record_budget(source, target, budget_input_tokens, max_tokens, usage["output"])
 
-            langfuse_context.flush()
+            self._finish_translation(text, source, target, messages, result, usage, start_time, cache_key)
             return result
 
         except Exception as e:
-            # 에러 발생 시 입력 토큰 추정 (Langfuse에 usage 정보 제공)
-            estimated_input_tokens = count_tokens(text, self.model)
-
-            # Langfuse observation에 output, model, usage 정보 업데이트 (에러 상태)
-            langfuse_context.update_current_observation(
-                output=ERROR_OUTPUT_MESSAGE,
-                model=self.model,
-                usage={
-                    "input": estimated_input_tokens,
-                    "output": 0,
-                    "total": estimated_input_tokens,
-                },
-                metadata={
-                    "direction": f"{source}→{target}",
-                    "deployment": self.deployment,
-                    "error": str(e),
-                }
-            )
+            self._fail_translation(text, source, target, e)
+            raise
 
-            # API 호출 실패 로깅
-            logger.error(
-                "번역 API 호출 실패",
-                extra={
-                    "provider": "azure",
-                    "model": self.model,
-                    "deployment": self.deployment,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "input_length": input_length
-                },
-                exc_info=True
+    async def translate_many(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        max_concurrency: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """여러 텍스트를 동시에 번역합니다.
+
+        최대 max_concurrency개의 요청을 동시에 보내며, 한 항목이 실패해도 나머지 항목은 계속 번역합니다.
+
+        Args:
+            texts: 번역할 텍스트 목록
+            source: 원본 언어
+            target: 대상 언어
+            session_id: 세션 ID (Langfuse 추적용)
+            max_concurrency: 최대 동시 요청 수 (None이면 config의 BATCH_MAX_CONCURRENCY 사용)
+
+        Returns:
+            입력 순서와 같은 결과 목록
+            [{"text": 원문, "translation": 번역문 또는 None, "error": 에러 메시지 또는 None}, ...]
+        """
+        start_time = time.time()
+        concurrency = max(1, max_concurrency if max_concurrency is not None else self.config.BATCH_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        logger.info("일괄 번역 시작", extra={
+            "items": len(texts),
+            "source_lang": source,
+            "target_lang": target,
+            "max_concurrency": concurrency
+        })
+
+        async def run(text: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    translation = await self.translate(text, source, target, session_id)
+                except Exception as e:
+                    # 실패 내용은 translate()에서 로그와 Langfuse에 기록됩니다
+                    return {"text": text, "translation": None, "error": f"{type(e).__name__}: {e}"}
+            return {"text": text, "translation": translation, "error": None}
+
+        results = list(await asyncio.gather(*(run(text) for text in texts)))
+
+        logger.info("일괄 번역 완료", extra={
+            "items": len(results),
+            "failed_items": sum(1 for result in results if result["error"] is not None),
+            "response_time_ms": int((time.time() - start_time) * 1000)
+        })
+
+        return results
+
+    @traced(name="translation_stream", as_type="generation")
+    async def translate_stream(  # type: ignore[override]
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """텍스트를 비동기 스트리밍으로 번역합니다.
+
+        TranslationManager.translate_stream()의 비동기 버전으로, `async for`로 번역문 조각을 받습니다.
+
+        Args:
+            text: 번역할 텍스트
+            source: 원본 언어 (예: "Korean", "English")
+            target: 대상 언어 (예: "English", "Korean")
+            session_id: 세션 ID (Langfuse 추적용)
+            context: 번역 일관성을 위한 참고 문맥 (번역하지 않음)
+
+        Yields:
+            번역문 조각 (이어 붙이면 전체 번역문)
+        """
+        start_time, cache_key, cached = self._begin_translation(
+            text, source, target, session_id, context, streaming=True
+        )
+        if cached is not None:
+            yield cached
+            return
+
+        try:
+            messages = self._build_messages(text, source, target, context)
+            max_tokens, budget_input_tokens = self._plan_max_tokens(text, source, target, messages)
+
+            await self._acquire_rate_limit_async(messages, max_tokens)
+            stream = await self._open_stream_async(messages, max_tokens)
+
+            parts: list[str] = []
+            usage = None
+            first_token_time: Optional[float] = None
+
+            async for chunk in stream:
+                delta, usage = self._read_stream_chunk(chunk, usage)
+                if delta:
+                    if first_token_time is None:
+                        first_token_time = time.time()
+                    parts.append(delta)
+                    yield delta
+
+            self._finish_stream(
+                text, source, target, messages, "".join(parts), usage, start_time, first_token_time,
+                cache_key, budget_input_tokens, max_tokens
             )
 
-            langfuse_context.flush()
+        except Exception as e:
+            self._fail_translation(text, source, target, e, streaming=True)
             raise
 
-    @classmethod
-    def load_deployments(cls, config: Config) -> None:
-        """Config에서 deployment 목록을 로드합니다.
 
+class AsyncAzureTranslationManager(AsyncTranslationManager, AzureTranslationManager):
+    """Azure OpenAI 비동기 번역 관리 클래스
+
+    AsyncAzureOpenAI 클라이언트를 사용하며, 초기화 파라미터는 AzureTranslationManager와 같습니다.
+    """
+
+
+class RoutingTranslationManager:
+    """요청마다 ModelRouter로 모델을 골라 해당 모델의 번역 관리자로 번역하는 클래스
+
+    TranslationManagerFactory.create(router=...)로 생성합니다.
+    번역 외의 속성(model, deployment, client 등)은 사용자가 고른 기본 관리자의 값을 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        default: TranslationManager,
+        router: ModelRouter,
+        create: Callable[[dict[str, Any]], Optional[TranslationManager]]
+    ) -> None:
+        """
         Args:
-            config: Config 인스턴스
+            default: 사용자가 고른 모델의 번역 관리자
+            router: 모델을 고르는 ModelRouter
+            create: 라우팅 결과로 번역 관리자를 만드는 함수 (만들 수 없으면 None)
         """
-        cls.SUPPORTED_DEPLOYMENTS = config.parse_azure_deployments(
-            config.AZURE_DEPLOYMENTS
-        )
+        self.default = default
+        self.router = router
+        self._create = create
+        self._managers: dict[str, TranslationManager] = {}
+
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> str:
+        """라우팅된 모델로 번역합니다 (TranslationManager.translate와 동일한 인터페이스)."""
+        manager, route = self.for_request(text, source, target)
+        token = _current_route.set(route)
+        try:
+            return manager.translate(text, source, target, session_id=session_id, context=context)
+        finally:
+            _current_route.reset(token)
+
+    def translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> Iterator[str]:
+        """라우팅된 모델로 스트리밍 번역합니다 (TranslationManager.translate_stream과 동일한 인터페이스)."""
+        manager, route = self.for_request(text, source, target)
+        token = _current_route.set(route)
+        try:
+            yield from manager.translate_stream(text, source, target, session_id=session_id, context=context)
+        finally:
+            _current_route.reset(token)
+
+    def for_request(self, text: str, source: str, target: str) -> tuple[TranslationManager, dict[str, Any]]:
+        """요청에 사용할 번역 관리자와 라우팅 결과를 반환합니다."""
+        route = self.router.route(text, source, target, self.default.model, request_type="primary")
+        if route["rule"] is None or route["model"] == self.default.model:
+            return self.default, route
+
+        manager = self._managers.get(route["model"])
+        if manager is None:
+            manager = self._create(route)
+            if manager is None:
+                return self.default, route
+            self._managers[route["model"]] = manager
+        return manager, route
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.default, name)
+
+
+class MemoryTranslationManager:
+    """번역 메모리로 이미 번역한 문장을 재사용하고 나머지 문장만 번역하는 클래스
+
+    입력을 문장 단위로 나누어 번역 메모리를 조회합니다. 저장된 번역이 있는 문장은 그대로 사용하고,
+    없는 문장은 연속된 것끼리 묶어 한 번에 번역합니다. 요청에는 묶음 안 문장들과 비슷한 문장의 번역(참고 예시),
+    앞부분 원문을 문맥으로 붙입니다. 번역 결과를 다시 문장으로 나누어 원문 문장 수와 같으면
+    문장별로 메모리에 저장합니다. 문자가 없는 조각(빈 줄, 숫자만 있는 줄 등)은 따로 번역하지 않습니다.
+    모델은 입력 전체로 한 번만 라우팅하므로, 메모리는 실제로 번역한 모델 기준으로 저장됩니다.
+    TranslationManagerFactory.create(translation_memory=...)로 생성하며, 번역 외의 속성은 내부 관리자의 값을 사용합니다.
+    """
+
+    def __init__(self, inner: Any, memory: TranslationMemory, context_chars: int = 300) -> None:
+        """
+        Args:
+            inner: 번역에 사용할 번역 관리자 (TranslationManager 또는 RoutingTranslationManager)
+            memory: 번역 메모리
+            context_chars: 묶음 번역 시 참고 문맥으로 전달할 앞부분 원문 길이 (0이면 전달 안 함)
+        """
+        self.inner = inner
+        self.memory = memory
+        self.context_chars = max(0, context_chars)
+
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> str:
+        """번역 메모리를 적용하여 번역합니다 (TranslationManager.translate와 동일한 인터페이스)."""
+        return "".join(self._translate_pieces(text, source, target, session_id, context))
+
+    def translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> Iterator[str]:
+        """번역 메모리를 적용하여 앞부분부터 순서대로 번역 결과를 내보냅니다.
+
+        첫 번째 묶음은 내부 관리자의 스트리밍으로 번역하고, 나머지 묶음은 그동안 병렬로 번역합니다.
+        """
+        yield from self._translate_pieces(text, source, target, session_id, context, stream=True)
+
+    def _translate_pieces(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str,
+        context: Optional[str],
+        stream: bool = False
+    ) -> Iterator[str]:
+        """입력 전체로 모델을 고른 뒤 문장별 번역 결과를 원래 순서대로 내보냅니다."""
+        manager, route = self._route(text, source, target)
+        token = _current_route.set(route)
+        try:
+            yield from self._translate_runs(manager, text, source, target, session_id, context, stream)
+        finally:
+            _current_route.reset(token)
+
+    def _route(self, text: str, source: str, target: str) -> tuple[Any, Optional[dict[str, Any]]]:
+        """번역에 사용할 관리자와 라우팅 결과를 반환합니다 (라우팅하지 않으면 내부 관리자와 None)."""
+        if isinstance(self.inner, RoutingTranslationManager):
+            return self.inner.for_request(text, source, target)
+        return self.inner, None
+
+    def _translate_runs(
+        self,
+        manager: Any,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str,
+        context: Optional[str],
+        stream: bool
+    ) -> Iterator[str]:
+        """메모리에 없는 문장 묶음을 번역하여 원래 순서대로 내보냅니다."""
+        start_time = time.time()
+        scope = make_memory_scope(source, target, manager.model)
+        pieces = []
+        for piece in split_sentences(text):
+            match = _SURROUNDING_WHITESPACE_PATTERN.match(piece)
+            leading, body, trailing = match.groups() if match else ("", piece, "")
+            if count_script_letters(body) == (0, 0):
+                pieces.append({"text": piece, "result": piece})
+                continue
+            found = self.memory.lookup(body, scope)
+            result = f"{leading}{found['translation']}{trailing}" if found["translation"] is not None else None
+            pieces.append({"text": piece, "body": body, "matches": found["matches"], "result": result})
+
+        runs = self._pending_runs(pieces)
+        logger.info("번역 메모리 조회", extra={
+            "sentences": len(pieces),
+            "memory_reused": sum(1 for piece in pieces if "body" in piece and piece["result"] is not None),
+            "memory_fuzzy_matches": sum(1 for piece in pieces if piece.get("matches")),
+            "translated_sentences": sum(1 for piece in pieces if piece["result"] is None),
+            "translation_requests": len(runs),
+            "lookup_time_ms": int((time.time() - start_time) * 1000)
+        })
+
+        def split_run(start: int, end: int) -> tuple[str, str, str]:
+            joined = "".join(piece["text"] for piece in pieces[start:end])
+            match = _SURROUNDING_WHITESPACE_PATTERN.match(joined)
+            return match.groups() if match else ("", joined, "")  # type: ignore[return-value]
+
+        def translate_run(start: int, end: int) -> str:
+            leading, body, trailing = split_run(start, end)
+            translated = manager.translate(
+                body, source, target, session_id=session_id, context=self._build_context(pieces, start, end, context)
+            )
+            self._remember(pieces[start:end], translated, scope)
+            return f"{leading}{translated.strip()}{trailing}"
+
+        def stream_run(start: int, end: int) -> Iterator[str]:
+            leading, body, trailing = split_run(start, end)
+            if leading:
+                yield leading
+            chunks = []
+            for chunk in manager.translate_stream(
+                body, source, target, session_id=session_id, context=self._build_context(pieces, start, end, context)
+            ):
+                chunks.append(chunk)
+                yield chunk
+            if trailing:
+                yield trailing
+            self._remember(pieces[start:end], "".join(chunks), scope)
+
+        streamed = runs[0] if stream and runs else None
+        background = [run for run in runs if run != streamed]
+        run_ends = dict(runs)
+        workers = min(self.memory.max_concurrency, len(background))
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="translation-memory") as executor:
+            futures: dict[int, Any] = {}
+            if workers > 1:
+                # 라우팅 결과(_current_route)가 작업 스레드에서도 보이도록 현재 컨텍스트를 복사해 실행합니다
+                for start, end in background:
+                    futures[start] = executor.submit(contextvars.copy_context().run, translate_run, start, end)
+            try:
+                index = 0
+                while index < len(pieces):
+                    end = run_ends.get(index)
+                    if end is None:
+                        yield pieces[index]["result"]
+                        index += 1
+                        continue
+                    if (index, end) == streamed:
+                        yield from stream_run(index, end)
+                    elif index in futures:
+                        yield futures[index].result()
+                    else:
+                        yield translate_run(index, end)
+                    index = end
+            finally:
+                for future in futures.values():
+                    future.cancel()
 
     @staticmethod
-    def validate_deployment(deployment: str) -> bool:
-        """Deployment가 유효한지 검증합니다.
+    def _pending_runs(pieces: list[dict[str, Any]]) -> list[tuple[int, int]]:
+        """메모리에 없는 연속 문장을 한 번에 번역할 [시작, 끝) 구간으로 묶습니다.
 
+        사이에 있는 문자 없는 조각(빈 줄, 숫자 등)은 구간에 포함하고, 메모리에서 재사용한 문장에서 구간을 나눕니다.
+        """
+        runs: list[tuple[int, int]] = []
+        start: Optional[int] = None
+        last = 0
+        for index, piece in enumerate(pieces):
+            if piece["result"] is None:
+                if start is None:
+                    start = index
+                last = index
+            elif "body" in piece and start is not None:
+                runs.append((start, last + 1))
+                start = None
+        if start is not None:
+            runs.append((start, last + 1))
+        return runs
+
+    def _remember(self, run: list[dict[str, Any]], translated: str, scope: str) -> None:
+        """묶음 번역 결과를 문장별로 나누어 메모리에 저장합니다 (문장 수가 다르면 저장하지 않음)."""
+        sources = [piece["body"] for piece in run if "body" in piece]
+        if len(sources) == 1:
+            self.memory.add(sources[0], translated.strip(), scope)
+            return
+
+        targets = [
+            sentence.strip() for sentence in split_sentences(translated)
+            if count_script_letters(sentence) != (0, 0)
+        ]
+        if len(targets) != len(sources):
+            logger.info("번역 메모리 문장 정렬 실패, 저장 생략", extra={
+                "sentences": len(sources),
+                "translated_sentences": len(targets)
+            })
+            return
+        for source_sentence, target_sentence in zip(sources, targets):
+            self.memory.add(source_sentence, target_sentence, scope)
+
+    def _build_context(
+        self,
+        pieces: list[dict[str, Any]],
+        start: int,
+        end: int,
+        context: Optional[str]
+    ) -> Optional[str]:
+        """묶음에 전달할 참고 문맥(호출자 문맥 + 유사 문장 번역 + 앞부분 원문 끝부분)을 만듭니다."""
+        parts = [context] if context else []
+        matches: list[dict[str, Any]] = []
+        for piece in pieces[start:end]:
+            for match in piece.get("matches", []):
+                if match not in matches:
+                    matches.append(match)
+        examples = TranslationMemory.format_matches(matches)
+        if examples:
+            parts.append(examples)
+        if self.context_chars:
+            previous = "".join(piece["text"] for piece in pieces[:start]).strip()
+            if previous:
+                parts.append("Preceding text:\n" + previous[-self.context_chars:])
+        return "\n\n".join(parts) or None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+class ProtectedTranslationManager:
+    """번역하지 않는 구간(코드, URL, 이미지, HTML)을 플레이스홀더로 바꿔 번역하고 되돌리는 클래스
+
+    코드 블록 등을 모델에 보내지 않으므로 입력/출력 토큰이 줄고 코드나 URL이 손상되지 않습니다.
+    번역 결과에 플레이스홀더가 정확히 한 번씩 돌아오지 않으면 보호 없이 원문으로 다시 번역합니다
+    (스트리밍은 다시 번역한 결과를 StreamResultReplaced로 전달).
+    TranslationManagerFactory.create(placeholder_protector=...)로 생성하며, 번역 외의 속성은 내부 관리자의 값을 사용합니다.
+    """
+
+    def __init__(self, inner: Any, protector: PlaceholderProtector) -> None:
+        """
         Args:
-            deployment: 검증할 deployment 이름
+            inner: 번역에 사용할 번역 관리자 (TranslationManager, RoutingTranslationManager, MemoryTranslationManager)
+            protector: 플레이스홀더 보호기
+        """
+        self.inner = inner
+        self.protector = protector
 
-        Returns:
-            유효하면 True, 아니면 False
+    def translate(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> str:
+        """번역하지 않는 구간을 보호하여 번역합니다 (TranslationManager.translate와 동일한 인터페이스)."""
+        protected, spans = self._protect(text)
+        if not spans:
+            return self.inner.translate(text, source, target, session_id=session_id, context=context)
+
+        translated = self.inner.translate(protected, source, target, session_id=session_id, context=context)
+        restored, invalid = self.protector.restore(translated, spans)
+        if not invalid:
+            return restored
+
+        logger.warning(
+            "플레이스홀더 복원 실패, 보호 없이 다시 번역",
+            extra={"placeholders": len(spans), "invalid_placeholders": invalid}
+        )
+        return self.inner.translate(text, source, target, session_id=session_id, context=context)
+
+    def translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session_id: str = "unknown",
+        context: Optional[str] = None
+    ) -> Iterator[str]:
+        """번역하지 않는 구간을 보호하여 스트리밍 번역합니다.
+
+        이미 내보낸 조각은 되돌릴 수 없으므로, 스트림이 끝난 뒤 플레이스홀더 복원에 실패했으면
+        보호 없이 원문으로 다시 번역하고 그 결과를 담아 StreamResultReplaced를 발생시킵니다.
+
+        Raises:
+            StreamResultReplaced: 내보낸 번역문을 다시 번역한 결과로 바꿔야 하는 경우
         """
-        return deployment in AzureTranslationManager.SUPPORTED_DEPLOYMENTS.values()
+        protected, spans = self._protect(text)
+        if not spans:
+            yield from self.inner.translate_stream(text, source, target, session_id=session_id, context=context)
+            return
+
+        invalid: list[int] = []
+        yield from self.protector.restore_stream(
+            self.inner.translate_stream(protected, source, target, session_id=session_id, context=context),
+            spans,
+            invalid
+        )
+        if not invalid:
+            return
+
+        logger.warning(
+            "스트리밍 플레이스홀더 복원 실패, 보호 없이 다시 번역",
+            extra={"placeholders": len(spans), "invalid_placeholders": invalid}
+        )
+        raise StreamResultReplaced(
+            self.inner.translate(text, source, target, session_id=session_id, context=context)
+        )
+
+    def _protect(self, text: str) -> tuple[str, list[str]]:
+        """번역하지 않는 구간을 플레이스홀더로 바꾸고 줄어든 입력 길이를 기록합니다."""
+        protected, spans = self.protector.protect(text)
+        if spans:
+            logger.info("플레이스홀더 보호", extra={
+                "placeholders": len(spans),
+                "input_length": len(text),
+                "protected_input_length": len(protected)
+            })
+        return protected, spans
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
 
 
 class TranslationManagerFactory:
@@ -456,17 +1661,73 @@ class TranslationManagerFactory:
     """
 
     @staticmethod
-    def create(provider: str, client: Any, **kwargs: Any) -> TranslationManager:
+    def create(
+        provider: str,
+        client: Any,
+        router: Optional[ModelRouter] = None,
+        translation_memory: Optional[TranslationMemory] = None,
+        placeholder_protector: Optional[PlaceholderProtector] = None,
+        **kwargs: Any
+    ) -> TranslationManager:
         """Provider에 따른 TranslationManager 생성
 
         Args:
             provider: "openai" 또는 "azure"
             client: OpenAI 또는 AzureOpenAI 클라이언트
+            router: 요청마다 모델을 고르는 ModelRouter (있으면 RoutingTranslationManager 반환)
+            translation_memory: 문장 단위 번역 메모리 (있으면 MemoryTranslationManager로 감싸서 반환)
+            placeholder_protector: 번역하지 않는 구간을 플레이스홀더로 바꾸는 보호기
+                                   (있으면 가장 바깥을 ProtectedTranslationManager로 감싸서 반환)
+            **kwargs: TranslationManager 초기화 파라미터
+
+        Returns:
+            TranslationManager, AzureTranslationManager, RoutingTranslationManager,
+            MemoryTranslationManager 또는 ProtectedTranslationManager 인스턴스
+        """
+        manager_class = AzureTranslationManager if provider == "azure" else TranslationManager
+        manager = manager_class(client, **kwargs)
+        if router is not None:
+            manager = TranslationManagerFactory._create_routing(provider, client, manager, router, kwargs)
+        if translation_memory is not None:
+            manager = MemoryTranslationManager(manager, translation_memory)  # type: ignore[assignment]
+        if placeholder_protector is not None:
+            # 번역 메모리가 문장을 나누기 전에 코드 블록 등을 먼저 바꿔야 하므로 가장 바깥에 둡니다
+            manager = ProtectedTranslationManager(manager, placeholder_protector)  # type: ignore[assignment]
+        return manager
+
+    @staticmethod
+    def _create_routing(
+        provider: str,
+        client: Any,
+        manager: TranslationManager,
+        router: ModelRouter,
+        kwargs: dict[str, Any]
+    ) -> TranslationManager:
+        """기본 관리자를 감싸 요청마다 모델을 고르는 RoutingTranslationManager를 만듭니다."""
+        def create_routed(route: dict[str, Any]) -> Optional[TranslationManager]:
+            if provider == "azure":
+                if route["deployment"] is None:
+                    return None
+                # deployment 풀은 기본 모델용이므로 라우팅된 모델에는 사용하지 않습니다
+                return AzureTranslationManager(client, **{
+                    **kwargs, "deployment": route["deployment"], "model": route["model"], "deployment_pool": None
+                })
+            return TranslationManager(client, **{**kwargs, "model": route["model"]})
+
+        return RoutingTranslationManager(manager, router, create_routed)  # type: ignore[return-value]
+
+    @staticmethod
+    def create_async(provider: str, client: Any, **kwargs: Any) -> AsyncTranslationManager:
+        """Provider에 따른 AsyncTranslationManager 생성
+
+        Args:
+            provider: "openai" 또는 "azure"
+            client: AsyncOpenAI 또는 AsyncAzureOpenAI 클라이언트
             **kwargs: TranslationManager 초기화 파라미터
 
         Returns:
-            TranslationManager 또는 AzureTranslationManager 인스턴스
+            AsyncTranslationManager 또는 AsyncAzureTranslationManager 인스턴스
         """
         if provider == "azure":
-            return AzureTranslationManager(client, **kwargs)
-        return TranslationManager(client, **kwargs)
+            return AsyncAzureTranslationManager(client, **kwargs)
+        return AsyncTranslationManager(client, **kwargs)
@@ -23,6 +23,19 @@ SET search_path TO transbot, public;
 --     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 -- );
 
+-- Sentence-level translation memory (TRANSLATION_MEMORY_BACKEND=postgres)
+-- The application also creates this table on startup if it does not exist.
+CREATE TABLE IF NOT EXISTS translation_memory (
+    id BIGSERIAL PRIMARY KEY,
+    scope TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE (scope, source)
+);
+CREATE INDEX IF NOT EXISTS idx_translation_memory_source_trgm
+    ON translation_memory USING GIN (source gin_trgm_ops);
+
 -- Grant privileges
 GRANT ALL PRIVILEGES ON SCHEMA transbot TO transbot_user;
 GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA transbot TO transbot_user;
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""TransBot 종단 간 지연 벤치마크
+
+로컬 mock 서버(scripts/mock_openai_server.py)를 띄우고 실제 번역 경로를 반복 실행하여
+시나리오별 처리량, p50/p95/p99 지연, 호출당 TransBot 자체 오버헤드를 측정합니다.
+오버헤드는 호출 소요 시간 중 mock 서버가 요청을 처리하지 않던 시간(클라이언트 측 처리 시간)입니다.
+
+시나리오:
+    translate: TranslationManager.translate (짧은 문장)
+    translate_stream: TranslationManager.translate_stream (스트림 끝까지 소비)
+    multi_style: StyleTranslator.translate_multi_style (전체 스타일)
+    multi_style_alternatives: StyleTranslator.translate_multi_style (전체 스타일 + 대안 표현)
+    statistics: IncrementalTextStatistics.update (긴 입력 끝에 한 문장씩 추가, API 호출 없음)
+    document: DocumentTranslator.translate (긴 Markdown 문서)
+
+결과는 JSON으로 저장할 수 있으며, 이전 결과 파일을 기준(baseline)으로 지정하면
+허용 비율보다 느려진 지표를 출력하고 종료 코드 1을 반환합니다.
+
+사용 예:
+    python scripts/benchmark.py --output benchmark.json
+    python scripts/benchmark.py --latency lognormal:300:0.5 --tokens-per-second 200 --baseline benchmark.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.client_registry import ClientRegistry  # noqa: E402
+from components.document import DocumentTranslator  # noqa: E402
+from components.statistics import IncrementalTextStatistics  # noqa: E402
+from components.style_translator import StyleTranslator  # noqa: E402
+from components.tokens import TokenCounter  # noqa: E402
+from components.translation import TranslationManagerFactory  # noqa: E402
+from config import Config  # noqa: E402
+from scripts.mock_openai_server import MockOpenAIServer  # noqa: E402
+
+SCENARIOS = (
+    "translate",
+    "translate_stream",
+    "multi_style",
+    "multi_style_alternatives",
+    "statistics",
+    "document",
+)
+
+# 기준 결과와 비교할 지표
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "overhead_mean_ms")
+
+SHORT_TEXT = "이번 주 회의 자료를 금요일까지 공유해 주실 수 있을까요?"
+
+_PARAGRAPH = (
+    "TransBot은 한국어와 영어 사이의 번역을 돕는 도구입니다. 긴 문서는 Markdown 구조를 유지한 채 구간으로 나누어 "
+    "병렬로 번역하고, 각 구간에는 앞 구간의 문맥을 함께 전달하여 용어와 문체를 일관되게 유지합니다."
+)
+
+
+def build_document(sections: int) -> str:
+    """벤치마크용 긴 Markdown 문서를 만듭니다 (섹션마다 제목, 문단 3개, 목록)."""
+    blocks = []
+    for index in range(1, sections + 1):
+        blocks.append(f"## 섹션 {index}")
+        blocks.extend([_PARAGRAPH] * 3)
+        blocks.append("- 첫 번째 항목\n- 두 번째 항목\n- 세 번째 항목")
+    return "\n\n".join(blocks)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """nearest-rank 방식의 백분위수를 반환합니다 (값이 없으면 0)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def server_busy_time(records: list[dict[str, Any]], start: float, end: float) -> float:
+    """[start, end] 구간에서 mock 서버가 하나 이상의 요청을 처리 중이던 시간(초)을 계산합니다.
+
+    동시 요청의 처리 구간은 합집합으로 계산하므로, 병렬 호출에서도 서버 대기 시간을 중복해서 빼지 않습니다.
+    """
+    intervals = sorted(
+        (max(record["start"], start), min(record["end"], end))
+        for record in records
+        if record["end"] > start and record["start"] < end
+    )
+    busy = 0.0
+    current_start: Optional[float] = None
+    current_end = 0.0
+    for interval_start, interval_end in intervals:
+        if current_start is None or interval_start > current_end:
+            if current_start is not None:
+                busy += current_end - current_start
+            current_start, current_end = interval_start, interval_end
+        else:
+            current_end = max(current_end, interval_end)
+    if current_start is not None:
+        busy += current_end - current_start
+    return busy
+
+
+def summarize(
+    durations: list[float],
+    overheads: list[float],
+    errors: int,
+    upstream_requests: int,
+    elapsed: float
+) -> dict[str, Any]:
+    """반복 측정 결과를 시나리오 지표로 요약합니다 (시간 단위는 ms)."""
+    calls = len(durations) + errors
+    return {
+        "iterations": calls,
+        "errors": errors,
+        "total_seconds": round(elapsed, 3),
+        "throughput_per_second": round(calls / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(durations, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(durations, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(durations, 0.99) * 1000, 2),
+        "overhead_mean_ms": round(sum(overheads) / len(overheads) * 1000, 2) if overheads else 0.0,
+        "overhead_p95_ms": round(percentile(overheads, 0.95) * 1000, 2),
+        "upstream_requests": upstream_requests,
+    }
+
+
+def compare_with_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.2,
+    min_delta_ms: float = 1.0
+) -> list[str]:
+    """기준 결과보다 tolerance 비율 이상 느려진 지표를 찾습니다.
+
+    Args:
+        results: 이번 실행 결과 (run_benchmark 반환값)
+        baseline: 기준 결과 (이전 실행의 JSON)
+        tolerance: 허용 증가 비율 (0.2이면 20%)
+        min_delta_ms: 이보다 작은 차이는 측정 오차로 보고 무시 (ms)
+
+    Returns:
+        회귀 설명 문자열 리스트 (없으면 빈 리스트)
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = previous.get(metric), current.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before >= min_delta_ms:
+                increase = f"+{(after / before - 1) * 100:.0f}%" if before else "new"
+                regressions.append(f"{name}.{metric}: {before:.2f}ms → {after:.2f}ms ({increase})")
+    return regressions
+
+
+class BenchmarkRunner:
+    """mock 서버에 연결한 번역 컴포넌트로 시나리오를 실행하는 클래스"""
+
+    def __init__(
+        self,
+        server: MockOpenAIServer,
+        provider: str = "openai",
+        model: str = "gpt-4o-mini",
+        style_concurrency: int = 5,
+        document_sections: int = 40
+    ) -> None:
+        """
+        Args:
+            server: 실행 중인 MockOpenAIServer
+            provider: "openai" 또는 "azure"
+            model: 번역 모델 (Azure에서는 같은 이름의 deployment로 요청)
+            style_concurrency: 다중 스타일 번역 동시 요청 수
+            document_sections: 긴 문서 시나리오의 섹션 수
+        """
+        self.server = server
+        self.config = Config.get()
+        self.registry = ClientRegistry.from_config(self.config)
+        deployment = model if provider == "azure" else None
+
+        if provider == "azure":
+            client = self.registry.get_client(
+                "azure", "mock-key", endpoint=server.url, api_version=self.config.AZURE_OPENAI_API_VERSION,
+                timeout=self.config.OPENAI_API_TIMEOUT, max_retries=self.config.OPENAI_MAX_RETRIES
+            )
+            manager_kwargs: dict[str, Any] = {"deployment": deployment}
+        else:
+            client = self.registry.get_client(
+                "openai", "mock-key", endpoint=server.openai_base_url,
+                timeout=self.config.OPENAI_API_TIMEOUT, max_retries=self.config.OPENAI_MAX_RETRIES
+            )
+            manager_kwargs = {}
+
+        self.token_counter = TokenCounter()
+        self.manager = TranslationManagerFactory.create(
+            provider, client, config=self.config, model=model, **manager_kwargs
+        )
+        self.style_translator = StyleTranslator(
+            client,
+            model=model,
+            deployment=deployment,
+            max_tokens=self.config.MAX_TOKENS,
+            timeout=self.config.OPENAI_API_TIMEOUT,
+            max_concurrency=style_concurrency
+        )
+        self.document_translator = DocumentTranslator(
+            self.manager,
+            max_segment_tokens=self.config.DOCUMENT_SEGMENT_MAX_TOKENS,
+            max_concurrency=self.config.DOCUMENT_MAX_CONCURRENCY,
+            token_counter=self.token_counter
+        )
+        self.document = build_document(document_sections)
+
+    def scenario(self, name: str) -> Callable[[int], Any]:
+        """시나리오 이름에 해당하는 호출 함수(반복 번호 → 결과)를 반환합니다."""
+        styles = list(StyleTranslator.STYLE_LABELS)
+
+        if name == "translate":
+            return lambda i: self.manager.translate(SHORT_TEXT, "Korean", "English", session_id="benchmark")
+        if name == "translate_stream":
+            return lambda i: "".join(
+                self.manager.translate_stream(SHORT_TEXT, "Korean", "English", session_id="benchmark")
+            )
+        if name in ("multi_style", "multi_style_alternatives"):
+            include_alternatives = name == "multi_style_alternatives"
+            return lambda i: self.style_translator.translate_multi_style(
+                SHORT_TEXT, styles, "Korean", "English", include_alternatives=include_alternatives
+            )
+        if name == "statistics":
+            statistics = IncrementalTextStatistics(token_counter=self.token_counter)
+            return lambda i: statistics.update(f"{self.document}\n\n{SHORT_TEXT} {i}", self.manager.model)
+        if name == "document":
+            return lambda i: self.document_translator.translate(self.document, "Korean", "English", "benchmark")
+        raise ValueError(f"지원하지 않는 시나리오입니다: {name}")
+
+    def run(self, name: str, iterations: int, warmup: int = 1) -> dict[str, Any]:
+        """시나리오를 warmup회 실행한 뒤 iterations회 측정합니다."""
+        call = self.scenario(name)
+        for i in range(warmup):
+            try:
+                call(-1 - i)
+            except Exception:
+                # 오류 주입 시 워밍업 실패는 측정에 포함하지 않습니다
+                pass
+
+        durations: list[float] = []
+        overheads: list[float] = []
+        errors = 0
+        started = time.monotonic()
+        for i in range(iterations):
+            start = time.monotonic()
+            try:
+                call(i)
+            except Exception:
+                errors += 1
+                continue
+            end = time.monotonic()
+            durations.append(end - start)
+            overheads.append(max(0.0, end - start - server_busy_time(self.server.records(start), start, end)))
+        elapsed = time.monotonic() - started
+
+        return summarize(durations, overheads, errors, len(self.server.records(started)), elapsed)
+
+    def close(self) -> None:
+        self.registry.close()
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """mock 서버를 띄우고 선택한 시나리오를 실행하여 결과를 반환합니다."""
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 시나리오입니다: {', '.join(unknown)}")
+
+    server = MockOpenAIServer(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        error_429_rate=args.error_429,
+        error_5xx_rate=args.error_5xx,
+        seed=args.seed
+    )
+    results: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "provider": args.provider,
+            "model": args.model,
+            "latency": args.latency,
+            "tokens_per_second": args.tokens_per_second,
+            "error_429": args.error_429,
+            "error_5xx": args.error_5xx,
+            "iterations": args.iterations,
+        },
+        "scenarios": {},
+    }
+
+    with server:
+        runner = BenchmarkRunner(
+            server,
+            provider=args.provider,
+            model=args.model,
+            style_concurrency=args.style_concurrency,
+            document_sections=args.document_sections
+        )
+        try:
+            for name in scenarios:
+                results["scenarios"][name] = runner.run(name, args.iterations, warmup=args.warmup)
+                print(f"{name:<26} {format_result(results['scenarios'][name])}")
+        finally:
+            runner.close()
+    return results
+
+
+def format_result(result: dict[str, Any]) -> str:
+    return (
+        f"p50 {result['p50_ms']:>9.2f}ms  p95 {result['p95_ms']:>9.2f}ms  p99 {result['p99_ms']:>9.2f}ms  "
+        f"overhead {result['overhead_mean_ms']:>7.2f}ms  {result['throughput_per_second']:>8.2f}/s  "
+        f"errors {result['errors']}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TransBot 종단 간 지연 벤치마크 (로컬 mock 서버 사용)")
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help=f"쉼표로 구분한 시나리오 ({', '.join(SCENARIOS)})"
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--provider", choices=("openai", "azure"), default="openai")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument(
+        "--latency", default="fixed:0", help="mock 서버 지연 분포 (fixed:MS, uniform:MIN:MAX, lognormal:MEDIAN:SIGMA)"
+    )
+    parser.add_argument("--tokens-per-second", type=float, default=0, help="mock 서버 출력 토큰 속도 (0이면 즉시)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="500/503 응답 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--style-concurrency", type=int, default=Config.get().STYLE_MAX_CONCURRENCY)
+    parser.add_argument("--document-sections", type=int, default=40)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 (다음 실행의 --baseline으로 사용)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준 대비 허용 증가 비율 (기본 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        changed = [
+            key for key in ("provider", "model", "latency", "tokens_per_second", "error_429", "error_5xx")
+            if baseline.get("meta", {}).get(key) != results["meta"][key]
+        ]
+        if changed:
+            print(f"\n⚠️ 기준 결과와 mock 서버/모델 설정이 다릅니다: {', '.join(changed)}")
+        regressions = compare_with_baseline(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print(f"\n❌ 기준 대비 {args.tolerance:.0%} 이상 느려진 지표:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            return 1
+        print(f"\n✅ 기준 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""strip_markdown / has_markdown 마이크로벤치마크
+
+한 번의 스캔으로 동작하는 utils.strip_markdown, utils.has_markdown을
+이전 구현(정규식 11개를 차례로 적용하는 방식)과 입력 크기별로 비교합니다.
+
+사용 예:
+    python scripts/benchmark_markdown.py
+    python scripts/benchmark_markdown.py --sizes 1000,10000,50000 --repeat 50
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import has_markdown, strip_markdown  # noqa: E402
+
+# 이전 구현의 패턴 (비교 기준)
+_LEGACY_PATTERNS = [
+    (re.compile(r'```[\s\S]*?```'), ''),
+    (re.compile(r'`([^`]+)`'), r'\1'),
+    (re.compile(r'!\[([^\]]*)\]\([^)]+\)'), r'\1'),
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),
+    (re.compile(r'\*([^*]+)\*'), r'\1'),
+    (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
+    (re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),
+    (re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),
+    (re.compile(r'^\s*>\s+', re.MULTILINE), ''),
+    (re.compile(r'^[-_*]{3,}$', re.MULTILINE), ''),
+]
+
+_SECTION = """## 회의 요약
+
+**일정**: 다음 주 *월요일* 오전 10시, 자세한 내용은 [공유 문서](https://example.com/doc)를 참고하세요.
+
+- 첫 번째 안건: `deploy.sh` 스크립트 정리
+- 두 번째 안건: ![다이어그램](diagram.png) 검토
+1. 발표 자료 준비
+2. 예산 확인
+
+> 참고: 지난 회의록과 비교해 주세요.
+
+```python
+print("hello")
+```
+
+---
+
+이번 분기 목표는 번역 품질을 유지하면서 응답 시간을 줄이는 것입니다. Plain paragraph text without any syntax.
+"""
+
+_PLAIN = "이번 분기 목표는 번역 품질을 유지하면서 응답 시간을 줄이는 것입니다. Plain paragraph text without any syntax.\n\n"
+
+
+def legacy_strip_markdown(text: str) -> str:
+    """이전 strip_markdown 구현 (정규식 11개를 차례로 적용)"""
+    for pattern, replacement in _LEGACY_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def legacy_has_markdown(text: str) -> bool:
+    """이전 TextAnalyzer.has_markdown 구현 (전체 제거 결과와 비교)"""
+    return legacy_strip_markdown(text) != text
+
+
+def build_input(size: int, markdown: bool = True) -> str:
+    """size 문자 길이의 입력을 만듭니다 (markdown=False이면 문법 없는 일반 텍스트)."""
+    unit = _SECTION if markdown else _PLAIN
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def measure(fn, text: str, repeat: int) -> float:
+    """fn(text) 한 번의 평균 실행 시간(ms)을 반환합니다 (5회 측정 중 최솟값 기준)."""
+    return min(timeit.repeat(lambda: fn(text), number=repeat, repeat=5)) / repeat * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="strip_markdown / has_markdown 마이크로벤치마크")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="쉼표로 구분한 입력 크기 (문자 수)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정당 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{'입력':<16} {'이전 strip':>12} {'새 strip':>12} {'배율':>7}   {'이전 has':>12} {'새 has':>12} {'배율':>7}")
+    for size in (int(value) for value in args.sizes.split(",") if value.strip()):
+        for markdown in (True, False):
+            text = build_input(size, markdown)
+            old_strip = measure(legacy_strip_markdown, text, args.repeat)
+            new_strip = measure(strip_markdown, text, args.repeat)
+            old_has = measure(legacy_has_markdown, text, args.repeat)
+            new_has = measure(has_markdown, text, args.repeat)
+            label = f"{size:,}자 {'markdown' if markdown else 'plain'}"
+            print(
+                f"{label:<16} {old_strip:>10.3f}ms {new_strip:>10.3f}ms {old_strip / new_strip:>6.1f}x   "
+                f"{old_has:>10.3f}ms {new_has:>10.3f}ms {old_has / new_has:>6.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""OpenAI/Azure OpenAI 호환 로컬 mock 서버
+
+실제 API 없이 TransBot 자체의 처리 시간(오버헤드)을 측정하고 부하 상황을 재현하기 위한 서버입니다.
+chat.completions 요청에 대해 설정한 지연 분포, 출력 속도(토큰/초), 429/5xx 오류 비율에 따라 응답하며,
+스트리밍(SSE)과 사용량(usage) 보고를 지원합니다.
+
+지원 경로:
+    POST /v1/chat/completions                                   (OpenAI, base_url=http://host:port/v1)
+    POST /openai/deployments/{deployment}/chat/completions      (Azure, azure_endpoint=http://host:port)
+
+지연 분포 형식 (--latency):
+    fixed:MS                 항상 MS 밀리초
+    uniform:MIN:MAX          MIN~MAX 밀리초 균등 분포
+    lognormal:MEDIAN:SIGMA   중앙값 MEDIAN 밀리초, 로그 표준편차 SIGMA의 로그정규 분포 (긴 꼬리 지연 재현)
+
+응답 내용은 번역 품질과 무관한 더미 텍스트이며, 출력 토큰 수는 마지막 user 메시지의 추정 토큰 수를
+max_tokens로 제한한 값입니다. response_format이 json_object인 요청(다중 스타일 일괄 번역)에는
+시스템 프롬프트의 STYLES 목록에 있는 스타일마다 더미 번역을 담은 {"translations": {...}}를 반환합니다.
+
+사용 예:
+    python scripts/mock_openai_server.py --port 8000 --latency lognormal:800:0.4 --tokens-per-second 80 \\
+        --error-429 0.05 --error-5xx 0.01
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """지연 분포 문자열을 (난수 생성기 → 지연 초) 함수로 변환합니다.
+
+    Args:
+        spec: "fixed:MS", "uniform:MIN:MAX" 또는 "lognormal:MEDIAN:SIGMA"
+
+    Returns:
+        지연 시간(초)을 반환하는 함수
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    kind, _, args = spec.partition(":")
+    try:
+        values = [float(value) for value in args.split(":")] if args else []
+    except ValueError:
+        raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+
+    if kind == "fixed" and len(values) == 1 and values[0] >= 0:
+        return lambda rng: values[0] / 1000
+    if kind == "uniform" and len(values) == 2 and 0 <= values[0] <= values[1]:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0 and values[1] >= 0:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1]) / 1000
+    raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+
+
+def batched_translations(system_prompt: str, content: str) -> dict[str, Any]:
+    """다중 스타일 일괄 번역 요청에 대한 {"translations": {...}} 응답을 만듭니다.
+
+    시스템 프롬프트의 "STYLES:" 아래 "- <style key>: ..." 줄에서 스타일 키를 읽고,
+    응답 형식에 "alternatives"가 있으면 스타일마다 대안 표현도 채웁니다.
+
+    Args:
+        system_prompt: 요청의 시스템 메시지
+        content: 스타일마다 넣을 더미 번역
+
+    Returns:
+        {"translations": {스타일 키: {"primary": ..., ["alternatives": [...]]}}}
+    """
+    _, _, style_section = system_prompt.partition("STYLES:\n")
+    entry: dict[str, Any] = {"primary": content}
+    if '"alternatives"' in system_prompt:
+        entry["alternatives"] = [content, content]
+
+    translations = {}
+    for line in style_section.splitlines():
+        if not line.startswith("- "):
+            break
+        style, _, _ = line[2:].partition(":")
+        translations[style.strip()] = dict(entry)
+    return {"translations": translations}
+
+
+class MockOpenAIServer:
+    """OpenAI 호환 chat.completions mock 서버
+
+    start()로 백그라운드 스레드에서 실행하며, 요청마다 서버 처리 구간(시작/종료 시각)을 기록하므로
+    클라이언트 측 소요 시간에서 서버 처리 시간을 빼 TransBot 자체 오버헤드를 계산할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0",
+        tokens_per_second: float = 0,
+        error_429_rate: float = 0.0,
+        error_5xx_rate: float = 0.0,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 빈 포트 자동 선택)
+            latency: 첫 토큰까지의 지연 분포 (parse_latency 형식)
+            tokens_per_second: 출력 토큰 생성 속도 (0이면 출력 시간 없이 즉시 응답)
+            error_429_rate: 429 응답 비율 (0.0~1.0)
+            error_5xx_rate: 500/503 응답 비율 (0.0~1.0)
+            seed: 난수 시드 (재현 가능한 지연/오류 분포용)
+        """
+        self.latency = parse_latency(latency)
+        self.tokens_per_second = max(0.0, tokens_per_second)
+        self.error_429_rate = error_429_rate
+        self.error_5xx_rate = error_5xx_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._records: list[dict[str, Any]] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL (Azure azure_endpoint로 사용)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        """OpenAI 클라이언트의 base_url"""
+        return f"{self.url}/v1"
+
+    def start(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다 (Ctrl+C로 종료)."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def records(self, since: float = 0.0) -> list[dict[str, Any]]:
+        """since(time.monotonic) 이후 시작된 요청 기록을 반환합니다.
+
+        Returns:
+            [{"start", "end", "status", "stream", "model", "prompt_tokens", "completion_tokens"}, ...]
+        """
+        with self._lock:
+            return [record for record in self._records if record["start"] >= since]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def _draw(self) -> tuple[float, Optional[int]]:
+        """이번 요청의 지연 시간(초)과 주입할 오류 상태 코드(없으면 None)를 정합니다."""
+        with self._lock:
+            delay = self.latency(self._rng)
+            roll = self._rng.random()
+            status = None
+            if roll < self.error_429_rate:
+                status = 429
+            elif roll < self.error_429_rate + self.error_5xx_rate:
+                status = self._rng.choice((500, 503))
+        return delay, status
+
+    def _record(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(_ChatCompletionsHandler):
+            mock = server
+
+        return Handler
+
+
+def _estimate_tokens(text: str) -> int:
+    """문자 수로 토큰 수를 추정합니다 (ASCII는 약 4문자당 1토큰, 한글 등은 문자당 1토큰)."""
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return max(1, math.ceil(ascii_chars / 4) + len(text) - ascii_chars)
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """chat.completions 요청 핸들러 (mock 속성은 MockOpenAIServer가 주입)"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 나누어 쓰므로 Nagle 알고리즘과 지연 ACK가 겹쳐 생기는 ~40ms 지연을 막습니다
+    disable_nagle_algorithm = True
+    mock: MockOpenAIServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # 요청마다 표준 오류로 접근 로그를 남기지 않습니다 (벤치마크 출력 방해 방지)
+        pass
+
+    def do_POST(self) -> None:
+        start = time.monotonic()
+        # keep-alive 연결을 재사용하므로 오류 응답 전에도 본문을 모두 읽습니다
+        raw_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = self.path.split("?", 1)[0]
+        deployment = None
+        if path.startswith("/openai/deployments/") and path.endswith("/chat/completions"):
+            deployment = path[len("/openai/deployments/"):-len("/chat/completions")]
+        elif path not in ("/v1/chat/completions", "/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path: {path}", "type": "invalid_request_error"}})
+            return
+
+        try:
+            body = json.loads(raw_body or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+            return
+
+        model = deployment or body.get("model") or "mock-model"
+        messages = body.get("messages") or []
+        prompt_tokens = sum(_estimate_tokens(str(message.get("content") or "")) for message in messages)
+        user_text = next(
+            (str(message.get("content") or "") for message in reversed(messages) if message.get("role") == "user"),
+            ""
+        )
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or 4096
+        completion_tokens = min(max_tokens, _estimate_tokens(user_text))
+        stream = bool(body.get("stream"))
+
+        delay, error_status = self.mock._draw()
+        time.sleep(delay)
+        record = {
+            "start": start,
+            "status": error_status or 200,
+            "stream": stream,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": 0 if error_status else completion_tokens,
+        }
+
+        if error_status is not None:
+            error_type = "rate_limit_exceeded" if error_status == 429 else "server_error"
+            headers = {"retry-after-ms": "50"} if error_status == 429 else {}
+            self._send_json(error_status, {
+                "error": {"message": f"Mock {error_status}", "type": error_type, "code": str(error_status)}
+            }, headers)
+        elif body.get("response_format", {}).get("type") == "json_object":
+            system_prompt = next(
+                (str(message.get("content") or "") for message in messages if message.get("role") == "system"),
+                ""
+            )
+            content = json.dumps(batched_translations(system_prompt, " ".join(["mock"] * completion_tokens)))
+            self._send_completion(model, content, prompt_tokens, completion_tokens, stream)
+        else:
+            content = " ".join(["mock"] * completion_tokens)
+            self._send_completion(
+                model, content, prompt_tokens, completion_tokens, stream,
+                include_usage=bool((body.get("stream_options") or {}).get("include_usage"))
+            )
+
+        record["end"] = time.monotonic()
+        self.mock._record(record)
+
+    def _send_completion(
+        self,
+        model: str,
+        content: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        stream: bool,
+        include_usage: bool = False
+    ) -> None:
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        per_token = 1 / self.mock.tokens_per_second if self.mock.tokens_per_second else 0.0
+
+        if not stream:
+            time.sleep(per_token * completion_tokens)
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def chunk(delta: dict[str, Any], finish_reason: Optional[str] = None, **extra: Any) -> dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+
+        self._write_event(chunk({"role": "assistant", "content": ""}))
+        pieces = content.split(" ")
+        for index, piece in enumerate(pieces):
+            time.sleep(per_token)
+            self._write_event(chunk({"content": piece if index == 0 else f" {piece}"}))
+        self._write_event(chunk({}, "stop"))
+        if include_usage:
+            self._write_event({**chunk({}), "choices": [], "usage": usage})
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _write_event(self, data: dict[str, Any]) -> None:
+        self._write_chunk(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: int, data: dict[str, Any], headers: Optional[dict[str, str]] = None) -> None:
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI/Azure OpenAI 호환 로컬 mock 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--latency", default="fixed:0", help="지연 분포 (fixed:MS, uniform:MIN:MAX, lognormal:MEDIAN:SIGMA)"
+    )
+    parser.add_argument("--tokens-per-second", type=float, default=0, help="출력 토큰 생성 속도 (0이면 즉시)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="429 응답 비율 (0.0~1.0)")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="500/503 응답 비율 (0.0~1.0)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        error_429_rate=args.error_429,
+        error_5xx_rate=args.error_5xx,
+        seed=args.seed
+    )
+    print(f"Mock OpenAI 서버 실행 중: {server.openai_base_url} (Azure endpoint: {server.url})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
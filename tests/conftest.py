@@ -1,4 +1,7 @@
 """테스트 공통 설정"""
+import time
+from unittest.mock import Mock
+
 import pytest
 
 
@@ -11,4 +14,44 @@ def disable_langfuse():
     """
     from langfuse.decorators import langfuse_context
     langfuse_context.configure(enabled=False)
-    yield
\ No newline at end of file
+    yield
+
+
+@pytest.fixture
+def make_response():
+    """chat.completions 응답 Mock을 만드는 팩토리
+
+    choices[0].message.content와 usage 토큰 수만 채운 응답을 반환합니다.
+    """
+    def factory(content="번역", prompt_tokens=10, completion_tokens=5):
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = content
+        response.usage.prompt_tokens = prompt_tokens
+        response.usage.completion_tokens = completion_tokens
+        response.usage.prompt_tokens_details = None
+        return response
+
+    return factory
+
+
+@pytest.fixture
+def make_client(make_response):
+    """make_response 응답을 반환하는 Mock 클라이언트 팩토리
+
+    delay를 주면 응답 전에 대기하고, error를 주면 응답 대신 예외를 발생시킵니다.
+    """
+    def factory(content="번역", completion_tokens=5, delay=0, error=None):
+        client = Mock()
+
+        def create(**kwargs):
+            if delay:
+                time.sleep(delay)
+            if error is not None:
+                raise error
+            return make_response(content, completion_tokens=completion_tokens)
+
+        client.chat.completions.create.side_effect = create
+        return client
+
+    return factory
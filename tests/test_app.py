@@ -1,6 +1,6 @@
 """app.py 함수 테스트"""
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 class TestFormatTranslationResult:
@@ -471,3 +471,121 @@ class TestSetupSidebarEdgeCases:
 
         # 구분선(---)이 호출되었는지 확인
         mock_streamlit.sidebar.markdown.assert_any_call("---")
+
+
+class TestHandleTranslationRouting:
+    """handle_translation()의 구간 번역 전환 테스트"""
+
+    KOREAN = "회의 안건을 공유합니다. 검토 부탁드립니다.\n\n"
+    ENGLISH = "> Hi team, please review the PR before the release.\n\n"
+
+    @pytest.fixture
+    def app_env(self):
+        """Streamlit, 설정, 토큰 카운터, 구간 번역 mock"""
+        from config import Config
+
+        cfg = Config()
+        cfg.MIXED_LANGUAGE_PASSTHROUGH_ENABLED = True
+        cfg.MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS = 20
+        cfg.TRANSLATION_STREAMING_ENABLED = True
+        token_counter = Mock()
+        token_counter.count.side_effect = lambda text, model, approximate=None: len(text.split())
+
+        with patch('app.st') as mock_st, \
+                patch('app.config', cfg), \
+                patch('app.get_token_counter', return_value=token_counter), \
+                patch('app.translate_document') as mock_translate_document:
+            yield mock_st, cfg, mock_translate_document
+
+    def test_short_passthrough_block_translated_in_one_request(self, app_env):
+        """대상 언어 문단이 짧으면 구간 번역으로 전환하지 않는지 테스트"""
+        from app import handle_translation
+
+        mock_st, _, mock_translate_document = app_env
+
+        handle_translation(self.KOREAN + self.ENGLISH, "Korean", "English", Mock(model="gpt-4o"))
+
+        mock_translate_document.assert_not_called()
+        assert mock_st.session_state.pending_translation["target"] == "English"
+
+    def test_large_passthrough_share_uses_document_path(self, app_env):
+        """대상 언어 문단이 기준 토큰 수 이상이면 구간 번역을 사용하는지 테스트"""
+        from app import handle_translation
+
+        _, _, mock_translate_document = app_env
+
+        handle_translation(self.KOREAN + self.ENGLISH * 3, "Korean", "English", Mock(model="gpt-4o"))
+
+        mock_translate_document.assert_called_once()
+
+    def test_passthrough_disabled(self, app_env):
+        """혼합 언어 유지가 꺼져 있으면 대상 언어 문단이 많아도 한 번에 번역하는지 테스트"""
+        from app import handle_translation
+
+        _, cfg, mock_translate_document = app_env
+        cfg.MIXED_LANGUAGE_PASSTHROUGH_ENABLED = False
+
+        handle_translation(self.KOREAN + self.ENGLISH * 3, "Korean", "English", Mock(model="gpt-4o"))
+
+        mock_translate_document.assert_not_called()
+
+
+class TestStreamTranslation:
+    """stream_translation() 결과 저장 테스트"""
+
+    def test_replaced_stream_result_stored(self):
+        """스트리밍 중 다시 번역한 결과로 바뀌면 그 결과를 저장하는지 테스트"""
+        from app import stream_translation
+        from components.translation import StreamResultReplaced
+
+        def translate_stream(text, source, target, session_id):
+            yield "Install: ⟦0⟧"
+            raise StreamResultReplaced("Install: `pip install transbot`")
+
+        manager = Mock()
+        manager.translate_stream.side_effect = translate_stream
+
+        with patch('app.st') as mock_st, patch('app.run_multi_style_translation'):
+            mock_st.session_state.pending_translation = {
+                "text": "설치: `pip install transbot`", "source": "Korean", "target": "English"
+            }
+            mock_st.write_stream.side_effect = lambda stream: "".join(stream)
+
+            stream_translation(manager)
+
+            assert mock_st.session_state.translation_result["text"] == "Install: `pip install transbot`"
+            mock_st.error.assert_not_called()
+
+
+class TestUpdateStatistics:
+    """update_statistics() 토큰 수 표시 테스트"""
+
+    @staticmethod
+    def _analyzer(threshold):
+        from components.text import TextAnalyzer
+        from components.tokens import TokenCounter
+
+        encoding = Mock()
+        encoding.name = "fake"
+        encoding.encode.side_effect = lambda text: list(text)
+        del encoding.encode_batch
+        counter = TokenCounter(approximate_threshold=threshold, encoding_getter=lambda m: encoding)
+        return TextAnalyzer(token_counter=counter)
+
+    def _render(self, text, threshold):
+        from app import update_statistics
+        from components.language import LanguageDetector
+
+        with patch('app.st') as mock_st:
+            mock_st.session_state = MagicMock()
+            placeholder = Mock()
+            update_statistics(text, placeholder, LanguageDetector(), self._analyzer(threshold), "gpt-4o")
+            return placeholder.markdown.call_args.args[0]
+
+    def test_large_input_shows_approximate_tokens(self):
+        """근사 기준보다 긴 입력은 추정 토큰 수를 ~N으로 표시하는지 테스트"""
+        assert "(~5,000 토큰)" in self._render("안녕하세요\n\n" * 700 + "a" * 100, threshold=1000)
+
+    def test_small_input_shows_exact_tokens(self):
+        """짧은 입력은 정확한 토큰 수를 표시하는지 테스트"""
+        assert "(5 토큰)" in self._render("Hello", threshold=1000)
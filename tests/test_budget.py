@@ -0,0 +1,159 @@
+"""TokenBudget 클래스 테스트"""
+import pytest
+
+from components.budget import MODEL_TOKEN_LIMITS, TokenBudget
+from components.style_translator import StyleTranslator
+from components.tokens import TokenCounter
+from components.translation import TranslationManager
+from config import Config
+
+
+class FakeEncoding:
+    """문자 1개를 토큰 1개로 인코딩하는 테스트용 인코더"""
+
+    name = "fake"
+
+    def encode(self, text):
+        return [ord(ch) for ch in text]
+
+
+def make_budget(**kwargs):
+    counter = TokenCounter(encoding_getter=lambda model: FakeEncoding())
+    return TokenBudget(token_counter=counter, **kwargs)
+
+
+class TestTokenBudget:
+    """TokenBudget 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.budget = make_budget(safety_margin=1.0, min_tokens=10)
+
+    def test_direction_ratios(self):
+        """번역 방향에 따라 예산이 달라지는지 테스트"""
+        ko_to_en = self.budget.estimate(1000, "Korean", "English", "gpt-4o")
+        en_to_ko = self.budget.estimate(1000, "English", "Korean", "gpt-4o")
+
+        assert ko_to_en == 900
+        assert en_to_ko == 1600
+
+    def test_style_factor(self):
+        """간결 스타일은 예산이 줄어드는지 테스트"""
+        concise = self.budget.estimate(1000, "English", "Korean", "gpt-4o", style="concise")
+        formal = self.budget.estimate(1000, "English", "Korean", "gpt-4o", style="formal")
+
+        assert concise == 1120
+        assert formal == 1760
+
+    def test_same_language_and_outputs(self):
+        """같은 언어(대안 표현)는 비율 1.0과 생성 개수를 적용하는지 테스트"""
+        assert self.budget.estimate(100, "English", "English", "gpt-4o", outputs=3) == 300
+
+    def test_min_tokens_and_safety_margin(self):
+        """최소 예산과 여유 배율 적용 테스트"""
+        budget = make_budget(safety_margin=1.5, min_tokens=256)
+
+        assert budget.estimate(1, "Korean", "English", "gpt-4o") == 256
+        assert budget.estimate(1000, "Korean", "English", "gpt-4o") == 1350
+
+    def test_clamp_to_model_output_limit(self):
+        """모델 최대 출력 토큰 이하로 제한하는지 테스트"""
+        assert self.budget.estimate(100000, "English", "Korean", "gpt-4-turbo") == 4096
+        max_output_tokens = MODEL_TOKEN_LIMITS["gpt-4o"]["max_output_tokens"]
+        assert self.budget.estimate(100000, "English", "Korean", "gpt-4o") == max_output_tokens
+
+    def test_clamp_to_context_window(self):
+        """남은 컨텍스트 윈도우 이하로 제한하는지 테스트"""
+        assert self.budget.estimate(3000, "English", "Korean", "gpt-4", prompt_tokens=7000) == 1192
+
+    def test_unknown_model_uses_conservative_limits(self):
+        """알 수 없는 모델은 보수적인 한도를 사용하는지 테스트"""
+        assert self.budget.estimate(3000, "English", "Korean", "my-deployment", prompt_tokens=100) == 4096
+
+    def test_count_messages(self):
+        """메시지 토큰 수에 구분 토큰이 포함되는지 테스트"""
+        messages = [{"role": "system", "content": "abc"}, {"role": "user", "content": "de"}]
+        assert self.budget.count_messages(messages, "gpt-4o") == 5 + 8
+
+    def test_record_and_calibrate(self):
+        """기록으로 비율을 다시 계산하는지 테스트"""
+        for _ in range(3):
+            self.budget.record("English", "Korean", 100, 200, 120, "gpt-4o")
+        self.budget.record("English", "Korean", 100, 50, 50, "gpt-4o")  # 잘린 기록은 제외
+        self.budget.record("Korean", "English", 100, 200, 70, "gpt-4o", style="concise")
+
+        history = self.budget.history()
+        assert len(history) == 5
+        assert history[3]["truncated"] is True
+
+        assert self.budget.calibrated_ratios(min_samples=3) == {("English", "Korean"): 1.2}
+        assert self.budget.calibrated_ratios(min_samples=1) == {("English", "Korean"): 1.2, ("Korean", "English"): 1.0}
+
+    def test_from_config(self):
+        """설정으로 생성 테스트"""
+        config = Config()
+        budget = TokenBudget.from_config(config)
+        assert budget.safety_margin == 1.3
+        assert budget.min_tokens == 256
+
+        config.TOKEN_BUDGET_ENABLED = False
+        assert TokenBudget.from_config(config) is None
+
+
+class TestTokenBudgetIntegration:
+    """번역 관리자와 StyleTranslator의 예산 적용 테스트"""
+
+    def test_translation_manager_uses_budget(self, make_client):
+        """TranslationManager가 예산으로 max_tokens를 정하고 기록하는지 테스트"""
+        client = make_client(completion_tokens=7)
+        budget = make_budget(min_tokens=1)
+        manager = TranslationManager(client, model="gpt-4o", token_budget=budget)
+
+        manager.translate("Hello world", "English", "Korean")
+
+        max_tokens = client.chat.completions.create.call_args[1]["max_tokens"]
+        assert max_tokens == budget.estimate(11, "English", "Korean", "gpt-4o")
+        assert budget.history()[0]["estimated_tokens"] == max_tokens
+        assert budget.history()[0]["actual_tokens"] == 7
+
+    def test_translation_manager_without_budget(self, make_client):
+        """예산이 없으면 max_tokens 설정값을 사용하는지 테스트"""
+        client = make_client()
+        manager = TranslationManager(client, model="gpt-4o", max_tokens=1234)
+
+        manager.translate("Hello", "English", "Korean")
+
+        assert client.chat.completions.create.call_args[1]["max_tokens"] == 1234
+
+    def test_style_translator_uses_style_budget(self, make_client):
+        """StyleTranslator가 스타일별 예산을 사용하는지 테스트"""
+        client = make_client()
+        budget = make_budget(safety_margin=1.0, min_tokens=1)
+        translator = StyleTranslator(client=client, model="gpt-4o", token_budget=budget)
+
+        translator.translate_single_style("a" * 100, StyleTranslator.STYLE_CONCISE, "Korean", "English")
+
+        assert client.chat.completions.create.call_args[1]["max_tokens"] == 63
+        assert budget.history()[0]["style"] == "concise"
+
+
+class TestTokenBudgetConfig:
+    """출력 토큰 예산 설정 테스트"""
+
+    def test_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TOKEN_BUDGET_ENABLED", "false")
+        monkeypatch.setenv("TOKEN_BUDGET_SAFETY_MARGIN", "1.5")
+        monkeypatch.setenv("TOKEN_BUDGET_MIN_TOKENS", "128")
+
+        config = Config.load()
+
+        assert config.TOKEN_BUDGET_ENABLED is False
+        assert config.TOKEN_BUDGET_SAFETY_MARGIN == 1.5
+        assert config.TOKEN_BUDGET_MIN_TOKENS == 128
+
+    def test_invalid_safety_margin(self, monkeypatch):
+        """여유 배율이 1.0 미만이면 ValueError 테스트"""
+        monkeypatch.setenv("TOKEN_BUDGET_SAFETY_MARGIN", "0.5")
+        with pytest.raises(ValueError, match="여유 배율"):
+            Config.load()
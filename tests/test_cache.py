@@ -0,0 +1,188 @@
+"""TranslationCache 및 캐시 계층 테스트"""
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from components.cache import (
+    CacheTier,
+    MemoryCacheTier,
+    SQLiteCacheTier,
+    TranslationCache,
+    make_cache_key,
+    normalize_text,
+)
+from config import Config
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_normalize_text(self):
+        """줄바꿈/공백 정규화 테스트"""
+        assert normalize_text("\r\n  \r\nHello\r\nWorld \r\n") == "Hello\nWorld"
+
+    def test_normalize_text_keeps_markdown_whitespace(self):
+        """Markdown 강제 줄바꿈과 들여쓴 코드 블록이 유지되는지 테스트"""
+        assert normalize_text("a  \nb") == "a  \nb"
+        assert make_cache_key("a  \nb", "English", "Korean", "gpt-4o", 0.3) != make_cache_key(
+            "a\nb", "English", "Korean", "gpt-4o", 0.3
+        )
+        assert normalize_text("\n    code()\n") == "    code()"
+
+    def test_same_request_same_key(self):
+        """정규화 후 동일한 요청은 같은 키를 생성하는지 테스트"""
+        key1 = make_cache_key("Hello\r\n", "English", "Korean", "gpt-4o", 0.3)
+        key2 = make_cache_key("Hello", "English", "Korean", "gpt-4o", 0.3)
+        assert key1 == key2
+        assert len(key1) == 64
+
+    @pytest.mark.parametrize("override", [
+        {"text": "Hi"},
+        {"source": "Korean"},
+        {"target": "Japanese"},
+        {"model": "gpt-4o-mini"},
+        {"temperature": 0.5},
+        {"style": "formal"},
+        {"custom_instruction": "humorous"},
+        {"prompt_version": "v2"},
+        {"preserve_proper_nouns": True},
+    ])
+    def test_key_changes_with_each_field(self, override):
+        """키 구성 요소가 바뀌면 키도 바뀌는지 테스트"""
+        base = {
+            "text": "Hello",
+            "source": "English",
+            "target": "Korean",
+            "model": "gpt-4o",
+            "temperature": 0.3,
+        }
+        assert make_cache_key(**base) != make_cache_key(**{**base, **override})
+
+
+class TestCacheTier:
+    """캐시 계층 인터페이스 테스트"""
+
+    def test_abstract(self):
+        """메서드를 구현하지 않은 계층은 생성할 수 없는지 테스트"""
+        class IncompleteTier(CacheTier):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            IncompleteTier()
+
+
+class TestMemoryCacheTier:
+    """메모리 LRU 계층 테스트"""
+
+    def test_get_set(self):
+        tier = MemoryCacheTier(max_entries=2)
+        tier.set("a", "1")
+        assert tier.get("a") == "1"
+        assert tier.get("missing") is None
+
+    def test_lru_eviction(self):
+        """최근 사용되지 않은 항목이 먼저 제거되는지 테스트"""
+        tier = MemoryCacheTier(max_entries=2)
+        tier.set("a", "1")
+        tier.set("b", "2")
+        tier.get("a")  # a를 최근 사용으로 갱신
+        tier.set("c", "3")
+
+        assert tier.get("a") == "1"
+        assert tier.get("b") is None
+        assert tier.get("c") == "3"
+        assert len(tier) == 2
+
+
+class TestSQLiteCacheTier:
+    """SQLite 디스크 계층 테스트"""
+
+    def test_persists_across_instances(self, tmp_path):
+        """다른 인스턴스에서도 저장된 값을 조회할 수 있는지 테스트"""
+        path = str(tmp_path / "cache" / "translations.sqlite3")
+        SQLiteCacheTier(path).set("key", "번역 결과")
+
+        assert SQLiteCacheTier(path).get("key") == "번역 결과"
+
+    def test_ttl_expiration(self, tmp_path, monkeypatch):
+        """TTL이 지난 항목은 조회되지 않는지 테스트"""
+        tier = SQLiteCacheTier(str(tmp_path / "cache.sqlite3"), ttl_seconds=10)
+        now = time.time()
+        monkeypatch.setattr("components.cache.time.time", lambda: now)
+        tier.set("key", "value")
+
+        monkeypatch.setattr("components.cache.time.time", lambda: now + 11)
+        assert tier.get("key") is None
+        assert len(tier) == 0
+
+    def test_size_eviction(self, tmp_path, monkeypatch):
+        """최대 항목 수를 넘으면 가장 오래 접근하지 않은 항목이 제거되는지 테스트"""
+        tier = SQLiteCacheTier(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        clock = iter(range(1000, 2000))
+        monkeypatch.setattr("components.cache.time.time", lambda: float(next(clock)))
+
+        tier.set("a", "1")
+        tier.set("b", "2")
+        tier.get("a")
+        tier.set("c", "3")
+
+        assert len(tier) == 2
+        assert tier.get("b") is None
+        assert tier.get("a") == "1"
+        assert tier.get("c") == "3"
+
+
+class TestTranslationCache:
+    """다계층 캐시 테스트"""
+
+    def test_hit_miss_counters(self):
+        cache = TranslationCache([MemoryCacheTier()])
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        stats = cache.stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hit_ratio"] == 0.5
+        assert stats["cache_tier_hits"] == {"memory": 1}
+
+    def test_disk_hit_promotes_to_memory(self, tmp_path):
+        """디스크 계층 적중 시 메모리 계층에 채워지는지 테스트"""
+        memory = MemoryCacheTier()
+        disk = SQLiteCacheTier(str(tmp_path / "cache.sqlite3"))
+        disk.set("key", "value")
+        cache = TranslationCache([memory, disk])
+
+        assert cache.get("key") == "value"
+        assert memory.get("key") == "value"
+        assert cache.stats()["cache_tier_hits"] == {"memory": 0, "disk": 1}
+
+    def test_tier_error_treated_as_miss(self):
+        """계층 오류가 발생해도 예외 없이 미스로 처리되는지 테스트"""
+        broken = Mock(spec=MemoryCacheTier)
+        broken.name = "broken"
+        broken.get.side_effect = RuntimeError("boom")
+        broken.set.side_effect = RuntimeError("boom")
+        cache = TranslationCache([broken])
+
+        cache.set("key", "value")
+        assert cache.get("key") is None
+        assert cache.stats()["cache_misses"] == 1
+
+    def test_from_config_disabled(self):
+        config = Config()
+        config.TRANSLATION_CACHE_ENABLED = False
+        assert TranslationCache.from_config(config) is None
+
+    def test_from_config_tiers(self, tmp_path):
+        config = Config()
+        config.TRANSLATION_CACHE_PATH = str(tmp_path / "cache.sqlite3")
+        cache = TranslationCache.from_config(config)
+        assert [tier.name for tier in cache.tiers] == ["memory", "disk"]
+
+        config.TRANSLATION_CACHE_PATH = None
+        cache = TranslationCache.from_config(config)
+        assert [tier.name for tier in cache.tiers] == ["memory"]
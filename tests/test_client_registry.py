@@ -0,0 +1,109 @@
+"""ClientRegistry 클래스 테스트"""
+import httpx
+from openai import AzureOpenAI, OpenAI
+
+from components.client_registry import ClientRegistry
+from config import Config
+
+
+class TestClientRegistry:
+    """ClientRegistry 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = ClientRegistry(max_connections=10, max_keepalive_connections=5)
+
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.registry.close()
+
+    def test_same_key_returns_shared_client(self):
+        """같은 설정이면 같은 클라이언트를 재사용하는지 테스트"""
+        first = self.registry.get_client("openai", api_key="sk-test")
+        second = self.registry.get_client("openai", api_key="sk-test")
+
+        assert isinstance(first, OpenAI)
+        assert first is second
+        assert len(self.registry) == 1
+
+    def test_different_key_creates_new_client(self):
+        """API 키가 다르면 별도 클라이언트를 생성하는지 테스트"""
+        first = self.registry.get_client("openai", api_key="sk-a")
+        second = self.registry.get_client("openai", api_key="sk-b")
+
+        assert first is not second
+        assert len(self.registry) == 2
+
+    def test_api_key_not_stored_in_key(self):
+        """레지스트리 키에 API 키 원문을 저장하지 않는지 테스트"""
+        self.registry.get_client("openai", api_key="sk-secret")
+
+        assert all("sk-secret" not in part for key in self.registry._clients for part in key)
+
+    def test_azure_client(self):
+        """Azure 클라이언트 생성 테스트"""
+        client = self.registry.get_client(
+            "azure",
+            api_key="azure-key",
+            endpoint="https://example.openai.azure.com/",
+            api_version="2024-02-15-preview"
+        )
+
+        assert isinstance(client, AzureOpenAI)
+
+    def test_pool_limits_applied(self):
+        """httpx 연결 풀 설정이 적용되는지 테스트"""
+        self.registry.get_client("openai", api_key="sk-test")
+        http_client = next(iter(self.registry._clients.values()))["http_client"]
+
+        pool = http_client._transport._pool
+        assert pool._max_connections == 10
+        assert pool._max_keepalive_connections == 5
+
+    def test_stats(self):
+        """요청 통계 테스트"""
+        self.registry.get_client("openai", api_key="sk-test")
+
+        stats = self.registry.stats()
+
+        assert stats == [{
+            "provider": "openai",
+            "endpoint": None,
+            "requests": 0,
+            "responses": 0,
+            "in_flight": 0,
+            "http2_responses": 0,
+            "http2": False,
+        }]
+
+    def test_stats_counted_by_event_hooks(self):
+        """요청/응답 이벤트 훅으로 통계를 집계하는지 테스트"""
+        self.registry.get_client("openai", api_key="sk-test")
+        http_client = next(iter(self.registry._clients.values()))["http_client"]
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+        for hook in http_client.event_hooks["request"]:
+            hook(request)
+            hook(request)
+        for hook in http_client.event_hooks["response"]:
+            hook(httpx.Response(200, request=request, extensions={"http_version": b"HTTP/2"}))
+
+        stats = self.registry.stats()[0]
+        assert stats["requests"] == 2
+        assert stats["responses"] == 1
+        assert stats["in_flight"] == 1
+        assert stats["http2_responses"] == 1
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """h2 패키지가 없으면 HTTP/1.1을 사용하는지 테스트"""
+        monkeypatch.setattr(ClientRegistry, "_http2_available", staticmethod(lambda: False))
+        assert ClientRegistry(http2=True).http2 is False
+
+    def test_from_config(self):
+        """Config 설정으로 생성하는지 테스트"""
+        config = Config()
+        config.HTTP_MAX_CONNECTIONS = 7
+
+        registry = ClientRegistry.from_config(config)
+
+        assert registry.limits.max_connections == 7
@@ -577,3 +577,388 @@ class TestConfigOpenAIModels:
         # 빈 딕셔너리가 반환되어야 함
         assert len(models) == 0
         assert models == {}
+
+
+class TestSingleFlightConfig:
+    """동일 요청 합치기 설정 테스트"""
+
+    def test_single_flight_default(self):
+        """기본값 테스트"""
+        assert Config().TRANSLATION_SINGLE_FLIGHT_ENABLED is True
+
+    def test_single_flight_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TRANSLATION_SINGLE_FLIGHT_ENABLED", "false")
+        assert Config.load().TRANSLATION_SINGLE_FLIGHT_ENABLED is False
+
+
+class TestBatchTranslationConfig:
+    """일괄 번역 설정 테스트"""
+
+    def test_batch_max_concurrency_default(self):
+        """기본값 테스트"""
+        assert Config().BATCH_MAX_CONCURRENCY == 8
+
+    def test_batch_max_concurrency_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("BATCH_MAX_CONCURRENCY", "16")
+        assert Config.load().BATCH_MAX_CONCURRENCY == 16
+
+    def test_invalid_batch_max_concurrency(self, monkeypatch):
+        """잘못된 동시 요청 수 검증 테스트"""
+        monkeypatch.setenv("BATCH_MAX_CONCURRENCY", "0")
+        with pytest.raises(ValueError):
+            Config.load()
+
+
+class TestTranslationMemoryConfig:
+    """번역 메모리 설정 테스트"""
+
+    def test_translation_memory_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.TRANSLATION_MEMORY_ENABLED is False
+        assert config.TRANSLATION_MEMORY_BACKEND == "sqlite"
+        assert config.TRANSLATION_MEMORY_MIN_SIMILARITY == 0.5
+        assert config.TRANSLATION_MEMORY_REUSE_SIMILARITY == 1.0
+        assert config.TRANSLATION_MEMORY_MAX_MATCHES == 3
+
+    def test_translation_memory_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TRANSLATION_MEMORY_ENABLED", "true")
+        monkeypatch.setenv("TRANSLATION_MEMORY_BACKEND", "Postgres")
+        monkeypatch.setenv("TRANSLATION_MEMORY_DSN", "postgresql://localhost/tm")
+        monkeypatch.setenv("TRANSLATION_MEMORY_MIN_SIMILARITY", "0.4")
+        monkeypatch.setenv("TRANSLATION_MEMORY_REUSE_SIMILARITY", "0.95")
+
+        config = Config.load()
+
+        assert config.TRANSLATION_MEMORY_ENABLED is True
+        assert config.TRANSLATION_MEMORY_BACKEND == "postgres"
+        assert config.TRANSLATION_MEMORY_DSN == "postgresql://localhost/tm"
+        assert config.TRANSLATION_MEMORY_MIN_SIMILARITY == 0.4
+        assert config.TRANSLATION_MEMORY_REUSE_SIMILARITY == 0.95
+
+    def test_invalid_translation_memory_backend(self, monkeypatch):
+        """지원하지 않는 저장소 검증 테스트"""
+        monkeypatch.setenv("TRANSLATION_MEMORY_BACKEND", "redis")
+        with pytest.raises(ValueError, match="지원하지 않는 번역 메모리 저장소"):
+            Config.load()
+
+    def test_reuse_similarity_below_min_similarity(self, monkeypatch):
+        """재사용 유사도가 참고 유사도보다 낮으면 검증 실패 테스트"""
+        monkeypatch.setenv("TRANSLATION_MEMORY_MIN_SIMILARITY", "0.8")
+        monkeypatch.setenv("TRANSLATION_MEMORY_REUSE_SIMILARITY", "0.6")
+        with pytest.raises(ValueError, match="재사용 유사도는 참고 유사도 이상"):
+            Config.load()
+
+
+class TestGlossaryConfig:
+    """용어집 설정 테스트"""
+
+    def test_glossary_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.GLOSSARY_ENABLED is False
+        assert config.GLOSSARY_PATHS == "glossaries"
+        assert config.GLOSSARY_RELOAD_INTERVAL_SECONDS == 5.0
+        assert config.GLOSSARY_MAX_TERMS == 50
+
+    def test_glossary_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("GLOSSARY_ENABLED", "true")
+        monkeypatch.setenv("GLOSSARY_PATHS", "glossaries/product.json,glossaries/legal")
+        monkeypatch.setenv("GLOSSARY_RELOAD_INTERVAL_SECONDS", "0")
+        monkeypatch.setenv("GLOSSARY_MAX_TERMS", "20")
+
+        config = Config.load()
+
+        assert config.GLOSSARY_ENABLED is True
+        assert config.GLOSSARY_PATHS == "glossaries/product.json,glossaries/legal"
+        assert config.GLOSSARY_RELOAD_INTERVAL_SECONDS == 0.0
+        assert config.GLOSSARY_MAX_TERMS == 20
+
+    def test_invalid_glossary_max_terms(self, monkeypatch):
+        """최대 용어 수 검증 테스트"""
+        monkeypatch.setenv("GLOSSARY_MAX_TERMS", "0")
+        with pytest.raises(ValueError, match="최대 용어 수는 1 이상"):
+            Config.load()
+
+
+class TestPlaceholderConfig:
+    """플레이스홀더 보호 설정 테스트"""
+
+    def test_placeholder_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.PLACEHOLDER_PROTECTION_ENABLED is False
+        assert config.PLACEHOLDER_MIN_CHARS == 8
+
+    def test_placeholder_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("PLACEHOLDER_PROTECTION_ENABLED", "true")
+        monkeypatch.setenv("PLACEHOLDER_MIN_CHARS", "16")
+
+        config = Config.load()
+
+        assert config.PLACEHOLDER_PROTECTION_ENABLED is True
+        assert config.PLACEHOLDER_MIN_CHARS == 16
+
+    def test_invalid_placeholder_min_chars(self, monkeypatch):
+        """최소 구간 길이 검증 테스트"""
+        monkeypatch.setenv("PLACEHOLDER_MIN_CHARS", "0")
+        with pytest.raises(ValueError, match="최소 구간 길이는 1 이상"):
+            Config.load()
+
+
+class TestMixedLanguageConfig:
+    """혼합 언어 구간 유지 설정 테스트"""
+
+    def test_mixed_language_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.MIXED_LANGUAGE_PASSTHROUGH_ENABLED is False
+        assert config.MIXED_LANGUAGE_MIN_CONFIDENCE == 0.8
+        assert config.MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS == 200
+
+    def test_mixed_language_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("MIXED_LANGUAGE_PASSTHROUGH_ENABLED", "true")
+        monkeypatch.setenv("MIXED_LANGUAGE_MIN_CONFIDENCE", "0.95")
+        monkeypatch.setenv("MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS", "50")
+
+        config = Config.load()
+
+        assert config.MIXED_LANGUAGE_PASSTHROUGH_ENABLED is True
+        assert config.MIXED_LANGUAGE_MIN_CONFIDENCE == 0.95
+        assert config.MIXED_LANGUAGE_MIN_PASSTHROUGH_TOKENS == 50
+
+    def test_invalid_mixed_language_confidence(self, monkeypatch):
+        """잘못된 신뢰도 기준 검증 테스트"""
+        monkeypatch.setenv("MIXED_LANGUAGE_MIN_CONFIDENCE", "0.3")
+        with pytest.raises(ValueError, match="혼합 언어 신뢰도 기준"):
+            Config.load()
+
+
+class TestHttpPoolConfig:
+    """HTTP 연결 풀 설정 테스트"""
+
+    def test_http_pool_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.HTTP_MAX_CONNECTIONS == 100
+        assert config.HTTP_MAX_KEEPALIVE_CONNECTIONS == 20
+        assert config.HTTP_KEEPALIVE_EXPIRY == 30.0
+        assert config.HTTP2_ENABLED is False
+
+    def test_http_pool_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "50")
+        monkeypatch.setenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+        monkeypatch.setenv("HTTP_KEEPALIVE_EXPIRY", "5")
+        monkeypatch.setenv("HTTP2_ENABLED", "true")
+
+        config = Config.load()
+
+        assert config.HTTP_MAX_CONNECTIONS == 50
+        assert config.HTTP_MAX_KEEPALIVE_CONNECTIONS == 10
+        assert config.HTTP_KEEPALIVE_EXPIRY == 5.0
+        assert config.HTTP2_ENABLED is True
+
+
+class TestStreamingConfig:
+    """스트리밍 번역 설정 테스트"""
+
+    def test_streaming_default(self):
+        """기본값 테스트"""
+        assert Config().TRANSLATION_STREAMING_ENABLED is True
+
+    def test_streaming_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TRANSLATION_STREAMING_ENABLED", "false")
+        assert Config.load().TRANSLATION_STREAMING_ENABLED is False
+
+
+class TestStyleTranslationConfig:
+    """다중 스타일 번역 설정 테스트"""
+
+    def test_style_max_concurrency_default(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.STYLE_MAX_CONCURRENCY == 5
+
+    def test_style_max_concurrency_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("STYLE_MAX_CONCURRENCY", "2")
+        config = Config.load()
+        assert config.STYLE_MAX_CONCURRENCY == 2
+
+    def test_style_max_concurrency_invalid(self, monkeypatch):
+        """1 미만 값 검증 테스트"""
+        monkeypatch.setenv("STYLE_MAX_CONCURRENCY", "0")
+        with pytest.raises(ValueError, match="동시 실행 한도"):
+            Config.load()
+
+    def test_style_translation_mode_default(self):
+        """스타일 번역 모드 기본값 테스트"""
+        config = Config()
+        assert config.STYLE_TRANSLATION_MODE == "per_style"
+
+    def test_style_translation_mode_batched(self, monkeypatch):
+        """batched 모드 로드 테스트"""
+        monkeypatch.setenv("STYLE_TRANSLATION_MODE", "batched")
+        config = Config.load()
+        assert config.STYLE_TRANSLATION_MODE == "batched"
+
+    def test_style_translation_mode_invalid(self, monkeypatch):
+        """지원하지 않는 모드 검증 테스트"""
+        monkeypatch.setenv("STYLE_TRANSLATION_MODE", "parallel")
+        with pytest.raises(ValueError, match="지원하지 않는 스타일 번역 모드"):
+            Config.load()
+
+    def test_prompt_version_default(self):
+        """프롬프트 버전 기본값 테스트"""
+        config = Config()
+        assert config.PROMPT_VERSION == "v2"
+
+    def test_prompt_version_v1(self, monkeypatch):
+        """v1 프롬프트 버전 로드 테스트"""
+        monkeypatch.setenv("PROMPT_VERSION", "v1")
+        config = Config.load()
+        assert config.PROMPT_VERSION == "v1"
+
+    def test_prompt_version_invalid(self, monkeypatch):
+        """지원하지 않는 프롬프트 버전 검증 테스트"""
+        monkeypatch.setenv("PROMPT_VERSION", "v9")
+        with pytest.raises(ValueError, match="지원하지 않는 프롬프트 버전"):
+            Config.load()
+
+
+class TestTranslationCacheConfig:
+    """번역 캐시 설정 테스트"""
+
+    def test_cache_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.TRANSLATION_CACHE_ENABLED is True
+        assert config.TRANSLATION_CACHE_MEMORY_MAX_ENTRIES == 512
+        assert config.TRANSLATION_CACHE_PATH == "cache/translations.sqlite3"
+        assert config.TRANSLATION_CACHE_TTL_SECONDS == 604800
+        assert config.TRANSLATION_CACHE_MAX_DISK_ENTRIES == 10000
+
+    def test_cache_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TRANSLATION_CACHE_ENABLED", "false")
+        monkeypatch.setenv("TRANSLATION_CACHE_MEMORY_MAX_ENTRIES", "64")
+        monkeypatch.setenv("TRANSLATION_CACHE_PATH", "")
+        monkeypatch.setenv("TRANSLATION_CACHE_TTL_SECONDS", "60")
+        monkeypatch.setenv("TRANSLATION_CACHE_MAX_DISK_ENTRIES", "100")
+
+        config = Config.load()
+
+        assert config.TRANSLATION_CACHE_ENABLED is False
+        assert config.TRANSLATION_CACHE_MEMORY_MAX_ENTRIES == 64
+        assert config.TRANSLATION_CACHE_PATH is None
+        assert config.TRANSLATION_CACHE_TTL_SECONDS == 60
+        assert config.TRANSLATION_CACHE_MAX_DISK_ENTRIES == 100
+
+
+class TestTokenCountConfig:
+    """토큰 카운팅 설정 테스트"""
+
+    def test_token_count_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.TOKEN_COUNT_APPROX_THRESHOLD == 20000
+        assert config.TOKEN_COUNT_MEMO_SIZE == 256
+
+    def test_token_count_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("TOKEN_COUNT_APPROX_THRESHOLD", "5000")
+        monkeypatch.setenv("TOKEN_COUNT_MEMO_SIZE", "32")
+
+        config = Config.load()
+
+        assert config.TOKEN_COUNT_APPROX_THRESHOLD == 5000
+        assert config.TOKEN_COUNT_MEMO_SIZE == 32
+
+
+class TestLangfuseExportConfig:
+    """Langfuse 전송 설정 테스트"""
+
+    def test_export_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.LANGFUSE_FLUSH_MODE == "background"
+        assert config.LANGFUSE_FLUSH_AT == 15
+        assert config.LANGFUSE_FLUSH_INTERVAL == 1.0
+        assert config.LANGFUSE_MAX_QUEUE_SIZE == 10000
+
+    def test_export_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("LANGFUSE_FLUSH_MODE", "sync")
+        monkeypatch.setenv("LANGFUSE_FLUSH_AT", "5")
+        monkeypatch.setenv("LANGFUSE_FLUSH_INTERVAL", "0.5")
+        monkeypatch.setenv("LANGFUSE_MAX_QUEUE_SIZE", "100")
+
+        config = Config.load()
+
+        assert config.LANGFUSE_FLUSH_MODE == "sync"
+        assert config.LANGFUSE_FLUSH_AT == 5
+        assert config.LANGFUSE_FLUSH_INTERVAL == 0.5
+        assert config.LANGFUSE_MAX_QUEUE_SIZE == 100
+
+    def test_invalid_flush_mode(self, monkeypatch):
+        """지원하지 않는 전송 모드 테스트"""
+        monkeypatch.setenv("LANGFUSE_FLUSH_MODE", "never")
+
+        with pytest.raises(ValueError, match="지원하지 않는 Langfuse 전송 모드입니다"):
+            Config.load()
+
+
+class TestConfigSharedInstance:
+    """Config.get()/Config.reload() 전역 인스턴스 테스트"""
+
+    def test_get_loads_once(self, monkeypatch):
+        """get()은 최초 1회만 load()를 호출하는지 테스트"""
+        monkeypatch.setattr(Config, "_instance", None)
+        calls = []
+        original_load = Config.load.__func__
+
+        def counting_load(cls):
+            calls.append(1)
+            return original_load(cls)
+
+        monkeypatch.setattr(Config, "load", classmethod(counting_load))
+
+        first = Config.get()
+        second = Config.get()
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_reload_replaces_instance(self, monkeypatch):
+        """reload()가 최신 환경 변수로 전역 인스턴스를 교체하는지 테스트"""
+        monkeypatch.setattr(Config, "_instance", None)
+        monkeypatch.setenv("LANGUAGE_DETECTION_THRESHOLD", "0.5")
+        original = Config.get()
+
+        monkeypatch.setenv("LANGUAGE_DETECTION_THRESHOLD", "0.8")
+        assert Config.get().LANGUAGE_DETECTION_THRESHOLD == 0.5
+
+        reloaded = Config.reload()
+
+        assert reloaded is not original
+        assert Config.get() is reloaded
+        assert Config.get().LANGUAGE_DETECTION_THRESHOLD == 0.8
+
+    def test_reload_invalid_keeps_previous_instance(self, monkeypatch):
+        """reload() 실패 시 기존 인스턴스가 유지되는지 테스트"""
+        monkeypatch.setattr(Config, "_instance", None)
+        original = Config.get()
+
+        monkeypatch.setenv("LANGUAGE_DETECTION_THRESHOLD", "1.5")
+        with pytest.raises(ValueError):
+            Config.reload()
+
+        assert Config.get() is original
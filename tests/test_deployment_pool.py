@@ -0,0 +1,320 @@
+"""DeploymentPool 클래스 테스트"""
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import openai
+import pytest
+
+from components.deployment_pool import DeploymentPool, is_retryable_error
+from components.style_translator import StyleTranslator
+from components.translation import AzureTranslationManager
+from config import Config
+
+
+def api_error(status_code):
+    request = httpx.Request("POST", "https://example.openai.azure.com/")
+    return openai.APIStatusError("error", response=httpx.Response(status_code, request=request), body=None)
+
+
+def make_pool(names=("eu", "us"), **kwargs):
+    members = [{"deployment": name, "client": Mock(name=name)} for name in names]
+    return DeploymentPool("gpt-4o", members, **kwargs)
+
+
+class TestDeploymentPool:
+    """DeploymentPool 테스트"""
+
+    def test_round_robin(self):
+        """순서대로 deployment를 사용하는지 테스트"""
+        pool = make_pool(("a", "b", "c"))
+
+        used = [pool.call(lambda client, deployment: deployment) for _ in range(6)]
+
+        assert used == ["a", "b", "c", "a", "b", "c"]
+
+    def test_least_outstanding(self):
+        """진행 중인 요청이 가장 적은 deployment를 사용하는지 테스트"""
+        pool = make_pool(("a", "b"), strategy="least_outstanding")
+        used = []
+
+        def nested(client, deployment):
+            used.append(deployment)
+            if len(used) == 1:
+                # a가 진행 중인 동안 들어온 요청은 b로 보내야 합니다
+                pool.call(nested)
+            return deployment
+
+        pool.call(nested)
+
+        assert used == ["a", "b"]
+
+    def test_latency_weighted_prefers_fast(self, monkeypatch):
+        """응답이 빠른 deployment의 가중치가 높은지 테스트"""
+        pool = make_pool(("slow", "fast"), strategy="latency_weighted")
+        pool._members[0]["latency"] = 1.0
+        pool._members[1]["latency"] = 0.1
+        captured = {}
+
+        def choices(candidates, weights):
+            captured["weights"] = weights
+            return [candidates[0]]
+
+        monkeypatch.setattr("components.deployment_pool.random.choices", choices)
+        pool.call(lambda client, deployment: deployment)
+
+        assert captured["weights"][1] == pytest.approx(10 * captured["weights"][0])
+
+    def test_failover_on_429(self):
+        """429 오류가 나면 다른 deployment로 다시 요청하는지 테스트"""
+        pool = make_pool(("a", "b"))
+
+        def fn(client, deployment):
+            if deployment == "a":
+                raise api_error(429)
+            return deployment
+
+        assert pool.call(fn) == "b"
+        stats = {s["deployment"]: s for s in pool.stats()}
+        assert stats["a"]["failures"] == 1
+        assert stats["a"]["outstanding"] == 0
+
+    def test_no_failover_on_client_error(self):
+        """400 오류는 다른 deployment로 재시도하지 않는지 테스트"""
+        pool = make_pool(("a", "b"))
+        fn = Mock(side_effect=api_error(400))
+
+        with pytest.raises(openai.APIStatusError):
+            pool.call(fn)
+        assert fn.call_count == 1
+        assert all(s["healthy"] for s in pool.stats())
+
+    def test_all_failed_raises(self):
+        """모든 deployment에서 실패하면 예외를 전달하는지 테스트"""
+        pool = make_pool(("a", "b"))
+        fn = Mock(side_effect=api_error(503))
+
+        with pytest.raises(openai.APIStatusError):
+            pool.call(fn)
+        assert fn.call_count == 2
+
+    def test_unhealthy_after_consecutive_failures(self):
+        """연속 오류 후 순환에서 제외되는지 테스트"""
+        pool = make_pool(("a", "b"), unhealthy_threshold=2, probe_interval=60)
+
+        def fn(client, deployment):
+            if deployment == "a":
+                raise api_error(500)
+            return deployment
+
+        pool.call(fn)
+        pool.call(fn)  # b부터 시작 (round robin)
+        pool.call(fn)
+
+        stats = {s["deployment"]: s for s in pool.stats()}
+        assert stats["a"]["healthy"] is False
+        assert [pool.call(fn) for _ in range(3)] == ["b", "b", "b"]
+
+    def test_probe_returns_to_rotation(self, monkeypatch):
+        """시험 시간이 지나면 시험 요청으로 복귀하는지 테스트"""
+        now = [1000.0]
+        monkeypatch.setattr("components.deployment_pool.time.monotonic", lambda: now[0])
+        pool = make_pool(("a", "b"), unhealthy_threshold=1, probe_interval=30)
+        failing = {"a"}
+
+        def fn(client, deployment):
+            if deployment in failing:
+                raise api_error(429)
+            return deployment
+
+        pool.call(fn)
+        assert pool.stats()[0]["healthy"] is False
+
+        now[0] += 31
+        failing.clear()
+        assert pool.call(fn) == "a"  # 시험 요청
+        assert pool.stats()[0]["healthy"] is True
+
+    def test_failed_probe_stays_excluded(self, monkeypatch):
+        """시험 요청이 실패하면 다시 제외되는지 테스트"""
+        now = [1000.0]
+        monkeypatch.setattr("components.deployment_pool.time.monotonic", lambda: now[0])
+        pool = make_pool(("a", "b"), unhealthy_threshold=3, probe_interval=30)
+        pool._members[0]["unhealthy_until"] = now[0] - 1
+
+        def fn(client, deployment):
+            if deployment == "a":
+                raise api_error(502)
+            return deployment
+
+        assert pool.call(fn) == "b"
+        assert pool._members[0]["unhealthy_until"] == now[0] + 30
+
+    def test_call_async(self):
+        """비동기 호출 failover 테스트"""
+        pool = make_pool(("a", "b"))
+
+        async def fn(client, deployment):
+            if deployment == "a":
+                raise openai.APIConnectionError(request=httpx.Request("POST", "https://example.com/"))
+            return deployment
+
+        assert asyncio.run(pool.call_async(fn)) == "b"
+
+    def test_is_retryable_error(self):
+        """오류 분류 테스트"""
+        assert is_retryable_error(api_error(429))
+        assert is_retryable_error(api_error(500))
+        assert not is_retryable_error(api_error(401))
+        assert not is_retryable_error(ValueError("x"))
+
+    def test_invalid_strategy(self):
+        """지원하지 않는 분산 방식이면 ValueError 테스트"""
+        with pytest.raises(ValueError, match="지원하지 않는 deployment 분산 방식"):
+            make_pool(strategy="random")
+
+
+class TestDeploymentPoolFromConfig:
+    """Config로 풀 생성 테스트"""
+
+    def test_from_config(self, monkeypatch):
+        """deployment가 여러 개인 모델만 풀을 만드는지 테스트"""
+        monkeypatch.setenv("AZURE_OPENAI_API_KEY_EU", "eu-key")
+        config = Config()
+        config.AZURE_OPENAI_API_KEY = "main-key"
+        config.AZURE_OPENAI_ENDPOINT = "https://main.openai.azure.com/"
+        config.AZURE_DEPLOYMENTS = "gpt-4o:us|eu,gpt-4o-mini:mini"
+        config.AZURE_DEPLOYMENT_ENDPOINTS = "eu=https://eu.openai.azure.com/@AZURE_OPENAI_API_KEY_EU"
+        get_client = Mock(side_effect=lambda endpoint, api_key: (endpoint, api_key))
+
+        pools = DeploymentPool.from_config(config, get_client)
+
+        assert list(pools) == ["gpt-4o"]
+        assert [m["client"] for m in pools["gpt-4o"]._members] == [
+            ("https://main.openai.azure.com/", "main-key"),
+            ("https://eu.openai.azure.com/", "eu-key"),
+        ]
+
+    def test_missing_key_raises(self):
+        """API 키가 없으면 ValueError 테스트"""
+        config = Config()
+        config.AZURE_OPENAI_ENDPOINT = "https://main.openai.azure.com/"
+        config.AZURE_DEPLOYMENTS = "gpt-4o:us|eu"
+
+        with pytest.raises(ValueError, match="API 키가 설정되지 않았습니다"):
+            DeploymentPool.from_config(config, Mock())
+
+
+class TestAzureTranslationManagerPool:
+    """AzureTranslationManager deployment 풀 적용 테스트"""
+
+    def test_requests_use_pool_deployment(self, monkeypatch):
+        """풀에서 고른 deployment 이름과 클라이언트로 요청하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "안녕하세요"
+        response.usage.prompt_tokens = 10
+        response.usage.completion_tokens = 5
+        pool = make_pool(("us", "eu"))
+        for member in pool._members:
+            member["client"].chat.completions.create.return_value = response
+        default_client = Mock()
+        manager = AzureTranslationManager(default_client, deployment="us", model="gpt-4o", deployment_pool=pool)
+
+        manager.translate("Hello", "English", "Korean")
+        manager.translate("World", "English", "Korean")
+
+        default_client.chat.completions.create.assert_not_called()
+        assert pool._members[0]["client"].chat.completions.create.call_args.kwargs["model"] == "us"
+        assert pool._members[1]["client"].chat.completions.create.call_args.kwargs["model"] == "eu"
+
+    def test_stream_fails_over(self, monkeypatch):
+        """스트림을 열 때 429가 나면 다른 deployment로 스트리밍하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        pool = make_pool(("us", "eu"))
+        pool._members[0]["client"].chat.completions.create.side_effect = api_error(429)
+        pool._members[1]["client"].chat.completions.create.return_value = iter([
+            Mock(choices=[Mock(delta=Mock(content="안녕"))], usage=None),
+            Mock(choices=[Mock(delta=Mock(content="하세요"))], usage=None),
+        ])
+        default_client = Mock()
+        manager = AzureTranslationManager(default_client, deployment="us", model="gpt-4o", deployment_pool=pool)
+
+        parts = list(manager.translate_stream("Hello", "English", "Korean"))
+
+        assert parts == ["안녕", "하세요"]
+        default_client.chat.completions.create.assert_not_called()
+        call_kwargs = pool._members[1]["client"].chat.completions.create.call_args.kwargs
+        assert call_kwargs["model"] == "eu"
+        assert call_kwargs["stream"] is True
+        assert pool.stats()[0]["failures"] == 1
+
+    def test_style_translator_uses_pool(self):
+        """StyleTranslator의 스타일 요청도 풀의 deployment로 분산되는지 테스트"""
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "Hello"
+        pool = make_pool(("us", "eu"))
+        for member in pool._members:
+            member["client"].chat.completions.create.return_value = response
+        default_client = Mock()
+        translator = StyleTranslator(default_client, model="gpt-4o", deployment="us", deployment_pool=pool)
+
+        translator.translate_multi_style("안녕", ["business", "formal"])
+
+        default_client.chat.completions.create.assert_not_called()
+        assert pool._members[0]["client"].chat.completions.create.call_args.kwargs["model"] == "us"
+        assert pool._members[1]["client"].chat.completions.create.call_args.kwargs["model"] == "eu"
+
+
+class TestAzureDeploymentPoolConfig:
+    """Azure deployment 풀 설정 테스트"""
+
+    def test_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.AZURE_DEPLOYMENT_ENDPOINTS is None
+        assert config.AZURE_BALANCING_STRATEGY == "round_robin"
+        assert config.AZURE_UNHEALTHY_THRESHOLD == 3
+        assert config.AZURE_PROBE_INTERVAL_SECONDS == 30.0
+
+    def test_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("AZURE_BALANCING_STRATEGY", "latency_weighted")
+        monkeypatch.setenv("AZURE_UNHEALTHY_THRESHOLD", "5")
+        monkeypatch.setenv("AZURE_PROBE_INTERVAL_SECONDS", "10")
+        monkeypatch.setenv("AZURE_DEPLOYMENT_ENDPOINTS", "eu=https://eu.openai.azure.com/")
+
+        config = Config.load()
+
+        assert config.AZURE_BALANCING_STRATEGY == "latency_weighted"
+        assert config.AZURE_UNHEALTHY_THRESHOLD == 5
+        assert config.AZURE_PROBE_INTERVAL_SECONDS == 10.0
+        assert config.AZURE_DEPLOYMENT_ENDPOINTS == "eu=https://eu.openai.azure.com/"
+
+    def test_invalid_strategy(self, monkeypatch):
+        """지원하지 않는 분산 방식이면 ValueError 테스트"""
+        monkeypatch.setenv("AZURE_BALANCING_STRATEGY", "random")
+        with pytest.raises(ValueError, match="지원하지 않는 deployment 분산 방식"):
+            Config.load()
+
+    def test_invalid_endpoints(self, monkeypatch):
+        """endpoint 형식이 잘못되면 ValueError 테스트"""
+        monkeypatch.setenv("AZURE_DEPLOYMENT_ENDPOINTS", "eu")
+        with pytest.raises(ValueError, match="deployment endpoint 설정 형식"):
+            Config.load()
+
+    def test_parse_pools(self):
+        """deployment 목록 파싱 테스트"""
+        deployments = "gpt-4o:us| eu ,gpt-4o-mini:mini"
+        assert Config.parse_azure_deployment_pools(deployments) == {"gpt-4o": ["us", "eu"], "gpt-4o-mini": ["mini"]}
+        assert Config.parse_azure_deployments(deployments) == {"gpt-4o": "us", "gpt-4o-mini": "mini"}
+
+    def test_parse_endpoints(self):
+        """endpoint 파싱 테스트"""
+        endpoints = "eu=https://eu.example.com/@EU_KEY,us=https://us.example.com/"
+        assert Config.parse_azure_deployment_endpoints(endpoints) == {
+            "eu": ("https://eu.example.com/", "EU_KEY"),
+            "us": ("https://us.example.com/", None),
+        }
@@ -0,0 +1,196 @@
+"""DocumentTranslator 클래스 테스트"""
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from components.document import DocumentTranslator, split_markdown_blocks
+from components.language import LanguageDetector
+from components.tokens import TokenCounter
+
+
+class WordEncoding:
+    """공백 기준 단어 1개를 토큰 1개로 인코딩하는 테스트용 인코더"""
+
+    name = "words"
+
+    def encode(self, text):
+        return text.split()
+
+
+@pytest.fixture
+def token_counter():
+    return TokenCounter(encoding_getter=lambda model: WordEncoding())
+
+
+@pytest.fixture
+def manager():
+    manager = Mock()
+    manager.model = "gpt-4o"
+    manager.translate.side_effect = lambda text, source, target, session_id, context=None: f"<{text}>"
+    return manager
+
+
+DOCUMENT = """# Title
+
+First paragraph has five words.
+
+```python
+print("code stays")
+```
+
+## Section
+
+Second paragraph here.
+"""
+
+
+class TestSplitMarkdownBlocks:
+    """Markdown 블록 분할 테스트"""
+
+    def test_blocks_concatenate_to_original(self):
+        """블록을 이어 붙이면 원문과 같은지 테스트"""
+        blocks = split_markdown_blocks(DOCUMENT)
+        assert "".join(block["content"] for block in blocks) == DOCUMENT
+
+    def test_block_types(self):
+        """제목/문단/코드 블록 종류 구분 테스트"""
+        types = [block["type"] for block in split_markdown_blocks(DOCUMENT)]
+        assert types == ["heading", "paragraph", "code", "heading", "paragraph"]
+
+    def test_code_block_with_blank_lines_intact(self):
+        """코드 블록 내부의 빈 줄과 제목 기호에서 나누지 않는지 테스트"""
+        text = "```\n# not a heading\n\nline\n```\nafter"
+        blocks = split_markdown_blocks(text)
+
+        assert blocks[0] == {"type": "code", "content": "```\n# not a heading\n\nline\n```\n"}
+        assert blocks[1] == {"type": "paragraph", "content": "after"}
+
+    def test_unclosed_fence(self):
+        """닫히지 않은 코드 블록은 끝까지 코드로 처리하는지 테스트"""
+        blocks = split_markdown_blocks("text\n\n~~~\ncode\n")
+        assert blocks[-1] == {"type": "code", "content": "~~~\ncode\n"}
+
+
+class TestDocumentTranslator:
+    """DocumentTranslator 테스트"""
+
+    def test_segments_respect_token_limit(self, manager, token_counter):
+        """구간이 토큰 상한을 넘지 않는지 테스트"""
+        translator = DocumentTranslator(manager, max_segment_tokens=6, token_counter=token_counter)
+        text = "\n\n".join(f"para {i} has four" for i in range(5))
+
+        segments = translator.split_segments(text)
+
+        assert "".join(segment["text"] for segment in segments) == text
+        assert all(len(segment["text"].split()) <= 6 for segment in segments)
+        assert len(segments) == 5
+
+    def test_oversized_paragraph_split_by_sentence(self, manager, token_counter):
+        """상한을 넘는 문단은 문장 단위로 나누는지 테스트"""
+        translator = DocumentTranslator(manager, max_segment_tokens=4, token_counter=token_counter)
+        text = "One two three. Four five six. Seven eight."
+
+        segments = translator.split_segments(text)
+
+        assert [segment["text"] for segment in segments] == ["One two three. ", "Four five six. ", "Seven eight."]
+
+    def test_code_blocks_not_translated(self, manager, token_counter):
+        """코드 블록은 번역하지 않고 순서대로 합치는지 테스트"""
+        translator = DocumentTranslator(manager, max_segment_tokens=5, token_counter=token_counter)
+
+        result = translator.translate(DOCUMENT, "English", "Korean")
+
+        assert '```python\nprint("code stays")\n```\n' in result
+        assert result.startswith("<# Title>\n\n<First paragraph has five words.>\n\n```python")
+        assert result.endswith("<## Section\n\nSecond paragraph here.>\n")
+        translated_texts = [call.args[0] for call in manager.translate.call_args_list]
+        assert not any("print" in text for text in translated_texts)
+
+    def test_parallel_preserves_order(self, token_counter):
+        """병렬 번역 시에도 원래 순서대로 합치는지 테스트"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_translate(text, source, target, session_id, context=None):
+            with lock:
+                active.append(text)
+                peak.append(len(active))
+            # 앞 구간일수록 늦게 끝나도록 지연
+            time.sleep(0.05 if text.startswith("p0") else 0.01)
+            with lock:
+                active.remove(text)
+            return text.upper()
+
+        manager = Mock(model="gpt-4o")
+        manager.translate.side_effect = slow_translate
+        translator = DocumentTranslator(manager, max_segment_tokens=2, max_concurrency=3, token_counter=token_counter)
+        text = "\n\n".join(f"p{i} words" for i in range(6))
+        progress = []
+
+        result = translator.translate(text, "English", "Korean", on_progress=lambda done, total: progress.append(done))
+
+        assert result == text.upper()
+        assert max(peak) <= 3
+        assert progress == [1, 2, 3, 4, 5, 6]
+
+    def test_context_carries_previous_text(self, manager, token_counter):
+        """앞 구간 원문 끝부분만 문맥으로 전달하는지 테스트"""
+        translator = DocumentTranslator(manager, max_segment_tokens=3, context_chars=10, token_counter=token_counter)
+        text = "Hello TransBot world\n\nSecond part here"
+
+        translator.translate(text, "English", "Korean")
+
+        assert manager.translate.call_args_list[0].kwargs["context"] is None
+        assert manager.translate.call_args_list[1].kwargs["context"] == "Preceding text:\nsBot world"
+
+    def test_segment_failure_raises(self, manager, token_counter):
+        """구간 번역 실패 시 예외를 전달하는지 테스트"""
+        manager.translate.side_effect = Exception("API Error")
+        translator = DocumentTranslator(manager, max_segment_tokens=2, max_concurrency=2, token_counter=token_counter)
+
+        with pytest.raises(Exception, match="API Error"):
+            translator.translate("a b\n\nc d\n\ne f", "English", "Korean")
+
+    def test_target_language_paragraphs_passed_through(self, manager, token_counter):
+        """이미 대상 언어인 문단은 번역하지 않고 그대로 유지하는지 테스트"""
+        text = "회의 안건을 공유합니다.\n\n> Hi team, please review the PR.\n\n검토 부탁드립니다.\n"
+        translator = DocumentTranslator(
+            manager,
+            max_segment_tokens=100,
+            max_concurrency=1,
+            token_counter=token_counter,
+            language_detector=LanguageDetector(threshold=0.5)
+        )
+
+        segments = translator.split_segments(text, "English")
+        result = translator.translate(text, "Korean", "English")
+
+        assert [segment.get("passthrough", False) for segment in segments] == [False, True, False]
+        assert result == "<회의 안건을 공유합니다.>\n\n> Hi team, please review the PR.\n\n<검토 부탁드립니다.>\n"
+        translated_texts = [call.args[0] for call in manager.translate.call_args_list]
+        assert not any("review the PR" in text for text in translated_texts)
+        assert translator.passthrough_tokens(text, "English") == 7
+        assert translator.passthrough_tokens("회의 안건을 공유합니다.\n", "English") == 0
+
+    def test_low_confidence_paragraph_translated(self, manager, token_counter):
+        """대상 언어 비율이 기준보다 낮은 문단은 번역하는지 테스트"""
+        translator = DocumentTranslator(
+            manager,
+            token_counter=token_counter,
+            language_detector=LanguageDetector(threshold=0.3),
+            passthrough_min_confidence=0.8
+        )
+
+        segments = translator.split_segments("Please 확인 부탁드립니다 thanks", "English")
+
+        assert segments == [{"text": "Please 확인 부탁드립니다 thanks", "translate": True}]
+
+    def test_passthrough_disabled_without_detector(self, manager, token_counter):
+        """언어 감지기가 없으면 모든 문단을 번역하는지 테스트"""
+        translator = DocumentTranslator(manager, token_counter=token_counter)
+
+        assert translator.passthrough_tokens("Hello world", "English") == 0
+        assert translator.split_segments("Hello world", "English") == [{"text": "Hello world", "translate": True}]
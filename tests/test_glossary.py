@@ -0,0 +1,215 @@
+"""용어집 테스트"""
+import json
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from components.glossary import AhoCorasick, Glossary, GlossaryRegistry
+from components.style_translator import StyleTranslator
+from components.translation import TranslationManager
+from config import Config
+
+
+def write_glossary(path, terms, version=None, **fields):
+    data = {"terms": terms, **fields}
+    if version is not None:
+        data["version"] = version
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime + seconds, stat.st_mtime + seconds))
+
+
+class TestAhoCorasick:
+    """Aho-Corasick 오토마톤 테스트"""
+
+    def test_finds_overlapping_patterns(self):
+        """겹치는 패턴과 접미사 패턴을 모두 찾는지 테스트"""
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        matches = sorted(automaton.iter_matches("ushers"))
+        assert matches == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+    def test_case_insensitive_positions(self):
+        """대소문자를 무시하고 원본 기준 위치를 반환하는지 테스트"""
+        automaton = AhoCorasick(["transbot"])
+        assert list(automaton.iter_matches("Hi TransBot")) == [(3, 11, 0)]
+
+    def test_korean_patterns(self):
+        """한국어 패턴 테스트"""
+        automaton = AhoCorasick(["번역", "번역 메모리"])
+        assert sorted(automaton.iter_matches("번역 메모리를")) == [(0, 2, 0), (0, 6, 1)]
+
+
+class TestGlossary:
+    """용어집 검색 테스트"""
+
+    def test_find_prefers_leftmost_longest(self):
+        """같은 위치에서는 가장 긴 용어만 찾는지 테스트"""
+        glossary = Glossary("test", {"번역": "translation", "번역 메모리": "translation memory"})
+        matches = glossary.find("번역 메모리를 켜고 번역합니다")
+        assert [match["term"] for match in matches] == ["번역 메모리", "번역"]
+
+    def test_english_word_boundary(self):
+        """영어 용어는 단어 경계에서만 찾고 복수형은 허용하는지 테스트"""
+        glossary = Glossary("test", {"API": "API", "cat": "고양이"})
+        assert [match["term"] for match in glossary.find("APIs and RAPID")] == ["API"]
+        assert glossary.find("category") == []
+
+    def test_korean_particles_attached(self):
+        """조사가 붙은 한국어 용어도 찾는지 테스트"""
+        glossary = Glossary("test", {"트랜스봇": "TransBot"})
+        assert glossary.find("트랜스봇은 번역기입니다")[0]["translation"] == "TransBot"
+
+    def test_version_defaults_to_content_hash(self):
+        """버전을 생략하면 용어 내용의 해시를 사용하는지 테스트"""
+        first = Glossary("a", {"용어": "term"})
+        assert first.version == Glossary("b", {"용어": "term"}).version
+        assert first.version != Glossary("a", {"용어": "word"}).version
+
+    def test_from_file(self, tmp_path):
+        """파일에서 이름, 버전, 방향을 읽는지 테스트"""
+        path = write_glossary(tmp_path / "product.json", {"트랜스봇": "TransBot"}, version="3",
+                              source="Korean", target="English")
+        glossary = Glossary.from_file(path)
+        assert glossary.name == "product"
+        assert glossary.version == "3"
+        assert glossary.applies_to("Korean", "English")
+        assert not glossary.applies_to("English", "Korean")
+
+    def test_from_file_invalid(self, tmp_path):
+        """terms가 없는 파일은 ValueError를 발생시키는지 테스트"""
+        path = tmp_path / "broken.json"
+        path.write_text('{"name": "broken"}', encoding="utf-8")
+        with pytest.raises(ValueError, match="terms"):
+            Glossary.from_file(str(path))
+
+
+class TestGlossaryRegistry:
+    """용어집 레지스트리 테스트"""
+
+    def test_lookup_only_matched_terms(self):
+        """입력에 등장한 용어만 등장 순서대로 반환하는지 테스트"""
+        registry = GlossaryRegistry([Glossary("test", {"계약서": "contract", "송장": "invoice", "없음": "none"})])
+        terms = registry.lookup("송장과 계약서를 보냈습니다", "Korean", "English")
+        assert [entry["term"] for entry in terms] == ["송장", "계약서"]
+        assert terms[0] == {"term": "송장", "translation": "invoice", "glossary": "test"}
+
+    def test_lookup_filters_direction_and_caps_terms(self):
+        """번역 방향이 다른 용어집은 제외하고 최대 용어 수를 지키는지 테스트"""
+        registry = GlossaryRegistry(
+            [
+                Glossary("ko-en", {"가": "a", "나": "b", "다": "c"}, source="Korean", target="English"),
+                Glossary("en-ko", {"a": "가"}, source="English", target="Korean"),
+            ],
+            max_terms=2
+        )
+        assert [entry["term"] for entry in registry.lookup("가 나 다", "Korean", "English")] == ["가", "나"]
+        assert registry.lookup("가 나 다", "English", "Korean") == []
+
+    def test_reload_if_changed(self, tmp_path):
+        """파일이 바뀌면 재시작 없이 새 버전을 적용하는지 테스트"""
+        path = write_glossary(tmp_path / "product.json", {"트랜스봇": "TransBot"}, version="1")
+        registry = GlossaryRegistry(paths=[str(tmp_path)], reload_interval=0.001)
+        assert registry.versions() == {"product": "1"}
+
+        write_glossary(tmp_path / "product.json", {"트랜스봇": "Transbot AI"}, version="2")
+        bump_mtime(path)
+        time.sleep(0.01)
+
+        terms = registry.lookup("트랜스봇", "Korean", "English")
+        assert registry.versions() == {"product": "2"}
+        assert terms[0]["translation"] == "Transbot AI"
+
+    def test_reload_keeps_previous_version_on_error(self, tmp_path):
+        """잘못된 파일로 바뀌면 이전 버전을 계속 사용하는지 테스트"""
+        path = write_glossary(tmp_path / "product.json", {"트랜스봇": "TransBot"}, version="1")
+        registry = GlossaryRegistry(paths=[path], reload_interval=0)
+
+        (tmp_path / "product.json").write_text("{not json", encoding="utf-8")
+        bump_mtime(path)
+
+        assert registry.reload() == []
+        assert registry.versions() == {"product": "1"}
+
+    def test_check_flags_violations(self):
+        """번역어가 결과에 없으면 위반으로 표시하는지 테스트"""
+        registry = GlossaryRegistry([Glossary("test", {"계약서": "contract", "송장": "invoice"})])
+        terms = registry.lookup("계약서와 송장", "Korean", "English")
+        violations = GlossaryRegistry.check("The Contracts and the bill", terms)
+        assert violations == [{"term": "송장", "expected": "invoice", "glossary": "test"}]
+
+    def test_format_prompt(self):
+        """찾은 용어만 지시문으로 만드는지 테스트"""
+        assert GlossaryRegistry.format_prompt([]) == ""
+        prompt = GlossaryRegistry.format_prompt([{"term": "송장", "translation": "invoice", "glossary": "test"}])
+        assert "- 송장 → invoice" in prompt
+
+    def test_from_config(self, tmp_path):
+        """설정으로 생성하는지 테스트 (꺼져 있으면 None)"""
+        config = Config()
+        assert GlossaryRegistry.from_config(config) is None
+
+        config.GLOSSARY_ENABLED = True
+        config.GLOSSARY_PATHS = write_glossary(tmp_path / "product.json", {"트랜스봇": "TransBot"})
+        config.GLOSSARY_MAX_TERMS = 10
+        registry = GlossaryRegistry.from_config(config)
+        assert registry is not None
+        assert registry.max_terms == 10
+        assert list(registry.versions()) == ["product"]
+
+
+class TestGlossaryIntegration:
+    """번역 관리자 및 스타일 번역기 연동 테스트"""
+
+    def setup_method(self):
+        self.registry = GlossaryRegistry([Glossary("test", {"송장": "invoice", "계약서": "contract"})])
+        self.client = Mock()
+
+    def test_translation_prompt_includes_matched_terms_only(self, make_client):
+        """기본 번역 프롬프트에 등장한 용어만 넣는지 테스트"""
+        self.client = make_client("Send the invoice")
+        manager = TranslationManager(self.client, model="gpt-4o", glossary=self.registry)
+
+        manager.translate("송장을 보내 주세요", "Korean", "English")
+
+        system_prompt = self.client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+        assert "송장 → invoice" in system_prompt
+        assert "계약서" not in system_prompt
+
+    def test_request_key_unchanged_without_matches(self):
+        """용어가 없는 입력은 용어집이 없을 때와 같은 캐시 키를 쓰는지 테스트"""
+        plain = TranslationManager(self.client, model="gpt-4o")
+        manager = TranslationManager(self.client, model="gpt-4o", glossary=self.registry)
+
+        assert manager._make_request_key("안녕", "Korean", "English") == plain._make_request_key(
+            "안녕", "Korean", "English"
+        )
+        assert manager._make_request_key("송장", "Korean", "English") != plain._make_request_key(
+            "송장", "Korean", "English"
+        )
+
+    def test_translation_logs_violation(self, caplog, make_client):
+        """번역 결과가 용어를 지키지 않으면 경고 로그를 남기는지 테스트"""
+        self.client = make_client("Send the bill")
+        manager = TranslationManager(self.client, model="gpt-4o", glossary=self.registry)
+
+        with caplog.at_level("WARNING", logger="transbot.glossary"):
+            manager.translate("송장을 보내 주세요", "Korean", "English")
+
+        assert any(record.message == "용어집 위반" for record in caplog.records)
+
+    def test_style_translation_prompt_includes_matched_terms(self, make_client):
+        """스타일 번역 프롬프트에도 등장한 용어만 넣는지 테스트"""
+        self.client = make_client("Please sign the contract")
+        translator = StyleTranslator(client=self.client, model="gpt-4o-mini", glossary=self.registry)
+
+        translator.translate_single_style("계약서에 서명해 주세요", StyleTranslator.STYLE_BUSINESS)
+
+        system_prompt = self.client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+        assert "계약서 → contract" in system_prompt
+        assert "송장" not in system_prompt
@@ -0,0 +1,327 @@
+"""HedgingPolicy 클래스 테스트"""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from components.hedging import HedgingPolicy
+from components.rate_limit import RateLimiter
+from components.translation import AsyncTranslationManager, TranslationManager
+from config import Config
+
+
+@pytest.fixture
+def slow_then_fast(make_response):
+    """첫 호출만 느리게 응답하는 함수를 만드는 팩토리"""
+    def factory(slow_seconds=0.5):
+        calls = []
+        lock = threading.Lock()
+
+        def fn():
+            with lock:
+                calls.append(len(calls))
+                index = len(calls) - 1
+            if index == 0:
+                time.sleep(slow_seconds)
+                return make_response("느린 응답", prompt_tokens=10, completion_tokens=7)
+            return make_response("빠른 응답")
+
+        return fn, calls
+
+    return factory
+
+
+class TestHedgingPolicy:
+    """HedgingPolicy 테스트"""
+
+    def test_fast_response_not_hedged(self, make_response):
+        """지연 기준 안에 끝나면 중복 요청을 보내지 않는지 테스트"""
+        policy = HedgingPolicy(delay_ms=200)
+        fn = Mock(return_value=make_response("안녕하세요"))
+
+        result = policy.run("openai:gpt-4o", fn)
+
+        assert result.choices[0].message.content == "안녕하세요"
+        assert fn.call_count == 1
+        stats = policy.stats()
+        assert stats["requests"] == 1
+        assert stats["hedged_requests"] == 0
+        assert stats["hedge_rate"] == 0.0
+
+    def test_slow_response_hedged(self, slow_then_fast):
+        """지연 기준이 지나면 중복 요청을 보내고 먼저 도착한 응답을 사용하는지 테스트"""
+        policy = HedgingPolicy(delay_ms=50)
+        fn, calls = slow_then_fast()
+
+        result = policy.run("openai:gpt-4o", fn)
+
+        assert result.choices[0].message.content == "빠른 응답"
+        assert len(calls) == 2
+        stats = policy.stats()
+        assert stats["hedged_requests"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["hedge_rate"] == 1.0
+
+    def test_discarded_response_counted_as_extra_tokens(self, slow_then_fast):
+        """결과를 버린 요청의 사용량이 추가 토큰으로 기록되는지 테스트"""
+        policy = HedgingPolicy(delay_ms=20)
+        fn, _ = slow_then_fast(slow_seconds=0.2)
+
+        policy.run("openai:gpt-4o", fn)
+        time.sleep(0.4)
+
+        stats = policy.stats()
+        assert stats["extra_prompt_tokens"] == 10
+        assert stats["extra_completion_tokens"] == 7
+
+    def test_hedge_fn_used_for_duplicate(self, slow_then_fast, make_response):
+        """중복 요청에는 hedge_fn을 사용하는지 테스트"""
+        policy = HedgingPolicy(delay_ms=20)
+        fn, _ = slow_then_fast(slow_seconds=0.3)
+        hedge_fn = Mock(return_value=make_response("헤지"))
+
+        result = policy.run("openai:gpt-4o", fn, hedge_fn=hedge_fn)
+
+        assert result.choices[0].message.content == "헤지"
+        hedge_fn.assert_called_once()
+
+    def test_can_hedge_false_skips_duplicate(self, slow_then_fast):
+        """can_hedge가 False이면 중복 요청을 보내지 않고 헤징으로 집계하지 않는지 테스트"""
+        policy = HedgingPolicy(delay_ms=20)
+        fn, calls = slow_then_fast(slow_seconds=0.1)
+
+        result = policy.run("openai:gpt-4o", fn, can_hedge=lambda: False)
+
+        assert result.choices[0].message.content == "느린 응답"
+        assert len(calls) == 1
+        assert policy.stats()["hedged_requests"] == 0
+
+    def test_failed_hedge_waits_for_primary(self, slow_then_fast):
+        """중복 요청이 실패하면 원래 요청의 결과를 기다리는지 테스트"""
+        policy = HedgingPolicy(delay_ms=20)
+        fn, _ = slow_then_fast(slow_seconds=0.2)
+
+        result = policy.run("openai:gpt-4o", fn, hedge_fn=Mock(side_effect=TimeoutError("한도 없음")))
+
+        assert result.choices[0].message.content == "느린 응답"
+        assert policy.stats()["hedge_wins"] == 0
+
+    def test_all_failed_raises_primary_error(self):
+        """모든 요청이 실패하면 첫 번째 요청의 예외를 전달하는지 테스트"""
+        policy = HedgingPolicy(delay_ms=200)
+
+        with pytest.raises(ValueError, match="API 오류"):
+            policy.run("openai:gpt-4o", Mock(side_effect=ValueError("API 오류")))
+        assert policy.stats()["requests"] == 1
+
+    def test_percentile_delay(self):
+        """고정 지연이 없으면 최근 응답 시간의 백분위수를 사용하는지 테스트"""
+        policy = HedgingPolicy(percentile=0.9, min_samples=10)
+        for i in range(1, 10):
+            policy.record_latency("openai:gpt-4o", i / 10)
+
+        assert policy.delay("openai:gpt-4o") is None
+
+        policy.record_latency("openai:gpt-4o", 1.0)
+        assert policy.delay("openai:gpt-4o") == pytest.approx(0.9)
+        assert policy.delay("azure:other") is None
+        assert policy.stats()["delay_ms"] == {"openai:gpt-4o": 900}
+
+    def test_no_hedge_without_samples(self, slow_then_fast):
+        """응답 기록이 부족하면 느린 요청도 헤징하지 않는지 테스트"""
+        policy = HedgingPolicy(min_samples=5)
+        fn, calls = slow_then_fast(slow_seconds=0.1)
+
+        policy.run("openai:gpt-4o", fn)
+
+        assert len(calls) == 1
+        assert policy.stats()["hedged_requests"] == 0
+
+    def test_run_async_cancels_loser(self, make_response):
+        """비동기 헤징에서 늦은 요청을 취소하고 입력 토큰을 추가 토큰으로 추정하는지 테스트"""
+        policy = HedgingPolicy(delay_ms=20)
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return make_response("느린 응답")
+
+        async def fast():
+            return make_response("빠른 응답", prompt_tokens=12)
+
+        result = asyncio.run(policy.run_async("openai:gpt-4o", slow, hedge_fn=fast))
+
+        assert result.choices[0].message.content == "빠른 응답"
+        assert cancelled == [True]
+        stats = policy.stats()
+        assert stats["hedge_wins"] == 1
+        assert stats["extra_prompt_tokens"] == 12
+        assert stats["extra_completion_tokens"] == 0
+
+    def test_from_config(self):
+        """HEDGING_ENABLED=false이면 생성하지 않는지 테스트"""
+        config = Config()
+        assert HedgingPolicy.from_config(config) is None
+
+        config.HEDGING_ENABLED = True
+        config.HEDGING_DELAY_MS = 800
+        policy = HedgingPolicy.from_config(config)
+        assert policy.delay("openai:gpt-4o") == 0.8
+
+
+class TestHedgingIntegration:
+    """TranslationManager 헤징 적용 테스트"""
+
+    def test_translation_manager_uses_first_response(self, monkeypatch, slow_then_fast):
+        """TranslationManager가 먼저 도착한 응답을 사용하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        fn, calls = slow_then_fast(slow_seconds=0.3)
+        client = Mock()
+        client.chat.completions.create.side_effect = lambda **kwargs: fn()
+        manager = TranslationManager(client, model="gpt-4o", max_tokens=100, hedging=HedgingPolicy(delay_ms=20))
+
+        result = manager.translate("Hello", "English", "Korean")
+
+        assert result == "빠른 응답"
+        assert client.chat.completions.create.call_count == 2
+        assert manager.hedging.stats()["hedged_requests"] == 1
+
+    def test_hedge_skipped_without_rate_limit(self, monkeypatch, slow_then_fast):
+        """요청 한도가 없으면 중복 요청을 보내지 않고 대기 시간 초과로 집계하지 않는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        fn, calls = slow_then_fast(slow_seconds=0.1)
+        client = Mock()
+        client.chat.completions.create.side_effect = lambda **kwargs: fn()
+        limiter = RateLimiter(rpm=1)
+        manager = TranslationManager(
+            client, model="gpt-4o", max_tokens=100, hedging=HedgingPolicy(delay_ms=20), rate_limiter=limiter
+        )
+
+        result = manager.translate("Hello", "English", "Korean")
+
+        assert result == "느린 응답"
+        assert len(calls) == 1
+        assert limiter.stats()["openai:gpt-4o"]["timeouts"] == 0
+
+    @staticmethod
+    def _stream_client(closed):
+        """첫 스트림만 첫 조각이 늦게 오는 Mock 클라이언트 (닫힌 스트림 이름을 closed에 기록)"""
+        client = Mock()
+        opened = []
+
+        def stream(name, delay):
+            try:
+                time.sleep(delay)
+                yield Mock(choices=[Mock(delta=Mock(content=name))], usage=None)
+                yield Mock(choices=[Mock(delta=Mock(content="!"))], usage=None)
+            finally:
+                closed.append(name)
+
+        def create(**kwargs):
+            opened.append(kwargs["stream"])
+            return stream("느린 스트림", 0.3) if len(opened) == 1 else stream("빠른 스트림", 0)
+
+        client.chat.completions.create.side_effect = create
+        return client
+
+    def test_translate_stream_hedges_first_token(self, monkeypatch):
+        """첫 조각이 늦으면 스트림을 한 번 더 열어 먼저 첫 조각이 온 스트림을 사용하고 늦은 스트림은 닫는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        closed = []
+        client = self._stream_client(closed)
+        manager = TranslationManager(client, model="gpt-4o", max_tokens=100, hedging=HedgingPolicy(delay_ms=20))
+
+        parts = list(manager.translate_stream("Hello", "English", "Korean"))
+
+        assert parts == ["빠른 스트림", "!"]
+        assert client.chat.completions.create.call_count == 2
+        stats = manager.hedging.stats()
+        assert stats["hedged_requests"] == 1
+        assert "openai:gpt-4o:stream" in stats["delay_ms"]
+        deadline = time.monotonic() + 2
+        while "느린 스트림" not in closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "느린 스트림" in closed
+
+    def test_translate_stream_fast_first_token_not_hedged(self, monkeypatch):
+        """첫 조각이 빨리 오면 스트림을 하나만 여는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = Mock()
+        client.chat.completions.create.return_value = iter([
+            Mock(choices=[Mock(delta=Mock(content=""))], usage=None),
+            Mock(choices=[Mock(delta=Mock(content="안녕하세요"))], usage=None),
+        ])
+        manager = TranslationManager(client, model="gpt-4o", max_tokens=100, hedging=HedgingPolicy(delay_ms=200))
+
+        assert list(manager.translate_stream("Hello", "English", "Korean")) == ["안녕하세요"]
+        assert client.chat.completions.create.call_count == 1
+        assert manager.hedging.stats()["hedged_requests"] == 0
+
+    def test_async_translate_stream_hedges_first_token(self, monkeypatch):
+        """비동기 스트리밍도 첫 조각이 늦으면 스트림을 한 번 더 열고 늦은 스트림을 닫는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        closed = []
+        opened = []
+
+        async def stream(name, delay):
+            try:
+                await asyncio.sleep(delay)
+                yield Mock(choices=[Mock(delta=Mock(content=name))], usage=None)
+            finally:
+                closed.append(name)
+
+        async def create(**kwargs):
+            opened.append(kwargs["stream"])
+            return stream("느린 스트림", 1) if len(opened) == 1 else stream("빠른 스트림", 0)
+
+        client = Mock()
+        client.chat.completions.create.side_effect = create
+        manager = AsyncTranslationManager(
+            client, model="gpt-4o", max_tokens=100, hedging=HedgingPolicy(delay_ms=20)
+        )
+
+        async def collect():
+            return [part async for part in manager.translate_stream("Hello", "English", "Korean")]
+
+        assert asyncio.run(collect()) == ["빠른 스트림"]
+        assert len(opened) == 2
+        assert "느린 스트림" in closed
+
+
+class TestHedgingConfig:
+    """요청 헤징 설정 테스트"""
+
+    def test_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.HEDGING_ENABLED is False
+        assert config.HEDGING_DELAY_MS == 0
+        assert config.HEDGING_PERCENTILE == 0.95
+        assert config.HEDGING_MIN_SAMPLES == 20
+
+    def test_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("HEDGING_ENABLED", "true")
+        monkeypatch.setenv("HEDGING_DELAY_MS", "1500")
+        monkeypatch.setenv("HEDGING_PERCENTILE", "0.9")
+        monkeypatch.setenv("HEDGING_MIN_SAMPLES", "50")
+
+        config = Config.load()
+
+        assert config.HEDGING_ENABLED is True
+        assert config.HEDGING_DELAY_MS == 1500
+        assert config.HEDGING_PERCENTILE == 0.9
+        assert config.HEDGING_MIN_SAMPLES == 50
+
+    @pytest.mark.parametrize("percentile", ["0", "1.0", "1.5"])
+    def test_invalid_percentile(self, monkeypatch, percentile):
+        """백분위수가 범위를 벗어나면 ValueError 테스트"""
+        monkeypatch.setenv("HEDGING_PERCENTILE", percentile)
+        with pytest.raises(ValueError, match="헤징 백분위수"):
+            Config.load()
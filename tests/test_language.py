@@ -1,5 +1,8 @@
 """LanguageDetector 클래스 테스트"""
+import pytest
+
 from components.language import LanguageDetector
+from config import Config
 
 
 class TestLanguageDetector:
@@ -94,3 +97,69 @@ class TestLanguageDetector:
         """커스텀 임계값 테스트"""
         detector = LanguageDetector(threshold=0.7)
         assert detector.threshold == 0.7
+
+    def test_threshold_drives_detection(self):
+        """임계값이 실제 감지 결과에 반영되는지 테스트"""
+        # 한글 6자 / 영문 4자 = 한국어 비율 0.6
+        text = "안녕하세요반 abcd"
+        assert LanguageDetector(threshold=0.5).detect(text) == "Korean"
+        assert LanguageDetector(threshold=0.7).detect(text) == "English"
+
+    def test_default_threshold_from_config(self, monkeypatch):
+        """임계값 미지정 시 전역 Config 값을 사용하는지 테스트"""
+        config = Config()
+        config.LANGUAGE_DETECTION_THRESHOLD = 0.9
+        monkeypatch.setattr(Config, "_instance", config)
+
+        assert LanguageDetector().threshold == 0.9
+
+    def test_detect_many(self):
+        """여러 텍스트 일괄 감지 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+        assert detector.detect_many(["안녕하세요", "Hello", ""]) == ["Korean", "English", "unknown"]
+
+    def test_sample_chars(self):
+        """표본 감지 설정 테스트"""
+        detector = LanguageDetector(threshold=0.5, sample_chars=1000)
+        text = "Hello world. " * 10 + "한국어 문장입니다. " * 5000
+
+        assert detector.sample_chars == 1000
+        assert detector.detect(text) == "Korean"
+
+    def test_label_confidence(self):
+        """언어와 신뢰도 반환 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+
+        assert detector.label("Please review the PR.") == {"language": "English", "confidence": 1.0}
+        assert detector.label("안녕하세요") == {"language": "Korean", "confidence": 1.0}
+        assert detector.label("12345") == {"language": "unknown", "confidence": 0.0}
+        assert detector.label("안녕하 hi") == {"language": "Korean", "confidence": 0.6}
+
+    def test_detect_segments_paragraph(self):
+        """문단 단위 구간 감지 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+        text = "안녕하세요 팀원 여러분.\n\n> Hi team, please review the PR.\n> Thanks!\n\n\n감사합니다."
+
+        segments = detector.detect_segments(text)
+
+        assert "".join(segment["text"] for segment in segments) == text
+        assert [segment["language"] for segment in segments] == ["Korean", "English", "Korean"]
+        assert segments[1]["text"] == "> Hi team, please review the PR.\n> Thanks!\n\n\n"
+
+    def test_detect_segments_sentence(self):
+        """문장 단위 구간 감지 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+        text = "회의는 3시입니다. See you there! 감사합니다"
+
+        segments = detector.detect_segments(text, granularity="sentence")
+
+        assert [segment["text"] for segment in segments] == ["회의는 3시입니다. ", "See you there! ", "감사합니다"]
+        assert [segment["language"] for segment in segments] == ["Korean", "English", "Korean"]
+
+    def test_detect_segments_empty_and_invalid(self):
+        """빈 텍스트와 지원하지 않는 구간 단위 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+
+        assert detector.detect_segments("") == []
+        with pytest.raises(ValueError, match="지원하지 않는 구간 단위"):
+            detector.detect_segments("text", granularity="word")
@@ -0,0 +1,322 @@
+"""번역 메모리 테스트"""
+from unittest.mock import Mock
+
+import pytest
+
+from components.memory import (
+    InMemoryMemoryStore,
+    MemoryStore,
+    SQLiteMemoryStore,
+    TranslationMemory,
+    make_memory_scope,
+    normalize_sentence,
+    similarity,
+    trigrams,
+)
+from components.router import ModelRouter
+from components.translation import MemoryTranslationManager, TranslationManagerFactory
+from config import Config
+
+SCOPE = make_memory_scope("Korean", "English", "gpt-4o")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    if request.param == "memory":
+        return InMemoryMemoryStore(max_entries=100)
+    return SQLiteMemoryStore(":memory:", max_entries=100)
+
+
+@pytest.fixture
+def inner():
+    manager = Mock()
+    manager.model = "gpt-4o"
+    manager.translate.side_effect = lambda text, source, target, session_id="unknown", context=None: f"<{text}>"
+    manager.translate_stream.side_effect = (
+        lambda text, source, target, session_id="unknown", context=None: iter([f"<{text}>"])
+    )
+    return manager
+
+
+class TestTrigramSimilarity:
+    """정규화 및 trigram 유사도 테스트"""
+
+    def test_normalize_sentence(self):
+        """공백 정리 테스트"""
+        assert normalize_sentence("  Hello \n  world.  ") == "Hello world."
+
+    def test_trigrams_pg_trgm_padding(self):
+        """pg_trgm과 같은 단어 패딩 테스트"""
+        assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+        assert trigrams("...") == set()
+
+    def test_similarity(self):
+        """유사도 범위 테스트"""
+        assert similarity("weekly report", "weekly report") == 1.0
+        assert similarity("weekly report", "completely different") < 0.2
+        assert 0.5 < similarity("이번 주 매출은 10% 증가했습니다.", "이번 주 매출은 12% 증가했습니다.") < 1.0
+        assert similarity("", "text") == 0.0
+
+
+class TestMemoryStore:
+    """저장소 공통 동작 테스트 (프로세스 내, SQLite)"""
+
+    def test_get_and_replace(self, store):
+        """정확 조회 및 번역문 교체 테스트"""
+        store.add(SCOPE, "안녕하세요.", "Hello.")
+        store.add(SCOPE, "안녕하세요.", "Hi.")
+
+        assert store.get(SCOPE, "안녕하세요.") == "Hi."
+        assert store.get(SCOPE, "없는 문장") is None
+        assert len(store) == 1
+
+    def test_scope_isolation(self, store):
+        """방향/모델/스타일이 다르면 재사용하지 않는지 테스트"""
+        store.add(SCOPE, "안녕하세요.", "Hello.")
+        other = make_memory_scope("Korean", "English", "gpt-4o", style="casual")
+
+        assert store.get(other, "안녕하세요.") is None
+        assert store.search(other, "안녕하세요.", 0.1, 3) == []
+
+    def test_search_ranks_by_similarity(self, store):
+        """유사 문장 검색 순서 및 하한 테스트"""
+        store.add(SCOPE, "이번 주 매출은 10% 증가했습니다.", "Sales rose 10% this week.")
+        store.add(SCOPE, "이번 주 매출은 감소했습니다.", "Sales fell this week.")
+        store.add(SCOPE, "회의는 월요일입니다.", "The meeting is on Monday.")
+
+        matches = store.search(SCOPE, "이번 주 매출은 12% 증가했습니다.", 0.3, 5)
+
+        assert [match["target"] for match in matches] == ["Sales rose 10% this week.", "Sales fell this week."]
+        expected = similarity("이번 주 매출은 12% 증가했습니다.", "이번 주 매출은 10% 증가했습니다.")
+        assert matches[0]["similarity"] == pytest.approx(expected)
+        assert store.search(SCOPE, "이번 주 매출은 12% 증가했습니다.", 0.3, 1) == matches[:1]
+
+    def test_evicts_oldest(self):
+        """최대 항목 수 초과 시 오래된 항목 제거 테스트"""
+        for store in (InMemoryMemoryStore(max_entries=2), SQLiteMemoryStore(":memory:", max_entries=2)):
+            store.add(SCOPE, "first sentence", "1")
+            store.add(SCOPE, "second sentence", "2")
+            store.add(SCOPE, "third sentence", "3")
+
+            assert len(store) == 2
+            assert store.get(SCOPE, "first sentence") is None
+            assert "1" not in [match["target"] for match in store.search(SCOPE, "first sentence", 0.1, 5)]
+
+    def test_clear(self, store):
+        """전체 삭제 테스트"""
+        store.add(SCOPE, "안녕하세요.", "Hello.")
+        store.clear()
+
+        assert len(store) == 0
+        assert store.search(SCOPE, "안녕하세요.", 0.1, 3) == []
+
+    def test_sqlite_persists(self, tmp_path):
+        """SQLite 저장소가 다시 열어도 유지되는지 테스트"""
+        path = str(tmp_path / "memory" / "tm.sqlite3")
+        store = SQLiteMemoryStore(path)
+        store.add(SCOPE, "안녕하세요.", "Hello.")
+        store.close()
+
+        reopened = SQLiteMemoryStore(path)
+        assert reopened.get(SCOPE, "안녕하세요.") == "Hello."
+        assert reopened.search(SCOPE, "안녕하세요!", 0.5, 3)[0]["target"] == "Hello."
+
+    def test_abstract(self):
+        """메서드를 구현하지 않은 저장소는 생성할 수 없는지 테스트"""
+        class IncompleteStore(MemoryStore):
+            def get(self, scope, source_key):
+                return None
+
+        with pytest.raises(TypeError):
+            IncompleteStore()
+
+
+class TestTranslationMemory:
+    """TranslationMemory 조회/저장 테스트"""
+
+    def test_lookup_reuse_fuzzy_and_miss(self):
+        """재사용, 유사 일치, 미스 및 통계 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), min_similarity=0.5)
+        memory.add("이번 주 매출은 10% 증가했습니다.", " Sales rose 10% this week. ", SCOPE)
+
+        reused = memory.lookup("이번 주  매출은 10% 증가했습니다.", SCOPE)
+        fuzzy = memory.lookup("이번 주 매출은 12% 증가했습니다.", SCOPE)
+        miss = memory.lookup("전혀 다른 문장입니다.", SCOPE)
+
+        assert reused == {"translation": "Sales rose 10% this week.", "matches": []}
+        assert fuzzy["translation"] is None
+        assert fuzzy["matches"][0]["target"] == "Sales rose 10% this week."
+        assert miss == {"translation": None, "matches": []}
+        assert memory.stats() == {
+            "memory_reused": 1,
+            "memory_fuzzy_hits": 1,
+            "memory_misses": 1,
+            "memory_reuse_ratio": pytest.approx(1 / 3, abs=1e-4),
+        }
+
+    def test_reuse_similarity_below_one(self):
+        """재사용 유사도 기준을 낮추면 거의 같은 문장도 재사용하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), min_similarity=0.5, reuse_similarity=0.7)
+        memory.add("이번 주 매출은 10% 증가했습니다.", "Sales rose 10% this week.", SCOPE)
+
+        assert memory.lookup("이번 주 매출은 12% 증가했습니다.", SCOPE)["translation"] == "Sales rose 10% this week."
+
+    def test_store_errors_do_not_raise(self):
+        """저장소 오류를 미스로 처리하는지 테스트"""
+        store = Mock(spec=MemoryStore)
+        store.name = "broken"
+        store.get.side_effect = RuntimeError("db down")
+        store.add.side_effect = RuntimeError("db down")
+        memory = TranslationMemory(store)
+
+        assert memory.lookup("안녕하세요.", SCOPE) == {"translation": None, "matches": []}
+        memory.add("안녕하세요.", "Hello.", SCOPE)
+
+    def test_from_config(self, tmp_path):
+        """Config 설정으로 생성 테스트"""
+        config = Config()
+        assert TranslationMemory.from_config(config) is None
+
+        config.TRANSLATION_MEMORY_ENABLED = True
+        config.TRANSLATION_MEMORY_PATH = str(tmp_path / "tm.sqlite3")
+        memory = TranslationMemory.from_config(config)
+        assert isinstance(memory.store, SQLiteMemoryStore)
+
+        config.TRANSLATION_MEMORY_BACKEND = "memory"
+        assert isinstance(TranslationMemory.from_config(config).store, InMemoryMemoryStore)
+
+    def test_from_config_postgres_unavailable_falls_back(self, monkeypatch):
+        """PostgreSQL 저장소를 열 수 없으면 프로세스 내 저장소를 사용하는지 테스트"""
+        config = Config()
+        config.TRANSLATION_MEMORY_ENABLED = True
+        config.TRANSLATION_MEMORY_BACKEND = "postgres"
+
+        def unavailable(*args, **kwargs):
+            raise ImportError("No module named 'psycopg'")
+
+        monkeypatch.setattr("components.memory.PostgresMemoryStore", unavailable)
+
+        assert isinstance(TranslationMemory.from_config(config).store, InMemoryMemoryStore)
+
+
+class TestMemoryTranslationManager:
+    """MemoryTranslationManager 테스트"""
+
+    def test_only_new_sentences_sent_to_model(self, inner):
+        """메모리에 있는 문장은 재사용하고 나머지만 번역하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), max_concurrency=1)
+        memory.add("주간 보고서입니다.", "This is the weekly report.", SCOPE)
+        manager = MemoryTranslationManager(inner, memory, context_chars=0)
+
+        result = manager.translate("주간 보고서입니다. 배포가 완료되었습니다.\n", "Korean", "English")
+
+        assert result == "This is the weekly report. <배포가 완료되었습니다.>\n"
+        assert [call.args[0] for call in inner.translate.call_args_list] == ["배포가 완료되었습니다."]
+        assert memory.lookup("배포가 완료되었습니다.", SCOPE)["translation"] == "<배포가 완료되었습니다.>"
+
+    def test_fuzzy_matches_passed_as_context(self, inner):
+        """유사 문장 번역과 앞부분 원문을 참고 문맥으로 전달하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), min_similarity=0.5, max_concurrency=1)
+        memory.add("요약입니다.", "Summary.", SCOPE)
+        memory.add("이번 주 매출은 10% 증가했습니다.", "Sales rose 10% this week.", SCOPE)
+        manager = MemoryTranslationManager(inner, memory)
+
+        manager.translate("요약입니다. 이번 주 매출은 12% 증가했습니다.", "Korean", "English", context="Glossary")
+
+        context = inner.translate.call_args.kwargs["context"]
+        assert context.startswith("Glossary\n\nTranslation memory")
+        assert "이번 주 매출은 10% 증가했습니다. → Sales rose 10% this week." in context
+        assert context.endswith("Preceding text:\n요약입니다.")
+
+    def test_consecutive_new_sentences_batched(self, inner):
+        """메모리에 없는 연속 문장은 한 번에 번역하고 문장별로 저장하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), max_concurrency=1)
+        manager = MemoryTranslationManager(inner, memory, context_chars=0)
+
+        result = manager.translate("배포가 완료되었습니다. 확인 부탁드립니다.", "Korean", "English")
+
+        assert result == "<배포가 완료되었습니다. 확인 부탁드립니다.>"
+        assert inner.translate.call_count == 1
+        assert memory.lookup("배포가 완료되었습니다.", SCOPE)["translation"] == "<배포가 완료되었습니다."
+        assert memory.lookup("확인 부탁드립니다.", SCOPE)["translation"] == "확인 부탁드립니다.>"
+
+    def test_unaligned_batch_not_stored(self, inner):
+        """번역 결과의 문장 수가 다르면 메모리에 저장하지 않는지 테스트"""
+        inner.translate.side_effect = lambda text, source, target, session_id="unknown", context=None: "Done"
+        memory = TranslationMemory(InMemoryMemoryStore(), max_concurrency=1)
+        manager = MemoryTranslationManager(inner, memory)
+
+        assert manager.translate("배포가 완료되었습니다. 확인 부탁드립니다.", "Korean", "English") == "Done"
+        assert memory.lookup("배포가 완료되었습니다.", SCOPE)["translation"] is None
+
+    def test_single_sentence_translated_as_is(self, inner):
+        """한 문장 입력은 앞뒤 공백을 유지하여 번역하고 저장하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore())
+        manager = MemoryTranslationManager(inner, memory)
+
+        assert manager.translate("  안녕하세요  ", "Korean", "English", context="ctx") == "  <안녕하세요>  "
+        inner.translate.assert_called_once_with("안녕하세요", "Korean", "English", session_id="unknown", context="ctx")
+        assert manager.translate("안녕하세요", "Korean", "English") == "<안녕하세요>"
+        assert inner.translate.call_count == 1
+
+    def test_non_letter_pieces_kept(self, inner):
+        """문자가 없는 조각(빈 줄, 숫자)은 따로 번역하지 않는지 테스트"""
+        manager = MemoryTranslationManager(inner, TranslationMemory(InMemoryMemoryStore(), max_concurrency=2))
+
+        result = manager.translate("2024\n첫 줄\n\n둘째 줄\n", "Korean", "English")
+
+        assert result == "2024\n<첫 줄\n\n둘째 줄>\n"
+        assert [call.args[0] for call in inner.translate.call_args_list] == ["첫 줄\n\n둘째 줄"]
+
+    def test_stream_first_batch_and_parallel_rest(self, inner):
+        """첫 묶음은 스트리밍하고 나머지 묶음은 병렬 번역하여 원래 순서대로 내보내는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(), max_concurrency=4)
+        memory.add("재사용 문장입니다.", "Reused.", SCOPE)
+        manager = MemoryTranslationManager(inner, memory, context_chars=0)
+        text = "첫 문장입니다. 둘째 문장입니다. 재사용 문장입니다. 넷째 문장입니다. 재사용 문장입니다. 여섯째 문장입니다."
+
+        chunks = list(manager.translate_stream(text, "Korean", "English"))
+
+        assert "".join(chunks) == (
+            "<첫 문장입니다. 둘째 문장입니다.> Reused. <넷째 문장입니다.> Reused. <여섯째 문장입니다.>"
+        )
+        assert chunks[0] == "<첫 문장입니다. 둘째 문장입니다.>"
+        assert [call.args[0] for call in inner.translate_stream.call_args_list] == ["첫 문장입니다. 둘째 문장입니다."]
+        assert sorted(call.args[0] for call in inner.translate.call_args_list) == ["넷째 문장입니다.", "여섯째 문장입니다."]
+
+    def test_single_sentence_stream_uses_inner_stream(self, inner):
+        """한 문장 스트리밍은 내부 관리자의 스트리밍을 사용하고 결과를 저장하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore())
+        manager = MemoryTranslationManager(inner, memory)
+
+        assert list(manager.translate_stream("안녕하세요", "Korean", "English")) == ["<안녕하세요>"]
+        assert memory.lookup("안녕하세요", SCOPE)["translation"] == "<안녕하세요>"
+
+    def test_memory_scoped_by_routed_model(self, monkeypatch, make_client):
+        """라우팅된 모델 기준으로 메모리를 저장하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        token_counter = Mock()
+        token_counter.count.side_effect = lambda text, model, approximate=None: len(text)
+        router = ModelRouter(Config.parse_model_routes("tokens<=50->gpt-4o-mini"), token_counter=token_counter)
+        client = make_client("Hello.")
+        memory = TranslationMemory(InMemoryMemoryStore())
+        manager = TranslationManagerFactory.create(
+            "openai", client, router=router, translation_memory=memory, model="gpt-4o"
+        )
+
+        manager.translate("안녕하세요.", "Korean", "English")
+
+        assert client.chat.completions.create.call_args.kwargs["model"] == "gpt-4o-mini"
+        routed_scope = make_memory_scope("Korean", "English", "gpt-4o-mini")
+        assert memory.lookup("안녕하세요.", routed_scope)["translation"] == "Hello."
+        assert memory.lookup("안녕하세요.", SCOPE)["translation"] is None
+
+    def test_factory_wraps_with_memory(self):
+        """TranslationManagerFactory가 번역 메모리로 감싸는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore())
+
+        manager = TranslationManagerFactory.create("openai", Mock(), translation_memory=memory, model="gpt-4o")
+
+        assert isinstance(manager, MemoryTranslationManager)
+        assert manager.model == "gpt-4o"
+        assert manager.memory is memory
@@ -0,0 +1,172 @@
+"""Mock OpenAI 서버와 벤치마크 도구 테스트"""
+import openai
+import pytest
+
+from components.style_translator import StyleTranslator
+from components.translation import TranslationManagerFactory
+from scripts.benchmark import compare_with_baseline, percentile, server_busy_time, summarize
+from scripts.mock_openai_server import MockOpenAIServer, parse_latency
+
+MESSAGES = [{"role": "user", "content": "hello world, this is a test"}]
+
+
+@pytest.fixture
+def server():
+    with MockOpenAIServer(seed=0) as server:
+        yield server
+
+
+class TestParseLatency:
+    """지연 분포 파싱 테스트"""
+
+    def test_fixed(self):
+        """고정 지연 테스트"""
+        assert parse_latency("fixed:250")(None) == 0.25
+
+    def test_uniform_and_lognormal(self):
+        """균등/로그정규 분포 범위 테스트"""
+        import random
+        rng = random.Random(0)
+
+        assert all(0.1 <= parse_latency("uniform:100:200")(rng) <= 0.2 for _ in range(50))
+        assert all(parse_latency("lognormal:100:0.5")(rng) > 0 for _ in range(50))
+
+    @pytest.mark.parametrize("spec", ["fixed", "fixed:-1", "uniform:200:100", "normal:100", "fixed:abc"])
+    def test_invalid(self, spec):
+        """잘못된 형식이면 ValueError 테스트"""
+        with pytest.raises(ValueError, match="지연 분포 형식"):
+            parse_latency(spec)
+
+
+class TestMockOpenAIServer:
+    """MockOpenAIServer 테스트"""
+
+    def test_chat_completion_with_usage(self, server):
+        """OpenAI 클라이언트로 응답과 사용량을 받는지 테스트"""
+        client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0)
+
+        response = client.chat.completions.create(model="gpt-4o", messages=MESSAGES, max_tokens=3)
+
+        assert response.choices[0].message.content == "mock mock mock"
+        assert response.usage.completion_tokens == 3
+        assert response.usage.prompt_tokens == 7
+        record = server.records()[0]
+        assert record["status"] == 200
+        assert record["model"] == "gpt-4o"
+        assert record["end"] >= record["start"]
+
+    def test_streaming_with_usage(self, server):
+        """스트리밍 응답 조각과 마지막 사용량 청크 테스트"""
+        client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0)
+
+        chunks = list(client.chat.completions.create(
+            model="gpt-4o", messages=MESSAGES, stream=True, stream_options={"include_usage": True}
+        ))
+
+        content = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+        assert content == " ".join(["mock"] * 7)
+        assert chunks[-1].usage.completion_tokens == 7
+
+    def test_azure_deployment_path(self, server):
+        """Azure 경로의 deployment 이름을 모델로 기록하는지 테스트"""
+        client = openai.AzureOpenAI(
+            azure_endpoint=server.url, api_key="mock", api_version="2024-02-15-preview", max_retries=0
+        )
+
+        response = client.chat.completions.create(model="my-deployment", messages=MESSAGES)
+
+        assert response.model == "my-deployment"
+        assert server.records()[0]["model"] == "my-deployment"
+
+    def test_error_injection(self):
+        """429/5xx 오류 주입 테스트"""
+        with MockOpenAIServer(error_429_rate=1.0) as server:
+            client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=1)
+            with pytest.raises(openai.RateLimitError):
+                client.chat.completions.create(model="gpt-4o", messages=MESSAGES)
+            # SDK 재시도까지 모두 429로 응답
+            assert [record["status"] for record in server.records()] == [429, 429]
+
+        with MockOpenAIServer(error_5xx_rate=1.0) as server:
+            client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0)
+            with pytest.raises(openai.InternalServerError):
+                client.chat.completions.create(model="gpt-4o", messages=MESSAGES)
+
+    def test_latency_and_token_rate(self):
+        """지연과 출력 속도가 응답 시간에 반영되는지 테스트"""
+        with MockOpenAIServer(latency="fixed:50", tokens_per_second=100) as server:
+            client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0)
+            client.chat.completions.create(model="gpt-4o", messages=MESSAGES, max_tokens=5)
+
+            record = server.records()[0]
+            # 지연 50ms + 출력 5토큰 / 100토큰/초 = 100ms
+            assert record["end"] - record["start"] >= 0.1
+
+    def test_json_object_returns_requested_styles(self, server):
+        """json_object 요청에는 시스템 프롬프트의 스타일마다 번역을 반환하는지 테스트"""
+        translator = StyleTranslator(
+            client=openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0),
+            model="gpt-4o-mini"
+        )
+        styles = [StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+
+        results = translator.translate_multi_style_batched("안녕하세요", styles, include_alternatives=True)
+
+        assert list(results) == styles
+        assert all(result["primary"].startswith("mock") for result in results.values())
+        assert all(len(result["alternatives"]) == 2 for result in results.values())
+        assert len(server.records()) == 1
+
+    def test_translation_manager_end_to_end(self, server, monkeypatch):
+        """TranslationManager가 mock 서버로 번역하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = openai.OpenAI(base_url=server.openai_base_url, api_key="mock", max_retries=0)
+        manager = TranslationManagerFactory.create("openai", client, model="gpt-4o-mini")
+
+        assert manager.translate("안녕하세요", "Korean", "English").startswith("mock")
+        assert len(server.records()) == 1
+
+
+class TestBenchmarkHelpers:
+    """벤치마크 집계 함수 테스트"""
+
+    def test_percentile(self):
+        """nearest-rank 백분위수 테스트"""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
+
+    def test_server_busy_time_merges_overlaps(self):
+        """겹치는 서버 처리 구간을 합집합으로, 측정 구간 밖은 잘라서 계산하는지 테스트"""
+        records = [
+            {"start": 1.0, "end": 3.0},
+            {"start": 2.0, "end": 4.0},
+            {"start": 6.0, "end": 7.0},
+            {"start": 9.0, "end": 12.0},
+        ]
+
+        assert server_busy_time(records, 0.0, 10.0) == pytest.approx(5.0)
+
+    def test_summarize(self):
+        """요약 지표 테스트"""
+        result = summarize([0.1, 0.2, 0.3], [0.01, 0.02, 0.03], errors=1, upstream_requests=4, elapsed=2.0)
+
+        assert result["iterations"] == 4
+        assert result["throughput_per_second"] == 2.0
+        assert result["p50_ms"] == 200.0
+        assert result["overhead_mean_ms"] == 20.0
+
+    def test_compare_with_baseline(self):
+        """허용 비율을 넘어 느려진 지표만 회귀로 보고하는지 테스트"""
+        baseline = {"scenarios": {"translate": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0,
+                                                "overhead_mean_ms": 0.5}}}
+        results = {"scenarios": {
+            "translate": {"p50_ms": 11.0, "p95_ms": 30.0, "p99_ms": 30.0, "overhead_mean_ms": 1.2},
+            "document": {"p50_ms": 100.0},
+        }}
+
+        regressions = compare_with_baseline(results, baseline, tolerance=0.2)
+
+        assert regressions == ["translate.p95_ms: 20.00ms → 30.00ms (+50%)"]
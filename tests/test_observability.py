@@ -2,7 +2,8 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from components.observability import configure_langfuse
+from components import observability
+from components.observability import configure_langfuse, flush_observations, get_observability_stats, traced
 from config import Config
 
 
@@ -13,6 +14,10 @@ def mock_config_enabled():
     config.LANGFUSE_PUBLIC_KEY = "pk-test"
     config.LANGFUSE_SECRET_KEY = "sk-test"
     config.LANGFUSE_HOST = "http://localhost:3000"
+    config.LANGFUSE_FLUSH_MODE = "background"
+    config.LANGFUSE_FLUSH_AT = 15
+    config.LANGFUSE_FLUSH_INTERVAL = 1.0
+    config.LANGFUSE_MAX_QUEUE_SIZE = 2
     config.langfuse_enabled = True
     return config
 
@@ -21,10 +26,24 @@ def mock_config_enabled():
 def mock_config_disabled():
     """Langfuse 비활성화된 Config Mock"""
     config = Mock(spec=Config)
+    config.LANGFUSE_FLUSH_MODE = "background"
+    config.LANGFUSE_FLUSH_INTERVAL = 1.0
+    config.LANGFUSE_MAX_QUEUE_SIZE = 10000
     config.langfuse_enabled = False
     return config
 
 
+@pytest.fixture(autouse=True)
+def reset_export_state(monkeypatch):
+    """테스트 간 전송 상태가 공유되지 않도록 초기화합니다."""
+    monkeypatch.setattr(observability, "_enabled", False)
+    monkeypatch.setattr(observability, "_flush_synchronously", False)
+    monkeypatch.setattr(observability, "_queued_traces", 0)
+    monkeypatch.setattr(observability, "_dropped_traces", 0)
+    monkeypatch.setattr(observability, "_start_exporter", Mock())
+    monkeypatch.setattr(observability, "_shutdown_registered", True)
+
+
 class TestConfigureLangfuse:
     """configure_langfuse 함수 테스트"""
 
@@ -39,6 +58,8 @@ class TestConfigureLangfuse:
             secret_key="sk-test",
             host="http://localhost:3000",
             timeout=5,
+            flush_at=15,
+            flush_interval=1.0,
             enabled=True,
         )
 
@@ -63,4 +84,100 @@ class TestConfigureLangfuse:
         assert result is False
         assert mock_context.configure.call_count == 2
         second_call = mock_context.configure.call_args_list[1]
-        assert second_call.kwargs == {"enabled": False}
\ No newline at end of file
+        assert second_call.kwargs == {"enabled": False}
+
+
+class TestBackgroundExport:
+    """백그라운드 전송 및 큐 통계 테스트"""
+
+    @patch('components.observability.langfuse_context')
+    def test_background_mode_does_not_flush(self, mock_context, mock_config_enabled):
+        """background 모드에서는 번역 경로에서 flush하지 않는지 테스트"""
+        configure_langfuse(mock_config_enabled)
+
+        flush_observations()
+
+        mock_context.flush.assert_not_called()
+
+    @patch('components.observability.langfuse_context')
+    def test_sync_mode_flushes(self, mock_context, mock_config_enabled):
+        """sync 모드에서는 즉시 flush하는지 테스트"""
+        mock_config_enabled.LANGFUSE_FLUSH_MODE = "sync"
+        configure_langfuse(mock_config_enabled)
+
+        flush_observations()
+
+        mock_context.flush.assert_called_once()
+        assert get_observability_stats()["flush_mode"] == "sync"
+
+    @patch('components.observability.langfuse_context')
+    def test_queue_bound_counts_dropped_traces(self, mock_context, mock_config_enabled):
+        """전송 대기 추적이 상한에 도달하면 추적 없이 실행하고 개수를 집계하는지 테스트"""
+        observed_calls = []
+
+        def fake_observe(name, as_type=None):
+            def decorator(func):
+                def wrapper(*args, **kwargs):
+                    observed_calls.append(name)
+                    return func(*args, **kwargs)
+                return wrapper
+            return decorator
+
+        with patch('components.observability.observe', fake_observe):
+            @traced(name="translation", as_type="generation")
+            def translate(text):
+                return text.upper()
+
+        configure_langfuse(mock_config_enabled)
+        results = [translate(text) for text in ["a", "b", "c"]]
+
+        stats = get_observability_stats()
+        assert results == ["A", "B", "C"]
+        assert observed_calls == ["translation", "translation"]
+        assert stats["queued_traces"] == 2
+        assert stats["dropped_traces"] == 1
+        assert stats["max_queue_size"] == 2
+
+    @patch('components.observability.langfuse_context')
+    def test_flush_releases_queued_traces(self, mock_context, mock_config_enabled):
+        """flush 후에는 전송 대기 추적 수가 줄어 다시 추적하는지 테스트"""
+        mock_config_enabled.LANGFUSE_FLUSH_MODE = "sync"
+        with patch('components.observability.observe', lambda name, as_type=None: lambda func: func):
+            @traced(name="translation")
+            def translate(text):
+                return text
+
+        configure_langfuse(mock_config_enabled)
+        translate("a")
+        translate("b")
+        flush_observations()
+        translate("c")
+
+        stats = get_observability_stats()
+        assert stats["queued_traces"] == 1
+        assert stats["dropped_traces"] == 0
+
+    @patch('components.observability.langfuse_context')
+    def test_generator_trace_recorded_when_exhausted(self, mock_context, mock_config_enabled):
+        """스트리밍 함수는 제너레이터가 끝날 때 추적을 기록하는지 테스트"""
+        with patch('components.observability.observe', lambda name, as_type=None: lambda func: func):
+            @traced(name="translation_stream")
+            def stream(text):
+                yield from text
+
+        configure_langfuse(mock_config_enabled)
+        chunks = stream("ab")
+        assert get_observability_stats()["queued_traces"] == 0
+        assert list(chunks) == ["a", "b"]
+        assert get_observability_stats()["queued_traces"] == 1
+
+    def test_disabled_does_not_count(self, mock_config_disabled):
+        """Langfuse 비활성화 시 추적 수를 집계하지 않는지 테스트"""
+        @traced(name="translation")
+        def translate(text):
+            return text
+
+        configure_langfuse(mock_config_disabled)
+        translate("a")
+
+        assert get_observability_stats()["queued_traces"] == 0
@@ -0,0 +1,174 @@
+"""플레이스홀더 보호 테스트"""
+from unittest.mock import Mock
+
+import pytest
+
+from components.memory import InMemoryMemoryStore, TranslationMemory
+from components.placeholders import PLACEHOLDER_INSTRUCTION, PlaceholderProtector
+from components.translation import (
+    MemoryTranslationManager,
+    ProtectedTranslationManager,
+    StreamResultReplaced,
+    TranslationManager,
+    TranslationManagerFactory,
+)
+from config import Config
+
+DOCUMENT = (
+    "설치 방법은 다음과 같습니다.\n\n"
+    "```bash\npip install transbot\n```\n\n"
+    "자세한 내용은 [문서](https://example.com/docs)를 참고하세요."
+)
+
+
+def echo_inner():
+    """입력을 "번역: " 뒤에 그대로 돌려주는 번역 관리자"""
+    manager = Mock()
+    manager.model = "gpt-4o"
+    manager.translate.side_effect = lambda text, source, target, session_id="unknown", context=None: f"번역: {text}"
+    manager.translate_stream.side_effect = (
+        lambda text, source, target, session_id="unknown", context=None: iter(
+            [text[i:i + 3] for i in range(0, len(text), 3)]
+        )
+    )
+    return manager
+
+
+class TestPlaceholderProtector:
+    """플레이스홀더 치환/복원 테스트"""
+
+    def setup_method(self):
+        self.protector = PlaceholderProtector(min_chars=8)
+
+    def test_protect_and_restore_round_trip(self):
+        """코드 블록과 링크 URL을 바꾸고 그대로 되돌리는지 테스트"""
+        protected, spans = self.protector.protect(DOCUMENT)
+
+        assert spans == ["```bash\npip install transbot\n```", "https://example.com/docs"]
+        assert "pip install" not in protected
+        assert "[문서](⟦1⟧)" in protected
+        assert self.protector.restore(protected, spans) == (DOCUMENT, [])
+
+    def test_short_spans_are_kept(self):
+        """최소 길이보다 짧은 구간은 그대로 두는지 테스트"""
+        assert self.protector.protect("변수 `x`를 사용합니다") == ("변수 `x`를 사용합니다", [])
+
+    def test_existing_placeholder_characters_disable_protection(self):
+        """입력에 플레이스홀더 괄호가 있으면 바꾸지 않는지 테스트"""
+        text = "⟦0⟧ and `long inline code`"
+        assert self.protector.protect(text) == (text, [])
+
+    def test_restore_reports_missing_duplicate_and_unknown(self):
+        """누락, 중복, 알 수 없는 플레이스홀더를 검증 실패로 반환하는지 테스트"""
+        spans = ["`first span`", "`second span`", "`third span`"]
+        restored, invalid = self.protector.restore("⟦ 0 ⟧ ⟦2⟧ ⟦2⟧ ⟦7⟧", spans)
+        assert restored.startswith("`first span` `third span`")
+        assert sorted(invalid) == [1, 2, 7]
+
+    def test_restore_stream_handles_split_placeholders(self):
+        """조각 사이에 걸친 플레이스홀더도 되돌리는지 테스트"""
+        spans = ["https://example.com"]
+        invalid = []
+        chunks = list(self.protector.restore_stream(iter(["링크: ⟦", "0", "⟧ 입니다"]), spans, invalid))
+        assert "".join(chunks) == "링크: https://example.com 입니다"
+        assert invalid == []
+
+    def test_restore_stream_reports_missing(self):
+        """스트림이 끝난 뒤 누락된 플레이스홀더를 알려 주는지 테스트"""
+        invalid = []
+        assert list(self.protector.restore_stream(iter(["번역문"]), ["`some code`"], invalid)) == ["번역문"]
+        assert invalid == [0]
+
+    def test_format_prompt(self):
+        """플레이스홀더가 있는 입력에만 보존 지시문을 반환하는지 테스트"""
+        assert PlaceholderProtector.format_prompt("일반 텍스트") == ""
+        assert PlaceholderProtector.format_prompt("실행: ⟦0⟧") == PLACEHOLDER_INSTRUCTION
+
+    def test_from_config(self):
+        """설정으로 생성하는지 테스트 (꺼져 있으면 None)"""
+        config = Config()
+        assert PlaceholderProtector.from_config(config) is None
+
+        config.PLACEHOLDER_PROTECTION_ENABLED = True
+        config.PLACEHOLDER_MIN_CHARS = 12
+        assert PlaceholderProtector.from_config(config).min_chars == 12
+
+
+class TestProtectedTranslationManager:
+    """ProtectedTranslationManager 테스트"""
+
+    def test_translate_sends_placeholders_and_restores(self):
+        """플레이스홀더로 바꾼 텍스트를 번역하고 결과를 되돌리는지 테스트"""
+        inner = echo_inner()
+        manager = ProtectedTranslationManager(inner, PlaceholderProtector())
+
+        result = manager.translate(DOCUMENT, "Korean", "English")
+
+        sent = inner.translate.call_args.args[0]
+        assert "pip install" not in sent
+        assert result == f"번역: {DOCUMENT}"
+
+    def test_translate_retries_without_protection_on_missing_placeholder(self):
+        """플레이스홀더가 돌아오지 않으면 원문으로 다시 번역하는지 테스트"""
+        inner = Mock()
+        inner.translate.side_effect = ["Installation is as follows.", "restored translation"]
+        manager = ProtectedTranslationManager(inner, PlaceholderProtector())
+
+        assert manager.translate(DOCUMENT, "Korean", "English") == "restored translation"
+        assert inner.translate.call_args_list[1].args[0] == DOCUMENT
+
+    def test_translate_without_spans_passes_through(self):
+        """보호할 구간이 없으면 원문을 그대로 전달하는지 테스트"""
+        inner = echo_inner()
+        manager = ProtectedTranslationManager(inner, PlaceholderProtector())
+
+        assert manager.translate("안녕하세요", "Korean", "English") == "번역: 안녕하세요"
+        assert inner.translate.call_args.args[0] == "안녕하세요"
+
+    def test_translate_stream_restores_chunks(self):
+        """스트리밍 번역 결과의 플레이스홀더를 되돌리는지 테스트"""
+        manager = ProtectedTranslationManager(echo_inner(), PlaceholderProtector())
+        assert "".join(manager.translate_stream(DOCUMENT, "Korean", "English")) == DOCUMENT
+
+    def test_translate_stream_replaced_on_missing_placeholder(self):
+        """스트리밍 결과에 플레이스홀더가 돌아오지 않으면 원문으로 다시 번역한 결과를 전달하는지 테스트"""
+        inner = Mock()
+        inner.translate_stream.side_effect = lambda *args, **kwargs: iter(["Installation ", "is as follows."])
+        inner.translate.return_value = "restored translation"
+        manager = ProtectedTranslationManager(inner, PlaceholderProtector())
+
+        stream = manager.translate_stream(DOCUMENT, "Korean", "English", context="앞 문단")
+        with pytest.raises(StreamResultReplaced) as replaced:
+            list(stream)
+
+        assert replaced.value.text == "restored translation"
+        assert inner.translate.call_args.args[0] == DOCUMENT
+        assert inner.translate.call_args.kwargs["context"] == "앞 문단"
+
+    def test_translate_stream_passes_context(self):
+        """스트리밍 번역에 참고 문맥을 전달하는지 테스트"""
+        inner = echo_inner()
+        manager = ProtectedTranslationManager(inner, PlaceholderProtector())
+
+        assert "".join(manager.translate_stream(DOCUMENT, "Korean", "English", context="앞 문단")) == DOCUMENT
+        assert inner.translate_stream.call_args.kwargs["context"] == "앞 문단"
+
+    def test_system_prompt_includes_instruction(self):
+        """플레이스홀더가 있는 요청에만 보존 지시문을 넣는지 테스트"""
+        manager = TranslationManager(Mock(), model="gpt-4o")
+        assert PLACEHOLDER_INSTRUCTION in manager._build_messages("실행: ⟦0⟧", "Korean", "English")[0]["content"]
+        assert PLACEHOLDER_INSTRUCTION not in manager._build_messages("실행", "Korean", "English")[0]["content"]
+
+    def test_factory_wraps_outermost(self):
+        """팩토리가 번역 메모리보다 바깥에서 보호하는지 테스트"""
+        memory = TranslationMemory(InMemoryMemoryStore(max_entries=10))
+        manager = TranslationManagerFactory.create(
+            provider="openai",
+            client=Mock(),
+            model="gpt-4o",
+            translation_memory=memory,
+            placeholder_protector=PlaceholderProtector()
+        )
+        assert isinstance(manager, ProtectedTranslationManager)
+        assert isinstance(manager.inner, MemoryTranslationManager)
+        assert manager.model == "gpt-4o"
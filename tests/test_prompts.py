@@ -0,0 +1,143 @@
+"""프롬프트 템플릿 레지스트리 테스트"""
+from unittest.mock import Mock
+
+import pytest
+
+from components.prompts import (
+    PROMPT_REGISTRY,
+    PromptRegistry,
+    PromptTemplate,
+    cached_prompt_tokens,
+    configure_prompts,
+    prompt_cache_stats
+)
+from config import Config
+
+
+class TestPromptRegistry:
+    """PromptRegistry 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.registry = PromptRegistry()
+        self.registry.register(PromptTemplate("greeting", "v1", "Static.", " Hello {name}"))
+
+    def test_render_static_first(self):
+        """정적 지침 뒤에 가변 부분을 붙이는지 테스트"""
+        assert self.registry.get("greeting").render(name="Kim") == "Static. Hello Kim"
+
+    def test_register_activates_latest(self):
+        """새 버전 등록 시 활성 버전이 바뀌는지 테스트"""
+        self.registry.register(PromptTemplate("greeting", "v2", "Static v2.", " {name}"))
+
+        assert self.registry.get("greeting").version == "v2"
+        assert self.registry.get("greeting", "v1").version == "v1"
+        assert self.registry.versions("greeting") == ["v1", "v2"]
+
+    def test_register_without_activate(self):
+        """activate=False이면 활성 버전을 유지하는지 테스트"""
+        self.registry.register(PromptTemplate("greeting", "v2", "Static v2."), activate=False)
+        assert self.registry.get("greeting").version == "v1"
+
+    def test_activate_rollback(self):
+        """이전 버전으로 되돌리기 테스트"""
+        self.registry.register(PromptTemplate("greeting", "v2", "Static v2."))
+        self.registry.activate("greeting", "v1")
+        assert self.registry.get("greeting").version == "v1"
+
+    def test_duplicate_version_raises(self):
+        """같은 버전 중복 등록 시 ValueError 테스트"""
+        with pytest.raises(ValueError, match="이미 등록된 프롬프트 템플릿입니다"):
+            self.registry.register(PromptTemplate("greeting", "v1", "Other."))
+
+    def test_unknown_template_raises(self):
+        """등록되지 않은 템플릿 조회 시 ValueError 테스트"""
+        with pytest.raises(ValueError, match="등록되지 않은 프롬프트 템플릿입니다"):
+            self.registry.get("missing")
+        with pytest.raises(ValueError):
+            self.registry.activate("greeting", "v9")
+
+
+class TestDefaultTemplates:
+    """기본 등록 템플릿 테스트"""
+
+    @pytest.mark.parametrize("name", ["translation", "style_translation", "style_translation_batch"])
+    def test_shared_prefix_across_directions(self, name):
+        """번역 방향이 달라도 프롬프트 앞부분이 같은지 테스트"""
+        template = PROMPT_REGISTRY.get(name)
+        values = {
+            "style_instruction": "Be brief.",
+            "proper_noun_instruction": "",
+            "style_lines": "- concise: Be brief.",
+            "alternatives_instruction": "",
+            "response_shape": "{}",
+        }
+
+        ko_to_en = template.render(source="Korean", target="English", **values)
+        en_to_ko = template.render(source="English", target="Korean", **values)
+
+        assert ko_to_en.startswith(template.static)
+        assert en_to_ko.startswith(template.static)
+        assert "{" not in template.static
+
+    def test_default_version_is_v2(self):
+        """기본 활성 버전은 v2이고 v1도 등록되어 있는지 테스트"""
+        for name in ("translation", "style_translation", "style_translation_batch"):
+            assert PROMPT_REGISTRY.get(name).version == "v2"
+            assert PROMPT_REGISTRY.versions(name) == ["v1", "v2"]
+
+    def test_v1_matches_original_prompt(self):
+        """v1이 템플릿 도입 전 프롬프트를 그대로 만드는지 테스트"""
+        prompt = PROMPT_REGISTRY.get("translation", "v1").render(source="Korean", target="English")
+
+        assert prompt == (
+            "You are a professional translator. Translate the following Korean text to English. "
+            "IMPORTANT: Preserve all Markdown formatting (bold, italic, headings, lists, links, code blocks, "
+            "blockquotes, tables, etc.) in the translation. Only respond with the translation, nothing else."
+        )
+
+
+class TestConfigurePrompts:
+    """configure_prompts 테스트"""
+
+    def teardown_method(self):
+        """각 테스트 후에 기본 버전으로 되돌림"""
+        configure_prompts(Config())
+
+    def test_rollback_to_v1(self):
+        """PROMPT_VERSION=v1이면 모든 기본 템플릿이 v1을 사용하는지 테스트"""
+        config = Config()
+        config.PROMPT_VERSION = "v1"
+
+        configure_prompts(config)
+
+        for name in ("translation", "style_translation", "style_translation_batch"):
+            assert PROMPT_REGISTRY.get(name).version == "v1"
+
+    def test_unknown_version_raises(self):
+        """등록되지 않은 버전이면 ValueError가 발생하는지 테스트"""
+        config = Config()
+        config.PROMPT_VERSION = "v9"
+
+        with pytest.raises(ValueError):
+            configure_prompts(config)
+
+
+class TestCachedPromptTokens:
+    """cached_prompt_tokens 테스트"""
+
+    def test_reads_cached_tokens(self):
+        """prompt_tokens_details.cached_tokens를 읽는지 테스트"""
+        usage = Mock(prompt_tokens=2000)
+        usage.prompt_tokens_details.cached_tokens = 1536
+
+        assert cached_prompt_tokens(usage) == 1536
+        assert prompt_cache_stats(usage) == {"prompt_tokens": 2000, "cached_prompt_tokens": 1536}
+
+    def test_missing_details(self):
+        """상세 정보가 없으면 0을 반환하는지 테스트"""
+        usage = Mock(spec=["prompt_tokens"], prompt_tokens=10)
+
+        assert cached_prompt_tokens(usage) == 0
+        assert cached_prompt_tokens(None) == 0
+        assert prompt_cache_stats(Mock()) == {"prompt_tokens": 0, "cached_prompt_tokens": 0}
@@ -0,0 +1,198 @@
+"""RateLimiter 클래스 테스트"""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from components.rate_limit import RateLimiter, RateLimitTimeout
+from components.translation import TranslationManager
+from config import Config
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_within_limit_no_wait(self):
+        """한도 안의 요청은 대기하지 않는지 테스트"""
+        limiter = RateLimiter(rpm=5)
+
+        waits = [limiter.acquire("openai", "gpt-4o", 10) for _ in range(5)]
+
+        assert all(wait < 0.05 for wait in waits)
+        assert limiter.stats()["openai:gpt-4o"]["requests"] == 5
+
+    def test_rpm_exceeded_waits(self):
+        """RPM을 넘으면 버킷이 채워질 때까지 대기하는지 테스트"""
+        limiter = RateLimiter(rpm=600)  # 0.1초마다 1건
+        for _ in range(600):
+            limiter.acquire("openai", "gpt-4o", 1)
+
+        start = time.monotonic()
+        waited = limiter.acquire("openai", "gpt-4o", 1)
+
+        assert waited >= 0.05
+        assert time.monotonic() - start >= 0.05
+        assert limiter.stats()["openai:gpt-4o"]["waited_requests"] == 1
+
+    def test_tpm_charges_tokens(self):
+        """TPM은 요청 토큰 수만큼 차감되는지 테스트"""
+        limiter = RateLimiter(tpm=6000, timeout=0.01)  # 초당 100토큰
+
+        limiter.acquire("openai", "gpt-4o", 5950)
+
+        with pytest.raises(RateLimitTimeout):
+            limiter.acquire("openai", "gpt-4o", 100)
+        assert limiter.stats()["openai:gpt-4o"]["timeouts"] == 1
+
+    def test_timeout_raises(self):
+        """최대 대기 시간 안에 확보할 수 없으면 예외가 발생하는지 테스트"""
+        limiter = RateLimiter(rpm=1, timeout=0.1)
+        limiter.acquire("openai", "gpt-4o", 1)
+
+        with pytest.raises(RateLimitTimeout, match="요청 한도 대기 시간을 초과했습니다"):
+            limiter.acquire("openai", "gpt-4o", 1)
+        assert limiter.stats()["openai:gpt-4o"]["queue_depth"] == 0
+
+    def test_try_acquire_does_not_wait_or_count_timeout(self, caplog):
+        """try_acquire는 한도가 부족하면 대기 없이 False를 반환하고 시간 초과로 집계하지 않는지 테스트"""
+        limiter = RateLimiter(rpm=1)
+
+        assert limiter.try_acquire("openai", "gpt-4o", 1) is True
+        with caplog.at_level("WARNING", logger="transbot.rate_limit"):
+            assert limiter.try_acquire("openai", "gpt-4o", 1) is False
+
+        stats = limiter.stats()["openai:gpt-4o"]
+        assert stats["requests"] == 1
+        assert stats["timeouts"] == 0
+        assert stats["queue_depth"] == 0
+        assert caplog.records == []
+
+    def test_request_larger_than_tpm(self):
+        """분당 한도보다 큰 요청도 버킷이 가득 차 있으면 보낼 수 있는지 테스트"""
+        limiter = RateLimiter(tpm=100)
+        assert limiter.acquire("openai", "gpt-4o", 1000) < 0.05
+
+    def test_keys_are_independent(self):
+        """provider + 모델/deployment별로 버킷이 나뉘는지 테스트"""
+        limiter = RateLimiter(rpm=1, timeout=0.01)
+        limiter.acquire("openai", "gpt-4o", 1)
+        limiter.acquire("openai", "gpt-4o-mini", 1)
+        limiter.acquire("azure", "gpt-4o", 1)
+
+        assert set(limiter.stats()) == {"openai:gpt-4o", "openai:gpt-4o-mini", "azure:gpt-4o"}
+
+    def test_overrides(self):
+        """이름별 한도가 기본 한도보다 우선하는지 테스트"""
+        limiter = RateLimiter(rpm=1, tpm=0, overrides={"my-deployment": (100, 1000)})
+
+        assert limiter.limits_for("my-deployment") == (100, 1000)
+        assert limiter.limits_for("gpt-4o") == (1, 0)
+
+    def test_queue_depth_and_on_wait(self):
+        """대기 중인 요청 수와 대기 콜백 테스트"""
+        limiter = RateLimiter(rpm=300)  # 0.2초마다 1건
+        for _ in range(300):
+            limiter.acquire("openai", "gpt-4o", 1)
+        on_wait = Mock()
+        depths = []
+
+        thread = threading.Thread(target=limiter.acquire, args=("openai", "gpt-4o", 1), kwargs={"on_wait": on_wait})
+        thread.start()
+        time.sleep(0.05)
+        depths.append(limiter.stats()["openai:gpt-4o"]["queue_depth"])
+        thread.join()
+
+        assert depths == [1]
+        assert limiter.stats()["openai:gpt-4o"]["queue_depth"] == 0
+        on_wait.assert_called_once()
+        assert on_wait.call_args[0][0] > 0
+
+    def test_acquire_async(self):
+        """비동기 대기 테스트"""
+        limiter = RateLimiter(rpm=600)
+
+        async def run():
+            for _ in range(600):
+                await limiter.acquire_async("openai", "gpt-4o", 1)
+            return await limiter.acquire_async("openai", "gpt-4o", 1)
+
+        assert asyncio.run(run()) >= 0.05
+
+    def test_estimate_tokens(self):
+        """토큰 카운터가 없으면 문자 수 + max_tokens로 추정하는지 테스트"""
+        limiter = RateLimiter(tpm=1000)
+        messages = [{"role": "system", "content": "abc"}, {"role": "user", "content": "안녕"}]
+
+        assert limiter.estimate_tokens(messages, 100, "gpt-4o") == 105
+
+    def test_from_config(self):
+        """한도가 없으면 생성하지 않는지 테스트"""
+        config = Config()
+        assert RateLimiter.from_config(config) is None
+
+        config.RATE_LIMIT_OVERRIDES = "gpt-4o=10:1000"
+        limiter = RateLimiter.from_config(config)
+        assert limiter.limits_for("gpt-4o") == (10, 1000)
+
+
+class TestRateLimiterIntegration:
+    """TranslationManager 요청 한도 적용 테스트"""
+
+    def test_translation_manager_acquires_before_call(self, monkeypatch):
+        """API 호출 전에 요청 한도를 확보하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = Mock()
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = "안녕하세요"
+        response.usage.prompt_tokens = 10
+        response.usage.completion_tokens = 5
+        client.chat.completions.create.return_value = response
+        limiter = RateLimiter(rpm=1, timeout=0.01)
+        manager = TranslationManager(client, model="gpt-4o", max_tokens=100, rate_limiter=limiter)
+
+        manager.translate("Hello", "English", "Korean")
+
+        assert limiter.stats()["openai:gpt-4o"]["requests"] == 1
+        with pytest.raises(RateLimitTimeout):
+            manager.translate("World", "English", "Korean")
+        assert client.chat.completions.create.call_count == 1
+
+
+class TestRateLimitConfig:
+    """요청 한도 설정 테스트"""
+
+    def test_defaults(self):
+        """기본값 테스트"""
+        config = Config()
+        assert config.RATE_LIMIT_RPM == 0
+        assert config.RATE_LIMIT_TPM == 0
+        assert config.RATE_LIMIT_OVERRIDES is None
+        assert config.RATE_LIMIT_TIMEOUT_SECONDS == 30.0
+
+    def test_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("RATE_LIMIT_RPM", "60")
+        monkeypatch.setenv("RATE_LIMIT_TPM", "40000")
+        monkeypatch.setenv("RATE_LIMIT_OVERRIDES", "gpt-4o=500:150000")
+        monkeypatch.setenv("RATE_LIMIT_TIMEOUT_SECONDS", "5")
+
+        config = Config.load()
+
+        assert config.RATE_LIMIT_RPM == 60
+        assert config.RATE_LIMIT_TPM == 40000
+        assert config.parse_rate_limit_overrides(config.RATE_LIMIT_OVERRIDES) == {"gpt-4o": (500, 150000)}
+        assert config.RATE_LIMIT_TIMEOUT_SECONDS == 5.0
+
+    def test_parse_overrides(self):
+        """한도 문자열 파싱 테스트"""
+        assert Config.parse_rate_limit_overrides("a=1:2, b=3:4,") == {"a": (1, 2), "b": (3, 4)}
+        assert Config.parse_rate_limit_overrides(None) == {}
+
+    def test_invalid_overrides(self, monkeypatch):
+        """잘못된 형식이면 ValueError 테스트"""
+        monkeypatch.setenv("RATE_LIMIT_OVERRIDES", "gpt-4o=fast")
+        with pytest.raises(ValueError, match="요청 한도 설정 형식이 올바르지 않습니다"):
+            Config.load()
@@ -0,0 +1,194 @@
+"""ModelRouter 클래스 테스트"""
+from unittest.mock import Mock
+
+import pytest
+
+from components.router import ModelRouter
+from components.style_translator import StyleTranslator
+from components.translation import (
+    AzureTranslationManager,
+    RoutingTranslationManager,
+    TranslationManager,
+    TranslationManagerFactory,
+)
+from config import Config
+
+ROUTES = "tokens<=50->gpt-4o-mini;type=alternatives->gpt-4o-mini;style=formal&source=Korean->gpt-4o"
+
+
+def make_router(routes=ROUTES, deployments=None):
+    """글자 수를 토큰 수로 사용하는 라우터를 만듭니다."""
+    token_counter = Mock()
+    token_counter.count.side_effect = lambda text, model, approximate=None: len(text)
+    return ModelRouter(Config.parse_model_routes(routes), token_counter=token_counter, deployments=deployments)
+
+
+class TestModelRouter:
+    """ModelRouter 테스트"""
+
+    def test_short_input_routed(self):
+        """짧은 입력은 규칙의 모델로 라우팅되는지 테스트"""
+        route = make_router().route("hi there", "English", "Korean", "gpt-4o")
+
+        assert route["model"] == "gpt-4o-mini"
+        assert route["rule"] == "tokens<=50->gpt-4o-mini"
+        assert route["input_tokens"] == 8
+
+    def test_no_match_uses_default(self):
+        """일치하는 규칙이 없으면 기본 모델을 사용하는지 테스트"""
+        route = make_router().route("x" * 100, "English", "Korean", "gpt-4o")
+
+        assert route["model"] == "gpt-4o"
+        assert route["rule"] is None
+
+    def test_request_type_and_style(self):
+        """요청 종류와 스타일/언어 조건 테스트"""
+        router = make_router()
+        text = "가" * 100
+
+        assert router.route(text, "Korean", "English", "gpt-4o", request_type="alternatives")["model"] == "gpt-4o-mini"
+        assert router.route(text, "Korean", "English", "gpt-4o-mini", style="formal", request_type="style")[
+            "model"] == "gpt-4o"
+        assert router.route(text, "English", "Korean", "gpt-4o-mini", style="formal", request_type="style")[
+            "rule"] is None
+
+    def test_first_matching_rule_wins(self):
+        """위에서부터 처음 일치하는 규칙을 사용하는지 테스트"""
+        router = make_router("tokens<10->gpt-3.5-turbo;tokens<100->gpt-4o-mini;*->gpt-4o")
+
+        assert router.route("a" * 5, "English", "Korean", "gpt-4")["model"] == "gpt-3.5-turbo"
+        assert router.route("a" * 50, "English", "Korean", "gpt-4")["model"] == "gpt-4o-mini"
+        assert router.route("a" * 500, "English", "Korean", "gpt-4")["model"] == "gpt-4o"
+
+    def test_azure_skips_models_without_deployment(self):
+        """Azure에서 deployment가 없는 모델의 규칙은 건너뛰는지 테스트"""
+        router = make_router("tokens<=50->gpt-4o-mini;tokens<=50->gpt-4o", deployments={"gpt-4o": "my-4o"})
+
+        route = router.route("hi", "English", "Korean", "gpt-4")
+
+        assert route["model"] == "gpt-4o"
+        assert route["deployment"] == "my-4o"
+
+    def test_from_config(self):
+        """MODEL_ROUTES가 없으면 생성하지 않는지 테스트"""
+        config = Config()
+        assert ModelRouter.from_config(config) is None
+
+        config.MODEL_ROUTES = ROUTES
+        assert len(ModelRouter.from_config(config, token_counter=Mock()).rules) == 3
+
+
+class TestRoutingTranslationManager:
+    """RoutingTranslationManager 테스트"""
+
+    def test_factory_returns_routing_manager(self, monkeypatch, make_client):
+        """router가 있으면 요청마다 라우팅된 모델로 번역하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = make_client()
+        manager = TranslationManagerFactory.create("openai", client, router=make_router(), model="gpt-4o")
+
+        assert isinstance(manager, RoutingTranslationManager)
+        assert manager.model == "gpt-4o"
+
+        manager.translate("hello", "English", "Korean")
+        assert client.chat.completions.create.call_args.kwargs["model"] == "gpt-4o-mini"
+
+        manager.translate("long text " * 20, "English", "Korean")
+        assert client.chat.completions.create.call_args.kwargs["model"] == "gpt-4o"
+
+    def test_factory_without_router(self):
+        """router가 없으면 기존 관리자를 반환하는지 테스트"""
+        manager = TranslationManagerFactory.create("openai", Mock(), model="gpt-4o")
+        assert type(manager) is TranslationManager
+
+    def test_azure_uses_routed_deployment(self, monkeypatch, make_client):
+        """Azure에서 라우팅된 모델의 deployment로 요청하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = make_client()
+        router = make_router(deployments={"gpt-4o-mini": "my-mini", "gpt-4o": "my-4o"})
+        manager = TranslationManagerFactory.create(
+            "azure", client, router=router, deployment="my-4o", model="gpt-4o"
+        )
+
+        manager.translate("hello", "English", "Korean")
+
+        assert client.chat.completions.create.call_args.kwargs["model"] == "my-mini"
+        assert isinstance(manager.for_request("hello", "English", "Korean")[0], AzureTranslationManager)
+
+    def test_route_in_metadata(self, monkeypatch, make_client):
+        """라우팅 결과가 로그/Langfuse 메타데이터에 포함되는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        update = Mock()
+        monkeypatch.setattr("components.translation.langfuse_context.update_current_observation", update)
+        manager = TranslationManagerFactory.create("openai", make_client(), router=make_router(), model="gpt-4o")
+
+        manager.translate("hello", "English", "Korean")
+
+        metadata = update.call_args.kwargs["metadata"]
+        assert metadata["route"] == "tokens<=50->gpt-4o-mini"
+        assert metadata["routed_model"] == "gpt-4o-mini"
+        assert metadata["route_request_type"] == "primary"
+
+
+class TestStyleTranslatorRouting:
+    """StyleTranslator 라우팅 테스트"""
+
+    def test_style_and_alternatives_routed(self, make_client):
+        """스타일 번역과 대안 표현이 각각 라우팅되는지 테스트"""
+        client = make_client()
+        translator = StyleTranslator(client, model="gpt-4o-mini", router=make_router())
+        text = "가" * 100
+
+        translator.translate_multi_style(
+            text, ["formal"], source_lang="Korean", target_lang="English", include_alternatives=True
+        )
+
+        models = [call.kwargs["model"] for call in client.chat.completions.create.call_args_list]
+        assert models == ["gpt-4o", "gpt-4o-mini"]
+        assert translator.model == "gpt-4o-mini"
+
+    def test_azure_keeps_deployment_when_unmapped(self, make_client):
+        """Azure에서 라우팅된 모델의 deployment가 없으면 기존 deployment를 사용하는지 테스트"""
+        client = make_client()
+        router = make_router("*->gpt-4o", deployments={})
+        translator = StyleTranslator(client, model="gpt-4o-mini", deployment="my-mini", router=router)
+
+        translator.translate_single_style("hello", "business", "English", "Korean")
+
+        assert client.chat.completions.create.call_args.kwargs["model"] == "my-mini"
+
+
+class TestModelRoutesConfig:
+    """모델 라우팅 설정 테스트"""
+
+    def test_default(self):
+        """기본값 테스트"""
+        assert Config().MODEL_ROUTES is None
+
+    def test_load_from_env(self, monkeypatch):
+        """환경 변수 로드 테스트"""
+        monkeypatch.setenv("MODEL_ROUTES", ROUTES)
+        assert Config.load().MODEL_ROUTES == ROUTES
+
+    def test_parse(self):
+        """규칙 표 파싱 테스트"""
+        rules = Config.parse_model_routes("tokens>=10 & tokens<100 & style=concise|conversational->gpt-4o-mini; ")
+
+        assert rules == [{
+            "name": "tokens>=10 & tokens<100 & style=concise|conversational->gpt-4o-mini",
+            "model": "gpt-4o-mini",
+            "tokens": [(">=", 10), ("<", 100)],
+            "match": {"style": ["concise", "conversational"]},
+        }]
+
+    @pytest.mark.parametrize("routes, message", [
+        ("tokens<=50", "모델 라우팅 규칙 형식"),
+        ("tokens<=50->gpt-5", "지원하지 않는 모델"),
+        ("length<=50->gpt-4o", "지원하지 않는 모델 라우팅 조건"),
+        ("type=summary->gpt-4o", "지원하지 않는 요청 종류"),
+    ])
+    def test_invalid_routes(self, monkeypatch, routes, message):
+        """잘못된 규칙이면 ValueError 테스트"""
+        monkeypatch.setenv("MODEL_ROUTES", routes)
+        with pytest.raises(ValueError, match=message):
+            Config.load()
@@ -0,0 +1,229 @@
+"""SingleFlight 클래스 테스트"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from components.singleflight import SingleFlight
+from components.style_translator import StyleTranslator
+from components.translation import TranslationManager
+from config import Config
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    def test_concurrent_same_key_runs_once(self):
+        """동시에 들어온 같은 키 요청이 한 번만 실행되는지 테스트"""
+        single_flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def fn():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(single_flight.do, "key", fn)
+            started.wait()
+            followers = [executor.submit(single_flight.do, "key", fn) for _ in range(4)]
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert len(calls) == 1
+        assert results[0] == ("result", False)
+        assert all(result == ("result", True) for result in results[1:])
+        assert single_flight.stats() == {"in_flight": 0, "upstream_calls": 1, "coalesced_requests": 4}
+
+    def test_different_keys_run_separately(self):
+        """키가 다르면 각각 실행되는지 테스트"""
+        single_flight = SingleFlight()
+
+        assert single_flight.do("a", lambda: 1) == (1, False)
+        assert single_flight.do("b", lambda: 2) == (2, False)
+        assert single_flight.stats()["upstream_calls"] == 2
+
+    def test_sequential_calls_not_coalesced(self):
+        """끝난 호출은 결과를 재사용하지 않는지 테스트 (캐시 아님)"""
+        single_flight = SingleFlight()
+        fn = Mock(return_value="result")
+
+        single_flight.do("key", fn)
+        single_flight.do("key", fn)
+
+        assert fn.call_count == 2
+
+    def test_exception_shared(self):
+        """leader의 예외가 합류한 요청에도 전달되는지 테스트"""
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def fn():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("API 오류")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", fn)
+            started.wait()
+            follower = executor.submit(single_flight.do, "key", fn)
+
+            with pytest.raises(RuntimeError, match="API 오류"):
+                leader.result()
+            with pytest.raises(RuntimeError, match="API 오류"):
+                follower.result()
+
+        assert single_flight.stats()["in_flight"] == 0
+
+    def test_from_config(self):
+        """설정에 따라 생성 여부가 결정되는지 테스트"""
+        config = Config()
+        assert isinstance(SingleFlight.from_config(config), SingleFlight)
+
+        config.TRANSLATION_SINGLE_FLIGHT_ENABLED = False
+        assert SingleFlight.from_config(config) is None
+
+
+class TestSingleFlightIntegration:
+    """번역 관리자와 StyleTranslator의 동일 요청 합치기 테스트"""
+
+    def test_translation_manager_coalesces(self, make_client):
+        """동시에 같은 텍스트를 번역하면 API를 한 번만 호출하는지 테스트"""
+        client = make_client("안녕하세요", delay=0.1)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda _: manager.translate("Hello", "English", "Korean"), range(3)))
+
+        assert results == ["안녕하세요"] * 3
+        assert client.chat.completions.create.call_count == 1
+        assert manager.single_flight.stats()["coalesced_requests"] == 2
+
+    def test_translation_manager_normalized_key(self, make_client):
+        """앞뒤 공백만 다른 요청도 합쳐지는지 테스트"""
+        client = make_client("안녕하세요", delay=0.1)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(
+                lambda text: manager.translate(text, "English", "Korean"), ["Hello", "Hello  "]
+            ))
+
+        assert client.chat.completions.create.call_count == 1
+
+    def test_translation_manager_shares_exception(self, monkeypatch, make_client):
+        """합류한 요청도 같은 예외를 받는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        client = make_client(error=RuntimeError("API 오류"), delay=0.1)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        def translate(_):
+            try:
+                manager.translate("Hello", "English", "Korean")
+            except RuntimeError as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            errors = list(executor.map(translate, range(2)))
+
+        assert errors == ["API 오류", "API 오류"]
+        assert client.chat.completions.create.call_count == 1
+
+    @staticmethod
+    def _stream_client(make_response, started):
+        """스트리밍 요청에는 started를 알린 뒤 천천히 조각을 보내는 Mock 클라이언트"""
+        client = Mock()
+
+        def create(**kwargs):
+            if not kwargs.get("stream"):
+                return make_response("안녕하세요")
+
+            def chunks():
+                for delta in ["안녕", "하세요"]:
+                    started.set()
+                    time.sleep(0.1)
+                    yield Mock(choices=[Mock(delta=Mock(content=delta))], usage=None)
+                yield Mock(choices=[], usage=Mock(prompt_tokens=10, completion_tokens=5, prompt_tokens_details=None))
+
+            return chunks()
+
+        client.chat.completions.create.side_effect = create
+        return client
+
+    def test_translation_manager_coalesces_streams(self, make_response):
+        """동시에 같은 텍스트를 스트리밍하면 스트림을 하나만 열고, 합류한 요청은 전체 번역문을 받는지 테스트"""
+        started = threading.Event()
+        client = self._stream_client(make_response, started)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(lambda: list(manager.translate_stream("Hello", "English", "Korean")))
+            started.wait()
+            follower = executor.submit(lambda: list(manager.translate_stream("Hello", "English", "Korean")))
+
+            assert leader.result() == ["안녕", "하세요"]
+            assert follower.result() == ["안녕하세요"]
+        assert client.chat.completions.create.call_count == 1
+        assert manager.single_flight.stats()["coalesced_requests"] == 1
+
+    def test_translate_joins_stream(self, make_response):
+        """스트리밍 중인 요청과 같은 translate() 요청이 스트림 결과를 받는지 테스트"""
+        started = threading.Event()
+        client = self._stream_client(make_response, started)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(lambda: list(manager.translate_stream("Hello", "English", "Korean")))
+            started.wait()
+            follower = executor.submit(manager.translate, "Hello", "English", "Korean")
+
+            assert follower.result() == "안녕하세요"
+            leader.result()
+        assert client.chat.completions.create.call_count == 1
+
+    def test_interrupted_stream_releases_followers(self, make_response):
+        """먼저 시작한 스트림이 중단되면 합류한 요청이 직접 API를 호출하는지 테스트"""
+        started = threading.Event()
+        client = self._stream_client(make_response, started)
+        manager = TranslationManager(client, model="gpt-4o", single_flight=SingleFlight())
+
+        stream = manager.translate_stream("Hello", "English", "Korean")
+        assert next(stream) == "안녕"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            follower = executor.submit(manager.translate, "Hello", "English", "Korean")
+            time.sleep(0.05)
+            stream.close()
+
+            assert follower.result() == "안녕하세요"
+        assert client.chat.completions.create.call_count == 2
+        assert manager.single_flight.stats()["in_flight"] == 0
+
+    def test_style_translator_coalesces(self, make_client):
+        """StyleTranslator도 동일 요청을 합치는지 테스트"""
+        client = make_client("Hello", delay=0.1)
+        translator = StyleTranslator(client=client, single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda _: translator.translate_single_style("안녕하세요", StyleTranslator.STYLE_FORMAL), range(2)
+            ))
+
+        assert results == ["Hello", "Hello"]
+        assert client.chat.completions.create.call_count == 1
+
+    def test_style_translator_batched_coalesces(self, make_client):
+        """일괄 다중 스타일 번역도 동일 요청을 합치는지 테스트"""
+        client = make_client('{"translations": {"formal": "Hello", "concise": "Hi"}}', delay=0.1)
+        translator = StyleTranslator(client=client, single_flight=SingleFlight())
+        styles = [StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda _: translator.translate_multi_style_batched("안녕하세요", styles), range(2)
+            ))
+
+        assert results == [{"formal": "Hello", "concise": "Hi"}] * 2
+        assert client.chat.completions.create.call_count == 1
@@ -0,0 +1,143 @@
+"""IncrementalTextStatistics 클래스 테스트"""
+import pytest
+
+from components.language import LanguageDetector
+from components.statistics import IncrementalTextStatistics, split_into_chunks
+from components.text import TextAnalyzer
+from components.tokens import TokenCounter
+
+
+class FakeEncoding:
+    """문자 1개를 토큰 1개로 인코딩하는 테스트용 인코더"""
+
+    name = "fake"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return list(text)
+
+
+@pytest.fixture
+def encoding():
+    return FakeEncoding()
+
+
+@pytest.fixture
+def statistics(encoding):
+    counter = TokenCounter(memo_size=1, encoding_getter=lambda model: encoding)
+    return IncrementalTextStatistics(token_counter=counter, max_chunk_chars=20)
+
+
+class TestSplitIntoChunks:
+    """구간 분할 테스트"""
+
+    def test_split_on_paragraphs(self):
+        """빈 줄 기준으로 나누는지 테스트"""
+        assert split_into_chunks("first\n\nsecond\n\nthird") == ["first\n\n", "second\n\n", "third"]
+
+    def test_long_paragraph_split_at_whitespace(self):
+        """긴 문단은 단어 중간이 아닌 공백 뒤에서 나누는지 테스트"""
+        text = "word " * 10
+        chunks = split_into_chunks(text, max_chunk_chars=12)
+
+        assert "".join(chunks) == text
+        assert all(chunk.endswith(" ") for chunk in chunks)
+
+    def test_crlf_not_split(self):
+        """CRLF 사이에서 나누지 않는지 테스트"""
+        chunks = split_into_chunks("abc\r\ndef", max_chunk_chars=3)
+        assert chunks == ["abc\r\n", "def"]
+
+    def test_empty(self):
+        """빈 텍스트 테스트"""
+        assert split_into_chunks("") == []
+
+
+class TestIncrementalTextStatistics:
+    """IncrementalTextStatistics 테스트"""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "Hello world",
+        "안녕하세요\n\nHello world\n\n\n반갑습니다 nice to meet you\n",
+        "line1\nline2\r\nline3 " * 10,
+        "x " * 100,
+    ])
+    def test_totals_match_full_computation(self, statistics, text):
+        """구간 합계가 전체 계산 결과와 같은지 테스트"""
+        result = statistics.update(text)
+
+        assert result["characters"] == len(text)
+        assert result["tokens"] == len(text)
+        assert result["words"] == len(text.split())
+        assert result["lines"] == len(text.splitlines())
+
+    def test_only_changed_chunks_recomputed(self, statistics, encoding):
+        """한 구간만 바뀌면 그 구간만 다시 계산하는지 테스트"""
+        text = "first paragraph\n\nsecond paragraph\n\nthird paragraph"
+        statistics.update(text)
+        assert statistics.last_recomputed_chunks == 3
+
+        encoding.encoded.clear()
+        statistics.update(text + "!")
+
+        assert statistics.last_recomputed_chunks == 1
+        assert encoding.encoded == ["third paragraph!"]
+
+    def test_model_change_recomputes(self, statistics):
+        """모델이 바뀌면 다시 계산하는지 테스트"""
+        statistics.update("Hello", model="gpt-4o")
+        statistics.update("Hello", model="gpt-4o-mini")
+        assert statistics.last_recomputed_chunks == 1
+
+    def test_approximate_encodes_only_samples(self, statistics, encoding):
+        """근사 모드에서는 새 구간 전체를 인코딩하지 않고 표본 구간만 인코딩하는지 테스트"""
+        text = "".join(f"chunk {index:04d} text\n\n" for index in range(500))
+
+        result = statistics.update(text, approximate=True)
+
+        assert statistics.last_recomputed_chunks == 500
+        assert sum(len(encoded) for encoded in encoding.encoded) == 4000
+        assert result["tokens"] == len(text)
+        assert result["characters"] == len(text)
+
+    def test_approximate_counts_not_reused_for_exact(self, statistics, encoding):
+        """근사 카운트한 구간을 정확한 카운트에 재사용하지 않는지 테스트"""
+        statistics.update("first\n\nsecond", approximate=True)
+        encoding.encoded.clear()
+
+        result = statistics.update("first\n\nsecond")
+
+        assert statistics.last_recomputed_chunks == 2
+        assert encoding.encoded == ["first\n\n", "second"]
+        assert result["tokens"] == len("first\n\nsecond")
+
+    def test_letter_tallies(self, statistics):
+        """한글/영문자 수 집계 테스트"""
+        result = statistics.update("안녕 Hi\n\n세상 abc")
+        assert result["korean_chars"] == 4
+        assert result["english_chars"] == 5
+
+
+class TestIncrementalIntegration:
+    """TextAnalyzer/LanguageDetector 연동 테스트"""
+
+    def test_text_analyzer_incremental(self, statistics):
+        """TextAnalyzer.get_statistics가 증분 계산기를 사용하는지 테스트"""
+        analyzer = TextAnalyzer(token_counter=statistics.token_counter)
+        result = analyzer.get_statistics("Hello world", incremental=statistics)
+
+        assert result["characters"] == 11
+        assert result["words"] == 2
+
+    def test_language_detector_from_statistics(self, statistics):
+        """통계 기반 언어 감지가 텍스트 기반 감지와 같은지 테스트"""
+        detector = LanguageDetector(threshold=0.5)
+        text = "안녕하세요 반갑습니다\n\nHello"
+        result = statistics.update(text)
+
+        assert detector.detect_from_statistics(result) == detector.detect(text) == "Korean"
+        assert detector.get_translation_direction_from_statistics(result) == detector.get_translation_direction(text)
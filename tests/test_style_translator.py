@@ -1,6 +1,10 @@
 """
 components/style_translator.py의 단위 테스트
 """
+import json
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from components.style_translator import StyleTranslator
@@ -307,6 +311,358 @@ class TestTranslateMultiStyle:
         assert len(result["conversational"]["alternatives"]) == 2
 
 
+class TestTranslateMultiStyleConcurrent:
+    """동시 실행 다중 스타일 번역 테스트"""
+
+    @staticmethod
+    def _make_slow_client(delay: float, fail_style_keyword: str = ""):
+        """지연 후 스타일 지침이 포함된 응답을 반환하는 Mock 클라이언트"""
+        client = Mock()
+
+        def create(**kwargs):
+            time.sleep(delay)
+            system_message = kwargs["messages"][0]["content"]
+            if fail_style_keyword and fail_style_keyword in system_message:
+                raise Exception("API Error")
+            content = system_message.split("STYLE INSTRUCTION: ")[-1].split("\n")[0]
+            return Mock(choices=[Mock(message=Mock(content=content))])
+
+        client.chat.completions.create.side_effect = create
+        return client
+
+    def test_init_max_concurrency(self, mock_openai_client):
+        """동시 실행 한도 초기화 테스트 (기본값 1, 최소값 1)"""
+        assert StyleTranslator(client=mock_openai_client).max_concurrency == 1
+        assert StyleTranslator(client=mock_openai_client, max_concurrency=4).max_concurrency == 4
+        assert StyleTranslator(client=mock_openai_client, max_concurrency=0).max_concurrency == 1
+
+    def test_concurrent_preserves_style_order(self):
+        """동시 실행 시에도 결과 순서가 styles 순서를 따르는지 테스트"""
+        client = self._make_slow_client(delay=0.05)
+        translator = StyleTranslator(client=client, max_concurrency=5)
+        styles = [
+            StyleTranslator.STYLE_FORMAL,
+            StyleTranslator.STYLE_CONVERSATIONAL,
+            StyleTranslator.STYLE_CONCISE
+        ]
+
+        result = translator.translate_multi_style(text="안녕하세요", styles=styles)
+
+        assert list(result.keys()) == styles
+        assert result["formal"] == StyleTranslator.STYLE_INSTRUCTIONS["formal"]
+        assert result["concise"] == StyleTranslator.STYLE_INSTRUCTIONS["concise"]
+
+    def test_concurrent_wall_clock_close_to_single_call(self):
+        """동시 실행 시 전체 시간이 호출 합계가 아닌 단일 호출 시간에 가까운지 테스트"""
+        delay = 0.2
+        client = self._make_slow_client(delay=delay)
+        translator = StyleTranslator(client=client, max_concurrency=5)
+        styles = list(StyleTranslator.STYLE_LABELS.keys())
+
+        start = time.perf_counter()
+        result = translator.translate_multi_style(text="안녕하세요", styles=styles)
+        elapsed = time.perf_counter() - start
+
+        assert len(result) == 5
+        assert elapsed < delay * len(styles) / 2
+
+    def test_concurrent_respects_max_concurrency(self):
+        """동시 API 호출 수가 max_concurrency를 넘지 않는지 테스트"""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        client = Mock()
+
+        def create(**kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return Mock(choices=[Mock(message=Mock(content="ok"))])
+
+        client.chat.completions.create.side_effect = create
+        translator = StyleTranslator(client=client, max_concurrency=2)
+
+        translator.translate_multi_style(
+            text="안녕하세요",
+            styles=list(StyleTranslator.STYLE_LABELS.keys())
+        )
+
+        assert state["peak"] <= 2
+        assert client.chat.completions.create.call_count == 5
+
+    def test_concurrent_partial_failure_isolated(self):
+        """동시 실행 시 일부 스타일 실패가 다른 스타일에 영향을 주지 않는지 테스트"""
+        client = self._make_slow_client(
+            delay=0.01,
+            fail_style_keyword=StyleTranslator.STYLE_INSTRUCTIONS["business"]
+        )
+        translator = StyleTranslator(client=client, max_concurrency=3)
+
+        result = translator.translate_multi_style(
+            text="안녕하세요",
+            styles=[
+                StyleTranslator.STYLE_CONVERSATIONAL,
+                StyleTranslator.STYLE_BUSINESS,
+                StyleTranslator.STYLE_FORMAL
+            ]
+        )
+
+        assert result["business"] == "[business 번역 실패]"
+        assert result["conversational"] == StyleTranslator.STYLE_INSTRUCTIONS["conversational"]
+        assert result["formal"] == StyleTranslator.STYLE_INSTRUCTIONS["formal"]
+
+    def test_concurrent_with_alternatives_chained(self):
+        """대안 표현 요청이 각 스타일 번역 결과를 기반으로 이어서 실행되는지 테스트"""
+        client = Mock()
+
+        def create(**kwargs):
+            user_message = kwargs["messages"][1]["content"]
+            if kwargs["messages"][0]["content"].startswith("You are a professional translator providing"):
+                base = user_message.split('"')[1]
+                return Mock(choices=[Mock(message=Mock(content=f"{base} alt1\n{base} alt2"))])
+            style = kwargs["messages"][0]["content"].split("STYLE INSTRUCTION: ")[-1].split(" ")[1]
+            return Mock(choices=[Mock(message=Mock(content=style))])
+
+        client.chat.completions.create.side_effect = create
+        translator = StyleTranslator(client=client, max_concurrency=5)
+
+        result = translator.translate_multi_style(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE],
+            include_alternatives=True
+        )
+
+        for style in ("formal", "concise"):
+            primary = result[style]["primary"]
+            assert result[style]["alternatives"] == [f"{primary} alt1", f"{primary} alt2"]
+
+    def test_custom_instruction_applied_to_all_styles(self, style_translator, mock_openai_client):
+        """커스텀 지침이 모든 스타일 요청에 적용되는지 테스트"""
+        style_translator.translate_multi_style(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE],
+            custom_instruction="Translate in a humorous tone."
+        )
+
+        for call in mock_openai_client.chat.completions.create.call_args_list:
+            assert "Translate in a humorous tone." in call.kwargs["messages"][0]["content"]
+
+
+class TestTranslateMultiStyleBatched:
+    """단일 호출 일괄 다중 스타일 번역 테스트"""
+
+    @staticmethod
+    def _json_response(payload):
+        return Mock(choices=[Mock(message=Mock(content=json.dumps(payload, ensure_ascii=False)))])
+
+    def test_batched_single_api_call(self, style_translator, mock_openai_client):
+        """모든 스타일을 한 번의 API 호출로 번역하는지 테스트"""
+        mock_openai_client.chat.completions.create.return_value = self._json_response({
+            "translations": {
+                "formal": "Formal translation",
+                "concise": {"primary": "Concise translation"}
+            }
+        })
+
+        result = style_translator.translate_multi_style_batched(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+        )
+
+        assert result == {"formal": "Formal translation", "concise": "Concise translation"}
+        mock_openai_client.chat.completions.create.assert_called_once()
+        call_kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+        assert call_kwargs["messages"][1]["content"] == "안녕하세요"
+        system_message = call_kwargs["messages"][0]["content"]
+        assert StyleTranslator.STYLE_INSTRUCTIONS["formal"] in system_message
+        assert StyleTranslator.STYLE_INSTRUCTIONS["concise"] in system_message
+
+    def test_batched_with_alternatives(self, style_translator, mock_openai_client):
+        """대안 표현 포함 일괄 번역 결과 형식 테스트"""
+        mock_openai_client.chat.completions.create.return_value = self._json_response({
+            "translations": {
+                "business": {
+                    "primary": "Thank you.",
+                    "alternatives": ["Thanks.", "Much appreciated.", "Many thanks.", "Cheers."]
+                }
+            }
+        })
+
+        result = style_translator.translate_multi_style_batched(
+            text="감사합니다",
+            styles=[StyleTranslator.STYLE_BUSINESS],
+            include_alternatives=True
+        )
+
+        assert result["business"]["primary"] == "Thank you."
+        assert result["business"]["alternatives"] == ["Thanks.", "Much appreciated.", "Many thanks."]
+        mock_openai_client.chat.completions.create.assert_called_once()
+
+    def test_batched_en_to_ko_uses_korean_instructions(self, style_translator, mock_openai_client):
+        """영→한 일괄 번역 시 한국어 스타일 지침 사용 테스트"""
+        mock_openai_client.chat.completions.create.return_value = self._json_response({
+            "translations": {"literal": "나는 행복하다."}
+        })
+
+        style_translator.translate_multi_style_batched(
+            text="I am happy.",
+            styles=[StyleTranslator.STYLE_LITERAL],
+            source_lang="English",
+            target_lang="Korean"
+        )
+
+        system_message = mock_openai_client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+        assert StyleTranslator.STYLE_INSTRUCTIONS_EN_TO_KO["literal"] in system_message
+
+    def test_batched_invalid_json_falls_back_to_per_style(self, style_translator, mock_openai_client):
+        """JSON 파싱 실패 시 스타일별 번역으로 대체되는지 테스트"""
+        mock_openai_client.chat.completions.create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content="not json"))]),
+            Mock(choices=[Mock(message=Mock(content="Formal translation"))]),
+            Mock(choices=[Mock(message=Mock(content="Concise translation"))])
+        ]
+
+        result = style_translator.translate_multi_style_batched(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+        )
+
+        assert result == {"formal": "Formal translation", "concise": "Concise translation"}
+        assert mock_openai_client.chat.completions.create.call_count == 3
+
+    def test_batched_missing_style_translated_individually(self, style_translator, mock_openai_client):
+        """응답에 누락된 스타일만 개별 번역하고 순서를 유지하는지 테스트"""
+        mock_openai_client.chat.completions.create.side_effect = [
+            self._json_response({"translations": {"concise": "Concise translation"}}),
+            Mock(choices=[Mock(message=Mock(content="Formal translation"))])
+        ]
+
+        result = style_translator.translate_multi_style_batched(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+        )
+
+        assert list(result.keys()) == ["formal", "concise"]
+        assert result["formal"] == "Formal translation"
+        assert result["concise"] == "Concise translation"
+        assert mock_openai_client.chat.completions.create.call_count == 2
+
+    def test_batched_api_failure_keeps_failure_isolation(self, style_translator, mock_openai_client):
+        """일괄 호출과 대체 호출이 모두 실패하면 스타일별 실패 메시지를 반환하는지 테스트"""
+        mock_openai_client.chat.completions.create.side_effect = Exception("API Error")
+
+        result = style_translator.translate_multi_style_batched(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL]
+        )
+
+        assert result == {"formal": "[formal 번역 실패]"}
+
+    def test_batched_empty_styles(self, style_translator, mock_openai_client):
+        """스타일이 없으면 API를 호출하지 않는지 테스트"""
+        assert style_translator.translate_multi_style_batched(text="안녕하세요", styles=[]) == {}
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+    def test_batched_max_tokens_clamped_to_model_limit(self, mock_openai_client):
+        """token_budget이 없어도 일괄 요청의 max_tokens가 모델의 최대 출력 토큰을 넘지 않는지 테스트"""
+        mock_openai_client.chat.completions.create.return_value = self._json_response(
+            {"translations": {"formal": "Formal", "concise": "Concise", "literal": "Literal"}}
+        )
+        translator = StyleTranslator(client=mock_openai_client, model="gpt-4-turbo", max_tokens=2000)
+
+        translator.translate_multi_style_batched(
+            text="안녕하세요",
+            styles=[StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE, StyleTranslator.STYLE_LITERAL]
+        )
+
+        assert mock_openai_client.chat.completions.create.call_args.kwargs["max_tokens"] == 4096
+
+
+class TestStyleTranslatorCache:
+    """스타일 번역 캐시 테스트"""
+
+    def test_single_style_cache_hit(self, mock_openai_client):
+        """동일 스타일 요청은 캐시에서 반환되는지 테스트"""
+        from components.cache import MemoryCacheTier, TranslationCache
+
+        cache = TranslationCache([MemoryCacheTier()])
+        translator = StyleTranslator(client=mock_openai_client, cache=cache)
+
+        first = translator.translate_single_style(text="안녕하세요", style=StyleTranslator.STYLE_FORMAL)
+        second = translator.translate_single_style(text="안녕하세요", style=StyleTranslator.STYLE_FORMAL)
+        translator.translate_single_style(text="안녕하세요", style=StyleTranslator.STYLE_CONCISE)
+        translator.translate_single_style(
+            text="안녕하세요",
+            style=StyleTranslator.STYLE_FORMAL,
+            custom_instruction="Translate in a humorous tone."
+        )
+
+        assert first == second == "Mocked translation"
+        assert mock_openai_client.chat.completions.create.call_count == 3
+        assert cache.stats()["cache_hits"] == 1
+
+    def test_batched_cache_hit(self, mock_openai_client):
+        """동일한 스타일 조합의 일괄 번역은 캐시에서 반환되는지 테스트"""
+        from components.cache import MemoryCacheTier, TranslationCache
+
+        mock_openai_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=json.dumps({
+                "translations": {"formal": "Formal translation", "concise": "Concise translation"}
+            })))]
+        )
+        cache = TranslationCache([MemoryCacheTier()])
+        translator = StyleTranslator(client=mock_openai_client, cache=cache)
+        styles = [StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+
+        first = translator.translate_multi_style_batched(text="안녕하세요", styles=styles)
+        second = translator.translate_multi_style_batched(text="안녕하세요", styles=styles)
+
+        assert first == second == {"formal": "Formal translation", "concise": "Concise translation"}
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert cache.stats()["cache_hits"] == 1
+
+    def test_batched_cache_key_includes_styles_and_alternatives(self, mock_openai_client):
+        """스타일 조합이나 대안 포함 여부가 다르면 캐시를 공유하지 않는지 테스트"""
+        from components.cache import MemoryCacheTier, TranslationCache
+
+        mock_openai_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=json.dumps({
+                "translations": {"formal": {"primary": "Formal translation", "alternatives": ["Alt"]}}
+            })))]
+        )
+        translator = StyleTranslator(client=mock_openai_client, cache=TranslationCache([MemoryCacheTier()]))
+
+        translator.translate_multi_style_batched(text="안녕하세요", styles=[StyleTranslator.STYLE_FORMAL])
+        result = translator.translate_multi_style_batched(
+            text="안녕하세요", styles=[StyleTranslator.STYLE_FORMAL], include_alternatives=True
+        )
+
+        assert result == {"formal": {"primary": "Formal translation", "alternatives": ["Alt"]}}
+        assert mock_openai_client.chat.completions.create.call_count == 2
+
+    def test_batched_partial_response_not_cached(self, mock_openai_client):
+        """누락된 스타일을 개별 번역한 결과는 일괄 캐시에 저장하지 않는지 테스트"""
+        from components.cache import MemoryCacheTier, TranslationCache
+
+        mock_openai_client.chat.completions.create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content=json.dumps({"translations": {"concise": "Concise"}})))]),
+            Mock(choices=[Mock(message=Mock(content="Formal"))]),
+            Mock(choices=[Mock(message=Mock(content=json.dumps({"translations": {"concise": "Concise"}})))])
+        ]
+        translator = StyleTranslator(client=mock_openai_client, cache=TranslationCache([MemoryCacheTier()]))
+        styles = [StyleTranslator.STYLE_FORMAL, StyleTranslator.STYLE_CONCISE]
+
+        translator.translate_multi_style_batched(text="안녕하세요", styles=styles)
+        result = translator.translate_multi_style_batched(text="안녕하세요", styles=styles)
+
+        # 두 번째 요청은 일괄 호출을 다시 하고, formal은 스타일별 캐시에서 가져옵니다
+        assert result == {"formal": "Formal", "concise": "Concise"}
+        assert mock_openai_client.chat.completions.create.call_count == 3
+
+
 class TestTranslateEnglishToKorean:
     """영어→한국어 번역 스타일 테스트"""
 
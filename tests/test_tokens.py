@@ -0,0 +1,109 @@
+"""TokenCounter 클래스 테스트"""
+import pytest
+
+from components.text import TextAnalyzer
+from components.tokens import TokenCounter
+
+
+class FakeEncoding:
+    """문자 1개를 토큰 1개로 인코딩하는 테스트용 인코더"""
+
+    name = "fake"
+
+    def __init__(self):
+        self.encode_calls = 0
+        self.encoded_chars = 0
+
+    def encode(self, text):
+        self.encode_calls += 1
+        self.encoded_chars += len(text)
+        return [ord(ch) for ch in text]
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+@pytest.fixture
+def encoding():
+    return FakeEncoding()
+
+
+@pytest.fixture
+def counter(encoding):
+    return TokenCounter(memo_size=2, approximate_threshold=10000, encoding_getter=lambda model: encoding)
+
+
+class TestTokenCounter:
+    """TokenCounter 테스트"""
+
+    def test_count_exact(self, counter):
+        """정확한 토큰 수 계산 테스트"""
+        assert counter.count("Hello") == 5
+
+    def test_count_empty(self, counter, encoding):
+        """빈 텍스트는 인코딩 없이 0을 반환하는지 테스트"""
+        assert counter.count("") == 0
+        assert encoding.encode_calls == 0
+
+    def test_count_memoized(self, counter, encoding):
+        """같은 텍스트는 다시 인코딩하지 않는지 테스트"""
+        counter.count("Hello")
+        counter.count("Hello")
+        assert encoding.encode_calls == 1
+
+    def test_memo_eviction(self, counter, encoding):
+        """memo_size를 넘으면 가장 오래된 항목이 제거되는지 테스트"""
+        counter.count("a")
+        counter.count("b")
+        counter.count("c")
+        counter.count("a")
+        assert encoding.encode_calls == 4
+
+    def test_encode_batch(self, counter):
+        """일괄 인코딩 시 입력 순서를 유지하는지 테스트"""
+        assert counter.encode_batch(["ab", "c"]) == [[97, 98], [99]]
+        assert counter.count_batch(["ab", "c", ""]) == [2, 1, 0]
+        assert counter.encode_batch([]) == []
+
+    def test_approximate_samples_only(self, counter, encoding):
+        """근사 카운트는 표본 구간만 인코딩하는지 테스트"""
+        text = "a" * 50000
+        result = counter.count(text, approximate=True)
+
+        assert result == 50000
+        assert encoding.encoded_chars == TokenCounter._SAMPLE_WINDOWS * TokenCounter._SAMPLE_WINDOW_SIZE
+
+    def test_approximate_short_text_exact(self, counter):
+        """표본보다 짧은 텍스트는 정확히 계산하는지 테스트"""
+        assert counter.count("Hello", approximate=True) == 5
+
+    def test_approximate_auto(self, counter):
+        """approximate=None이면 임계값에 따라 자동 선택하는지 테스트"""
+        assert counter.is_approximate("a" * 100) is False
+        assert counter.is_approximate("a" * 10001) is True
+        assert counter.is_approximate("a" * 100, approximate=True) is True
+
+    def test_warm_up_skips_failures(self):
+        """인코더 로드 실패 모델은 건너뛰는지 테스트"""
+        def getter(model):
+            if model == "broken":
+                raise RuntimeError("download failed")
+            return FakeEncoding()
+
+        counter = TokenCounter(encoding_getter=getter)
+        assert counter.warm_up(["gpt-4o", "broken", "gpt-4o"]) == ["gpt-4o"]
+
+
+class TestTextAnalyzerTokenCounter:
+    """TextAnalyzer의 TokenCounter 연동 테스트"""
+
+    def test_uses_injected_counter(self, counter):
+        """주입된 TokenCounter를 사용하는지 테스트"""
+        analyzer = TextAnalyzer(token_counter=counter)
+        assert analyzer.count_tokens("Hello") == 5
+
+    def test_statistics_display_approximate(self, counter):
+        """대용량 텍스트는 근사 토큰 수로 표시하는지 테스트"""
+        analyzer = TextAnalyzer(token_counter=counter)
+        result = analyzer.format_statistics_display("a" * 20000)
+        assert "~20,000 토큰" in result
@@ -1,9 +1,14 @@
 """TranslationManager 클래스 테스트"""
+import asyncio
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
+from components.cache import MemoryCacheTier, TranslationCache
 from components.translation import (
     TranslationManager,
     AzureTranslationManager,
+    AsyncTranslationManager,
+    AsyncAzureTranslationManager,
     TranslationManagerFactory
 )
 
@@ -348,3 +353,352 @@ class TestTranslationManagerFactory:
         assert manager.deployment == "custom-deployment"
         assert manager.model == "gpt-4o"
         assert manager.temperature == 0.7
+
+
+class TestTranslationCacheIntegration:
+    """번역 관리자 캐시 연동 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "안녕하세요"
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 15
+        self.mock_client.chat.completions.create.return_value = mock_response
+        self.cache = TranslationCache([MemoryCacheTier()])
+
+    def test_cache_hit_skips_api_call(self):
+        """동일 요청은 두 번째부터 API를 호출하지 않는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o", cache=self.cache)
+
+        first = manager.translate("Hello", "English", "Korean", "test-session")
+        second = manager.translate("Hello\n", "English", "Korean", "test-session")
+
+        assert first == second == "안녕하세요"
+        self.mock_client.chat.completions.create.assert_called_once()
+        assert self.cache.stats()["cache_hits"] == 1
+        assert self.cache.stats()["cache_misses"] == 1
+
+    def test_cache_miss_on_different_settings(self):
+        """방향/temperature가 다르면 API를 다시 호출하는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o", cache=self.cache)
+
+        manager.translate("Hello", "English", "Korean")
+        manager.set_temperature(0.7)
+        manager.translate("Hello", "English", "Korean")
+        manager.translate("Hello", "Korean", "English")
+
+        assert self.mock_client.chat.completions.create.call_count == 3
+
+    def test_failed_translation_not_cached(self, monkeypatch):
+        """API 실패 결과는 캐시되지 않는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        manager = TranslationManager(self.mock_client, model="gpt-4o", cache=self.cache)
+        self.mock_client.chat.completions.create.side_effect = [Exception("API Error"), Mock(
+            choices=[Mock(message=Mock(content="안녕하세요"))],
+            usage=Mock(prompt_tokens=1, completion_tokens=1)
+        )]
+
+        with pytest.raises(Exception, match="API Error"):
+            manager.translate("Hello", "English", "Korean")
+        assert manager.translate("Hello", "English", "Korean") == "안녕하세요"
+        assert self.mock_client.chat.completions.create.call_count == 2
+
+    def test_azure_cache_keyed_by_deployment(self):
+        """Azure는 deployment별로 캐시가 분리되는지 테스트"""
+        manager_a = AzureTranslationManager(self.mock_client, deployment="deploy-a", cache=self.cache)
+        manager_b = AzureTranslationManager(self.mock_client, deployment="deploy-b", cache=self.cache)
+
+        manager_a.translate("Hello", "English", "Korean")
+        manager_a.translate("Hello", "English", "Korean")
+        manager_b.translate("Hello", "English", "Korean")
+
+        assert self.mock_client.chat.completions.create.call_count == 2
+
+    def test_factory_passes_cache(self):
+        """Factory가 cache 파라미터를 전달하는지 테스트"""
+        manager = TranslationManagerFactory.create("openai", self.mock_client, cache=self.cache)
+        assert manager.cache is self.cache
+
+
+def make_stream_chunks(deltas, prompt_tokens=10, completion_tokens=5, include_usage=True):
+    """스트리밍 응답 청크 목록을 생성합니다 (include_usage 사용 시 마지막 청크는 usage만 포함)."""
+    chunks = [
+        Mock(choices=[Mock(delta=Mock(content=delta))], usage=None)
+        for delta in deltas
+    ]
+    if include_usage:
+        chunks.append(Mock(
+            choices=[],
+            usage=Mock(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        ))
+    return chunks
+
+
+class TestTranslateStream:
+    """translate_stream 스트리밍 번역 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.mock_client = Mock()
+        self.mock_client.chat.completions.create.return_value = iter(
+            make_stream_chunks(["안녕", None, "하세요"])
+        )
+
+    def test_yields_deltas(self):
+        """생성된 조각을 순서대로 yield하는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        parts = list(manager.translate_stream("Hello", "English", "Korean", "test-session"))
+
+        assert parts == ["안녕", "하세요"]
+
+    def test_stream_request_parameters(self):
+        """stream=True와 include_usage 옵션으로 호출하는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        list(manager.translate_stream("Hello", "English", "Korean"))
+
+        call_kwargs = self.mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["model"] == "gpt-4o"
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["stream_options"] == {"include_usage": True}
+
+    def test_azure_uses_deployment(self):
+        """Azure는 deployment 이름으로 호출하는지 테스트"""
+        manager = AzureTranslationManager(self.mock_client, deployment="my-deployment", model="gpt-4o")
+
+        list(manager.translate_stream("Hello", "English", "Korean"))
+
+        call_kwargs = self.mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["model"] == "my-deployment"
+
+    def test_usage_estimated_without_usage_chunk(self, monkeypatch):
+        """usage가 없는 스트림에서도 정상 완료되는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+        self.mock_client.chat.completions.create.return_value = iter(
+            make_stream_chunks(["Hi"], include_usage=False)
+        )
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        assert list(manager.translate_stream("안녕", "Korean", "English")) == ["Hi"]
+
+    def test_stream_result_cached(self):
+        """스트리밍 결과가 캐시되어 다음 요청은 API를 호출하지 않는지 테스트"""
+        cache = TranslationCache([MemoryCacheTier()])
+        manager = TranslationManager(self.mock_client, model="gpt-4o", cache=cache)
+
+        list(manager.translate_stream("Hello", "English", "Korean"))
+        cached = list(manager.translate_stream("Hello", "English", "Korean"))
+
+        assert cached == ["안녕하세요"]
+        assert manager.translate("Hello", "English", "Korean") == "안녕하세요"
+        self.mock_client.chat.completions.create.assert_called_once()
+
+    def test_stream_error_raises(self, monkeypatch):
+        """스트림 도중 오류가 발생하면 예외를 전달하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+
+        def failing_stream():
+            yield make_stream_chunks(["안녕"], include_usage=False)[0]
+            raise Exception("Stream Error")
+
+        self.mock_client.chat.completions.create.return_value = failing_stream()
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        with pytest.raises(Exception, match="Stream Error"):
+            list(manager.translate_stream("Hello", "English", "Korean"))
+
+
+class TestTranslationContext:
+    """translate context 파라미터 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "안녕하세요"
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 15
+        self.mock_client.chat.completions.create.return_value = mock_response
+
+    def test_context_added_to_system_prompt(self):
+        """context가 시스템 프롬프트에 추가되는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        manager.translate("Hello", "English", "Korean", context="Preceding text:\nGreeting")
+
+        messages = self.mock_client.chat.completions.create.call_args[1]["messages"]
+        assert "<context>\nPreceding text:\nGreeting\n</context>" in messages[0]["content"]
+        assert messages[1]["content"] == "Hello"
+
+    def test_no_context_keeps_prompt(self):
+        """context가 없으면 기존 프롬프트를 유지하는지 테스트"""
+        manager = TranslationManager(self.mock_client, model="gpt-4o")
+
+        manager.translate("Hello", "English", "Korean")
+
+        messages = self.mock_client.chat.completions.create.call_args[1]["messages"]
+        assert "<context>" not in messages[0]["content"]
+
+    def test_context_part_of_cache_key(self):
+        """context가 다르면 캐시를 공유하지 않는지 테스트"""
+        manager = TranslationManager(
+            self.mock_client, model="gpt-4o", cache=TranslationCache([MemoryCacheTier()])
+        )
+
+        manager.translate("Hello", "English", "Korean", context="A")
+        manager.translate("Hello", "English", "Korean", context="B")
+        manager.translate("Hello", "English", "Korean", context="A")
+
+        assert self.mock_client.chat.completions.create.call_count == 2
+
+
+class TestAsyncTranslationManager:
+    """AsyncTranslationManager 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, make_response):
+        """각 테스트 전에 실행"""
+        self.make_response = make_response
+        self.mock_client = Mock()
+        self.mock_client.chat.completions.create = AsyncMock(
+            side_effect=lambda **kwargs: self.make_response(f"번역:{kwargs['messages'][1]['content']}")
+        )
+        self.manager = AsyncTranslationManager(self.mock_client, model="gpt-4o")
+
+    def test_translate(self):
+        """비동기 번역 테스트"""
+        result = asyncio.run(self.manager.translate("Hello", "English", "Korean"))
+
+        assert result == "번역:Hello"
+        assert self.mock_client.chat.completions.create.call_args[1]["model"] == "gpt-4o"
+
+    def test_translate_many_keeps_order(self):
+        """완료 순서와 관계없이 입력 순서를 유지하는지 테스트"""
+        async def create(**kwargs):
+            text = kwargs["messages"][1]["content"]
+            # 앞 항목일수록 늦게 끝나도록 지연
+            await asyncio.sleep(0.01 * (5 - int(text)))
+            return self.make_response(f"번역:{text}")
+
+        self.mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        texts = [str(i) for i in range(5)]
+
+        results = asyncio.run(self.manager.translate_many(texts, "English", "Korean"))
+
+        assert [result["text"] for result in results] == texts
+        assert [result["translation"] for result in results] == [f"번역:{text}" for text in texts]
+        assert all(result["error"] is None for result in results)
+
+    def test_translate_many_reports_failures_per_item(self, monkeypatch):
+        """실패 항목만 에러로 보고하고 나머지는 번역하는지 테스트"""
+        monkeypatch.setattr("components.translation.count_tokens", lambda text, model: 1)
+
+        async def create(**kwargs):
+            text = kwargs["messages"][1]["content"]
+            if text == "bad":
+                raise RuntimeError("API 오류")
+            return self.make_response(f"번역:{text}")
+
+        self.mock_client.chat.completions.create = AsyncMock(side_effect=create)
+
+        results = asyncio.run(self.manager.translate_many(["a", "bad", "b"], "English", "Korean"))
+
+        assert results[0] == {"text": "a", "translation": "번역:a", "error": None}
+        assert results[1]["translation"] is None
+        assert results[1]["error"] == "RuntimeError: API 오류"
+        assert results[2]["translation"] == "번역:b"
+
+    def test_translate_many_limits_concurrency(self):
+        """동시 요청 수가 max_concurrency를 넘지 않는지 테스트"""
+        active = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return self.make_response("번역")
+
+        self.mock_client.chat.completions.create = AsyncMock(side_effect=create)
+
+        asyncio.run(self.manager.translate_many(["t"] * 10, "English", "Korean", max_concurrency=3))
+
+        assert peak == 3
+
+    def test_translate_many_empty(self):
+        """빈 목록 테스트"""
+        assert asyncio.run(self.manager.translate_many([], "English", "Korean")) == []
+
+    def test_translate_many_uses_cache(self):
+        """캐시 적중 항목은 API를 호출하지 않는지 테스트"""
+        manager = AsyncTranslationManager(
+            self.mock_client, model="gpt-4o", cache=TranslationCache([MemoryCacheTier()])
+        )
+
+        asyncio.run(manager.translate_many(["Hello"], "English", "Korean"))
+        results = asyncio.run(manager.translate_many(["Hello", "Hello"], "English", "Korean"))
+
+        assert [result["translation"] for result in results] == ["번역:Hello", "번역:Hello"]
+        assert self.mock_client.chat.completions.create.call_count == 1
+
+    def test_azure_uses_deployment(self):
+        """Azure는 deployment 이름으로 호출하는지 테스트"""
+        manager = AsyncAzureTranslationManager(self.mock_client, deployment="my-gpt4o", model="gpt-4o")
+
+        asyncio.run(manager.translate("Hello", "English", "Korean"))
+
+        assert self.mock_client.chat.completions.create.call_args[1]["model"] == "my-gpt4o"
+
+    @staticmethod
+    async def _collect(stream):
+        return [part async for part in stream]
+
+    def test_translate_stream_yields_deltas(self):
+        """비동기 스트리밍으로 생성된 조각을 순서대로 받는지 테스트"""
+        async def chunks():
+            for chunk in make_stream_chunks(["안녕", None, "하세요"]):
+                yield chunk
+
+        self.mock_client.chat.completions.create = AsyncMock(side_effect=lambda **kwargs: chunks())
+
+        parts = asyncio.run(self._collect(self.manager.translate_stream("Hello", "English", "Korean")))
+
+        assert parts == ["안녕", "하세요"]
+        call_kwargs = self.mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["stream_options"] == {"include_usage": True}
+
+    def test_translate_stream_result_cached(self):
+        """비동기 스트리밍 결과가 캐시되어 translate()와 공유되는지 테스트"""
+        async def chunks():
+            for chunk in make_stream_chunks(["안녕하세요"]):
+                yield chunk
+
+        self.mock_client.chat.completions.create = AsyncMock(side_effect=lambda **kwargs: chunks())
+        manager = AsyncTranslationManager(
+            self.mock_client, model="gpt-4o", cache=TranslationCache([MemoryCacheTier()])
+        )
+
+        asyncio.run(self._collect(manager.translate_stream("Hello", "English", "Korean")))
+        cached = asyncio.run(self._collect(manager.translate_stream("Hello", "English", "Korean")))
+
+        assert cached == ["안녕하세요"]
+        assert asyncio.run(manager.translate("Hello", "English", "Korean")) == "안녕하세요"
+        assert self.mock_client.chat.completions.create.call_count == 1
+
+    def test_factory_create_async(self):
+        """팩토리의 비동기 관리자 생성 테스트"""
+        openai_manager = TranslationManagerFactory.create_async("openai", self.mock_client, model="gpt-4o")
+        azure_manager = TranslationManagerFactory.create_async(
+            "azure", self.mock_client, deployment="my-gpt4o"
+        )
+
+        assert type(openai_manager) is AsyncTranslationManager
+        assert type(azure_manager) is AsyncAzureTranslationManager
@@ -1,7 +1,22 @@
 """
 utils.py의 핵심 함수들에 대한 단위 테스트
 """
-from utils import detect_language, count_tokens, strip_markdown, count_sentences, is_short_text
+import pytest
+
+from config import Config
+from utils import (
+    count_script_letters,
+    count_sentences,
+    count_tokens,
+    detect_language,
+    detect_many,
+    find_protected_spans,
+    has_markdown,
+    is_short_text,
+    sample_text,
+    split_sentences,
+    strip_markdown,
+)
 
 
 class TestDetectLanguage:
@@ -48,6 +63,94 @@ class TestDetectLanguage:
         # 50:50인 경우 영어로 판정 (> 0.5 조건)
         assert result == "English"
 
+    def test_detect_with_explicit_threshold(self):
+        """명시적 임계값 사용 테스트"""
+        # 한국어 비율 0.6
+        assert detect_language("안녕하세요반 abcd", threshold=0.5) == "Korean"
+        assert detect_language("안녕하세요반 abcd", threshold=0.7) == "English"
+
+    def test_detect_does_not_reload_config(self, monkeypatch):
+        """감지 시 Config.load()를 다시 호출하지 않는지 테스트"""
+        def fail_load(cls):
+            raise AssertionError("Config.load() should not be called")
+
+        monkeypatch.setattr(Config, "_instance", Config())
+        monkeypatch.setattr(Config, "load", classmethod(fail_load))
+
+        assert detect_language("안녕하세요") == "Korean"
+        assert detect_language("Hello", threshold=0.5) == "English"
+
+
+class TestCountScriptLetters:
+    """한글/영문자 일괄 카운트 테스트"""
+
+    @staticmethod
+    def count_by_char(text):
+        """문자 단위로 세는 이전 방식 (비교 기준)"""
+        korean_chars = sum(1 for char in text if '\uac00' <= char <= '\ud7a3')
+        english_chars = sum(1 for char in text if char.isalpha() and ord(char) < 128)
+        return korean_chars, english_chars
+
+    def test_simple(self):
+        """한글/영문자 카운트 테스트"""
+        assert count_script_letters("안녕 Hello, 123!") == (2, 5)
+        assert count_script_letters("") == (0, 0)
+
+    def test_all_code_points(self):
+        """모든 유니코드 문자에 대해 문자 단위 카운트와 같은지 테스트"""
+        text = "".join(chr(code) for code in range(0x110000))
+        assert count_script_letters(text) == self.count_by_char(text)
+
+    def test_hangul_boundaries(self):
+        """한글 음절 범위 경계와 자모/호환 자모 제외 테스트"""
+        text = "\uabff\uac00\ud7a3\ud7a4\ud7ff\u3131\u1100\ud7a3"
+        assert count_script_letters(text) == (3, 0)
+
+
+class TestSampleLanguageDetection:
+    """표본 언어 감지와 일괄 감지 테스트"""
+
+    def test_sample_text_short_input(self):
+        """짧은 텍스트는 그대로 반환하는지 테스트"""
+        assert sample_text("안녕하세요", 100) == "안녕하세요"
+
+    def test_sample_text_stratified(self):
+        """구간마다 같은 길이의 표본을 읽는지 테스트"""
+        text = "".join(str(index % 10) * 100 for index in range(10))
+
+        sample = sample_text(text, 50, strata=5)
+
+        assert sample == "00000000002222222222444444444466666666668888888888"
+
+    def test_sample_reflects_whole_document(self):
+        """앞부분만이 아닌 문서 전체의 언어 분포를 반영하는지 테스트"""
+        text = "Hello world. " * 100 + "한국어 문장입니다. " * 2000
+
+        assert detect_language(text, 0.5, sample_chars=800) == "Korean"
+        assert detect_language(text, 0.5, sample_chars=800) == detect_language(text, 0.5)
+
+    def test_sample_without_letters_falls_back(self):
+        """표본에 문자가 없으면 전체를 다시 세는지 테스트"""
+        text = "1234567890" * 100 + "abc"
+
+        assert detect_language(text, 0.5, sample_chars=50) == "English"
+
+    def test_detect_many(self):
+        """일괄 감지 결과가 detect_language와 같은지 테스트"""
+        texts = ["안녕하세요", "Hello", "", "   ", "12345", "안녕 Hello world"]
+
+        assert detect_many(texts, 0.5) == [detect_language(text, 0.5) for text in texts]
+
+    def test_detect_many_reads_config_once(self, monkeypatch):
+        """threshold가 없으면 Config 임계값을 사용하는지 테스트"""
+        config = Config()
+        config.LANGUAGE_DETECTION_THRESHOLD = 0.9
+        monkeypatch.setattr(Config, "_instance", config)
+
+        # 한글 5자 / 영문 2자 = 한국어 비율 약 0.71
+        assert detect_many(["안녕하세요 Hi"]) == ["English"]
+        assert detect_many(["안녕하세요 Hi"], threshold=0.5) == ["Korean"]
+
 
 class TestCountTokens:
     """토큰 카운트 함수 테스트"""
@@ -187,6 +290,66 @@ class TestStripMarkdown:
         result = strip_markdown(text)
         assert result == text
 
+    # 이전 구현(정규식 11개를 차례로 적용, scripts/benchmark_markdown.py의 legacy_strip_markdown)의 출력
+    @pytest.mark.parametrize("text, expected", [
+        ("**bold text**", "bold text"),
+        ("*italic text*", "italic text"),
+        ("# Heading 1", "Heading 1"),
+        ("[link text](https://example.com)", "link text"),
+        ("`code`", "code"),
+        ("- list item", "list item"),
+        ("* list item", "list item"),
+        ("1. list item", "list item"),
+        ("> quoted text", "quoted text"),
+        ("---", ""),
+        ("```python\nprint('hello')\n```", ""),
+        ("![alt text](image.png)", "alt text"),
+        ("# Title\n**Bold** and *italic* with `code` and [link](url)", "Title\nBold and italic with code and link"),
+        ("", ""),
+        ("This is plain text with no markdown.", "This is plain text with no markdown."),
+        ("**[a](u)** and [**b**](u)", "a and b"),
+        ("> - x", "- x"),
+        ("- > x", "x"),
+        ("2 * 3 * 4", "2  3  4"),
+        ("text\n***\nmore", "text\n\nmore"),
+    ])
+    def test_same_as_legacy_chain(self, text, expected):
+        """이전 정규식 11개 구현과 같은 결과인지 테스트"""
+        assert strip_markdown(text) == expected
+
+    def test_strip_badge_link(self):
+        """이미지를 감싼 링크(배지) 제거 테스트"""
+        assert strip_markdown("[![build](badge.svg)](https://ci.example.com)") == "build"
+
+    def test_strip_asterisk_list_items(self):
+        """여러 줄의 별표 목록을 이탤릭으로 인식하지 않는지 테스트"""
+        assert strip_markdown("* first\n* second") == "first\nsecond"
+
+    def test_keep_blank_line_before_list(self):
+        """목록 앞의 빈 줄(문단 구분)을 유지하는지 테스트"""
+        assert strip_markdown("Intro\n\n- item") == "Intro\n\nitem"
+
+    def test_emphasis_within_line(self):
+        """볼드/이탤릭은 한 줄 안에서만 인식하는지 테스트"""
+        assert strip_markdown("a *b\nc* d") == "a *b\nc* d"
+
+
+class TestHasMarkdown:
+    """Markdown 포함 여부 감지 테스트"""
+
+    @pytest.mark.parametrize("text", [
+        "**bold**", "*italic*", "# Heading", "- item", "1. item", "> quote", "---", "`code`",
+        "[link](url)", "![alt](img.png)", "```\ncode\n```", "plain first line\n## heading later",
+    ])
+    def test_detects_syntax(self, text):
+        """각 문법을 감지하는지 테스트"""
+        assert has_markdown(text) is True
+
+    @pytest.mark.parametrize("text", ["", "plain text", "  indented plain text  ", "2 * 3", "#hashtag", "a - b"])
+    def test_plain_text(self, text):
+        """일반 텍스트는 감지하지 않는지 테스트"""
+        assert has_markdown(text) is False
+
 
 class TestCountSentences:
     """문장 수 계산 함수 테스트"""
@@ -243,6 +406,56 @@ class TestCountSentences:
         assert result == 5
 
 
+class TestSplitSentences:
+    """문장 조각 분리 함수 테스트"""
+
+    def test_split_sentences_concatenates_to_original(self):
+        """조각을 이어 붙이면 원문과 같은지 테스트"""
+        text = "안녕하세요. 반갑습니다!  다음 줄\n\n- 항목 1\n- 항목 2?"
+        pieces = split_sentences(text)
+
+        assert "".join(pieces) == text
+        assert pieces == ["안녕하세요. ", "반갑습니다!  ", "다음 줄\n", "\n", "- 항목 1\n", "- 항목 2?"]
+
+    def test_split_sentences_keeps_decimals_and_urls(self):
+        """공백이 뒤따르지 않는 마침표에서는 나누지 않는지 테스트"""
+        assert split_sentences("v1.2 released at example.com. Done") == ["v1.2 released at example.com. ", "Done"]
+
+    def test_split_sentences_empty(self):
+        """빈 텍스트 테스트"""
+        assert split_sentences("") == []
+
+
+class TestFindProtectedSpans:
+    """번역하지 않는 구간 탐색 함수 테스트"""
+
+    def test_find_protected_spans(self):
+        """코드, 이미지, URL, HTML 태그는 전체를, 링크는 URL만 찾는지 테스트"""
+        text = (
+            "```py\nprint(1)\n```\n"
+            "[문서](https://a.io/docs) ![로고](logo.png) `pip install x` "
+            "https://example.com/a?b=1. <br/> 일반 텍스트"
+        )
+        spans = [text[start:end] for start, end in find_protected_spans(text)]
+        assert spans == [
+            "```py\nprint(1)\n```",
+            "https://a.io/docs",
+            "![로고](logo.png)",
+            "`pip install x`",
+            "https://example.com/a?b=1",
+            "<br/>",
+        ]
+
+    def test_find_protected_spans_url_stops_at_hangul(self):
+        """URL 뒤에 붙은 한글은 포함하지 않는지 테스트"""
+        text = "https://x.kr에서 확인"
+        assert [text[start:end] for start, end in find_protected_spans(text)] == ["https://x.kr"]
+
+    def test_find_protected_spans_plain_text(self):
+        """보호할 구간이 없는 텍스트 테스트"""
+        assert find_protected_spans("a < b 이고 c > d 입니다") == []
+
+
 class TestIsShortText:
     """짧은 텍스트 판단 함수 테스트"""
 
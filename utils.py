@@ -3,6 +3,8 @@ TransBot 유틸리티 함수 모듈
 """
 import tiktoken
 import re
+from functools import lru_cache
+from typing import Iterable, Optional
 from config import Config
 
 
@@ -10,30 +12,84 @@ from config import Config
 # Markdown 패턴 상수
 # ============================================================================
 
-_MARKDOWN_CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```')
-_MARKDOWN_INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
-_MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
-_MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]+\)')
-_MARKDOWN_BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
-_MARKDOWN_ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
-_MARKDOWN_HEADING_PATTERN = re.compile(r'^#{1,6}\s+', re.MULTILINE)
-_MARKDOWN_LIST_PATTERN = re.compile(r'^\s*[-*+]\s+', re.MULTILINE)
-_MARKDOWN_NUMBERED_LIST_PATTERN = re.compile(r'^\s*\d+\.\s+', re.MULTILINE)
-_MARKDOWN_QUOTE_PATTERN = re.compile(r'^\s*>\s+', re.MULTILINE)
-_MARKDOWN_HORIZONTAL_RULE_PATTERN = re.compile(r'^[-_*]{3,}$', re.MULTILINE)
+# 인라인 문법: 코드 블록, 인라인 코드, 이미지를 감싼 링크(배지), 링크, 이미지, 볼드, 이탤릭
+# (볼드/이탤릭은 한 줄 안에서만 인식합니다)
+_MARKDOWN_CODE_BLOCK = r'```(?P<block>[\s\S]*?)```'
+_MARKDOWN_INLINE_CODE = r'`(?P<code>[^`]+)`'
+_MARKDOWN_BADGE = r'\[!\[(?P<badge>[^\]]*)\]\([^)]+\)\]\([^)]+\)'
+_MARKDOWN_LINK = r'\[(?P<link>[^\]]+)\]\([^)]+\)'
+_MARKDOWN_IMAGE = r'!\[(?P<image>[^\]]*)\]\([^)]+\)'
+_MARKDOWN_INLINE_SYNTAX = '|'.join((
+    _MARKDOWN_CODE_BLOCK,
+    _MARKDOWN_INLINE_CODE,
+    _MARKDOWN_BADGE,
+    _MARKDOWN_LINK,
+    _MARKDOWN_IMAGE,
+    r'\*\*(?P<bold>[^*\n]+)\*\*',
+    r'\*(?P<italic>[^*\n]+)\*',
+))
+# 줄 시작 문법: 헤딩, 목록, 번호 목록, 인용 기호(이 순서로 각각 최대 한 번)와 수평선
+# 앞의 줄바꿈부터 매칭하므로 strip_markdown은 텍스트 앞에 줄바꿈을 붙여 첫 줄도 같은 규칙으로 처리합니다
+_MARKDOWN_LIST = r'[^\S\n]*[-*+][^\S\n]+'
+_MARKDOWN_NUMBERED_LIST = r'[^\S\n]*\d+\.[^\S\n]+'
+_MARKDOWN_QUOTE = r'[^\S\n]*>[^\S\n]+'
+_MARKDOWN_HORIZONTAL_RULE = r'[-_*]{3,}$'
+_MARKDOWN_LINE_SYNTAX = (
+    rf'\n(?P<prefix>#{{1,6}}[^\S\n]+(?:{_MARKDOWN_LIST})?(?:{_MARKDOWN_NUMBERED_LIST})?(?:{_MARKDOWN_QUOTE})?'
+    rf'|{_MARKDOWN_LIST}(?:{_MARKDOWN_NUMBERED_LIST})?(?:{_MARKDOWN_QUOTE})?'
+    rf'|{_MARKDOWN_NUMBERED_LIST}(?:{_MARKDOWN_QUOTE})?'
+    rf'|{_MARKDOWN_QUOTE})(?:{_MARKDOWN_HORIZONTAL_RULE})?'
+    rf'|\n(?P<rule>{_MARKDOWN_HORIZONTAL_RULE})'
+)
+# 모든 문법을 하나의 패턴으로 합쳐 텍스트를 한 번만 훑습니다.
+# 모든 분기가 고정 문자(\n ` [ ! *)로 시작하므로 정규식 엔진이 다른 문자는 빠르게 건너뜁니다
+_MARKDOWN_PATTERN = re.compile(f'{_MARKDOWN_LINE_SYNTAX}|{_MARKDOWN_INLINE_SYNTAX}', re.MULTILINE)
+# 링크 텍스트, 볼드/이탤릭 내용 등 중첩된 내용에는 인라인 문법만 적용합니다
+_MARKDOWN_INLINE_PATTERN = re.compile(_MARKDOWN_INLINE_SYNTAX)
+
+# 번역하지 않는 구간: 코드 블록, 인라인 코드, 배지, 이미지, 링크 URL, 일반 URL, HTML 태그/주석
+# 링크는 링크 텍스트를 번역해야 하므로 URL 부분만 보호합니다 (protect_spans 참고)
+_URL = r"https?://[A-Za-z0-9\-._~:/?#@!$&*+,;=%]*[A-Za-z0-9\-_~/#@$&*+=%]"
+_HTML = r'<!--[\s\S]*?-->|</?[A-Za-z][A-Za-z0-9-]*(?:\s[^<>]*)?/?>'
+_PROTECTED_SPAN_PATTERN = re.compile('|'.join((
+    _MARKDOWN_CODE_BLOCK,
+    _MARKDOWN_INLINE_CODE,
+    _MARKDOWN_BADGE,
+    _MARKDOWN_LINK,
+    _MARKDOWN_IMAGE,
+    rf'(?P<url>{_URL})',
+    rf'(?P<html>{_HTML})',
+)))
+
+
+# ============================================================================
+# 언어 감지 상수
+# ============================================================================
+
+# UTF-16-BE 상위 바이트 중 한글 음절(U+AC00~U+D7A3) 범위(0xAC~0xD7)가 아닌 바이트 (삭제 후 남은 길이 = 후보 수)
+_NON_HANGUL_HIGH_BYTES = bytes(byte for byte in range(256) if not 0xAC <= byte <= 0xD7)
+# 상위 바이트가 0xD7이지만 한글 음절이 아닌 문자 (U+D7A4~U+D7FF)
+_HANGUL_TAIL_PATTERN = re.compile('[\ud7a4-\ud7ff]')
+# ASCII 중 영문자가 아닌 바이트
+_ASCII_NON_LETTER_BYTES = bytes(byte for byte in range(128) if not chr(byte).isalpha())
+# 표본 감지 시 텍스트를 나눌 구간 수 (구간마다 같은 길이의 표본을 읽음)
+_LANGUAGE_SAMPLE_STRATA = 8
 
 
 # ============================================================================
 # 언어 감지 함수
 # ============================================================================
 
-def detect_language(text: str) -> str:
+def detect_language(text: str, threshold: Optional[float] = None, sample_chars: Optional[int] = None) -> str:
     """텍스트의 언어를 감지합니다.
 
-    Config에서 LANGUAGE_DETECTION_THRESHOLD를 로드하여 한국어 감지 임계값으로 사용합니다.
+    threshold가 주어지지 않으면 프로세스 전역 Config(Config.get())의
+    LANGUAGE_DETECTION_THRESHOLD를 한국어 감지 임계값으로 사용합니다.
 
     Args:
         text: 분석할 텍스트
+        threshold: 한국어 감지 임계값 (None이면 Config 값 사용)
+        sample_chars: 이보다 긴 텍스트는 구간별 표본(sample_text)만 읽어 감지 (None이면 전체 사용)
 
     Returns:
         감지된 언어 ("Korean", "English", "unknown")
@@ -41,18 +97,99 @@ def detect_language(text: str) -> str:
     if not text or not text.strip():
         return "unknown"
 
-    # Config에서 임계값 로드
-    config = Config.load()
-    threshold = config.LANGUAGE_DETECTION_THRESHOLD
+    korean_chars, english_chars = 0, 0
+    if sample_chars and len(text) > sample_chars:
+        korean_chars, english_chars = count_script_letters(sample_text(text, sample_chars))
+    if korean_chars + english_chars == 0:
+        # 표본에 문자가 없으면 (예: 코드/숫자 구간) 전체를 다시 셉니다
+        korean_chars, english_chars = count_script_letters(text)
+    return classify_language(korean_chars, english_chars, threshold)
+
+
+def detect_many(
+    texts: Iterable[str],
+    threshold: Optional[float] = None,
+    sample_chars: Optional[int] = None
+) -> list[str]:
+    """여러 텍스트의 언어를 한 번에 감지합니다 (스크립트/일괄 처리용).
+
+    Args:
+        texts: 분석할 텍스트 목록
+        threshold: 한국어 감지 임계값 (None이면 Config 값을 한 번만 읽어 사용)
+        sample_chars: detect_language와 같은 표본 감지 기준
+
+    Returns:
+        텍스트 순서대로 감지된 언어 리스트
+    """
+    if threshold is None:
+        threshold = Config.get().LANGUAGE_DETECTION_THRESHOLD
+    return [detect_language(text, threshold, sample_chars) for text in texts]
+
+
+def count_script_letters(text: str) -> tuple[int, int]:
+    """텍스트의 한글 음절 수와 ASCII 영문자 수를 셉니다.
+
+    문자마다 Python 비교를 하지 않고 인코딩된 바이트를 C 수준의 bytes.translate로 한 번에 셉니다.
+    한글 음절은 UTF-16-BE 상위 바이트가 0xAC~0xD7인 문자에서 U+D7A4~U+D7FF를 뺀 수입니다.
 
-    korean_chars = sum(1 for char in text if '\uac00' <= char <= '\ud7a3')
-    english_chars = sum(1 for char in text if char.isalpha() and ord(char) < 128)
+    Args:
+        text: 분석할 텍스트
+
+    Returns:
+        (한글 음절 수, ASCII 영문자 수) 튜플
+    """
+    high_bytes = text.encode("utf-16-be", "surrogatepass")[0::2]
+    korean_chars = len(high_bytes.translate(None, _NON_HANGUL_HIGH_BYTES))
+    if b"\xd7" in high_bytes:
+        korean_chars -= len(_HANGUL_TAIL_PATTERN.findall(text))
 
+    english_chars = len(text.encode("ascii", "ignore").translate(None, _ASCII_NON_LETTER_BYTES))
+    return korean_chars, english_chars
+
+
+def sample_text(text: str, max_chars: int, strata: int = _LANGUAGE_SAMPLE_STRATA) -> str:
+    """긴 텍스트에서 구간별 표본을 모아 최대 max_chars 길이의 텍스트를 만듭니다.
+
+    텍스트를 strata개 구간으로 나누고 각 구간의 앞부분을 같은 길이만큼 읽으므로
+    앞부분만 읽을 때와 달리 문서 전체의 언어 분포를 반영합니다. 같은 입력에는 항상 같은 표본을 반환합니다.
+
+    Args:
+        text: 원본 텍스트
+        max_chars: 표본 전체의 최대 문자 수
+        strata: 나눌 구간 수
+
+    Returns:
+        표본 텍스트 (max_chars 이하인 텍스트는 그대로 반환)
+    """
+    if len(text) <= max_chars:
+        return text
+    strata = max(1, min(strata, max_chars))
+    window = max_chars // strata
+    stride = len(text) // strata
+    return "".join(text[index * stride:index * stride + window] for index in range(strata))
+
+
+def classify_language(korean_chars: int, english_chars: int, threshold: Optional[float] = None) -> str:
+    """한글/영문자 수로 언어를 판정합니다.
+
+    구간별 문자 수를 합산한 값으로도 detect_language와 같은 결과를 얻을 수 있도록 분리한 함수입니다.
+
+    Args:
+        korean_chars: 한글 음절 수
+        english_chars: ASCII 영문자 수
+        threshold: 한국어 감지 임계값 (None이면 Config 값 사용)
+
+    Returns:
+        감지된 언어 ("Korean", "English", "unknown")
+    """
     total_alpha = korean_chars + english_chars
 
     if total_alpha == 0:
         return "unknown"
 
+    if threshold is None:
+        threshold = Config.get().LANGUAGE_DETECTION_THRESHOLD
+
     if korean_chars / total_alpha > threshold:
         return "Korean"
     else:
@@ -63,12 +200,21 @@ def detect_language(text: str) -> str:
 # 토큰 카운팅 함수
 # ============================================================================
 
-def count_tokens(text: str, model: str = "gpt-4o") -> int:
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """모델에 맞는 tiktoken 인코더를 반환합니다.
+
+    인코더 생성(BPE 랭크 파일 로드)은 비용이 크므로 모델별로 한 번만 생성하여 재사용합니다.
+    알 수 없는 모델은 cl100k_base 인코더를 사용합니다.
+    """
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    return len(get_encoding(model).encode(text))
 
 
 # ============================================================================
@@ -76,24 +222,81 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
 # ============================================================================
 
 def strip_markdown(text: str) -> str:
-    text = _MARKDOWN_CODE_BLOCK_PATTERN.sub('', text)
-    text = _MARKDOWN_INLINE_CODE_PATTERN.sub(r'\1', text)
-    text = _MARKDOWN_IMAGE_PATTERN.sub(r'\1', text)
-    text = _MARKDOWN_LINK_PATTERN.sub(r'\1', text)
-    text = _MARKDOWN_BOLD_PATTERN.sub(r'\1', text)
-    text = _MARKDOWN_ITALIC_PATTERN.sub(r'\1', text)
-    text = _MARKDOWN_HEADING_PATTERN.sub('', text)
-    text = _MARKDOWN_LIST_PATTERN.sub('', text)
-    text = _MARKDOWN_NUMBERED_LIST_PATTERN.sub('', text)
-    text = _MARKDOWN_QUOTE_PATTERN.sub('', text)
-    text = _MARKDOWN_HORIZONTAL_RULE_PATTERN.sub('', text)
-    return text.strip()
+    """Markdown 문법을 제거한 일반 텍스트를 반환합니다.
+
+    모든 문법을 합친 정규식 하나로 텍스트를 한 번만 훑으며 결과를 만듭니다.
+    코드 블록과 수평선은 제거하고, 인라인 코드/이미지/링크/볼드/이탤릭은 내용만 남기며,
+    줄 시작의 헤딩/목록/번호 목록/인용 기호를 제거합니다.
+    볼드/이탤릭은 한 줄 안에서만 인식하고, 목록 앞의 빈 줄은 그대로 유지합니다.
+
+    Args:
+        text: Markdown 텍스트
+
+    Returns:
+        Markdown 문법을 제거하고 앞뒤 공백을 정리한 텍스트
+    """
+    return _MARKDOWN_PATTERN.sub(_replace_markdown, "\n" + text).strip()
+
+
+def has_markdown(text: str) -> bool:
+    """텍스트에 strip_markdown이 제거할 Markdown 문법이 있는지 확인합니다.
+
+    결과 텍스트를 만들지 않고 처음 발견한 문법에서 바로 반환합니다.
+    """
+    return _MARKDOWN_PATTERN.search("\n" + text) is not None
+
+
+def _replace_markdown(match: re.Match) -> str:
+    """문법 하나를 남길 내용으로 바꿉니다 (중첩된 인라인 문법도 제거)."""
+    group = match.lastgroup
+    if group in ("prefix", "rule"):
+        return "\n"
+    if group == "block":
+        return ""
+    content = match.group(group)
+    if group == "code":
+        return content
+    return _MARKDOWN_INLINE_PATTERN.sub(_replace_markdown, content)
+
+
+def find_protected_spans(text: str) -> list[tuple[int, int]]:
+    """번역하지 않고 그대로 유지해야 하는 구간의 위치를 찾습니다.
+
+    코드 블록, 인라인 코드, 배지, 이미지, 일반 URL, HTML 태그/주석은 구간 전체를,
+    링크는 링크 텍스트를 번역해야 하므로 괄호 안의 URL 부분만 반환합니다.
+
+    Args:
+        text: Markdown 텍스트
+
+    Returns:
+        (시작 위치, 끝 위치) 리스트 (등장 순서, 겹치지 않음)
+
+    Examples:
+        >>> find_protected_spans("See [docs](https://a.io) and `x = 1`")
+        [(11, 23), (29, 36)]
+    """
+    spans = []
+    for match in _PROTECTED_SPAN_PATTERN.finditer(text):
+        if match.lastgroup == "link":
+            # "[텍스트](URL)"에서 "](" 다음부터 마지막 ")" 앞까지
+            spans.append((match.end("link") + 2, match.end() - 1))
+        else:
+            spans.append(match.span())
+    return spans
 
 
 # ============================================================================
 # 문장 수 감지 함수
 # ============================================================================
 
+# 문장 종결 부호 (영어: . ! ?, 한국어: . ! ? 。)
+_SENTENCE_DELIMITERS = r'[.!?。]+'
+_SENTENCE_DELIMITER_PATTERN = re.compile(_SENTENCE_DELIMITERS)
+# 문장 조각: 뒤에 공백이나 텍스트 끝이 오는 종결 부호(소수점, URL 제외) 또는 줄바꿈까지
+# 종결 부호 뒤 공백과 줄바꿈은 앞 조각에 포함되므로 조각을 이어 붙이면 원문과 같습니다
+_SENTENCE_PIECE_PATTERN = re.compile(rf'.*?(?:{_SENTENCE_DELIMITERS}(?=\s|\Z)[^\S\n]*\n?|\n|\Z)')
+
+
 def count_sentences(text: str) -> int:
     """텍스트의 문장 수를 계산합니다.
 
@@ -116,8 +319,8 @@ def count_sentences(text: str) -> int:
     if not text or not text.strip():
         return 0
 
-    # 문장 종결 부호로 분리 (영어: . ! ?, 한국어: . ! ? 。)
-    sentences = re.split(r'[.!?。]+', text)
+    # 문장 종결 부호로 분리
+    sentences = _SENTENCE_DELIMITER_PATTERN.split(text)
 
     # 빈 문자열 제거
     sentences = [s.strip() for s in sentences if s.strip()]
@@ -125,6 +328,28 @@ def count_sentences(text: str) -> int:
     return len(sentences)
 
 
+def split_sentences(text: str) -> list[str]:
+    """텍스트를 문장 단위 조각으로 나눕니다.
+
+    count_sentences와 같은 문장 종결 부호를 사용하되, 뒤에 공백이나 텍스트 끝이 오는 경우만 문장 끝으로 보고
+    (소수점, 버전 번호, URL 유지) 줄바꿈도 문장 경계로 봅니다 (목록, 표 등 한 줄 항목 유지).
+    조각에는 뒤따르는 공백/줄바꿈이 포함되므로 조각을 이어 붙이면 원문과 같습니다.
+
+    Args:
+        text: 나눌 텍스트
+
+    Returns:
+        문장 조각 리스트 (빈 텍스트이면 빈 리스트)
+
+    Examples:
+        >>> split_sentences("Hello. How are you?")
+        ['Hello. ', 'How are you?']
+        >>> split_sentences("v1.2 released!")
+        ['v1.2 released!']
+    """
+    return [piece for piece in _SENTENCE_PIECE_PATTERN.findall(text) if piece]
+
+
 def is_short_text(text: str, threshold: int = 3) -> bool:
     """텍스트가 짧은지 판단합니다 (문장 수 기준).
 